@@ -39,6 +39,29 @@ class Settings(BaseSettings):
             return v
         raise ValueError(v)
 
+    # Cutoff dataset version: how often the DB fingerprint is re-checked
+    DATASET_VERSION_TTL_SECONDS: int = 300
+
+    # In-memory cutoff snapshot (normalized_data CSVs). When the directory is
+    # missing, recommendations are served from the database instead.
+    CUTOFF_SNAPSHOT_DIR: Optional[str] = "../normalized_data"
+    # Poll interval of the data directory watcher; 0 disables it
+    SNAPSHOT_WATCH_INTERVAL_SECONDS: int = 10
+    # Required in X-Admin-Token for admin endpoints; admin API is disabled if unset
+    ADMIN_TOKEN: Optional[str] = None
+
+    # Recommendation result cache (serves repeat requests and page continuation)
+    RECOMMENDATION_CACHE_TTL_SECONDS: int = 900
+    RECOMMENDATION_CACHE_MAX_ENTRIES: int = 256
+
+    # Maximum students per /recommend/batch request
+    BATCH_MAX_STUDENTS: int = 10000
+
+    # Counseling years accepted while no cutoff snapshot is loaded (database
+    # fallback); with a snapshot, its published and projected years apply
+    CUTOFF_MIN_YEAR: int = 2020
+    CUTOFF_MAX_YEAR: int = 2025
+
     # Application Configuration
     PROJECT_NAME: str = "IIT Rank-Based College Recommendation System"
     VERSION: str = "1.0.0"
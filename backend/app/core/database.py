@@ -2,23 +2,40 @@
 Database configuration and session management using SQLAlchemy.
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, inspect
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from typing import Dict, FrozenSet, Generator
 
 from app.core.config import settings
+from app.core.metrics import DB_POOL_CAPACITY, DB_POOL_CHECKED_OUT, DB_POOL_CHECKOUTS
+
+# Connections kept open per process, and opened beyond those under load
+POOL_SIZE = 5
+MAX_OVERFLOW = 10
 
 # Create SQLAlchemy engine
 # Enable echo=True temporarily for SQL query debugging if needed
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
+    pool_size=POOL_SIZE,
+    max_overflow=MAX_OVERFLOW,
     echo=False  # Set to True for SQL query debugging
 )
 
+
+def _on_checkout(*args) -> None:
+    DB_POOL_CHECKOUTS.inc()
+    DB_POOL_CHECKED_OUT.inc()
+
+
+# Pool usage for /metrics, tracked on the pool's events rather than read at
+# scrape time, so that a scrape served by one worker covers every worker's pool
+DB_POOL_CAPACITY.set(POOL_SIZE + MAX_OVERFLOW)
+event.listen(engine, "checkout", _on_checkout)
+event.listen(engine, "checkin", lambda *args: DB_POOL_CHECKED_OUT.dec())
+
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -36,3 +53,17 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+# Column names of live tables and views, read once per process: the schema
+# only changes through the migration scripts, which are followed by a restart
+_live_columns: Dict[str, FrozenSet[str]] = {}
+
+
+def live_columns(db: Session, table: str) -> FrozenSet[str]:
+    """Column names of a table or view as it exists in the connected database."""
+    columns = _live_columns.get(table)
+    if columns is None:
+        columns = frozenset(column["name"] for column in inspect(db.get_bind()).get_columns(table))
+        _live_columns[table] = columns
+    return columns
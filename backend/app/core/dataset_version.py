@@ -0,0 +1,103 @@
+"""
+Version stamp of the loaded cutoff dataset.
+
+Deterministic outputs (recommendation lists, comparisons) depend only on the
+request and the cutoff data, so the pair (request key, dataset version)
+identifies them. The version drives ETags and invalidates internal caches,
+which subscribe to changes.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from typing import Callable, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Tables whose contents define the cutoff dataset
+CUTOFF_TABLES = ["cutoffs", "nit_cutoffs", "iiit_cutoffs", "cfi_cutoffs"]
+
+
+def fingerprint_database(db: Session) -> str:
+    """
+    Cheap fingerprint of the cutoff tables (row count, max id, rank sum).
+    Changes whenever data is re-imported.
+    """
+    digest = hashlib.sha256()
+    for table in CUTOFF_TABLES:
+        try:
+            row = db.execute(text(
+                f"SELECT count(*), coalesce(max(cutoff_id), 0), coalesce(sum(closing_rank::bigint), 0) FROM {table}"
+            )).one()
+            digest.update(f"{table}:{row[0]}:{row[1]}:{row[2]};".encode("utf-8"))
+        except Exception as e:
+            # Missing table (e.g. JEE Mains data not imported) - skip it
+            logger.warning(f"Could not fingerprint {table}: {e}")
+            db.rollback()
+    return digest.hexdigest()[:16]
+
+
+class DatasetVersion:
+    """Holds the current dataset version and notifies subscribers when it changes."""
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._version: Optional[str] = None
+        self._checked_at = 0.0
+        # When pinned (set explicitly by a data loader), the DB is not polled
+        self._pinned = False
+        self._subscribers: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback: Callable[[], None]) -> None:
+        """Register a callback (e.g. a cache clear) run when the version changes."""
+        self._subscribers.append(callback)
+
+    def current(self, db: Optional[Session] = None) -> str:
+        """Current version; re-fingerprints the DB once the TTL has passed."""
+        stale = time.monotonic() - self._checked_at > self.ttl_seconds
+        if db is not None and not self._pinned and (self._version is None or stale):
+            self._update(fingerprint_database(db))
+        return self._version or "unknown"
+
+    def set(self, version: str) -> None:
+        """Pin the version computed by a data loader (e.g. a content hash)."""
+        self._pinned = True
+        self._update(version)
+
+    def _update(self, version: str) -> None:
+        with self._lock:
+            self._checked_at = time.monotonic()
+            changed = version != self._version
+            self._version = version
+        if changed:
+            logger.info(f"Dataset version changed to {version}; invalidating caches")
+            for callback in self._subscribers:
+                callback()
+
+
+def make_etag(*parts: object) -> str:
+    """Strong ETag over the given parts (rendered body, dataset version, ...); bytes are hashed as-is."""
+    digest = hashlib.sha1()
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else str(part).encode("utf-8"))
+        digest.update(b"|")
+    return '"' + digest.hexdigest() + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Evaluate an If-None-Match header against an ETag."""
+    if not if_none_match:
+        return False
+    candidates = [c.strip() for c in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+# Global dataset version instance
+dataset_version = DatasetVersion(ttl_seconds=settings.DATASET_VERSION_TTL_SECONDS)
@@ -3,6 +3,7 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from app.core.database import SessionLocal
 from app.core.security import verify_token
+from app.core.metrics import STAGE_SECONDS
 import jwt
 
 # Bearer token scheme
@@ -14,7 +15,8 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
     """
     token = credentials.credentials
     try:
-        payload = verify_token(token)
+        with STAGE_SECONDS.labels(stage="auth").time():
+            payload = verify_token(token)
         return payload
     except jwt.ExpiredSignatureError:
         print("DEBUG: Token Expired")
@@ -0,0 +1,102 @@
+"""
+Application metrics in the Prometheus exposition format (prometheus_client).
+
+Metrics live in the client's default registry and are served by GET
+/metrics (see app/main.py) through render(). Under several worker
+processes (gunicorn or `uvicorn --workers`), set PROMETHEUS_MULTIPROC_DIR
+to an empty directory shared by the workers and cleared before start:
+every process then writes its samples there and a scrape, whichever
+worker serves it, aggregates all of them (MultiProcessCollector). Gauges
+declare how they aggregate across processes (multiprocess_mode); without
+the variable each process reports only its own values.
+
+The pipeline stages timed in STAGE_SECONDS are:
+
+    auth            bearer-token verification (app/core/deps.py)
+    session_load    reading a chat session
+    session_write   creating a session or storing messages, state and recommendations
+                    (aged-out messages are folded deterministically; the LLM rewrite
+                    of the summary runs after the response)
+    rank_filter     cutoff filtering and bucketing (snapshot or SQL)
+    prompt_build    building an LLM prompt
+    fallback        generating a deterministic answer instead of the LLM's
+    serialization   rendering a response body to JSON bytes
+
+Stages are timed with STAGE_SECONDS.labels(stage=...).time(), as a
+decorator or a with-block. LLM calls are timed per LLMService method in
+LLM_CALL_SECONDS; the LLM circuit breaker's state is LLM_CIRCUIT_STATE.
+"""
+
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+
+CONTENT_TYPE = CONTENT_TYPE_LATEST
+
+# Seconds; spans in-memory filtering (~1 ms) to LLM calls (tens of seconds)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Values of LLM_CIRCUIT_STATE, ordered so that the max over workers is the worst
+CIRCUIT_CLOSED, CIRCUIT_HALF_OPEN, CIRCUIT_OPEN = 0, 1, 2
+
+
+def render() -> bytes:
+    """Exposition of every metric, aggregated over the worker processes in multiprocess mode."""
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        # A fresh registry per scrape, read from the shared directory
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest(REGISTRY)
+
+
+STAGE_SECONDS = Histogram(
+    "app_stage_duration_seconds", "Latency of a request pipeline stage (see app/core/metrics.py).", ["stage"],
+    buckets=DEFAULT_BUCKETS
+)
+LLM_CALL_SECONDS = Histogram(
+    "app_llm_call_duration_seconds", "Latency of an LLM call by LLMService method and outcome.", ["method", "outcome"],
+    buckets=DEFAULT_BUCKETS
+)
+LLM_FALLBACKS = Counter(
+    "app_llm_fallbacks", "Answers served by a deterministic fallback instead of the LLM.", ["method", "reason"]
+)
+LLM_ENABLED = Gauge(
+    "app_llm_enabled", "1 when an LLM client is configured, 0 when every call falls back.",
+    multiprocess_mode="livemax"
+)
+LLM_CONSECUTIVE_FAILURES = Gauge(
+    "app_llm_consecutive_failures", "LLM calls failed in a row since the last success, per worker.",
+    multiprocess_mode="liveall"
+)
+LLM_CIRCUIT_STATE = Gauge(
+    "app_llm_circuit_state", "LLM circuit breaker state per worker: 0 closed, 1 half-open, 2 open.",
+    multiprocess_mode="liveall"
+)
+CACHE_REQUESTS = Counter(
+    "app_cache_requests", "Cache lookups by cache and result (hit, miss, expired, stale).", ["cache", "result"]
+)
+DB_POOL_CHECKOUTS = Counter(
+    "app_db_pool_checkouts", "Connections checked out of the SQLAlchemy pool."
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "app_db_pool_checked_out", "SQLAlchemy pool connections currently checked out, summed over workers.",
+    multiprocess_mode="livesum"
+)
+DB_POOL_CAPACITY = Gauge(
+    "app_db_pool_capacity", "SQLAlchemy pool size plus overflow, summed over workers.",
+    multiprocess_mode="livesum"
+)
+HTTP_REQUEST_SECONDS = Histogram(
+    "app_http_request_duration_seconds", "End-to-end request latency by route template, method and status.",
+    ["route", "method", "status"], buckets=DEFAULT_BUCKETS
+)
@@ -0,0 +1,31 @@
+"""
+Response classes for high-throughput JSON serialization.
+"""
+
+from typing import Any, Optional, Set
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
+from app.core.metrics import STAGE_SECONDS
+
+
+class PydanticJSONResponse(JSONResponse):
+    """
+    JSON response rendered by pydantic-core's compiled serializer.
+
+    Pydantic models are serialized straight to bytes through the schema
+    serializer built at class-definition time, skipping FastAPI's
+    model -> dict -> jsonable_encoder -> json.dumps round trip. This matters
+    for large recommendation payloads with thousands of items.
+    """
+
+    def __init__(self, content: Any, *args: Any, include: Optional[Set[str]] = None, **kwargs: Any):
+        # Field projection is applied by the serializer itself
+        self.include = include
+        super().__init__(content, *args, **kwargs)
+
+    @STAGE_SECONDS.labels(stage="serialization").time()
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content, include=self.include)
+        return to_json(content, include=self.include)
@@ -3,13 +3,17 @@ FastAPI application entry point.
 Main application setup and route registration.
 """
 
-from fastapi import FastAPI, Depends
+import time
+from fastapi import FastAPI, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from app.core.config import settings
 from app.core.database import get_db
-from app.routes import recommend, chat, jee_mains_chat
+from app.core.metrics import CONTENT_TYPE, HTTP_REQUEST_SECONDS, render
+from app.routes import recommend, chat, jee_mains_chat, admin
+from app.services.snapshot_manager import snapshot_manager
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -25,12 +29,43 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Dataset-Version"],
 )
 
+@app.middleware("http")
+async def observe_request_latency(request: Request, call_next):
+    """Time every request by its route template (not the raw path, which embeds session ids)."""
+    start = time.perf_counter()
+    status = "500"
+    try:
+        response = await call_next(request)
+        status = str(response.status_code)
+        return response
+    finally:
+        route = request.scope.get("route")
+        HTTP_REQUEST_SECONDS.labels(
+            route=getattr(route, "path", "unmatched"),
+            method=request.method,
+            status=status
+        ).observe(time.perf_counter() - start)
+
+
 # Register routes
 app.include_router(recommend.router, prefix=settings.API_PREFIX)
 app.include_router(chat.router, prefix=settings.API_PREFIX)
 app.include_router(jee_mains_chat.router, prefix=settings.API_PREFIX)
+app.include_router(admin.router, prefix=settings.API_PREFIX)
+
+
+@app.on_event("startup")
+def load_cutoff_snapshot():
+    """Load the in-memory cutoff snapshot and start watching its directory."""
+    snapshot_manager.start()
+
+
+@app.on_event("shutdown")
+def stop_snapshot_watcher():
+    snapshot_manager.stop()
 
 
 @app.get("/")
@@ -49,6 +84,16 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """
+    Prometheus scrape endpoint: per-stage and per-LLM-method latency
+    histograms, fallback and cache counters, LLM health and database pool
+    usage, over all worker processes in multiprocess mode (see app/core/metrics.py).
+    """
+    return Response(content=render(), media_type=CONTENT_TYPE)
+
+
 @app.get("/health/db")
 async def health_check_db(db: Session = Depends(get_db)):
     """Database health check endpoint."""
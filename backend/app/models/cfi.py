@@ -2,7 +2,7 @@
 SQLAlchemy models for CFI data.
 """
 
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Boolean, Column, Integer, String, ForeignKey
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 
@@ -13,6 +13,7 @@ class CFI(Base):
     id = Column(Integer, primary_key=True, index=True, name="cfi_id")
     name = Column(String, nullable=False, index=True)
     location = Column(String, nullable=True)
+    state = Column(String, nullable=True)
     # nirf_rank might not be available or applicable in same way but keeping structure similar
     
 class CFIBranch(Base):
@@ -35,6 +36,9 @@ class CFICutoff(Base):
     
     year = Column(Integer, nullable=False, index=True)
     category = Column(String, nullable=False, index=True)
+    gender = Column(String, nullable=False, default="Gender-Neutral", index=True)
+    pwd = Column(Boolean, nullable=False, default=False)
+    opening_rank = Column(Integer, nullable=True)
     closing_rank = Column(Integer, nullable=False)
     round = Column(Integer, nullable=False, index=True)
     quota = Column(String, nullable=True)
@@ -2,7 +2,7 @@
 SQLAlchemy model for Cutoff table.
 """
 
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Boolean, Column, Integer, String, ForeignKey
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 
@@ -17,6 +17,10 @@ class Cutoff(Base):
     branch_id = Column(Integer, ForeignKey("branches.branch_id"), nullable=False, index=True)
     year = Column(Integer, nullable=False, index=True)
     category = Column(String, nullable=False, index=True)
+    # Seat pool within the category: "Gender-Neutral" / "Female-only", PwD-reserved seats
+    gender = Column(String, nullable=False, default="Gender-Neutral", index=True)
+    pwd = Column(Boolean, nullable=False, default=False)
+    opening_rank = Column(Integer, nullable=True)
     closing_rank = Column(Integer, nullable=False)
     round = Column(Integer, nullable=False, index=True)
     
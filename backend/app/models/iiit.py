@@ -2,7 +2,7 @@
 SQLAlchemy models for IIIT data.
 """
 
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Boolean, Column, Integer, String, ForeignKey
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 
@@ -13,6 +13,7 @@ class IIIT(Base):
     id = Column(Integer, primary_key=True, index=True, name="iiit_id")
     name = Column(String, nullable=False, index=True)
     location = Column(String, nullable=True)
+    state = Column(String, nullable=True)
     nirf_rank = Column(Integer, nullable=True)
 
 class IIITBranch(Base):
@@ -33,6 +34,9 @@ class IIITCutoff(Base):
     branch_id = Column(Integer, ForeignKey("iiit_branches.branch_id"), nullable=False, index=True)
     year = Column(Integer, nullable=False, index=True)
     category = Column(String, nullable=False, index=True)
+    gender = Column(String, nullable=False, default="Gender-Neutral", index=True)
+    pwd = Column(Boolean, nullable=False, default=False)
+    opening_rank = Column(Integer, nullable=True)
     closing_rank = Column(Integer, nullable=False)
     round = Column(Integer, nullable=False, index=True)
     quota = Column(String, nullable=True)
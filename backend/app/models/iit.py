@@ -14,4 +14,5 @@ class IIT(Base):
     id = Column(Integer, primary_key=True, index=True, name="iit_id")
     name = Column(String, nullable=False, index=True)
     location = Column(String, nullable=True)
+    state = Column(String, nullable=True)
     nirf_rank = Column(Integer, nullable=True)
@@ -3,7 +3,7 @@ SQLAlchemy model for JEE Mains Cutoff View.
 Maps to the 'jee_mains_cutoffs' SQL view.
 """
 
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Boolean, Column, Integer, String
 from app.core.database import Base
 
 
@@ -22,10 +22,16 @@ class JeeMainsCutoff(Base):
     
     institute_id = Column(Integer)
     institute_name = Column(String)
+    institute_state = Column(String)
+    institute_location = Column(String)
+    nirf_rank = Column(Integer)
     branch_id = Column(Integer)
     branch_name = Column(String)
     year = Column(Integer)
     category = Column(String)
+    gender = Column(String)
+    pwd = Column(Boolean)
+    opening_rank = Column(Integer)
     closing_rank = Column(Integer)
     round = Column(Integer)
     quota = Column(String)
@@ -1,4 +1,5 @@
 from sqlalchemy import Column, String, Integer, JSON, DateTime, ForeignKey, Text
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from app.core.database import Base
@@ -20,7 +21,12 @@ class Session(Base):
     state = Column(String)
     
     history = Column(JSONB)
-    recommendations = Column(JSONB)
+    # Deferred: the recommendations payload is large and most session reads
+    # (state checks, chat history) never need it. It is only SELECTed when
+    # the attribute is accessed.
+    recommendations = deferred(Column(JSONB))
+    # Rolling summary of messages that aged out of `history`
+    history_summary = Column(Text)
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
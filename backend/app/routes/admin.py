@@ -0,0 +1,50 @@
+"""
+Admin API: cutoff snapshot status and hot reload.
+Protected by the X-Admin-Token header (settings.ADMIN_TOKEN).
+"""
+
+import hmac
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Header, Query
+from fastapi.responses import JSONResponse
+from app.core.config import settings
+from app.services.snapshot_manager import snapshot_manager
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+def require_admin(x_admin_token: Optional[str] = Header(default=None)) -> None:
+    """Reject requests without the configured admin token."""
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Admin API is disabled (ADMIN_TOKEN not set)")
+    if not x_admin_token or not hmac.compare_digest(x_admin_token, settings.ADMIN_TOKEN):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+
+
+@router.get("/snapshot", dependencies=[Depends(require_admin)])
+async def get_snapshot_status():
+    """Live snapshot version, row counts and last reload error."""
+    return snapshot_manager.status()
+
+
+@router.post("/snapshot/reload", dependencies=[Depends(require_admin)])
+def reload_snapshot(wait: bool = Query(default=False, description="Block until the reload finishes")):
+    """
+    Rebuild the cutoff snapshot from CUTOFF_SNAPSHOT_DIR and swap it in.
+    Requests keep being served from the current snapshot meanwhile.
+    """
+    if not settings.CUTOFF_SNAPSHOT_DIR:
+        raise HTTPException(status_code=400, detail="CUTOFF_SNAPSHOT_DIR is not configured")
+
+    if not wait:
+        started = snapshot_manager.reload_in_background()
+        return JSONResponse(
+            status_code=202,
+            content={"status": "started" if started else "already_running", **snapshot_manager.status()}
+        )
+
+    try:
+        snapshot_manager.reload()
+    except Exception as e:
+        raise HTTPException(status_code=422, detail=f"Snapshot reload failed, previous snapshot kept: {e}")
+    return snapshot_manager.status()
@@ -13,13 +13,15 @@ from app.services.llm_service import LLMService
 
 router = APIRouter(prefix="/chat", tags=["chat"])
 
-session_service = SessionService()
 rank_filter_service = RankFilterService()
 llm_service = LLMService()
+# Older turns are folded into a rolling summary by the LLM
+session_service = SessionService(summarizer=llm_service.summarize_conversation)
 
 @router.post("/start", response_model=ChatSession)
 async def start_session(
     request: SessionCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
@@ -38,7 +40,9 @@ async def start_session(
             db=db,
             rank=request.rank,
             category=request.category,
-            year=request.year
+            year=request.year,
+            gender=request.gender,
+            pwd=request.pwd
         )
         
         # Determine strict state transition
@@ -56,7 +60,7 @@ async def start_session(
         )
         
         # Add system/assistant welcome message to history
-        session_service.add_message(db, session.session_id, Role.ASSISTANT, summary)
+        session_service.add_message(db, session.session_id, Role.ASSISTANT, summary, background_tasks)
         
         # Store recommendations in session for context
         from app.schemas.response import RecommendationResponse, FilteredComparisonItem
@@ -93,6 +97,7 @@ async def start_session(
 async def send_message(
     session_id: str,
     request: ChatRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
@@ -100,7 +105,7 @@ async def send_message(
     Send a message to the counselor.
     Returns the AI response and current session state.
     """
-    session = session_service.get_session(db, session_id)
+    session = session_service.get_session(db, session_id, include_history=False)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
         
@@ -111,7 +116,7 @@ async def send_message(
         raise HTTPException(status_code=403, detail="Not authorized")
 
     # 1. Add user message to history
-    session_service.add_message(db, session_id, Role.USER, request.message)
+    session_service.add_message(db, session_id, Role.USER, request.message, background_tasks)
     
     # 2. Generate response based on state and context
     response_text = ""
@@ -128,13 +133,14 @@ async def send_message(
                 query=None,
                 safe=session.recommendations.safe,
                 moderate=session.recommendations.moderate,
-                ambitious=session.recommendations.ambitious
+                ambitious=session.recommendations.ambitious,
+                year=session.year
             )
             session.recommendations.full_report = report
             session_service.set_recommendations(db, session_id, session.recommendations)
             
         response_text = "I've prepared your full counseling report. You can view it now. Do you have any specific questions about it?"
-        session_service.add_message(db, session_id, Role.ASSISTANT, response_text)
+        session_service.add_message(db, session_id, Role.ASSISTANT, response_text, background_tasks)
         
         return ChatResponse(
             session_id=session_id,
@@ -145,16 +151,21 @@ async def send_message(
         
     # Standard Chat Flow (Follow-up)
     history_str = session_service.get_formatted_history(db, session_id)
+    # Cutoffs of the institutes/branches the student named (entity dictionary lookup)
+    mentioned = rank_filter_service.get_mentioned_cutoffs(
+        request.message, session.rank, session.category, session.year
+    )
     
     response_text = llm_service.generate_chat_response(
         rank=session.rank,
         category=session.category,
         message=request.message,
         history_str=history_str,
-        recommendations=session.recommendations
+        recommendations=session.recommendations,
+        mentioned=mentioned
     )
     
-    session_service.add_message(db, session_id, Role.ASSISTANT, response_text)
+    session_service.add_message(db, session_id, Role.ASSISTANT, response_text, background_tasks)
     
     return ChatResponse(
         session_id=session_id,
@@ -171,7 +182,7 @@ async def generate_full_report_endpoint(
     """
     Generate the full counseling report on demand.
     """
-    session = session_service.get_session(db, session_id)
+    session = session_service.get_session(db, session_id, include_history=False)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     
@@ -198,7 +209,8 @@ async def generate_full_report_endpoint(
             query=None,
             safe=session.recommendations.safe,
             moderate=session.recommendations.moderate,
-            ambitious=session.recommendations.ambitious
+            ambitious=session.recommendations.ambitious,
+            year=session.year
         )
         
         # Update session state and data
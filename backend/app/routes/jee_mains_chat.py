@@ -3,33 +3,57 @@ API routes for JEE Mains session-based counseling chat.
 Mirrors chat.py but uses JEE Mains data (NITs, IIITs, GFTIs).
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 from app.core.database import get_db
 from app.core.deps import get_current_user
+from app.schemas.request import check_year
 from app.schemas.session import ChatResponse, ChatRequest, SessionState, ChatSession, Role
 from app.services.session_service import SessionService
 from app.services.jee_mains_rank_filter import JeeMainsRankFilterService
+from app.services.cutoff_index import canonical_home_state
 from app.services.llm_service import LLMService
 
 router = APIRouter(prefix="/jee-mains-chat", tags=["jee-mains-chat"])
 
-session_service = SessionService()
 rank_filter_service = JeeMainsRankFilterService()
 llm_service = LLMService()
+# Older turns are folded into a rolling summary by the LLM
+session_service = SessionService(summarizer=llm_service.summarize_conversation)
 
 class JeeMainsSessionCreate(BaseModel):
     rank: int
     category: str
     year: int = 2024
+    gender: Optional[str] = None
+    pwd: bool = False
+    quotas: Optional[List[str]] = None
+    home_state: Optional[str] = None
     query: Optional[str] = None
     institute_types: Optional[List[str]] = ["NIT", "IIIT", "GFTI"]
 
+    @field_validator("year")
+    @classmethod
+    def validate_year(cls, v: int) -> int:
+        return check_year(v)
+
+    @field_validator("home_state")
+    @classmethod
+    def validate_home_state(cls, v: Optional[str]) -> Optional[str]:
+        """Canonical spelling of the home state, which decides HS/OS eligibility."""
+        if v is None:
+            return v
+        state = canonical_home_state(v)
+        if state is None:
+            raise ValueError(f"Unknown home state: {v}")
+        return state
+
 @router.post("/start", response_model=ChatSession)
 async def start_jee_mains_session(
     request: JeeMainsSessionCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
@@ -56,7 +80,11 @@ async def start_jee_mains_session(
             rank=request.rank,
             category=request.category,
             year=request.year,
-            institute_types=request.institute_types
+            institute_types=request.institute_types,
+            gender=request.gender,
+            pwd=request.pwd,
+            quotas=request.quotas,
+            home_state=request.home_state
         )
         
         session_service.update_state(db, session.session_id, SessionState.SUMMARY_SHOWN)
@@ -71,7 +99,7 @@ async def start_jee_mains_session(
             ambitious=ambitious
         )
         
-        session_service.add_message(db, session.session_id, Role.ASSISTANT, summary)
+        session_service.add_message(db, session.session_id, Role.ASSISTANT, summary, background_tasks)
         
         # Store recommendations
         from app.schemas.response import RecommendationResponse, FilteredComparisonItem
@@ -107,11 +135,12 @@ async def start_jee_mains_session(
 async def send_jee_mains_message(
     session_id: str,
     request: ChatRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """Send a message to the JEE Mains counselor."""
-    session = session_service.get_session(db, session_id)
+    session = session_service.get_session(db, session_id, include_history=False)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     
@@ -121,7 +150,7 @@ async def send_jee_mains_message(
     if str(db_sess.user_id) != current_user.get("sub"):
         raise HTTPException(status_code=403, detail="Not authorized")
 
-    session_service.add_message(db, session_id, Role.USER, request.message)
+    session_service.add_message(db, session_id, Role.USER, request.message, background_tasks)
     
     # Check for full report request
     if "full report" in request.message.lower() and session.state != SessionState.REPORT_SHOWN:
@@ -134,13 +163,14 @@ async def send_jee_mains_message(
                 query=None,
                 safe=session.recommendations.safe,
                 moderate=session.recommendations.moderate,
-                ambitious=session.recommendations.ambitious
+                ambitious=session.recommendations.ambitious,
+                year=session.year
             )
             session.recommendations.full_report = report
             session_service.set_recommendations(db, session_id, session.recommendations)
         
         response_text = "I've prepared your full counseling report for NITs, IIITs, and GFTIs. You can view it now."
-        session_service.add_message(db, session_id, Role.ASSISTANT, response_text)
+        session_service.add_message(db, session_id, Role.ASSISTANT, response_text, background_tasks)
         
         return ChatResponse(
             session_id=session_id,
@@ -151,16 +181,21 @@ async def send_jee_mains_message(
     
     # Standard chat
     history_str = session_service.get_formatted_history(db, session_id)
+    # Cutoffs of the institutes/branches the student named (entity dictionary lookup)
+    mentioned = rank_filter_service.get_mentioned_cutoffs(
+        request.message, session.rank, session.category, session.year
+    )
     
     response_text = llm_service.generate_chat_response(
         rank=session.rank,
         category=session.category,
         message=request.message,
         history_str=history_str,
-        recommendations=session.recommendations
+        recommendations=session.recommendations,
+        mentioned=mentioned
     )
     
-    session_service.add_message(db, session_id, Role.ASSISTANT, response_text)
+    session_service.add_message(db, session_id, Role.ASSISTANT, response_text, background_tasks)
     
     return ChatResponse(
         session_id=session_id,
@@ -176,7 +211,7 @@ async def generate_jee_mains_full_report(
     current_user: dict = Depends(get_current_user)
 ):
     """Generate the full JEE Mains counseling report on demand."""
-    session = session_service.get_session(db, session_id)
+    session = session_service.get_session(db, session_id, include_history=False)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     
@@ -200,7 +235,8 @@ async def generate_jee_mains_full_report(
             query=None,
             safe=session.recommendations.safe,
             moderate=session.recommendations.moderate,
-            ambitious=session.recommendations.ambitious
+            ambitious=session.recommendations.ambitious,
+            year=session.year
         )
         
         session.recommendations.full_report = report
@@ -3,14 +3,29 @@ Recommendation API endpoint.
 """
 
 import logging
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Header, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import text
+from app.core.config import settings
 from app.core.database import get_db
-from app.schemas.request import RecommendationRequest
-from app.schemas.response import RecommendationResponse, FilteredComparisonItem
+from app.core.dataset_version import dataset_version, make_etag, etag_matches
+from app.core.responses import PydanticJSONResponse
+from app.schemas.request import RecommendationRequest, BatchRecommendationRequest, ChoiceListRequest, check_year
+from app.schemas.response import (
+    RecommendationResponse, RecommendationPage, FilteredComparisonItem, RangeMatch, RangeMatchResponse,
+    ChoiceListResponse
+)
 from app.services.rank_filter import RankFilterService
+from app.services.jee_mains_rank_filter import JeeMainsRankFilterService
 from app.services.llm_service import LLMService
+from app.services.recommendation_cache import recommendation_cache, encode_cursor, decode_cursor
+from app.services.snapshot_manager import snapshot_manager
+from app.services.cutoff_index import canonical_home_state
+from app.services.batch_recommender import iter_batch_results, to_ndjson
+from app.services.choice_list import optimize_choices
+from app.utils.constants import VALID_CATEGORIES, VALID_GENDERS, RANGE_TOLERANCE, RANGE_MATCH_LIMIT
 
 logger = logging.getLogger(__name__)
 
@@ -18,14 +33,18 @@ router = APIRouter(prefix="/recommend", tags=["recommendations"])
 
 # Initialize services
 rank_filter_service = RankFilterService()
+jee_mains_filter_service = JeeMainsRankFilterService()
 llm_service = LLMService()
 
+BUCKETS = ("safe", "moderate", "ambitious")
 
-@router.post("", response_model=RecommendationResponse)
+
+@router.post("", response_model=RecommendationResponse, response_class=PydanticJSONResponse)
 async def get_recommendations(
     request: RecommendationRequest,
-    db: Session = Depends(get_db)
-) -> RecommendationResponse:
+    db: Session = Depends(get_db),
+    if_none_match: Optional[str] = Header(default=None)
+) -> Response:
     """
     Get IIT and branch recommendations based on JEE Advanced rank.
     
@@ -33,134 +52,41 @@ async def get_recommendations(
     1. Filters eligible options using deterministic logic (no LLM)
     2. Categorizes results into Safe / Moderate / Ambitious
     3. Optionally generates LLM counseling explanation
+    
+    Use `limit_per_bucket` to receive only the first items of each list (the
+    rest is paged from the cached result via /recommend/page) and `fields`
+    to project the response, e.g. omit `full_report`.
+    
+    Responses carry an ETag of the rendered body and the cutoff dataset
+    version; a matching `If-None-Match` returns 304 without the body. The
+    body includes LLM text, which is only regenerated once the cached
+    result is evicted, so a recomputed answer gets a new ETag.
     """
     try:
-        # Test database connection first
-        try:
-            db.execute(text("SELECT 1"))
-        except Exception as db_error:
-            logger.error(f"Database connection error: {db_error}")
-            raise HTTPException(
-                status_code=500,
-                detail=f"Database connection failed: {str(db_error)}"
-            )
-        
-        # Check if tables exist
-        try:
-            tables_check = db.execute(text("""
-                SELECT table_name 
-                FROM information_schema.tables 
-                WHERE table_schema = 'public' 
-                AND table_name IN ('iits', 'branches', 'cutoffs')
-            """))
-            existing_tables = [row[0] for row in tables_check]
-            if len(existing_tables) < 3:
-                missing = set(['iits', 'branches', 'cutoffs']) - set(existing_tables)
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Missing tables in database: {', '.join(missing)}. Please import data first."
-                )
-        except HTTPException:
-            raise
-        except Exception as table_error:
-            logger.warning(f"Could not check tables: {table_error}")
-            # Continue anyway - might be permission issue
-        
-        # Get categorized recommendations using deterministic filtering
-        safe, moderate, ambitious = rank_filter_service.get_recommendations(
-            db=db,
-            rank=request.rank,
-            category=request.category,
-            year=request.year,
-            round_number=5
-        )
-        
-        # Generate Layer 1: Counselor Summary (brief)
-        counselor_summary = llm_service.generate_counselor_summary(
-            rank=request.rank,
-            category=request.category,
-            query=request.query,
-            safe=safe,
-            moderate=moderate,
-            ambitious=ambitious
-        )
-        
-        # Generate appropriate response based on whether this is a follow-up query
-        if request.query and len(request.query.strip()) > 0:
-            # This is a follow-up question - generate contextual response
-            full_report = llm_service.generate_followup_response(
-                rank=request.rank,
-                category=request.category,
-                user_query=request.query,
-                safe=safe,
-                moderate=moderate,
-                ambitious=ambitious
-            )
-        else:
-            # This is initial recommendation - generate full report
-            full_report = llm_service.generate_full_report(
-                rank=request.rank,
-                category=request.category,
-                query=request.query,
-                safe=safe,
-                moderate=moderate,
-                ambitious=ambitious
-            )
-        
-        # Generate Layer 2: Filtered Comparison (top 3-5 per category)
-        def get_admission_probability(confidence: str) -> str:
-            """Map confidence to admission probability."""
-            if confidence == "safe":
-                return "High"
-            elif confidence == "moderate":
-                return "Medium"
-            else:
-                return "Low"
-        
-        filtered_comparison = []
-        
-        # Add top 3 safe options
-        for item in safe[:3]:
-            filtered_comparison.append(FilteredComparisonItem(
-                category="safe",
-                iit=item.iit,
-                branch=item.branch,
-                closing_rank=item.closing_rank,
-                admission_probability=get_admission_probability(item.confidence),
-                location=item.location
-            ))
+        cache_key = recommendation_cache.key_for(request)
+        version = dataset_version.current(db)
         
-        # Add top 3 moderate options
-        for item in moderate[:3]:
-            filtered_comparison.append(FilteredComparisonItem(
-                category="moderate",
-                iit=item.iit,
-                branch=item.branch,
-                closing_rank=item.closing_rank,
-                admission_probability=get_admission_probability(item.confidence),
-                location=item.location
-            ))
+        full_response = recommendation_cache.get(cache_key, version)
+        if full_response is None:
+            full_response = _compute_recommendations(request, db)
+            recommendation_cache.put(cache_key, full_response, version)
         
-        # Add top 3 ambitious options
-        for item in ambitious[:3]:
-            filtered_comparison.append(FilteredComparisonItem(
-                category="ambitious",
-                iit=item.iit,
-                branch=item.branch,
-                closing_rank=item.closing_rank,
-                admission_probability=get_admission_probability(item.confidence),
-                location=item.location
-            ))
+        response = full_response
+        include = set(request.fields) if request.fields else None
+        if request.limit_per_bucket:
+            response = _first_page(full_response, cache_key, request.limit_per_bucket)
+            if include is not None:
+                include |= {"totals", "next_cursors"}
         
-        # Return structured layered response
-        return RecommendationResponse(
-            counselor_summary=counselor_summary,
-            filtered_comparison=filtered_comparison,
-            full_report=full_report,
-            safe=safe,
-            moderate=moderate,
-            ambitious=ambitious
-        )
+        # Serialized directly to JSON bytes by the compiled schema serializer
+        # (no re-validation / jsonable_encoder pass)
+        rendered = PydanticJSONResponse(response, include=include)
+        etag = make_etag(rendered.body, version)
+        headers = {"ETag": etag, "X-Dataset-Version": version}
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+        rendered.headers.update(headers)
+        return rendered
     
     except HTTPException:
         # Re-raise HTTP exceptions as-is
@@ -177,3 +103,357 @@ async def get_recommendations(
             status_code=500,
             detail=f"Error processing recommendation request: {str(e)}. Check server logs for details."
         )
+
+
+@router.get("/page", response_model=RecommendationPage, response_class=PydanticJSONResponse)
+async def get_recommendation_page(
+    cursor: str = Query(..., description="Cursor from next_cursors / next_cursor"),
+    limit: int = Query(default=20, ge=1, le=500),
+    if_none_match: Optional[str] = Header(default=None)
+) -> Response:
+    """Continue one bucket of a previous /recommend response from the cache."""
+    try:
+        cache_key, bucket, offset = decode_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if bucket not in BUCKETS:
+        raise HTTPException(status_code=400, detail=f"Invalid bucket in cursor: {bucket}")
+    
+    # Only a result produced under the current version is served
+    version = dataset_version.current()
+    full_response = recommendation_cache.get(cache_key, version)
+    if full_response is None:
+        raise HTTPException(
+            status_code=410,
+            detail="Cursor expired. Please repeat the recommendation request."
+        )
+    
+    etag = make_etag(cursor, limit, version)
+    headers = {"ETag": etag, "X-Dataset-Version": version}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    
+    items = getattr(full_response, bucket)
+    if offset >= len(items):
+        raise HTTPException(status_code=400, detail=f"Cursor offset {offset} is past the end of {bucket}")
+    end = offset + limit
+    return PydanticJSONResponse(RecommendationPage(
+        bucket=bucket,
+        items=items[offset:end],
+        total=len(items),
+        next_cursor=encode_cursor(cache_key, bucket, end) if end < len(items) else None
+    ), headers=headers)
+
+
+@router.get("/range", response_model=RangeMatchResponse, response_class=PydanticJSONResponse)
+async def get_range_matches(
+    rank: int = Query(..., ge=1, description="JEE Advanced or JEE Mains rank"),
+    category: str = Query(..., description="Category: GEN, OBC, SC, ST, or EWS"),
+    exam: str = Query(default="advanced", pattern="^(advanced|mains)$"),
+    year: int = Query(default=2024, description="Counseling year with cutoff data"),
+    round_number: int = Query(default=5, ge=1, le=6, alias="round", description="JOSAA round"),
+    gender: Optional[str] = Query(default=None, description="MALE, FEMALE or OTHER"),
+    pwd: bool = Query(default=False, description="Match PwD-reserved seats"),
+    quota: Optional[List[str]] = Query(
+        default=None, description="JEE Mains quotas to match (repeatable); default AI, HS and OS"
+    ),
+    home_state: Optional[str] = Query(
+        default=None, description="JEE Mains: candidate's home state; matches HS/OS seats by eligibility"
+    ),
+    tolerance: float = Query(
+        default=RANGE_TOLERANCE, ge=0, le=1, description="Also match ranges missing the rank by <= rank * tolerance"
+    ),
+    limit: int = Query(default=RANGE_MATCH_LIMIT, ge=1, le=500),
+    db: Session = Depends(get_db)
+) -> Response:
+    """
+    Seats whose admitted range [opening rank, closing rank] in the given
+    round contains the rank or misses it by at most rank * tolerance.
+    Each match reports where the rank lands inside the range (`position`:
+    0 at the opening rank, 1 at the closing rank). Only the candidate's
+    seat pools are matched (see `gender`, `pwd` and, for JEE Mains, `quota`
+    and `home_state`).
+    """
+    category = category.upper()
+    if category not in VALID_CATEGORIES:
+        raise HTTPException(status_code=422, detail=f"Category must be one of {VALID_CATEGORIES}")
+    try:
+        check_year(year)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    if gender is not None:
+        gender = gender.upper()
+        if gender not in VALID_GENDERS:
+            raise HTTPException(status_code=422, detail=f"Gender must be one of {VALID_GENDERS}")
+    if home_state is not None:
+        state = canonical_home_state(home_state)
+        if state is None:
+            raise HTTPException(status_code=422, detail=f"Unknown home state: {home_state}")
+        home_state = state
+    
+    if exam == "advanced":
+        matches = rank_filter_service.get_range_matches(
+            db, rank, category, year, round_number=round_number, gender=gender, pwd=pwd,
+            tolerance=tolerance, limit=limit
+        )
+    else:
+        matches = jee_mains_filter_service.get_range_matches(
+            db, rank, category, year, round_number=round_number, gender=gender, pwd=pwd,
+            quotas=[q.upper() for q in quota] if quota else None, home_state=home_state,
+            tolerance=tolerance, limit=limit
+        )
+    return PydanticJSONResponse(RangeMatchResponse(
+        exam=exam,
+        rank=rank,
+        category=category,
+        year=year,
+        round=round_number,
+        gender=gender,
+        pwd=pwd,
+        home_state=home_state,
+        tolerance=tolerance,
+        matches=[RangeMatch(**match) for match in matches]
+    ), headers={"X-Dataset-Version": dataset_version.current(db)})
+
+
+@router.post("/choices", response_model=ChoiceListResponse, response_class=PydanticJSONResponse)
+def get_choice_list(request: ChoiceListRequest) -> Response:
+    """
+    Optimized JoSAA choice list: the seats of the candidate's pools worth
+    listing, in the order to list them, maximizing expected utility under
+    each seat's per-round admission probabilities. Utility weighs branch,
+    institute, location and placement scores (see app/services/choice_list.py).
+    """
+    snapshot = snapshot_manager.current()
+    if snapshot is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Choice lists need the in-memory cutoff snapshot, which is not loaded"
+        )
+    
+    preferred_branches = []
+    for name in request.preferred_branches:
+        entity_id = snapshot.entities.resolve_branch(name)
+        if entity_id is None:
+            raise HTTPException(status_code=422, detail=f"Unknown branch: {name}")
+        preferred_branches.append(entity_id)
+    
+    if request.exam == "advanced":
+        table = snapshot.advanced
+        rows = table.seat_rows(request.category, request.year, request.gender, request.pwd)
+    else:
+        table = snapshot.mains
+        rows = table.seat_rows(
+            request.category, request.year, request.gender, request.pwd,
+            request.quotas, request.home_state, request.institute_types
+        )
+    weights = request.weights.model_dump()
+    result = optimize_choices(
+        table, rows, request.rank, weights,
+        preferred_branches=preferred_branches,
+        preferred_states=request.preferred_states,
+        max_choices=request.max_choices
+    )
+    return PydanticJSONResponse(ChoiceListResponse(
+        exam=request.exam,
+        rank=request.rank,
+        category=request.category,
+        year=request.year,
+        gender=request.gender,
+        pwd=request.pwd,
+        home_state=request.home_state if request.exam == "mains" else None,
+        weights=weights,
+        **result
+    ), headers={"X-Dataset-Version": snapshot.version})
+
+
+@router.post("/batch", response_class=StreamingResponse)
+def get_batch_recommendations(request: BatchRecommendationRequest) -> StreamingResponse:
+    """
+    Deterministic recommendations for many students in one call.
+    
+    Streams one JSON object per line (application/x-ndjson) in request
+    order; see BatchRecommendationResult. No LLM is called: with
+    `include_report` each line carries the templated fallback report.
+    The whole batch is evaluated against one cutoff snapshot, even if a
+    reload happens mid-stream.
+    """
+    if len(request.students) > settings.BATCH_MAX_STUDENTS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch too large: {len(request.students)} students (max {settings.BATCH_MAX_STUDENTS})"
+        )
+    snapshot = snapshot_manager.current()
+    if snapshot is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Batch recommendations need the in-memory cutoff snapshot, which is not loaded"
+        )
+    
+    results = iter_batch_results(snapshot, request.students, include_report=request.include_report)
+    return StreamingResponse(
+        to_ndjson(results),
+        media_type="application/x-ndjson",
+        headers={"X-Dataset-Version": snapshot.version}
+    )
+
+
+def _first_page(full_response: RecommendationResponse, cache_key: str, limit: int) -> RecommendationResponse:
+    """Copy of the response with each bucket cut to `limit` items plus continuation cursors."""
+    update = {"totals": {}, "next_cursors": {}}
+    for bucket in BUCKETS:
+        items = getattr(full_response, bucket)
+        update[bucket] = items[:limit]
+        update["totals"][bucket] = len(items)
+        if len(items) > limit:
+            update["next_cursors"][bucket] = encode_cursor(cache_key, bucket, limit)
+    return full_response.model_copy(update=update)
+
+
+def _check_database(db: Session) -> None:
+    """Fail fast with a clear error when the database is unusable."""
+    # Test database connection first
+    try:
+        db.execute(text("SELECT 1"))
+    except Exception as db_error:
+        logger.error(f"Database connection error: {db_error}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Database connection failed: {str(db_error)}"
+        )
+    
+    # Check if tables exist
+    try:
+        tables_check = db.execute(text("""
+            SELECT table_name 
+            FROM information_schema.tables 
+            WHERE table_schema = 'public' 
+            AND table_name IN ('iits', 'branches', 'cutoffs')
+        """))
+        existing_tables = [row[0] for row in tables_check]
+        if len(existing_tables) < 3:
+            missing = set(['iits', 'branches', 'cutoffs']) - set(existing_tables)
+            raise HTTPException(
+                status_code=500,
+                detail=f"Missing tables in database: {', '.join(missing)}. Please import data first."
+            )
+    except HTTPException:
+        raise
+    except Exception as table_error:
+        logger.warning(f"Could not check tables: {table_error}")
+        # Continue anyway - might be permission issue
+
+
+def _compute_recommendations(request: RecommendationRequest, db: Session) -> RecommendationResponse:
+    """Run filtering and LLM generation for a request (cache miss path)."""
+    # The database is only queried when no in-memory snapshot is loaded
+    if snapshot_manager.current() is None:
+        _check_database(db)
+    
+    # Get categorized recommendations using deterministic filtering
+    safe, moderate, ambitious = rank_filter_service.get_recommendations(
+        db=db,
+        rank=request.rank,
+        category=request.category,
+        year=request.year,
+        gender=request.gender,
+        pwd=request.pwd
+    )
+    # Chance of landing at least one option per bucket (snapshot only; reuses
+    # the simulation that filled the items' Monte Carlo fields)
+    admission_outlook = rank_filter_service.get_outlook(
+        rank=request.rank,
+        category=request.category,
+        year=request.year,
+        gender=request.gender,
+        pwd=request.pwd
+    )
+    
+    # Generate Layer 1: Counselor Summary (brief)
+    counselor_summary = llm_service.generate_counselor_summary(
+        rank=request.rank,
+        category=request.category,
+        query=request.query,
+        safe=safe,
+        moderate=moderate,
+        ambitious=ambitious
+    )
+    
+    # Generate appropriate response based on whether this is a follow-up query
+    if request.query and len(request.query.strip()) > 0:
+        # This is a follow-up question - generate contextual response
+        full_report = llm_service.generate_followup_response(
+            rank=request.rank,
+            category=request.category,
+            user_query=request.query,
+            safe=safe,
+            moderate=moderate,
+            ambitious=ambitious
+        )
+    else:
+        # This is initial recommendation - generate full report
+        full_report = llm_service.generate_full_report(
+            rank=request.rank,
+            category=request.category,
+            query=request.query,
+            safe=safe,
+            moderate=moderate,
+            ambitious=ambitious,
+            year=request.year
+        )
+    
+    # Generate Layer 2: Filtered Comparison (top 3-5 per category)
+    def get_admission_probability(confidence: str) -> str:
+        """Map confidence to admission probability."""
+        if confidence == "safe":
+            return "High"
+        elif confidence == "moderate":
+            return "Medium"
+        else:
+            return "Low"
+    
+    filtered_comparison = []
+    
+    # Add top 3 safe options
+    for item in safe[:3]:
+        filtered_comparison.append(FilteredComparisonItem(
+            category="safe",
+            iit=item.iit,
+            branch=item.branch,
+            closing_rank=item.closing_rank,
+            admission_probability=get_admission_probability(item.confidence),
+            location=item.location
+        ))
+    
+    # Add top 3 moderate options
+    for item in moderate[:3]:
+        filtered_comparison.append(FilteredComparisonItem(
+            category="moderate",
+            iit=item.iit,
+            branch=item.branch,
+            closing_rank=item.closing_rank,
+            admission_probability=get_admission_probability(item.confidence),
+            location=item.location
+        ))
+    
+    # Add top 3 ambitious options
+    for item in ambitious[:3]:
+        filtered_comparison.append(FilteredComparisonItem(
+            category="ambitious",
+            iit=item.iit,
+            branch=item.branch,
+            closing_rank=item.closing_rank,
+            admission_probability=get_admission_probability(item.confidence),
+            location=item.location
+        ))
+    
+    # Return structured layered response
+    return RecommendationResponse(
+        counselor_summary=counselor_summary,
+        filtered_comparison=filtered_comparison,
+        full_report=full_report,
+        safe=safe,
+        moderate=moderate,
+        ambitious=ambitious,
+        admission_outlook=admission_outlook
+    )
@@ -3,7 +3,19 @@ Pydantic schemas for request validation.
 """
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Optional
+from typing import List, Optional
+from app.schemas.response import RecommendationResponse
+from app.services.cutoff_index import canonical_home_state
+from app.services.snapshot_manager import snapshot_manager
+from app.utils.constants import VALID_CATEGORIES, VALID_GENDERS, CHOICE_MAX_CHOICES, CHOICE_MAX_CHOICES_LIMIT
+
+
+def check_year(year: int) -> int:
+    """Reject counseling years without cutoff data (see SnapshotManager.years)."""
+    years = snapshot_manager.years()
+    if year not in years:
+        raise ValueError(f"No cutoff data for {year}; available years: {', '.join(str(y) for y in years)}")
+    return year
 
 
 class RecommendationRequest(BaseModel):
@@ -11,27 +23,210 @@ class RecommendationRequest(BaseModel):
     
     rank: int = Field(..., ge=1, description="JEE Advanced rank")
     category: str = Field(..., description="Category: GEN, OBC, SC, ST, or EWS")
-    year: int = Field(default=2024, ge=2020, le=2025, description="Academic year")
+    year: int = Field(
+        default=2024,
+        description="Counseling year with cutoff data; the year after the latest data is served from projected cutoffs"
+    )
+    gender: Optional[str] = Field(
+        default=None,
+        description="MALE, FEMALE or OTHER; female candidates also match female-only (supernumerary) seats"
+    )
+    pwd: bool = Field(default=False, description="Match PwD-reserved seats; `rank` is then the PwD category rank")
     query: Optional[str] = Field(default=None, description="Optional user query for LLM context")
-    round: Optional[int] = Field(default=6, ge=1, le=6, description="JOSAA round (1-6)")
+    round: Optional[int] = Field(
+        default=6, ge=1, le=6,
+        description="JOSAA round (1-6); ignored, recommendations weigh the closing ranks of every round"
+    )
+    limit_per_bucket: Optional[int] = Field(
+        default=None, ge=1, le=500,
+        description="Return at most this many safe/moderate/ambitious items each; the rest via /recommend/page"
+    )
+    fields: Optional[List[str]] = Field(
+        default=None,
+        description="Response fields to include, e.g. ['counselor_summary', 'safe']. Default: all"
+    )
+    
+    @field_validator("year")
+    @classmethod
+    def validate_year(cls, v: int) -> int:
+        return check_year(v)
     
     @field_validator("category")
     @classmethod
     def validate_category(cls, v: str) -> str:
         """Validate category is one of the allowed values."""
-        valid_categories = ["GEN", "OBC", "SC", "ST", "EWS"]
         v_upper = v.upper()
-        if v_upper not in valid_categories:
-            raise ValueError(f"Category must be one of {valid_categories}")
+        if v_upper not in VALID_CATEGORIES:
+            raise ValueError(f"Category must be one of {VALID_CATEGORIES}")
+        return v_upper
+    
+    @field_validator("gender")
+    @classmethod
+    def validate_gender(cls, v: Optional[str]) -> Optional[str]:
+        """Validate gender is one of the allowed values."""
+        if v is None:
+            return v
+        v_upper = v.upper()
+        if v_upper not in VALID_GENDERS:
+            raise ValueError(f"Gender must be one of {VALID_GENDERS}")
         return v_upper
     
+    @field_validator("fields")
+    @classmethod
+    def validate_fields(cls, v: Optional[List[str]]) -> Optional[List[str]]:
+        """Validate projected fields exist on the response."""
+        if v is None:
+            return v
+        unknown = set(v) - set(RecommendationResponse.model_fields)
+        if unknown:
+            raise ValueError(f"Unknown response fields: {sorted(unknown)}")
+        return v
+    
     class Config:
         json_schema_extra = {
             "example": {
                 "rank": 5000,
                 "category": "GEN",
                 "year": 2024,
+                "gender": "FEMALE",
                 "query": "I prefer computer science and locations in South India",
                 "round": 6
             }
         }
+
+
+class BatchStudent(BaseModel):
+    """One student of a batch recommendation request."""
+    
+    id: Optional[str] = Field(default=None, description="Caller's student id, echoed in the result")
+    rank: int = Field(..., ge=1, description="JEE Advanced rank")
+    category: str = Field(..., description="Category: GEN, OBC, SC, ST, or EWS")
+    year: int = Field(
+        default=2024,
+        description="Counseling year with cutoff data; the year after the latest data is served from projected cutoffs"
+    )
+    gender: Optional[str] = Field(default=None, description="MALE, FEMALE or OTHER")
+    pwd: bool = Field(default=False, description="Match PwD-reserved seats")
+    round: Optional[int] = Field(default=6, ge=1, le=6, description="JOSAA round (1-6)")
+    
+    @field_validator("year")
+    @classmethod
+    def validate_year(cls, v: int) -> int:
+        return check_year(v)
+    
+    @field_validator("category")
+    @classmethod
+    def validate_category(cls, v: str) -> str:
+        return RecommendationRequest.validate_category(v)
+    
+    @field_validator("gender")
+    @classmethod
+    def validate_gender(cls, v: Optional[str]) -> Optional[str]:
+        return RecommendationRequest.validate_gender(v)
+
+
+class BatchRecommendationRequest(BaseModel):
+    """Request schema for bulk recommendations (streamed back as NDJSON)."""
+    
+    students: List[BatchStudent] = Field(..., min_length=1)
+    include_report: bool = Field(
+        default=False,
+        description="Add a templated counseling report (no LLM) to every result"
+    )
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "students": [
+                    {"id": "S-001", "rank": 5000, "category": "GEN", "year": 2024},
+                    {"id": "S-002", "rank": 12000, "category": "OBC", "year": 2024}
+                ],
+                "include_report": False
+            }
+        }
+
+
+class ChoiceWeights(BaseModel):
+    """Relative weights of the scores making up a seat's utility in a choice list."""
+    
+    branch: float = Field(default=1.0, ge=0, description="Preferred branches (or branch demand without any)")
+    institute: float = Field(default=1.0, ge=0, description="Institute demand (how low its closing ranks are)")
+    location: float = Field(default=0.5, ge=0, description="Institute in one of the preferred states")
+    placement: float = Field(default=0.5, ge=0, description="Average placement package")
+
+
+class ChoiceListRequest(BaseModel):
+    """Request schema for an optimized JoSAA choice list."""
+    
+    rank: int = Field(..., ge=1, description="JEE Advanced or JEE Mains rank")
+    category: str = Field(..., description="Category: GEN, OBC, SC, ST, or EWS")
+    exam: str = Field(default="advanced", pattern="^(advanced|mains)$")
+    year: int = Field(
+        default=2024,
+        description="Counseling year with cutoff data; the year after the latest data is served from projected cutoffs"
+    )
+    gender: Optional[str] = Field(default=None, description="MALE, FEMALE or OTHER")
+    pwd: bool = Field(default=False, description="Match PwD-reserved seats; `rank` is then the PwD category rank")
+    quotas: Optional[List[str]] = Field(default=None, description="JEE Mains quotas; default AI, HS and OS")
+    home_state: Optional[str] = Field(default=None, description="JEE Mains: home state, for HS/OS eligibility")
+    institute_types: Optional[List[str]] = Field(default=None, description="JEE Mains: NIT, IIIT and/or GFTI")
+    preferred_branches: List[str] = Field(default=[], description="Branch names or abbreviations, most wanted first")
+    preferred_states: List[str] = Field(default=[], description="States scored by the location weight")
+    weights: ChoiceWeights = Field(default_factory=ChoiceWeights)
+    max_choices: int = Field(default=CHOICE_MAX_CHOICES, ge=1, le=CHOICE_MAX_CHOICES_LIMIT)
+    
+    @field_validator("year")
+    @classmethod
+    def validate_year(cls, v: int) -> int:
+        return check_year(v)
+    
+    @field_validator("category")
+    @classmethod
+    def validate_category(cls, v: str) -> str:
+        return RecommendationRequest.validate_category(v)
+    
+    @field_validator("gender")
+    @classmethod
+    def validate_gender(cls, v: Optional[str]) -> Optional[str]:
+        return RecommendationRequest.validate_gender(v)
+    
+    @field_validator("quotas", "institute_types")
+    @classmethod
+    def validate_codes(cls, v: Optional[List[str]]) -> Optional[List[str]]:
+        return [code.upper() for code in v] if v is not None else v
+    
+    @field_validator("home_state")
+    @classmethod
+    def validate_home_state(cls, v: Optional[str]) -> Optional[str]:
+        if v is None:
+            return v
+        state = canonical_home_state(v)
+        if state is None:
+            raise ValueError(f"Unknown home state: {v}")
+        return state
+    
+    @field_validator("preferred_states")
+    @classmethod
+    def validate_preferred_states(cls, v: List[str]) -> List[str]:
+        return [cls.validate_home_state(state) for state in v]
+    
+    @field_validator("weights")
+    @classmethod
+    def validate_weights(cls, v: ChoiceWeights) -> ChoiceWeights:
+        if not any(v.model_dump().values()):
+            raise ValueError("At least one weight must be positive")
+        return v
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "rank": 12000,
+                "category": "GEN",
+                "exam": "mains",
+                "home_state": "Karnataka",
+                "preferred_branches": ["CSE", "ECE"],
+                "preferred_states": ["Karnataka", "Tamil Nadu"],
+                "weights": {"branch": 2, "institute": 1, "location": 0.5, "placement": 1},
+                "max_choices": 30
+            }
+        }
@@ -2,8 +2,8 @@
 Pydantic schemas for API responses.
 """
 
-from pydantic import BaseModel
-from typing import List, Optional
+from pydantic import BaseModel, TypeAdapter
+from typing import Dict, List, Optional
 
 
 class RecommendationItem(BaseModel):
@@ -13,8 +13,24 @@ class RecommendationItem(BaseModel):
     branch: str
     closing_rank: int
     confidence: str  # "safe", "moderate", or "ambitious"
+    admission_probability: Optional[float] = None  # band that decided `confidence`
+    # Monte Carlo outlook (in-memory snapshot only): share of simulated years
+    # admitting the rank, and the central interval of the simulated closing rank
+    admission_frequency: Optional[float] = None
+    closing_rank_low: Optional[int] = None
+    closing_rank_high: Optional[int] = None
     location: Optional[str] = None
     nirf_rank: Optional[int] = None
+    gender: Optional[str] = None  # seat pool: "Gender-Neutral" or "Female-only"
+    quota: Optional[str] = None  # JEE Mains quota (AI, HS, OS, ...)
+    # Placement packages in rupees per annum
+    average_package: Optional[int] = None
+    highest_package: Optional[int] = None
+    # Fees in rupees per semester (tuition + other fees) by JoSAA income band
+    fee_above_5l: Optional[int] = None
+    fee_1l_to_5l: Optional[int] = None
+    fee_below_1l: Optional[int] = None
+    fee_reserved: Optional[int] = None  # SC/ST/PwD
     
     class Config:
         json_schema_extra = {
@@ -23,12 +39,20 @@ class RecommendationItem(BaseModel):
                 "branch_name": "Computer Science and Engineering",
                 "closing_rank": 4500,
                 "confidence": "safe",
+                "admission_probability": 0.93,
                 "location": "Chennai, Tamil Nadu",
-                "nirf_rank": 1
+                "nirf_rank": 1,
+                "average_package": 1700000,
+                "highest_package": 13100000
             }
         }
 
 
+# Bulk constructor for recommendation rows: validating a whole list of dicts
+# in one pydantic-core call is faster than per-item __init__ or model_construct.
+RecommendationItemList = TypeAdapter(List[RecommendationItem])
+
+
 class FilteredComparisonItem(BaseModel):
     """Top recommendations for comparison table (Layer 2)."""
     
@@ -40,6 +64,14 @@ class FilteredComparisonItem(BaseModel):
     location: Optional[str] = None
 
 
+class AdmissionOutlook(BaseModel):
+    """Chance of being admitted to at least one option, with cutoffs simulated jointly."""
+    
+    rank: int  # rank the simulation ran at (the request's, snapped to a cached rank cell)
+    draws: int
+    at_least_one: Dict[str, float]  # "safe" / "moderate" / "ambitious" / "any" -> probability
+
+
 class RecommendationResponse(BaseModel):
     """Layered recommendation response with counselor summary, filtered comparison, and full report."""
     
@@ -57,6 +89,13 @@ class RecommendationResponse(BaseModel):
     moderate: List[RecommendationItem]
     ambitious: List[RecommendationItem]
     
+    # Joint Monte Carlo outlook (None when served from the database)
+    admission_outlook: Optional[AdmissionOutlook] = None
+    
+    # Pagination (set only when the request uses limit_per_bucket)
+    totals: Optional[Dict[str, int]] = None  # full size of each bucket
+    next_cursors: Optional[Dict[str, str]] = None  # bucket -> cursor for /recommend/page
+    
     class Config:
         json_schema_extra = {
             "example": {
@@ -68,3 +107,92 @@ class RecommendationResponse(BaseModel):
                 "ambitious": []
             }
         }
+
+
+class RecommendationPage(BaseModel):
+    """One page of a bucket from a cached recommendation response."""
+    
+    bucket: str  # "safe", "moderate", or "ambitious"
+    items: List[RecommendationItem]
+    total: int
+    next_cursor: Optional[str] = None
+
+
+class RangeMatch(BaseModel):
+    """A seat whose admitted rank range [opening_rank, closing_rank] contains or nearly contains a rank."""
+    
+    institute: str
+    branch: str
+    opening_rank: Optional[int] = None
+    closing_rank: int
+    round: int
+    gender: Optional[str] = None
+    quota: Optional[str] = None
+    position: Optional[float] = None  # 0 = at the opening rank, 1 = at the closing rank, outside [0, 1] = near miss
+
+
+class RangeMatchResponse(BaseModel):
+    """Result of /recommend/range."""
+    
+    exam: str  # "advanced" or "mains"
+    rank: int
+    category: str
+    year: int
+    round: int
+    gender: Optional[str] = None
+    pwd: bool = False
+    home_state: Optional[str] = None
+    tolerance: float
+    matches: List[RangeMatch]
+
+
+class BatchRecommendationResult(BaseModel):
+    """One NDJSON line of /recommend/batch: the result for one student."""
+    
+    index: int  # position in the request's students list
+    id: Optional[str] = None  # caller's student id, echoed back
+    rank: int
+    category: str
+    year: int
+    gender: Optional[str] = None
+    pwd: bool = False
+    safe: List[RecommendationItem]
+    moderate: List[RecommendationItem]
+    ambitious: List[RecommendationItem]
+    full_report: Optional[str] = None  # templated report, when requested
+
+
+class ChoiceItem(BaseModel):
+    """One entry of an optimized JoSAA choice list."""
+    
+    preference: int  # 1 = first choice
+    institute: str
+    branch: str
+    location: Optional[str] = None
+    state: Optional[str] = None
+    nirf_rank: Optional[int] = None
+    average_package: Optional[int] = None  # rupees per annum
+    utility: float  # weighted preference score in [0, 1]
+    admission_probability: float  # of being offered this seat in some round
+    allotment_probability: float  # of ending up with this choice (no earlier choice offered)
+    closing_ranks: List[Optional[int]]  # per round of `rounds`
+    round_probabilities: List[float]  # admission probability per round of `rounds`
+    likely_round: Optional[int] = None  # first round with admission probability >= 0.5
+
+
+class ChoiceListResponse(BaseModel):
+    """Result of /recommend/choices."""
+    
+    exam: str  # "advanced" or "mains"
+    rank: int
+    category: str
+    year: int
+    gender: Optional[str] = None
+    pwd: bool = False
+    home_state: Optional[str] = None
+    weights: Dict[str, float]
+    rounds: List[int]
+    seats_considered: int  # seats with a non-negligible admission probability
+    expected_utility: float
+    admission_probability: float  # of being allotted any listed seat
+    choices: List[ChoiceItem]
@@ -2,9 +2,10 @@
 Pydantic schemas for session-based chat management.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from typing import List, Optional, Dict, Any
 from enum import Enum
+from app.schemas.request import check_year
 from app.schemas.response import RecommendationResponse, RecommendationItem
 from datetime import datetime
 
@@ -37,9 +38,17 @@ class SessionCreate(BaseModel):
     """Request to create a new session."""
     rank: int = Field(..., ge=1, description="JEE Advanced rank")
     category: str = Field(..., description="Category: GEN, OBC, SC, ST, or EWS")
-    year: int = Field(default=2024, ge=2020, le=2025)
+    year: int = Field(default=2024, description="Counseling year with cutoff data")
+    # Seat pools for the initial recommendations (see RecommendationRequest); not stored with the session
+    gender: Optional[str] = None
+    pwd: bool = False
     query: Optional[str] = None
 
+    @field_validator("year")
+    @classmethod
+    def validate_year(cls, v: int) -> int:
+        return check_year(v)
+
 class ChatRequest(BaseModel):
     """Request to send a message to the chat."""
     message: str
@@ -53,9 +62,13 @@ class ChatSession(BaseModel):
     created_at: datetime = Field(default_factory=datetime.now)
     state: SessionState = SessionState.INITIAL
     history: List[ChatMessage] = []
+    # Rolling summary of older turns that aged out of `history`
+    history_summary: str = ""
     
     # Store the generated recommendations to avoid re-calculating
-    # and to provide context to LLM
+    # and to provide context to LLM.
+    # The payload is large, so SessionService.get_session only fills it
+    # (and `history`) when asked to; otherwise it is left None/empty.
     recommendations: Optional[RecommendationResponse] = None
 
 class ChatResponse(BaseModel):
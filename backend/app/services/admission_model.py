@@ -0,0 +1,169 @@
+"""
+Round-by-round admission probabilities for cutoff rows.
+
+A seat series is one (year, institute, branch, category, gender, pwd,
+quota) of a cutoff table. Its closing rank moves from round to round as
+seats are vacated and refilled, so a row of round r says little on its own
+about where the series closes. For every series the model fits the log
+change of the closing rank per round: its mean (drift) and variance
+(volatility). Both are shrunk towards the table-wide values with
+PRIOR_STEPS pseudo-observations, so a series seen in one or two rounds
+keeps the pooled movement. A row then predicts its series' final closing
+rank as
+
+    log c_final ~ log c_r + drift * (R - r)      (R = series' last round)
+
+and its log-scale spread is
+
+    spread^2 = calibration^2 * volatility * (R - r) + ADMISSION_YEAR_SPREAD^2
+
+The second term is the year-to-year uncertainty of a cutoff, which remains
+even for a final-round row. `calibration` rescales the within-year term so
+that COVERAGE of the standardized errors of the earlier-round rows
+(predicting their series' actual final closing rank) fall inside the
+logistic's central COVERAGE interval; most series do not move between
+rounds and a few jump, so a variance match would be set by those few.
+Movements are modelled as logistic, so a rank x is admitted with probability
+
+    p = 1 / (1 + exp((log x - center) * slope)),   slope = pi / (sqrt(3) * spread)
+
+All parameters are fitted at once with bincount sums when a snapshot is
+loaded, and only each row's `center` and `slope` are kept, so a query
+costs O(1) per seat. Without a fit (the SQL fallback) static_probability
+applies the year-to-year term alone.
+"""
+
+import math
+from typing import Dict, Optional
+
+import numpy as np
+
+from app.utils.constants import (
+    ADMISSION_YEAR_SPREAD,
+    SAFE_PROBABILITY,
+    MODERATE_PROBABILITY,
+    MIN_ADMISSION_PROBABILITY,
+    CONFIDENCE_SAFE,
+    CONFIDENCE_MODERATE,
+    CONFIDENCE_AMBITIOUS,
+)
+
+# Columns identifying a seat series
+SERIES_COLUMNS = ("year", "institute", "branch", "category", "gender", "pwd", "quota")
+# Weight of the table-wide drift and volatility in a series' estimates, in round-to-round steps
+PRIOR_STEPS = 2.0
+# Logistic slope giving unit standard deviation
+LOGISTIC_SCALE = math.pi / math.sqrt(3.0)
+# Share of standardized errors the calibrated central interval must cover
+COVERAGE = 0.8
+
+
+def logistic_probability(log_margin, spread: float = ADMISSION_YEAR_SPREAD):
+    """Admission probability when the cutoff exceeds the rank by `log_margin` (log closing - log rank)."""
+    return 1.0 / (1.0 + np.exp(-LOGISTIC_SCALE * np.asarray(log_margin, dtype=np.float64) / spread))
+
+
+def static_probability(closing_rank, rank: int):
+    """Probability without a fitted model: the closing rank taken as final, with the year-to-year spread."""
+    return logistic_probability(np.log(np.maximum(closing_rank, 1)) - math.log(rank))
+
+
+def confidence_band(probability: float) -> Optional[str]:
+    """Bucket of an option by admission probability (None below MIN_ADMISSION_PROBABILITY)."""
+    if probability >= SAFE_PROBABILITY:
+        return CONFIDENCE_SAFE
+    if probability >= MODERATE_PROBABILITY:
+        return CONFIDENCE_MODERATE
+    if probability >= MIN_ADMISSION_PROBABILITY:
+        return CONFIDENCE_AMBITIOUS
+    return None
+
+
+def _series_codes(columns: Dict[str, np.ndarray]) -> np.ndarray:
+    """One integer per row identifying its series."""
+    codes = np.zeros(len(columns["closing_rank"]), dtype=np.int64)
+    for name in SERIES_COLUMNS:
+        values = columns[name].astype(np.int64)
+        values -= values.min()
+        codes = codes * (int(values.max()) + 1) + values
+    return codes
+
+
+class AdmissionModel:
+    """Per-row admission parameters of one cutoff table (see the module docstring)."""
+
+    def __init__(self, center: np.ndarray, slope: np.ndarray, drift: float, volatility: float, calibration: float):
+        self.center = center
+        self.slope = slope
+        # Table-wide values, for reporting
+        self.drift = drift
+        self.volatility = volatility
+        self.calibration = calibration
+
+    @classmethod
+    def fit(cls, columns: Dict[str, np.ndarray]) -> "AdmissionModel":
+        """Fit every series of a table's columns (rows in any order)."""
+        if not len(columns["closing_rank"]):
+            return cls(np.empty(0, dtype=np.float32), np.empty(0, dtype=np.float32), 0.0, 0.0, 1.0)
+        rounds = columns["round"].astype(np.int64)
+        log_closing = np.log(np.maximum(columns["closing_rank"], 1).astype(np.float64))
+        _, series = np.unique(_series_codes(columns), return_inverse=True)
+        series = series.ravel()
+        count = int(series.max()) + 1
+
+        # A series' closing rank in a round is its largest there (several
+        # programs can share a branch); (series, round) groups come out sorted
+        groups, group = np.unique(series * (int(rounds.max()) + 1) + rounds, return_inverse=True)
+        group_log = np.full(len(groups), -np.inf)
+        np.maximum.at(group_log, group.ravel(), log_closing)
+        group_series, group_round = np.divmod(groups, int(rounds.max()) + 1)
+
+        # Round-to-round steps of each series, per round elapsed
+        gap = np.diff(group_round)
+        is_step = group_series[1:] == group_series[:-1]
+        steps = np.diff(group_log)[is_step] / gap[is_step]
+        owner = group_series[1:][is_step]
+        prior_drift = float(steps.mean()) if len(steps) else 0.0
+        prior_volatility = float(steps.var()) if len(steps) else 0.0
+
+        n = np.bincount(owner, minlength=count)
+        total = np.bincount(owner, steps, minlength=count)
+        squares = np.bincount(owner, steps * steps, minlength=count)
+        drift = (total + PRIOR_STEPS * prior_drift) / (n + PRIOR_STEPS)
+        deviation = np.maximum(squares - 2 * drift * total + n * drift * drift, 0.0)
+        volatility = (deviation + PRIOR_STEPS * prior_volatility) / (n + PRIOR_STEPS)
+
+        # Groups are sorted by round within a series, so the last one is the final round
+        is_last = np.append(group_series[1:] != group_series[:-1], True)
+        last_round = group_round[is_last]
+        final = group_log[is_last]
+        remaining = last_round[series] - rounds
+        center = log_closing + drift[series] * remaining
+        within = volatility[series] * remaining
+
+        # Calibrate the within-year term on the rows that predict a known final closing rank
+        predicts = (remaining > 0) & (within > 0)
+        calibration = 1.0
+        if predicts.any():
+            errors = (final[series[predicts]] - center[predicts]) / np.sqrt(within[predicts])
+            # Half-width of the central COVERAGE interval of a unit logistic
+            half_width = math.log((1 + COVERAGE) / (1 - COVERAGE)) / LOGISTIC_SCALE
+            calibration = float(np.quantile(np.abs(errors), COVERAGE)) / half_width or 1.0
+
+        spread = np.sqrt(calibration ** 2 * within + ADMISSION_YEAR_SPREAD ** 2)
+        return cls(
+            center.astype(np.float32),
+            (LOGISTIC_SCALE / spread).astype(np.float32),
+            prior_drift,
+            prior_volatility,
+            calibration
+        )
+
+    def probability(self, rows: np.ndarray, rank: int) -> np.ndarray:
+        """Admission probability of `rank` for each of the given rows."""
+        center, slope = self.center[rows].astype(np.float64), self.slope[rows].astype(np.float64)
+        return 1.0 / (1.0 + np.exp((math.log(rank) - center) * slope))
+
+    def stats(self) -> dict:
+        return {"drift": round(self.drift, 4), "volatility": round(self.volatility, 5),
+                "calibration": round(self.calibration, 3)}
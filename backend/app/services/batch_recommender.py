@@ -0,0 +1,80 @@
+"""
+Bulk recommendations over the in-memory cutoff snapshot.
+
+Students are processed in chunks; within a chunk they are grouped by
+(year, category, gender, pwd) so each group is evaluated against one
+shared set of sorted seat-pool arrays. Results are yielded in request order, one
+serialized BatchRecommendationResult per student.
+"""
+
+from collections import defaultdict
+from typing import Iterable, Iterator, List, Optional
+
+from app.schemas.request import BatchStudent
+from app.schemas.response import BatchRecommendationResult
+from app.services.cutoff_index import CutoffSnapshot
+from app.services.fallback_report_generator import generate_fallback_report
+
+# Students evaluated per group pass before results are flushed
+BATCH_CHUNK_SIZE = 500
+
+_serializer = BatchRecommendationResult.__pydantic_serializer__
+
+
+def iter_batch_results(
+    snapshot: CutoffSnapshot,
+    students: List[BatchStudent],
+    include_report: bool = False,
+    start_index: int = 0,
+    chunk_size: int = BATCH_CHUNK_SIZE
+) -> Iterator[BatchRecommendationResult]:
+    """Yield one result per student, in input order."""
+    index = snapshot.advanced
+    for chunk_start in range(0, len(students), chunk_size):
+        chunk = students[chunk_start:chunk_start + chunk_size]
+
+        # Group by seat pools so each (year, category, gender, pwd) is evaluated once per chunk
+        groups = defaultdict(list)
+        for position, student in enumerate(chunk):
+            # Only FEMALE changes the seat pools
+            gender = student.gender if student.gender == "FEMALE" else None
+            groups[(student.year, student.category, gender, student.pwd)].append(position)
+
+        classified: List[Optional[tuple]] = [None] * len(chunk)
+        for (year, category, gender, pwd), positions in groups.items():
+            ranks = [chunk[p].rank for p in positions]
+            for position, buckets in zip(positions, index.classify(ranks, category, year, gender, pwd)):
+                classified[position] = buckets
+
+        for position, student in enumerate(chunk):
+            safe, moderate, ambitious = index.to_items(student.rank, *classified[position])
+            full_report = None
+            if include_report:
+                full_report = generate_fallback_report(
+                    rank=student.rank,
+                    category=student.category,
+                    query=None,
+                    safe=safe,
+                    moderate=moderate,
+                    ambitious=ambitious,
+                    year=student.year
+                )
+            yield BatchRecommendationResult(
+                index=start_index + chunk_start + position,
+                id=student.id,
+                rank=student.rank,
+                category=student.category,
+                year=student.year,
+                gender=student.gender,
+                pwd=student.pwd,
+                safe=safe,
+                moderate=moderate,
+                ambitious=ambitious,
+                full_report=full_report
+            )
+
+
+def to_ndjson(results: Iterable[BatchRecommendationResult]) -> Iterator[bytes]:
+    """Serialize results as newline-delimited JSON."""
+    for result in results:
+        yield _serializer.to_json(result) + b"\n"
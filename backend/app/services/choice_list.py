@@ -0,0 +1,218 @@
+"""
+JoSAA choice-list optimizer over the in-memory cutoff snapshot.
+
+A seat is an (institute, branch) pair of the candidate's seat pools. Its
+closing rank in each round is the largest over those pools, and its
+admission probability in a round is the best of its rows there under the
+table's fitted admission model (admission_model.py).
+
+JoSAA upgrades a candidate round by round to the best choice it can offer,
+so a seat is won if it is offered in any round: its probability is that of
+its best round.
+
+Each seat's utility is the weighted mean of four scores in [0, 1]:
+- branch: the position of the branch in the candidate's preferred branches
+  (0 for others), or without preferences how strongly the branch is
+  demanded (low closing ranks across institutes; the table's `demand`,
+  computed once over all of its seats);
+- institute: how strongly the institute is demanded, likewise;
+- location: 1 for institutes in a preferred state;
+- placement: the institute's average package (the median where unknown).
+
+Under deferred acceptance listing seats in true preference order is
+optimal, so the list is in utility order; what remains is which seats to
+list. With admissions taken as independent, the expected utility of a list
+is sum(u_j * p_j * prod(1 - p_l for l listed before j)), and adding seats
+one at a time by largest gain in expected utility (Chade and Smith's
+marginal improvement algorithm) is optimal for any list length. A gain is
+never negative, so the list fills up to its length: once no seat adds
+anything (below an all-but-certain seat) the rest follow in utility order.
+Every step is a few whole-array operations over the seats, sorted by
+utility once, so no Python loop runs per seat.
+"""
+
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+
+from app.services.cutoff_index import CutoffTable
+from app.utils.constants import CHOICE_MIN_PROBABILITY, CHOICE_MAX_CHOICES
+
+SCORES = ("branch", "institute", "location", "placement")
+# Admission probability from which a round is reported as a seat's likely round
+LIKELY_PROBABILITY = 0.5
+
+
+def _scaled(values: np.ndarray) -> np.ndarray:
+    """Values mapped linearly onto [0, 1] (all zeros when constant)."""
+    if not len(values) or values.max() <= values.min():
+        return np.zeros(len(values))
+    return (values - values.min()) / (values.max() - values.min())
+
+
+def seat_matrix(
+    table: CutoffTable, rows: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+    """
+    (institute, branch) positions of every seat in `rows`, the rounds they
+    span, the seats x rounds matrix of closing ranks (0 where a seat has no
+    cutoff in a round) and each row's (seat, round) cell in that matrix.
+    """
+    branches = len(table.branch_names)
+    pair = table.columns["institute"][rows].astype(np.int64) * branches + table.columns["branch"][rows]
+    pairs, seat = np.unique(pair, return_inverse=True)
+    rounds, round_index = np.unique(table.columns["round"][rows], return_inverse=True)
+    cells = (seat.ravel(), round_index.ravel())
+    closing = np.zeros((len(pairs), len(rounds)), dtype=np.int64)
+    np.maximum.at(closing, cells, table.columns["closing_rank"][rows])
+    return pairs // branches, pairs % branches, rounds, closing, cells
+
+
+def admission_probabilities(
+    table: CutoffTable, rows: np.ndarray, cells: Tuple[np.ndarray, np.ndarray], shape: Tuple[int, int], rank: int
+) -> np.ndarray:
+    """
+    Per-round admission probability of each seat: the best of its rows in
+    the round under the table's admission model (0 in rounds without a cutoff).
+    """
+    probability = np.zeros(shape)
+    np.maximum.at(probability, cells, table.admission.probability(rows, rank))
+    return probability
+
+
+def seat_scores(
+    table: CutoffTable,
+    institutes: np.ndarray,
+    branches: np.ndarray,
+    preferred_branches: Sequence[int] = (),
+    preferred_states: Sequence[str] = ()
+) -> Dict[str, np.ndarray]:
+    """SCORES of each seat, each in [0, 1]."""
+    demand = table.demand
+    scores = {"institute": demand["institute"][institutes]}
+
+    # Dimension-sized lookups (one entry per branch / institute position), then gathered per seat
+    if preferred_branches:
+        # 1 for the first preferred branch down to 1/n for the last
+        by_entity = {}
+        for position, entity_id in enumerate(preferred_branches):
+            by_entity.setdefault(entity_id, 1.0 - position / len(preferred_branches))
+        by_branch = np.array([by_entity.get(e, 0.0) for e in table.branch_entities.tolist()], dtype=np.float64)
+        scores["branch"] = by_branch[branches]
+    else:
+        scores["branch"] = demand["branch"][branches]
+
+    states = set(preferred_states)
+    in_state = np.array([state in states for state in table.institutes["state"]], dtype=np.float64)
+    scores["location"] = in_state[institutes]
+
+    packages = np.array(
+        [np.nan if facts["average_package"] is None else facts["average_package"] for facts in table.institute_facts],
+        dtype=np.float64
+    )[institutes]
+    known = ~np.isnan(packages)
+    packages[~known] = np.median(packages[known]) if known.any() else 0.0
+    scores["placement"] = _scaled(packages)
+    return scores
+
+
+def select_choices(utility: np.ndarray, probability: np.ndarray, max_choices: int) -> np.ndarray:
+    """
+    Indices of up to `max_choices` seats to list, in listing order (utility
+    descending), chosen greedily by gain in expected utility. Gains are
+    never negative; once they are all zero (e.g. below a seat that is all
+    but certain) the first unlisted seat in utility order is taken.
+    """
+    order = np.lexsort((-probability, -utility))
+    u, p = utility[order], probability[order]
+    selected = np.zeros(len(order), dtype=bool)
+    for _ in range(min(max_choices, len(order))):
+        # Probability of reaching each position, i.e. of not being admitted to a listed seat above it
+        reach = np.cumprod(np.where(selected, 1.0 - p, 1.0))
+        reach = np.concatenate(([1.0], reach[:-1]))
+        value = np.where(selected, u * p * reach, 0.0)
+        below = np.cumsum(value[::-1])[::-1] - value
+        # Listing seat j adds its own term and scales every listed seat below it by (1 - p_j)
+        gain = np.where(selected, -np.inf, p * (reach * u - below))
+        selected[int(np.argmax(gain))] = True
+    return order[selected]
+
+
+def list_value(utility: np.ndarray, probability: np.ndarray) -> Tuple[np.ndarray, float, float]:
+    """
+    For a list in preference order: the probability of being allotted each
+    choice, the list's expected utility and the probability of any allotment.
+    """
+    reach = np.concatenate(([1.0], np.cumprod(1.0 - probability)[:-1]))
+    allotted = probability * reach
+    return allotted, float(allotted @ utility), float(allotted.sum())
+
+
+def optimize_choices(
+    table: CutoffTable,
+    rows: np.ndarray,
+    rank: int,
+    weights: Dict[str, float],
+    preferred_branches: Sequence[int] = (),
+    preferred_states: Sequence[str] = (),
+    max_choices: int = CHOICE_MAX_CHOICES
+) -> dict:
+    """
+    Ordered choice list for a candidate of `rank` over the seats in `rows`
+    (see the tables' seat_rows). Returns the fields of ChoiceListResponse
+    that depend on the data: rounds, seats_considered, expected_utility,
+    admission_probability and the choices.
+    """
+    if not len(rows):
+        return {"rounds": [], "seats_considered": 0, "expected_utility": 0.0, "admission_probability": 0.0,
+                "choices": []}
+    institutes, branches, rounds, closing, cells = seat_matrix(table, rows)
+    round_probability = admission_probabilities(table, rows, cells, closing.shape, rank)
+    probability = round_probability.max(axis=1)
+    scores = seat_scores(table, institutes, branches, preferred_branches, preferred_states)
+    total_weight = sum(weights.get(name, 0.0) for name in SCORES)
+    utility = sum(weights.get(name, 0.0) * scores[name] for name in SCORES) / total_weight
+
+    candidates = np.flatnonzero(probability >= CHOICE_MIN_PROBABILITY)
+    listed = candidates[select_choices(utility[candidates], probability[candidates], max_choices)]
+    allotted, expected_utility, admitted = list_value(utility[listed], probability[listed])
+
+    # First round in which each listed seat is more likely than not
+    likely_rounds = round_probability[listed] >= LIKELY_PROBABILITY
+    likely = np.where(likely_rounds.any(axis=1), rounds[likely_rounds.argmax(axis=1)], 0)
+    names, locations = table.institutes["name"], table.institutes["location"]
+    states, nirf = table.institutes["state"], table.institutes["nirf_rank"]
+    choices = [
+        {
+            "preference": position + 1,
+            "institute": names[i],
+            "branch": table.branch_names[b],
+            "location": locations[i],
+            "state": states[i],
+            "nirf_rank": nirf[i],
+            "average_package": table.institute_facts[i]["average_package"],
+            "utility": round(u, 4),
+            "admission_probability": round(p, 4),
+            "allotment_probability": round(a, 4),
+            "closing_ranks": [c or None for c in closing_row],
+            "round_probabilities": [round(q, 4) for q in probability_row],
+            "likely_round": r or None,
+        }
+        for position, (i, b, u, p, a, closing_row, probability_row, r) in enumerate(zip(
+            institutes[listed].tolist(),
+            branches[listed].tolist(),
+            utility[listed].tolist(),
+            probability[listed].tolist(),
+            allotted.tolist(),
+            closing[listed].tolist(),
+            round_probability[listed].tolist(),
+            likely.tolist(),
+        ))
+    ]
+    return {
+        "rounds": rounds.tolist(),
+        "seats_considered": len(candidates),
+        "expected_utility": round(expected_utility, 4),
+        "admission_probability": round(admitted, 4),
+        "choices": choices,
+    }
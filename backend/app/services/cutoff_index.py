@@ -0,0 +1,1094 @@
+"""
+In-memory columnar cutoff index built from the normalized_data tables.
+
+Rows are held as NumPy columns sorted by closing rank, with string
+dimensions (institute, branch, category, gender, quota, institute type)
+encoded as small integer codes. Partitions map a key such as (year,
+category, gender, pwd) to the row positions of that partition, still in
+closing-rank order, so a rank query is a binary search plus a slice
+instead of a table scan. Seat pools are partition dimensions: gender-neutral
+and female-only seats, PwD-reserved seats and (for JEE Mains) quotas are
+never mixed, and a query merges only the pools the candidate competes for.
+Rows also keep their opening rank, and an interval index per partition of
+RANGE_PARTITION over [opening_rank, closing_rank] answers "which seats
+admitted ranks around mine" without scanning. Home-state (HS/OS) quotas
+depend on the institute's state as well, so JEE Mains queries with a home
+state select seats with a precomputed per-state eligibility mask.
+
+Tables are memory-mapped from the per-exam .npy bundles the ingestion
+pipeline writes to normalized_data/columnar/exams/ (already merged and
+sorted by closing rank), or parsed from the CSVs when no up-to-date
+bundle is available. Each family's projected cutoffs for
+the upcoming year (normalized_data/projected/, see
+ingestion/projections.py) are loaded into the same table as rows of that
+year, so a forward-looking query is the same partition lookup as a
+historical one. Institutes and branches are also mapped
+to the entity ids of normalized_data/entities.json, so rows can be
+selected by names resolved from free text, and the institute dimension
+is joined once with the placement and fee facts of
+normalized_data/institute_facts.csv (keyed by the same ids), so
+recommendation items carry them without a per-request lookup.
+
+This module has no database or settings dependency so offline tools can
+use it directly.
+"""
+
+import csv
+import hashlib
+import itertools
+import json
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.schemas.response import RecommendationItem, RecommendationItemList
+from app.services.admission_model import AdmissionModel
+from app.services.monte_carlo import Simulation, SimulationCache, simulate
+from app.utils.entity_resolution import ENTITIES_FILE, EntityDictionary, Mentions
+from app.utils.interval_index import IntervalIndex
+from app.utils.constants import (
+    MIN_ELIGIBLE_THRESHOLD,
+    SAFE_PROBABILITY,
+    MODERATE_PROBABILITY,
+    MIN_ADMISSION_PROBABILITY,
+    RANGE_TOLERANCE,
+    RANGE_MATCH_LIMIT,
+    GENDER_NEUTRAL,
+    FEMALE_ONLY,
+    DEFAULT_MAINS_QUOTAS,
+    ALL_INDIA_QUOTA,
+    HOME_STATE_QUOTA,
+    OTHER_STATE_QUOTA,
+    DOMICILE_QUOTAS,
+    VALID_STATES,
+    CONFIDENCE_SAFE,
+    CONFIDENCE_MODERATE,
+    CONFIDENCE_AMBITIOUS,
+    MC_CACHE_ENTRIES,
+)
+
+RecommendationLists = Tuple[List[RecommendationItem], List[RecommendationItem], List[RecommendationItem]]
+
+# (institute_type, columnar bundle, institute file, institute id column, branch file, cutoff file)
+ADVANCED_SOURCES = [
+    ("IIT", "iit", "iit.csv", "iit_id", "branch.csv", "cutoff.csv"),
+]
+MAINS_SOURCES = [
+    ("NIT", "nit", "nit.csv", "nit_id", "nit_branch.csv", "nit_cutoff.csv"),
+    ("IIIT", "iiit", "iiit.csv", "iiit_id", "iiit_branch.csv", "iiit_cutoff.csv"),
+    ("GFTI", "cfi", "cfi.csv", "cfi_id", "cfi_branch.csv", "cfi_cutoff.csv"),
+]
+
+# Layout written by ingestion/columnar.py and ingestion/projections.py
+COLUMNAR_DIR = "columnar"
+EXAMS_DIR = "exams"
+EXAM_SCHEMA_VERSION = 1
+PROJECTED_DIR = "projected"
+# Written by ingestion/institute_facts.py; amounts in rupees
+INSTITUTE_FACTS_FILE = "institute_facts.csv"
+FACT_COLUMNS = ("average_package", "highest_package", "fee_above_5l", "fee_1l_to_5l", "fee_below_1l", "fee_reserved")
+# Stored opening rank of rows without one
+MISSING_RANK = -1
+
+
+class SnapshotValidationError(ValueError):
+    """Raised when loaded cutoff data fails validation."""
+
+
+def eligible_genders(gender: Optional[str]) -> Tuple[str, ...]:
+    """Values of the gender column a candidate competes for (unknown gender: gender-neutral seats only)."""
+    if gender and gender.upper() == "FEMALE":
+        return (GENDER_NEUTRAL, FEMALE_ONLY)
+    return (GENDER_NEUTRAL,)
+
+
+def canonical_home_state(state: Optional[str]) -> Optional[str]:
+    """The VALID_STATES spelling of a state name (case-insensitive), None if unknown."""
+    if state is None:
+        return None
+    key = " ".join(state.split()).casefold()
+    return next((valid for valid in VALID_STATES if valid.casefold() == key), None)
+
+
+def range_fact(
+    institute: str,
+    branch: str,
+    opening_rank: Optional[int],
+    closing_rank: int,
+    round_number: int,
+    gender: Optional[str],
+    quota: Optional[str],
+    rank: int
+) -> dict:
+    """
+    One seat of a range query. `position` places the rank inside the
+    admitted range: 0 at the opening rank, 1 at the closing rank, below 0 or
+    above 1 outside it (None without an opening rank).
+    """
+    position = None
+    if opening_rank is not None:
+        position = round((rank - opening_rank) / max(closing_rank - opening_rank, 1), 3)
+    return {
+        "institute": institute,
+        "branch": branch,
+        "opening_rank": opening_rank,
+        "closing_rank": closing_rank,
+        "round": round_number,
+        "gender": gender,
+        "quota": quota,
+        "position": position,
+    }
+
+
+def range_distance(opening_rank: Optional[int], closing_rank: int, rank: int) -> int:
+    """How far `rank` lies outside [opening_rank, closing_rank] (0 inside)."""
+    start = closing_rank if opening_rank is None else min(opening_rank, closing_rank)
+    return max(start - rank, rank - closing_rank, 0)
+
+
+class CutoffTable:
+    """Columnar cutoff rows of one exam, sorted by closing rank."""
+
+    # Dictionary-encoded string columns
+    CODED_COLUMNS = ("category", "gender", "quota", "institute_type")
+    # Partition of the opening/closing rank interval indexes: one per round and seat pool
+    RANGE_PARTITION = ("year", "round", "category", "gender", "pwd", "quota")
+
+    def __init__(
+        self,
+        columns: Dict[str, np.ndarray],
+        vocab: Dict[str, List[str]],
+        institutes: Dict[str, list],
+        branch_names: List[str],
+        projected_years: Sequence[int] = ()
+    ):
+        # Columns are kept as given (possibly memory-mapped), so they must arrive in closing-rank order
+        closing_rank = columns["closing_rank"]
+        if len(closing_rank) > 1 and not bool(np.all(closing_rank[1:] >= closing_rank[:-1])):
+            raise SnapshotValidationError("Cutoff rows are not sorted by closing rank")
+        self.columns = columns
+        self.vocab = vocab
+        # Institute dimension, indexed by the `institute` column
+        self.institutes = institutes
+        # FACT_COLUMNS of each institute position (filled by attach_entities)
+        self.institute_facts: List[dict] = [dict.fromkeys(FACT_COLUMNS)] * len(institutes["name"])
+        self.branch_names = branch_names
+        # Years whose rows are projections rather than published cutoffs
+        self.projected_years = sorted(set(projected_years))
+        self._partitions: Dict[Tuple[str, ...], Dict[tuple, np.ndarray]] = {}
+        self._pools: Dict[tuple, np.ndarray] = {}
+        self._ranges: Dict[tuple, IntervalIndex] = {}
+        self._admission: Optional[AdmissionModel] = None
+        self._demand: Optional[Dict[str, np.ndarray]] = None
+        self._simulations = SimulationCache(MC_CACHE_ENTRIES)
+        # Entity id of each institute / branch position (-1 = not in the dictionary)
+        self.institute_entities = np.full(len(institutes["name"]), -1, dtype=np.int32)
+        self.branch_entities = np.full(len(branch_names), -1, dtype=np.int32)
+
+    def __len__(self) -> int:
+        return len(self.columns["closing_rank"])
+
+    def years(self) -> List[int]:
+        """Years with rows, published or projected."""
+        return np.unique(self.columns["year"]).tolist()
+
+    def code(self, column: str, value: str) -> int:
+        """Integer code of a string value in a coded column, -1 if absent."""
+        try:
+            return self.vocab[column].index(value)
+        except ValueError:
+            return -1
+
+    def codes(self, column: str, values: Sequence[str]) -> List[int]:
+        """Codes of the values present in a coded column."""
+        return [code for code in (self.code(column, value) for value in values) if code >= 0]
+
+    def partition(self, keys: Tuple[str, ...]) -> Dict[tuple, np.ndarray]:
+        """
+        Row positions grouped by the values of `keys`, each group in
+        closing-rank order. Built once per key set and then reused.
+        """
+        if keys not in self._partitions:
+            if len(self) == 0:
+                self._partitions[keys] = {}
+                return self._partitions[keys]
+            stacked = np.stack([self.columns[k].astype(np.int64) for k in keys], axis=1)
+            groups, inverse = np.unique(stacked, axis=0, return_inverse=True)
+            inverse = inverse.ravel()
+            # Stable sort keeps closing-rank order within each group
+            order = np.argsort(inverse, kind="stable")
+            bounds = np.searchsorted(inverse[order], np.arange(len(groups) + 1))
+            self._partitions[keys] = {
+                tuple(int(v) for v in group): order[bounds[i]:bounds[i + 1]]
+                for i, group in enumerate(groups)
+            }
+        return self._partitions[keys]
+
+    def partition_keys(self, keys: Tuple[str, ...], values: Dict[str, Sequence[int]]) -> Tuple[tuple, ...]:
+        """Keys of the `keys` partition present in the table with each column's value in `values`."""
+        partition = self.partition(keys)
+        return tuple(key for key in itertools.product(*(values[k] for k in keys)) if key in partition)
+
+    def pool_rows(self, keys: Tuple[str, ...], pool: Tuple[tuple, ...]) -> np.ndarray:
+        """
+        Rows of several partitions of `keys` merged in closing-rank order.
+        Row positions follow closing rank, so merging is a sort of the
+        partitions' positions; cached per set of partitions.
+        """
+        partition = self.partition(keys)
+        if len(pool) == 1:
+            return partition[pool[0]]
+        if (keys, pool) not in self._pools:
+            merged = [partition[key] for key in pool]
+            self._pools[keys, pool] = np.sort(np.concatenate(merged)) if merged else np.empty(0, dtype=np.int64)
+        return self._pools[keys, pool]
+
+    def range_index(self, key: tuple) -> Optional[IntervalIndex]:
+        """
+        Interval index over [opening_rank, closing_rank] of a RANGE_PARTITION
+        partition (positions refer to the partition's rows). A row without an
+        opening rank is the single point [closing_rank, closing_rank].
+        """
+        if key not in self._ranges:
+            rows = self.partition(self.RANGE_PARTITION).get(key)
+            if rows is None:
+                return None
+            closing = self.columns["closing_rank"][rows]
+            opening = self.columns["opening_rank"][rows]
+            self._ranges[key] = IntervalIndex(np.where(opening > 0, np.minimum(opening, closing), closing), closing)
+        return self._ranges[key]
+
+    def warm_ranges(self) -> None:
+        for key in self.partition(self.RANGE_PARTITION):
+            self.range_index(key)
+
+    @property
+    def admission(self) -> AdmissionModel:
+        """Admission model of the table's rows, fitted on first use."""
+        if self._admission is None:
+            self._admission = AdmissionModel.fit(self.columns)
+        return self._admission
+
+    @property
+    def demand(self) -> Dict[str, np.ndarray]:
+        """
+        How strongly each institute and branch position is demanded, over
+        every seat ((institute, branch) pair) of the table: 1 for the lowest
+        mean log closing rank of its seats, 0 for the highest (and for
+        positions without seats). Computed on first use.
+        """
+        if self._demand is None:
+            branches = len(self.branch_names)
+            pair = self.columns["institute"].astype(np.int64) * branches + self.columns["branch"]
+            pairs, seat = np.unique(pair, return_inverse=True)
+            seat = seat.ravel()
+            log_closing = np.log(np.maximum(self.columns["closing_rank"], 1).astype(np.float64))
+            seat_log = np.bincount(seat, log_closing, minlength=len(pairs)) / np.maximum(np.bincount(seat), 1)
+            self._demand = {}
+            for name, codes, size in (
+                ("institute", pairs // branches, len(self.institutes["name"])),
+                ("branch", pairs % branches, branches),
+            ):
+                counts = np.bincount(codes, minlength=size)
+                means = np.bincount(codes, seat_log, minlength=size) / np.maximum(counts, 1)
+                scores = np.zeros(size)
+                known = counts > 0
+                if known.any() and np.ptp(means[known]) > 0:
+                    low, high = means[known].min(), means[known].max()
+                    scores[known] = (high - means[known]) / (high - low)
+                self._demand[name] = scores
+        return self._demand
+
+    def bands(self, rows: np.ndarray, rank: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Subsets of `rows` (order kept) whose admission probability falls in the
+        safe, moderate and ambitious bands; rows below all three are dropped.
+        """
+        probability = self.admission.probability(rows, rank)
+        return (
+            rows[probability >= SAFE_PROBABILITY],
+            rows[(probability >= MODERATE_PROBABILITY) & (probability < SAFE_PROBABILITY)],
+            rows[(probability >= MIN_ADMISSION_PROBABILITY) & (probability < MODERATE_PROBABILITY)],
+        )
+
+    def simulation(self, buckets: Sequence[np.ndarray], rank: int) -> Simulation:
+        """Monte Carlo outlook of (safe, moderate, ambitious) rows, cached per rank cell."""
+        key = SimulationCache.key_for(buckets, rank)
+        result = self._simulations.get(key)
+        if result is None:
+            result = simulate(self.admission, buckets, rank)
+            self._simulations.put(key, result)
+        return result
+
+    def to_items(
+        self, rank: int, safe: np.ndarray, moderate: np.ndarray, ambitious: np.ndarray, simulated: bool = False
+    ) -> RecommendationLists:
+        """Response items of each bucket; `simulated` adds the Monte Carlo fields."""
+        buckets = (safe, moderate, ambitious)
+        outcomes = [None] * len(buckets)
+        if simulated:
+            outcomes = self.simulation(buckets, rank).split([len(rows) for rows in buckets])
+        return tuple(
+            RecommendationItemList.validate_python(self._item_rows(rows, confidence, rank, outcome))
+            for rows, confidence, outcome in zip(
+                buckets, (CONFIDENCE_SAFE, CONFIDENCE_MODERATE, CONFIDENCE_AMBITIOUS), outcomes
+            )
+        )
+
+    def _in_range(
+        self, keys: Sequence[tuple], rank: int, tolerance: float, limit: int, mask: Optional[np.ndarray] = None
+    ) -> List[dict]:
+        """
+        Seats of the given RANGE_PARTITION partitions whose admitted range
+        [opening, closing] overlaps [rank * (1 - tolerance), rank * (1 + tolerance)]:
+        those containing the rank first, then the nearest, then by closing rank.
+        `mask` (per table row) drops ineligible seats before the limit applies.
+        """
+        low, high = rank * (1 - tolerance), rank * (1 + tolerance)
+        found = []
+        for key in keys:
+            index = self.range_index(key)
+            if index is not None:
+                found.append(self.partition(self.RANGE_PARTITION)[key][index.overlapping(low, high)])
+        if not found:
+            return []
+        rows = np.concatenate(found)
+        if mask is not None:
+            rows = rows[mask[rows]]
+        closing = self.columns["closing_rank"][rows].astype(np.int64)
+        opening = self.columns["opening_rank"][rows].astype(np.int64)
+        start = np.where(opening > 0, np.minimum(opening, closing), closing)
+        outside = np.maximum(np.maximum(start - rank, rank - closing), 0)
+        rows = rows[np.lexsort((closing, outside))][:limit]
+        return self._range_rows(rows, rank)
+
+    def _range_rows(self, rows: np.ndarray, rank: int) -> List[dict]:
+        """Range facts (see range_fact) of the given rows."""
+        names = self.institutes["name"]
+        gender, quota = self.vocab["gender"], self.vocab["quota"]
+        return [
+            range_fact(names[i], self.branch_names[b], o if o > 0 else None, c, r, gender[g], quota[q] or None, rank)
+            for i, b, o, c, r, g, q in zip(
+                self.columns["institute"][rows].tolist(),
+                self.columns["branch"][rows].tolist(),
+                self.columns["opening_rank"][rows].tolist(),
+                self.columns["closing_rank"][rows].tolist(),
+                self.columns["round"][rows].tolist(),
+                self.columns["gender"][rows].tolist(),
+                self.columns["quota"][rows].tolist(),
+            )
+        ]
+
+    def attach_entities(self, entities: EntityDictionary, facts: Optional[Dict[int, dict]] = None) -> None:
+        """
+        Resolve the institute and branch dimensions to entity ids and copy
+        each institute's facts (entity id -> FACT_COLUMNS values) to its
+        position in the institute dimension. Done once per snapshot.
+        """
+        for target, names, resolve in (
+            (self.institute_entities, self.institutes["name"], entities.resolve_institute),
+            (self.branch_entities, self.branch_names, entities.resolve_branch),
+        ):
+            for position, name in enumerate(names):
+                entity_id = resolve(name)
+                target[position] = -1 if entity_id is None else entity_id
+        facts = facts or {}
+        self.institute_facts = [
+            {column: facts.get(entity_id, {}).get(column) for column in FACT_COLUMNS}
+            for entity_id in self.institute_entities.tolist()
+        ]
+
+    def mentioned_rows(self, rows: np.ndarray, mentions: Mentions) -> np.ndarray:
+        """Subset of `rows` matching the mentioned institutes and branches (either list may be empty)."""
+        mask = np.ones(len(rows), dtype=bool)
+        if mentions.institutes:
+            mask &= np.isin(self.institute_entities[self.columns["institute"][rows]], mentions.institutes)
+        if mentions.branches:
+            mask &= np.isin(self.branch_entities[self.columns["branch"][rows]], mentions.branches)
+        return rows[mask]
+
+    def _lookup_rows(self, rows: np.ndarray, rank: int, limit: int) -> List[dict]:
+        """Rows as closing-rank facts, nearest to `rank` first."""
+        closing = self.columns["closing_rank"][rows].astype(np.int64)
+        rows = rows[np.argsort(np.abs(closing - rank), kind="stable")][:limit]
+        gender, quota = self.vocab["gender"], self.vocab["quota"]
+        return [
+            {
+                "institute": self.institutes["name"][i],
+                "branch": self.branch_names[b],
+                "closing_rank": c,
+                "round": r,
+                "gender": gender[g],
+                "quota": quota[q] or None,
+            }
+            for i, b, c, r, g, q in zip(
+                self.columns["institute"][rows].tolist(),
+                self.columns["branch"][rows].tolist(),
+                self.columns["closing_rank"][rows].tolist(),
+                self.columns["round"][rows].tolist(),
+                self.columns["gender"][rows].tolist(),
+                self.columns["quota"][rows].tolist(),
+            )
+        ]
+
+    def rank_window(self, rows: np.ndarray, low: float, high: Optional[float] = None) -> np.ndarray:
+        """Subset of `rows` (closing-rank ordered) with low <= closing_rank <= high."""
+        closing = self.columns["closing_rank"][rows]
+        start = np.searchsorted(closing, low, side="left")
+        end = len(rows) if high is None else np.searchsorted(closing, high, side="right")
+        return rows[start:end]
+
+    def _item_rows(
+        self, rows: np.ndarray, confidence: str, rank: int, simulated: Optional[tuple] = None
+    ) -> List[dict]:
+        """
+        Response rows (see RecommendationItem) for the given row positions;
+        `simulated` is their (frequency, closing_low, closing_high) from a Simulation.
+        """
+        names = self.institutes["name"]
+        locations = self.institutes["location"]
+        nirf = self.institutes["nirf_rank"]
+        facts = self.institute_facts
+        gender, quota = self.vocab["gender"], self.vocab["quota"]
+        institute = self.columns["institute"][rows].tolist()
+        branch = self.columns["branch"][rows].tolist()
+        closing = self.columns["closing_rank"][rows].tolist()
+        genders = self.columns["gender"][rows].tolist()
+        quotas = self.columns["quota"][rows].tolist()
+        probabilities = np.round(self.admission.probability(rows, rank), 3).tolist()
+        if simulated is None:
+            outlook = [{}] * len(rows)
+        else:
+            frequency, low, high = simulated
+            outlook = [
+                {"admission_frequency": f, "closing_rank_low": lo, "closing_rank_high": hi}
+                for f, lo, hi in zip(
+                    np.round(frequency, 3).tolist(), np.rint(low).astype(np.int64).tolist(),
+                    np.rint(high).astype(np.int64).tolist()
+                )
+            ]
+        return [
+            {
+                "iit": names[i],
+                "branch": self.branch_names[b],
+                "closing_rank": c,
+                "confidence": confidence,
+                "admission_probability": p,
+                "location": locations[i],
+                "nirf_rank": nirf[i],
+                "gender": gender[g],
+                "quota": quota[q] or None,
+                **facts[i],
+                **extra
+            }
+            for i, b, c, g, q, p, extra in zip(institute, branch, closing, genders, quotas, probabilities, outlook)
+        ]
+
+
+class AdvancedCutoffIndex(CutoffTable):
+    """JEE Advanced (IIT) cutoffs; mirrors RankFilterService's DB query."""
+
+    # One partition per seat pool (IIT seats are all-India: no quota)
+    PARTITION = ("year", "category", "gender", "pwd")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._previous: Dict[tuple, np.ndarray] = {}
+
+    def warm(self) -> None:
+        for year, category, _, pwd in list(self.partition(self.PARTITION)):
+            for gender in ("MALE", "FEMALE"):
+                self.previous_same_pair(self.pool_keys(year, self.vocab["category"][category], gender, bool(pwd)))
+        self.warm_ranges()
+        self.admission  # fits the admission model
+        self.demand  # scores institutes and branches for choice lists
+
+    def pool_keys(self, year: int, category: str, gender: Optional[str], pwd: bool) -> Tuple[tuple, ...]:
+        """PARTITION keys of the seat pools a candidate competes for."""
+        return self.partition_keys(self.PARTITION, {
+            "year": [year],
+            "category": [self.code("category", category)],
+            "gender": self.codes("gender", eligible_genders(gender)),
+            "pwd": [int(pwd)],
+        })
+
+    def previous_same_pair(self, pool: Tuple[tuple, ...]) -> np.ndarray:
+        """
+        For each row of a set of seat pools (see pool_rows), the position of
+        the previous row (in closing-rank order) with the same (iit, branch)
+        pair, or -1.
+
+        A row is the lowest eligible closing rank of its pair for a query
+        starting at position s exactly when its previous same-pair row lies
+        before s, so deduplication needs no per-query sort.
+        """
+        if pool not in self._previous:
+            rows = self.pool_rows(self.PARTITION, pool)
+            pair = self.columns["institute"][rows].astype(np.int64) * len(self.branch_names) + self.columns["branch"][rows]
+            # Stable: positions stay ascending within a pair
+            order = np.argsort(pair, kind="stable")
+            same = pair[order][1:] == pair[order][:-1]
+            previous = np.full(len(rows), -1, dtype=np.int64)
+            previous[order[1:][same]] = order[:-1][same]
+            self._previous[pool] = previous
+        return self._previous[pool]
+
+    def classify(
+        self,
+        ranks: Sequence[int],
+        category: str,
+        year: int,
+        gender: Optional[str] = None,
+        pwd: bool = False
+    ) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Row positions of (safe, moderate, ambitious) options for each rank,
+        all evaluated against the same shared arrays of the candidates'
+        seat pools. Each (IIT, branch) pair is represented by its lowest
+        closing rank >= rank * MIN_ELIGIBLE_THRESHOLD and bucketed by that
+        row's admission probability.
+        """
+        empty = np.empty(0, dtype=np.int64)
+        pool = self.pool_keys(year, category, gender, pwd)
+        if not pool:
+            return [(empty, empty, empty) for _ in ranks]
+
+        rows = self.pool_rows(self.PARTITION, pool)
+        previous = self.previous_same_pair(pool)
+        closing = self.columns["closing_rank"][rows]
+        ranks = np.asarray(ranks, dtype=np.float64)
+        starts = np.searchsorted(closing, ranks * MIN_ELIGIBLE_THRESHOLD, side="left")
+
+        results = []
+        for rank, start in zip(ranks.tolist(), starts.tolist()):
+            # First occurrence of each pair at or after `start`, still rank ordered
+            selected = start + np.flatnonzero(previous[start:] < start)
+            results.append(self.bands(rows[selected], int(rank)))
+        return results
+
+    def recommend(
+        self,
+        rank: int,
+        category: str,
+        year: int,
+        gender: Optional[str] = None,
+        pwd: bool = False
+    ) -> RecommendationLists:
+        """
+        Eligible (IIT, branch) options with closing_rank >= rank * MIN_ELIGIBLE_THRESHOLD,
+        keeping the lowest such closing rank per pair across rounds and the
+        candidate's seat pools, in admission probability bands, with their
+        Monte Carlo frequencies and closing-rank intervals.
+        """
+        return self.to_items(rank, *self.classify([rank], category, year, gender, pwd)[0], simulated=True)
+
+    def outlook(
+        self,
+        rank: int,
+        category: str,
+        year: int,
+        gender: Optional[str] = None,
+        pwd: bool = False
+    ) -> Simulation:
+        """Simulation of the options `recommend` returns (shared through the simulation cache)."""
+        return self.simulation(self.classify([rank], category, year, gender, pwd)[0], rank)
+
+    def seat_rows(
+        self,
+        category: str,
+        year: int,
+        gender: Optional[str] = None,
+        pwd: bool = False
+    ) -> np.ndarray:
+        """Rows of every round of the candidate's seat pools, in closing-rank order."""
+        pool = self.pool_keys(year, category, gender, pwd)
+        if not pool:
+            return np.empty(0, dtype=np.int64)
+        return self.pool_rows(self.PARTITION, pool)
+
+    def lookup(
+        self,
+        mentions: Mentions,
+        rank: int,
+        category: str,
+        year: int,
+        gender: Optional[str] = None,
+        pwd: bool = False,
+        limit: int = 10
+    ) -> List[dict]:
+        """
+        Closing ranks of the mentioned (IIT, branch) pairs in each pair's
+        last round, nearest to `rank` first.
+        """
+        pool = self.pool_keys(year, category, gender, pwd)
+        if not pool:
+            return []
+        rows = self.mentioned_rows(self.pool_rows(self.PARTITION, pool), mentions)
+        # Only each pair's last round (a female candidate's two seat pools stay separate rows)
+        pairs = list(zip(self.columns["institute"][rows].tolist(), self.columns["branch"][rows].tolist()))
+        rounds = self.columns["round"][rows].tolist()
+        last = {}
+        for pair, round_number in zip(pairs, rounds):
+            last[pair] = max(last.get(pair, round_number), round_number)
+        latest = np.array([last[pair] == r for pair, r in zip(pairs, rounds)], dtype=bool)
+        return self._lookup_rows(rows[latest], rank, limit)
+
+    def in_range(
+        self,
+        rank: int,
+        category: str,
+        year: int,
+        round_number: int,
+        gender: Optional[str] = None,
+        pwd: bool = False,
+        tolerance: float = RANGE_TOLERANCE,
+        limit: int = RANGE_MATCH_LIMIT
+    ) -> List[dict]:
+        """(IIT, branch) seats of the round whose opening-closing range contains or nearly contains `rank`."""
+        keys = self.partition_keys(self.RANGE_PARTITION, {
+            "year": [year],
+            "round": [round_number],
+            "category": [self.code("category", category)],
+            "gender": self.codes("gender", eligible_genders(gender)),
+            "pwd": [int(pwd)],
+            "quota": range(len(self.vocab["quota"])),
+        })
+        return self._in_range(keys, rank, tolerance, limit)
+
+
+class MainsCutoffIndex(CutoffTable):
+    """JEE Mains (NIT/IIIT/GFTI) cutoffs; mirrors JeeMainsRankFilterService's view query."""
+
+    # One partition per round and seat pool
+    PARTITION = ("year", "round", "category", "gender", "pwd", "quota")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._state_masks: Dict[str, np.ndarray] = {}
+
+    def warm(self) -> None:
+        self.partition(self.PARTITION)
+        self.warm_ranges()
+        self.admission  # fits the admission model
+        self.demand  # scores institutes and branches for choice lists
+        for state in VALID_STATES:
+            self.state_mask(state)
+
+    def state_mask(self, home_state: str) -> np.ndarray:
+        """
+        Per-row eligibility of a candidate from `home_state`: AI seats, HS
+        seats of institutes in the state, OS seats of institutes elsewhere
+        (or of unknown state) and the state's domicile quotas. Built once
+        per state with whole-column comparisons.
+        """
+        if home_state not in self._state_masks:
+            quota = self.columns["quota"]
+            in_state = np.array([s == home_state for s in self.institutes["state"]], dtype=bool)
+            in_state = in_state[self.columns["institute"]] if len(in_state) else np.zeros(len(self), dtype=bool)
+            domicile = [q for q, state in DOMICILE_QUOTAS.items() if state == home_state]
+            self._state_masks[home_state] = (
+                (quota == self.code("quota", ALL_INDIA_QUOTA))
+                | ((quota == self.code("quota", HOME_STATE_QUOTA)) & in_state)
+                | ((quota == self.code("quota", OTHER_STATE_QUOTA)) & ~in_state)
+                | np.isin(quota, self.codes("quota", domicile))
+            )
+        return self._state_masks[home_state]
+
+    def eligible_rows(self, rows: np.ndarray, home_state: Optional[str]) -> np.ndarray:
+        """Subset of `rows` open to a candidate from `home_state` (all of them without one)."""
+        if home_state is None:
+            return rows
+        return rows[self.state_mask(home_state)[rows]]
+
+    def category_codes(self, category: str) -> np.ndarray:
+        """Codes matching the service's category filter (GEN also matches OPEN)."""
+        vocab = self.vocab["category"]
+        if category and category not in ("OPEN", "GEN"):
+            matches = [i for i, c in enumerate(vocab) if category.upper() in c.upper()]
+        else:
+            matches = [i for i, c in enumerate(vocab) if c in ("OPEN", "GEN") or "OPEN" in c.upper()]
+        return np.array(matches, dtype=np.int16)
+
+    def pool_keys(
+        self,
+        category: str,
+        year: int,
+        round_number: int,
+        gender: Optional[str] = None,
+        pwd: bool = False,
+        quotas: Optional[Sequence[str]] = None,
+        home_state: Optional[str] = None
+    ) -> Tuple[tuple, ...]:
+        """
+        PARTITION keys of the round's seat pools a candidate competes for.
+        With a home state and no explicit quotas every quota's pool is
+        included; state_mask then keeps the eligible seats.
+        """
+        if quotas is not None:
+            quota_codes = self.codes("quota", quotas)
+        elif home_state is not None:
+            quota_codes = list(range(len(self.vocab["quota"])))
+        else:
+            quota_codes = self.codes("quota", DEFAULT_MAINS_QUOTAS)
+        return self.partition_keys(self.PARTITION, {
+            "year": [year],
+            "round": [round_number],
+            "category": self.category_codes(category).tolist(),
+            "gender": self.codes("gender", eligible_genders(gender)),
+            "pwd": [int(pwd)],
+            "quota": quota_codes,
+        })
+
+    def recommend(
+        self,
+        rank: int,
+        category: str,
+        year: int,
+        round_number: int,
+        institute_types: Sequence[str],
+        gender: Optional[str] = None,
+        pwd: bool = False,
+        quotas: Optional[Sequence[str]] = None,
+        home_state: Optional[str] = None
+    ) -> RecommendationLists:
+        pool = self.pool_keys(category, year, round_number, gender, pwd, quotas, home_state)
+        if not pool:
+            return [], [], []
+
+        # Same window as the DB query: rank * 0.5 <= closing <= min(rank * 3, rank + 50000),
+        # cut from each pool before merging
+        partition = self.partition(self.PARTITION)
+        low, high = max(rank * 0.5, 1), min(rank * 3, rank + 50000)
+        rows = np.sort(np.concatenate([self.rank_window(partition[key], low, high) for key in pool]))
+        rows = self.eligible_rows(rows, home_state)
+        if institute_types:
+            type_codes = [self.code("institute_type", t) for t in institute_types]
+            rows = rows[np.isin(self.columns["institute_type"][rows], type_codes)]
+
+        safe, moderate, ambitious = self.bands(rows, rank)
+        ambitious = ambitious[::-1]  # Closest to reach first
+        return self.to_items(rank, safe, moderate, ambitious, simulated=True)
+
+    def seat_rows(
+        self,
+        category: str,
+        year: int,
+        gender: Optional[str] = None,
+        pwd: bool = False,
+        quotas: Optional[Sequence[str]] = None,
+        home_state: Optional[str] = None,
+        institute_types: Optional[Sequence[str]] = None
+    ) -> np.ndarray:
+        """Rows of every round of the candidate's eligible seat pools, in closing-rank order."""
+        rounds = sorted({key[1] for key in self.partition(self.PARTITION) if key[0] == year})
+        pool = tuple(itertools.chain.from_iterable(
+            self.pool_keys(category, year, round_number, gender, pwd, quotas, home_state) for round_number in rounds
+        ))
+        if not pool:
+            return np.empty(0, dtype=np.int64)
+        rows = self.eligible_rows(self.pool_rows(self.PARTITION, pool), home_state)
+        if institute_types:
+            rows = rows[np.isin(self.columns["institute_type"][rows], self.codes("institute_type", institute_types))]
+        return rows
+
+    def lookup(
+        self,
+        mentions: Mentions,
+        rank: int,
+        category: str,
+        year: int,
+        round_number: int,
+        gender: Optional[str] = None,
+        pwd: bool = False,
+        quotas: Optional[Sequence[str]] = None,
+        home_state: Optional[str] = None,
+        limit: int = 10
+    ) -> List[dict]:
+        """Closing ranks of the mentioned (institute, branch) pairs in the given round, nearest to `rank` first."""
+        pool = self.pool_keys(category, year, round_number, gender, pwd, quotas, home_state)
+        if not pool:
+            return []
+        rows = self.eligible_rows(self.pool_rows(self.PARTITION, pool), home_state)
+        return self._lookup_rows(self.mentioned_rows(rows, mentions), rank, limit)
+
+    def in_range(
+        self,
+        rank: int,
+        category: str,
+        year: int,
+        round_number: int,
+        gender: Optional[str] = None,
+        pwd: bool = False,
+        quotas: Optional[Sequence[str]] = None,
+        home_state: Optional[str] = None,
+        tolerance: float = RANGE_TOLERANCE,
+        limit: int = RANGE_MATCH_LIMIT
+    ) -> List[dict]:
+        """Seats of the round whose opening-closing range contains or nearly contains `rank`."""
+        # PARTITION and RANGE_PARTITION have the same columns, so the pool keys index the interval trees
+        pool = self.pool_keys(category, year, round_number, gender, pwd, quotas, home_state)
+        mask = self.state_mask(home_state) if home_state is not None else None
+        return self._in_range(pool, rank, tolerance, limit, mask)
+
+
+def projected_file(cutoff_file: str) -> str:
+    """A family's projected cutoff CSV, relative to the data directory."""
+    return f"{PROJECTED_DIR}/{cutoff_file}"
+
+
+def _read_csv(path: Path) -> List[dict]:
+    with open(path, encoding="utf-8", newline="") as f:
+        return list(csv.DictReader(f))
+
+
+def _optional_int(value: Optional[str]) -> Optional[int]:
+    if value is None or value == "":
+        return None
+    return int(float(value))
+
+
+def _encode(values: List[str], vocab: List[str]) -> np.ndarray:
+    """Dictionary-encode strings, extending `vocab` in first-seen order."""
+    lookup = {v: i for i, v in enumerate(vocab)}
+    codes = np.empty(len(values), dtype=np.int16)
+    for i, v in enumerate(values):
+        if v not in lookup:
+            lookup[v] = len(vocab)
+            vocab.append(v)
+        codes[i] = lookup[v]
+    return codes
+
+
+def load_table(data_dir: Path, sources, table_cls):
+    """Load and join one exam's institute, branch, cutoff and projected cutoff CSVs into a table."""
+    institutes = {"name": [], "location": [], "state": [], "nirf_rank": [], "institute_type": []}
+    branch_names: List[str] = []
+    branch_lookup: Dict[str, int] = {}
+    vocab = {column: [] for column in CutoffTable.CODED_COLUMNS}
+    parts: Dict[str, list] = {
+        "institute": [], "branch": [], "year": [], "round": [], "opening_rank": [],
+        "closing_rank": [], "category": [], "gender": [], "pwd": [], "quota": [], "institute_type": []
+    }
+    projected_years = set()
+
+    for institute_type, _, institute_file, id_column, branch_file, cutoff_file in sources:
+        institute_index = {}
+        for row in _read_csv(data_dir / institute_file):
+            institute_index[row[id_column]] = len(institutes["name"])
+            institutes["name"].append(row["name"])
+            institutes["location"].append(row.get("location") or None)
+            institutes["state"].append(row.get("state") or None)
+            institutes["nirf_rank"].append(_optional_int(row.get("nirf_rank")))
+            institutes["institute_type"].append(institute_type)
+
+        # Branches are shared by name across families
+        branch_index = {}
+        for row in _read_csv(data_dir / branch_file):
+            name = row["branch_name"]
+            if name not in branch_lookup:
+                branch_lookup[name] = len(branch_names)
+                branch_names.append(name)
+            branch_index[row["branch_id"]] = branch_lookup[name]
+
+        for file_name in (cutoff_file, projected_file(cutoff_file)):
+            cutoffs = _read_csv(data_dir / file_name)
+            try:
+                parts["institute"].append(np.array([institute_index[r[id_column]] for r in cutoffs], dtype=np.int32))
+                parts["branch"].append(np.array([branch_index[r["branch_id"]] for r in cutoffs], dtype=np.int32))
+            except KeyError as e:
+                raise SnapshotValidationError(f"{file_name}: unknown institute/branch id {e}")
+            years = np.array([int(r["year"]) for r in cutoffs], dtype=np.int16)
+            if file_name != cutoff_file:
+                projected_years.update(np.unique(years).tolist())
+            parts["year"].append(years)
+            parts["round"].append(np.array([int(r["round"]) for r in cutoffs], dtype=np.int16))
+            parts["opening_rank"].append(np.array(
+                [_optional_int(r.get("opening_rank")) or MISSING_RANK for r in cutoffs], dtype=np.int32
+            ))
+            parts["closing_rank"].append(np.array([int(r["closing_rank"]) for r in cutoffs], dtype=np.int32))
+            parts["category"].append(_encode([r["category"] for r in cutoffs], vocab["category"]))
+            parts["gender"].append(_encode([r.get("gender") or GENDER_NEUTRAL for r in cutoffs], vocab["gender"]))
+            parts["pwd"].append(np.array([r.get("pwd") == "True" for r in cutoffs], dtype=bool))
+            parts["quota"].append(_encode([r.get("quota") or "" for r in cutoffs], vocab["quota"]))
+            parts["institute_type"].append(_encode([institute_type] * len(cutoffs), vocab["institute_type"]))
+
+    columns = {name: np.concatenate(chunks) for name, chunks in parts.items()}
+    order = np.argsort(columns["closing_rank"], kind="stable")
+    columns = {name: values[order] for name, values in columns.items()}
+    return table_cls(columns, vocab, institutes, branch_names, projected_years)
+
+
+def _file_sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def load_columnar_table(data_dir: Path, exam: str, sources, table_cls):
+    """
+    Same table as load_table, memory-mapped from the exam bundle in
+    data_dir/columnar/exams/<exam>/ (see ingestion/columnar.py). The bundle
+    holds the columns already merged and sorted, so nothing is copied.
+
+    Raises SnapshotValidationError if the bundle is missing, has another
+    schema version, or does not match the CSVs it was written from.
+    """
+    bundle = data_dir / COLUMNAR_DIR / EXAMS_DIR / exam
+    try:
+        meta = json.loads((bundle / "meta.json").read_text(encoding="utf-8"))
+        strings = json.loads((bundle / "strings.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        raise SnapshotValidationError(f"No usable columnar bundle for {exam}: {e}")
+    if meta.get("schema_version") != EXAM_SCHEMA_VERSION:
+        raise SnapshotValidationError(f"Columnar bundle for {exam} has schema {meta.get('schema_version')}")
+    names = [
+        name for _, _, institute_file, _, branch_file, cutoff_file in sources
+        for name in (institute_file, branch_file, cutoff_file, projected_file(cutoff_file))
+    ]
+    stale = [name for name in names if meta.get("sources", {}).get(name) != _file_sha256(data_dir / name)]
+    if stale:
+        raise SnapshotValidationError(f"Columnar bundle for {exam} does not match {', '.join(stale)}")
+
+    # Plain ndarray views of the mappings (no copy; skips np.memmap's per-slice overhead)
+    columns = {
+        name: np.asarray(np.load(bundle / f"{name}.npy", mmap_mode="r"))
+        for name in ("institute", "branch", "year", "round", "opening_rank", "closing_rank",
+                     "category", "gender", "pwd", "quota", "institute_type")
+    }
+    if any(len(values) != meta.get("rows") for values in columns.values()):
+        raise SnapshotValidationError(f"Columnar bundle for {exam} has columns of different lengths")
+    stored = strings["institutes"]
+    institutes = {
+        "name": stored["name"],
+        "location": [location or None for location in stored["location"]],
+        "state": [state or None for state in stored["state"]],
+        "nirf_rank": [rank if rank >= 0 else None for rank in stored["nirf_rank"]],
+        "institute_type": stored["institute_type"],
+    }
+    vocab = {column: list(strings["vocab"][column]) for column in CutoffTable.CODED_COLUMNS}
+    return table_cls(columns, vocab, institutes, strings["branch_names"], meta.get("projected_years", ()))
+
+
+def load_institute_facts(data_dir: Path) -> Dict[int, dict]:
+    """Entity id -> FACT_COLUMNS values (int or None); empty if the facts file is missing."""
+    path = data_dir / INSTITUTE_FACTS_FILE
+    if not path.exists():
+        return {}
+    return {
+        int(row["institute_id"]): {column: _optional_int(row.get(column)) for column in FACT_COLUMNS}
+        for row in _read_csv(path)
+    }
+
+
+def fingerprint_files(data_dir: Path, file_names: Sequence[str]) -> str:
+    """Content hash of the given files, used as the dataset version."""
+    digest = hashlib.sha256()
+    for name in sorted(file_names):
+        digest.update(name.encode("utf-8"))
+        digest.update((data_dir / name).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+class CutoffSnapshot:
+    """Immutable snapshot of all cutoff data, swapped atomically on reload."""
+
+    def __init__(
+        self,
+        advanced: AdvancedCutoffIndex,
+        mains: MainsCutoffIndex,
+        version: str,
+        source: str,
+        data_format: str = "csv",
+        entities: Optional[EntityDictionary] = None,
+        facts: Optional[Dict[int, dict]] = None
+    ):
+        self.advanced = advanced
+        self.mains = mains
+        self.version = version
+        self.source = source
+        self.data_format = data_format
+        self.entities = entities if entities is not None else EntityDictionary()
+        self.advanced.attach_entities(self.entities, facts)
+        self.mains.attach_entities(self.entities, facts)
+        # Published and projected years of either exam
+        self.years = sorted(set(self.advanced.years()) | set(self.mains.years()))
+        self.loaded_at = time.time()
+
+    @staticmethod
+    def source_files() -> List[str]:
+        files = []
+        for sources in (ADVANCED_SOURCES, MAINS_SOURCES):
+            for _, _, institute_file, _, branch_file, cutoff_file in sources:
+                files.extend([institute_file, branch_file, cutoff_file, projected_file(cutoff_file)])
+        return files
+
+    @classmethod
+    def watched_files(cls) -> List[str]:
+        """Files whose change triggers a reload: the sources, the entity dictionary and the institute facts."""
+        return cls.source_files() + [ENTITIES_FILE, INSTITUTE_FACTS_FILE]
+
+    @classmethod
+    def load(cls, data_dir: str) -> "CutoffSnapshot":
+        """Build a snapshot from a normalized_data directory and validate it."""
+        path = Path(data_dir)
+        missing = [f for f in cls.source_files() if not (path / f).exists()]
+        if missing:
+            raise SnapshotValidationError(f"Missing files in {path}: {', '.join(missing)}")
+
+        try:
+            advanced = load_columnar_table(path, "advanced", ADVANCED_SOURCES, AdvancedCutoffIndex)
+            mains = load_columnar_table(path, "mains", MAINS_SOURCES, MainsCutoffIndex)
+            data_format = "columnar"
+        except SnapshotValidationError as e:
+            print(f"LOG: Columnar snapshot unavailable ({e}); parsing CSVs")
+            advanced = load_table(path, ADVANCED_SOURCES, AdvancedCutoffIndex)
+            mains = load_table(path, MAINS_SOURCES, MainsCutoffIndex)
+            data_format = "csv"
+
+        # Facts change what an item shows, and the entity dictionary decides
+        # which institute each fact attaches to, so both are part of the version when present
+        optional_files = [f for f in (ENTITIES_FILE, INSTITUTE_FACTS_FILE) if (path / f).exists()]
+        snapshot = cls(
+            advanced=advanced,
+            mains=mains,
+            version=fingerprint_files(path, cls.source_files() + optional_files),
+            source=str(path),
+            data_format=data_format,
+            entities=EntityDictionary.load(data_dir),
+            facts=load_institute_facts(path)
+        )
+        snapshot.validate()
+        # Build partitions now so the first request after a swap is not slower
+        snapshot.advanced.warm()
+        snapshot.mains.warm()
+        return snapshot
+
+    def validate(self) -> None:
+        """Sanity checks run before a snapshot may replace the live one."""
+        for name, table in (("advanced", self.advanced), ("mains", self.mains)):
+            if len(table) == 0:
+                raise SnapshotValidationError(f"{name} cutoff table is empty")
+            if int(table.columns["closing_rank"].min()) <= 0:
+                raise SnapshotValidationError(f"{name} cutoff table has non-positive closing ranks")
+            unknown = set(table.vocab["category"]) - {"GEN", "OBC", "SC", "ST", "EWS", "OPEN"}
+            if unknown:
+                raise SnapshotValidationError(f"{name} cutoff table has unknown categories: {sorted(unknown)}")
+            unknown = set(table.vocab["gender"]) - {GENDER_NEUTRAL, FEMALE_ONLY}
+            if unknown:
+                raise SnapshotValidationError(f"{name} cutoff table has unknown seat pools: {sorted(unknown)}")
+            unknown = {state for state in table.institutes["state"] if state is not None} - set(VALID_STATES)
+            if unknown:
+                raise SnapshotValidationError(f"{name} institutes have unknown states: {sorted(unknown)}")
+
+    def stats(self) -> dict:
+        return {
+            "version": self.version,
+            "source": self.source,
+            "format": self.data_format,
+            "loaded_at": self.loaded_at,
+            "advanced_rows": len(self.advanced),
+            "mains_rows": len(self.mains),
+            "projected_years": sorted(set(self.advanced.projected_years) | set(self.mains.projected_years)),
+            "entities": len(self.entities),
+            "admission_model": {"advanced": self.advanced.admission.stats(), "mains": self.mains.admission.stats()},
+        }
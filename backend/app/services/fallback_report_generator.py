@@ -8,11 +8,13 @@ def generate_fallback_report(
     query: Optional[str],
     safe: List[RecommendationItem],
     moderate: List[RecommendationItem],
-    ambitious: List[RecommendationItem]
+    ambitious: List[RecommendationItem],
+    year: int = 2024
 ) -> str:
     """
     Generates a deterministic fallback counseling report when LLM is unavailable.
-    Strictly follows the requested 10-section structure.
+    Strictly follows the requested 10-section structure. `year` is the
+    counseling year the recommendations were filtered for.
     """
     
     # helper for list formatting
@@ -24,6 +26,11 @@ def generate_fallback_report(
         for item in items[:limit]:
             lines.append(f"- **{item.iit}** - {item.branch}")
             lines.append(f"  - Closing Rank: {item.closing_rank}")
+            if item.admission_frequency is not None:
+                lines.append(
+                    f"  - Simulated cutoff: {item.closing_rank_low}-{item.closing_rank_high} "
+                    f"(admitted in {item.admission_frequency:.0%} of simulated years)"
+                )
             if item.confidence == 'safe':
                 lines.append("  - *Reason:* Your rank is significantly better than the historical cutoff.")
             elif item.confidence == 'moderate':
@@ -39,7 +46,7 @@ def generate_fallback_report(
     report += "### 2. Student Profile Summary\n"
     report += f"- **JEE Advanced Rank:** {rank}\n"
     report += f"- **Category:** {category}\n"
-    report += f"- **Counseling Year:** 2024\n"
+    report += f"- **Counseling Year:** {year}\n"
     if query:
         report += f"- **Student's Goal:** {query}\n"
     report += "\n---\n\n"
@@ -111,6 +118,6 @@ def generate_fallback_report(
 
     # 10. Disclaimer
     report += "### 10. Disclaimer\n"
-    report += "Recommendations are based on historical cutoff data from previous years. Final outcomes depend on JOSAA 2024 dynamics, seat matrix changes, and total applicants. This report is for guidance only."
+    report += f"Recommendations are based on historical cutoff data from previous years. Final outcomes depend on JOSAA {year} dynamics, seat matrix changes, and total applicants. This report is for guidance only."
 
     return report
@@ -3,16 +3,35 @@ Service for filtering JEE Mains recommendations based on rank.
 Queries the jee_mains_cutoffs view which unifies NIT, IIIT, and CFI data.
 """
 
+import math
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
-from typing import List, Tuple
+from sqlalchemy import and_, func, null, or_
+from typing import List, Optional, Sequence, Tuple
 from app.models.jee_mains import JeeMainsCutoff
-from app.schemas.response import RecommendationItem
+from app.schemas.response import RecommendationItem, RecommendationItemList
+from app.services.admission_model import confidence_band, static_probability
+from app.services.cutoff_index import eligible_genders, range_distance, range_fact
+from app.services.snapshot_manager import snapshot_manager
+from app.core.database import live_columns
+from app.core.metrics import STAGE_SECONDS
+from app.utils.constants import (
+    RANGE_TOLERANCE,
+    RANGE_MATCH_LIMIT,
+    DEFAULT_MAINS_QUOTAS,
+    ALL_INDIA_QUOTA,
+    HOME_STATE_QUOTA,
+    OTHER_STATE_QUOTA,
+    DOMICILE_QUOTAS,
+    CONFIDENCE_SAFE,
+    CONFIDENCE_MODERATE,
+    CONFIDENCE_AMBITIOUS,
+)
 
 
 class JeeMainsRankFilterService:
     """Service for filtering JEE Mains college recommendations."""
     
+    @STAGE_SECONDS.labels(stage="rank_filter").time()
     def get_recommendations(
         self, 
         db: Session, 
@@ -20,16 +39,32 @@ class JeeMainsRankFilterService:
         category: str, 
         year: int = 2024,
         round_number: int = 5,
-        institute_types: List[str] = None
+        institute_types: List[str] = None,
+        gender: Optional[str] = None,
+        pwd: bool = False,
+        quotas: Optional[Sequence[str]] = None,
+        home_state: Optional[str] = None
     ) -> Tuple[List[RecommendationItem], List[RecommendationItem], List[RecommendationItem]]:
         """
         Get recommendations for JEE Mains based on Rank.
+        Only the candidate's seat pools are matched: gender-neutral seats
+        (plus female-only ones for FEMALE), PwD-reserved seats only with
+        `pwd`, and the given quotas (default DEFAULT_MAINS_QUOTAS). With a
+        `home_state`, quotas are matched by eligibility instead: HS seats
+        only at institutes in that state, OS seats only elsewhere.
         Returns Tuple of (Safe, Moderate, Ambitious) lists.
         """
         
         if institute_types is None:
             institute_types = ["NIT", "IIIT", "GFTI"]
         
+        # Serve from the in-memory snapshot when loaded (same semantics as the query below)
+        snapshot = snapshot_manager.current()
+        if snapshot is not None:
+            return snapshot.mains.recommend(
+                rank, category, year, round_number, institute_types, gender, pwd, quotas, home_state
+            )
+        
         # Base Query
         query = db.query(JeeMainsCutoff).filter(
             JeeMainsCutoff.year == year,
@@ -38,16 +73,10 @@ class JeeMainsRankFilterService:
         )
         
         # Category Filter
-        if category and category != "OPEN" and category != "GEN":
-            query = query.filter(JeeMainsCutoff.category.ilike(f"%{category}%"))
-        else:
-            query = query.filter(
-                or_(
-                    JeeMainsCutoff.category == "OPEN",
-                    JeeMainsCutoff.category == "GEN",
-                    JeeMainsCutoff.category.ilike("%OPEN%")
-                )
-            )
+        query = self._filter_category(query, category)
+        
+        # Seat Pool Filter
+        query = self._filter_pools(query, gender, pwd, quotas, home_state)
         
         # Institute Type Filter
         if institute_types:
@@ -61,41 +90,156 @@ class JeeMainsRankFilterService:
             JeeMainsCutoff.closing_rank >= rank * 0.5  # Don't show options way below rank
         ).all()
         
-        safe = []
-        moderate = []
-        ambitious = []
+        buckets = {CONFIDENCE_SAFE: [], CONFIDENCE_MODERATE: [], CONFIDENCE_AMBITIOUS: []}
         
         for item in results:
-            closing = item.closing_rank
-            
-            # Classification logic
-            # Safe: Closing rank is 15%+ higher than user rank
-            # Moderate: Closing rank is within 15% of user rank
-            # Ambitious: Closing rank is 5-15% lower than user rank
-            
-            if closing > rank * 1.15:
-                confidence = "safe"
-                safe.append(self._map_to_schema(item, confidence))
-            elif rank * 0.95 <= closing <= rank * 1.15:
-                confidence = "moderate"
-                moderate.append(self._map_to_schema(item, confidence))
-            elif rank * 0.85 <= closing < rank * 0.95:
-                confidence = "ambitious"
-                ambitious.append(self._map_to_schema(item, confidence))
+            # Admission probability band, with the closing rank taken as final
+            # (the snapshot refines this with the round-by-round model)
+            probability = float(static_probability(item.closing_rank, rank))
+            confidence = confidence_band(probability)
+            if confidence is not None:
+                buckets[confidence].append(self._to_row(item, confidence, probability))
+        safe = buckets[CONFIDENCE_SAFE]
+        moderate = buckets[CONFIDENCE_MODERATE]
+        ambitious = buckets[CONFIDENCE_AMBITIOUS]
         
         # Sort by closing rank (lower = better college)
-        safe.sort(key=lambda x: x.closing_rank)
-        moderate.sort(key=lambda x: x.closing_rank)
-        ambitious.sort(key=lambda x: x.closing_rank, reverse=True)  # Closest to reach first
+        safe.sort(key=lambda x: x["closing_rank"])
+        moderate.sort(key=lambda x: x["closing_rank"])
+        ambitious.sort(key=lambda x: x["closing_rank"], reverse=True)  # Closest to reach first
         
-        return safe, moderate, ambitious
+        # Build response items in bulk (one pydantic-core call per bucket)
+        return (
+            RecommendationItemList.validate_python(safe),
+            RecommendationItemList.validate_python(moderate),
+            RecommendationItemList.validate_python(ambitious)
+        )
+
+    def get_range_matches(
+        self,
+        db: Session,
+        rank: int,
+        category: str,
+        year: int = 2024,
+        round_number: int = 5,
+        gender: Optional[str] = None,
+        pwd: bool = False,
+        quotas: Optional[Sequence[str]] = None,
+        home_state: Optional[str] = None,
+        tolerance: float = RANGE_TOLERANCE,
+        limit: int = RANGE_MATCH_LIMIT
+    ) -> List[dict]:
+        """
+        Range query mode: seats of a round whose admitted range
+        [opening_rank, closing_rank] contains or nearly contains the rank
+        (overlaps rank * (1 -/+ tolerance)), in the candidate's seat pools and
+        the same order as RankFilterService.get_range_matches.
+        """
+        snapshot = snapshot_manager.current()
+        if snapshot is not None:
+            return snapshot.mains.in_range(
+                rank, category, year, round_number, gender, pwd, quotas, home_state, tolerance, limit
+            )
+        
+        # Integer bounds: ranks are integers and the columns compare as INTEGER
+        low, high = math.ceil(rank * (1 - tolerance)), math.floor(rank * (1 + tolerance))
+        # LEAST ignores NULL, so a missing opening rank leaves the point [closing, closing];
+        # a view created before opening_rank existed treats every seat that way
+        if "opening_rank" in live_columns(db, JeeMainsCutoff.__tablename__):
+            opening = JeeMainsCutoff.opening_rank
+            start = func.least(JeeMainsCutoff.opening_rank, JeeMainsCutoff.closing_rank)
+        else:
+            opening, start = null(), JeeMainsCutoff.closing_rank
+        query = db.query(
+            JeeMainsCutoff.institute_name, JeeMainsCutoff.branch_name, opening.label("opening_rank"),
+            JeeMainsCutoff.closing_rank, JeeMainsCutoff.round, JeeMainsCutoff.gender, JeeMainsCutoff.quota
+        ).filter(
+            JeeMainsCutoff.year == year,
+            JeeMainsCutoff.round == round_number,
+            start <= high,
+            JeeMainsCutoff.closing_rank >= low
+        )
+        query = self._filter_pools(self._filter_category(query, category), gender, pwd, quotas, home_state)
+        results = query.all()
+        results.sort(key=lambda item: (range_distance(item.opening_rank, item.closing_rank, rank), item.closing_rank))
+        return [
+            range_fact(
+                item.institute_name, item.branch_name, item.opening_rank, item.closing_rank,
+                item.round, item.gender, item.quota or None, rank
+            )
+            for item in results[:limit]
+        ]
+
+    @staticmethod
+    def _filter_category(query, category: str):
+        """Category filter shared by the queries (GEN also matches OPEN)."""
+        if category and category != "OPEN" and category != "GEN":
+            return query.filter(JeeMainsCutoff.category.ilike(f"%{category}%"))
+        return query.filter(
+            or_(
+                JeeMainsCutoff.category == "OPEN",
+                JeeMainsCutoff.category == "GEN",
+                JeeMainsCutoff.category.ilike("%OPEN%")
+            )
+        )
 
-    def _map_to_schema(self, item: JeeMainsCutoff, confidence: str) -> RecommendationItem:
-        """Map database model to response schema."""
-        return RecommendationItem(
-            iit=item.institute_name,  # Using 'iit' field for institute name
-            branch=item.branch_name,
-            closing_rank=item.closing_rank,
-            confidence=confidence,
-            location="India"
+    @staticmethod
+    def _filter_pools(
+        query, gender: Optional[str], pwd: bool, quotas: Optional[Sequence[str]], home_state: Optional[str] = None
+    ):
+        """Seat pool filter shared by the queries (see get_recommendations and MainsCutoffIndex.state_mask)."""
+        query = query.filter(
+            JeeMainsCutoff.gender.in_(eligible_genders(gender)),
+            JeeMainsCutoff.pwd == pwd
         )
+        if home_state is None:
+            return query.filter(JeeMainsCutoff.quota.in_(DEFAULT_MAINS_QUOTAS if quotas is None else list(quotas)))
+        if quotas is not None:
+            query = query.filter(JeeMainsCutoff.quota.in_(list(quotas)))
+        same_state = JeeMainsCutoff.institute_state == home_state
+        domicile = [quota for quota, state in DOMICILE_QUOTAS.items() if state == home_state]
+        return query.filter(or_(
+            JeeMainsCutoff.quota == ALL_INDIA_QUOTA,
+            and_(JeeMainsCutoff.quota == HOME_STATE_QUOTA, same_state),
+            and_(JeeMainsCutoff.quota == OTHER_STATE_QUOTA,
+                 or_(JeeMainsCutoff.institute_state.is_(None), ~same_state)),
+            JeeMainsCutoff.quota.in_(domicile)
+        ))
+
+    def get_mentioned_cutoffs(
+        self,
+        message: str,
+        rank: int,
+        category: str,
+        year: int = 2024,
+        round_number: int = 5
+    ) -> List[dict]:
+        """
+        Closing ranks of the institutes and branches named in a chat
+        message, resolved with the snapshot's entity dictionary. Empty when
+        no snapshot is loaded or nothing is mentioned.
+        """
+        snapshot = snapshot_manager.current()
+        if snapshot is None:
+            return []
+        mentions = snapshot.entities.find_mentions(message)
+        if not mentions:
+            return []
+        return snapshot.mains.lookup(mentions, rank, category, year, round_number)
+
+    def _to_row(self, item: JeeMainsCutoff, confidence: str, probability: Optional[float] = None) -> dict:
+        """
+        Map database model to a response row (see RecommendationItem).
+        Placement and fee facts are only joined by the in-memory snapshot.
+        """
+        return {
+            "iit": item.institute_name,  # Using 'iit' field for institute name
+            "branch": item.branch_name,
+            "closing_rank": item.closing_rank,
+            "confidence": confidence,
+            "admission_probability": None if probability is None else round(probability, 3),
+            "location": item.institute_location or "India",
+            "nirf_rank": item.nirf_rank,
+            "gender": item.gender,
+            "quota": item.quota or None
+        }
@@ -2,13 +2,91 @@
 Gemini LLM service for generating counseling explanations.
 """
 
+import threading
+import time
 from typing import List, Optional
 import google.generativeai as genai
 from app.schemas.response import RecommendationItem, RecommendationResponse
 from app.core.config import settings
+from app.core.metrics import (
+    STAGE_SECONDS,
+    LLM_CALL_SECONDS,
+    LLM_FALLBACKS,
+    LLM_ENABLED,
+    LLM_CONSECUTIVE_FAILURES,
+    LLM_CIRCUIT_STATE,
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+)
+from app.utils.constants import (
+    CHARS_PER_TOKEN,
+    CHAT_SUMMARY_TOKEN_BUDGET,
+    LLM_BREAKER_FAILURES,
+    LLM_BREAKER_COOLDOWN,
+)
 from app.services.fallback_report_generator import generate_fallback_report
 
 
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling the LLM while the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open breaker around the LLM calls of a process.
+    `failures` failed calls in a row open it; calls then fail fast with
+    CircuitOpenError (and get the deterministic fallbacks) for `cooldown`
+    seconds. The first call after that is a trial (half-open) while the
+    others keep failing fast: its success closes the breaker, its failure
+    opens it for another cooldown. The state is exported as LLM_CIRCUIT_STATE.
+    """
+
+    def __init__(self, failures: int, cooldown: float):
+        self.failures = failures
+        self.cooldown = cooldown
+        self.state = CIRCUIT_CLOSED
+        self._failed = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+        LLM_CIRCUIT_STATE.set(self.state)
+
+    def _move(self, state: int) -> None:
+        self.state = state
+        LLM_CIRCUIT_STATE.set(state)
+
+    def before_call(self) -> None:
+        """Let a call through, or raise CircuitOpenError."""
+        with self._lock:
+            if self.state == CIRCUIT_CLOSED:
+                return
+            if self.state == CIRCUIT_OPEN and time.monotonic() - self._opened_at >= self.cooldown:
+                self._move(CIRCUIT_HALF_OPEN)
+                return
+            raise CircuitOpenError(f"LLM circuit breaker open after {self._failed} failed calls")
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failed = 0
+            LLM_CONSECUTIVE_FAILURES.set(0)
+            if self.state != CIRCUIT_CLOSED:
+                print("LOG: LLM circuit breaker closed.")
+                self._move(CIRCUIT_CLOSED)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failed += 1
+            LLM_CONSECUTIVE_FAILURES.set(self._failed)
+            if self.state == CIRCUIT_HALF_OPEN or (self.state == CIRCUIT_CLOSED and self._failed >= self.failures):
+                print(f"LOG: LLM circuit breaker opened for {self.cooldown:.0f}s after {self._failed} failed calls.")
+                self._opened_at = time.monotonic()
+                self._move(CIRCUIT_OPEN)
+
+
+# Shared by every LLMService of the process: they all call the same API
+circuit_breaker = CircuitBreaker(LLM_BREAKER_FAILURES, LLM_BREAKER_COOLDOWN)
+
+
 class LLMService:
     """Service for generating LLM-based counseling explanations."""
     
@@ -27,6 +105,34 @@ class LLMService:
                 self.enabled = False
         else:
             self.model = None
+        LLM_ENABLED.set(int(self.enabled))
+
+    def _generate(self, method: str, prompt: str):
+        """
+        Call the model through the circuit breaker (CircuitOpenError while
+        it is open). The call's latency is observed per `method` and outcome.
+        """
+        circuit_breaker.before_call()
+        start = time.perf_counter()
+        try:
+            response = self.model.generate_content(prompt)
+        except Exception:
+            LLM_CALL_SECONDS.labels(method=method, outcome="error").observe(time.perf_counter() - start)
+            circuit_breaker.record_failure()
+            raise
+        LLM_CALL_SECONDS.labels(method=method, outcome="ok").observe(time.perf_counter() - start)
+        circuit_breaker.record_success()
+        return response
+
+    @staticmethod
+    def _failure_reason(error: Exception) -> str:
+        """Fallback reason of a failed LLM answer."""
+        return "circuit_open" if isinstance(error, CircuitOpenError) else "error"
+
+    @staticmethod
+    def _record_fallback(method: str, reason: str) -> None:
+        """Count an answer served without the LLM: disabled, circuit_open, error, empty or blocked."""
+        LLM_FALLBACKS.labels(method=method, reason=reason).inc()
     
     def generate_counselor_summary(
         self,
@@ -53,6 +159,7 @@ class LLMService:
         """
         if not self.enabled:
             print("LOG: LLM disabled. Using fallback summary.")
+            self._record_fallback("counselor_summary", "disabled")
             return self._fallback_summary(safe, moderate, ambitious)
         
         try:
@@ -60,7 +167,7 @@ class LLMService:
             prompt = self._build_summary_prompt(rank, category, query, safe, moderate, ambitious)
             print(f"LOG: Summary Prompt Length: {len(prompt)}")
             
-            response = self.model.generate_content(prompt)
+            response = self._generate("counselor_summary", prompt)
             
             if not response.text:
                 print("LOG: LLM Empty Response for Summary")
@@ -73,6 +180,7 @@ class LLMService:
             print(f"LOG: Error generating counselor summary: {e}")
             if hasattr(e, 'response'): 
                  print(f"LOG: Block Reason: {e.response.prompt_feedback}")
+            self._record_fallback("counselor_summary", self._failure_reason(e))
             return self._fallback_summary(safe, moderate, ambitious)
     
     def generate_followup_response(
@@ -99,14 +207,16 @@ class LLMService:
             Contextual response string
         """
         if not self.enabled:
+            self._record_fallback("followup_response", "disabled")
             return "I understand your question. Based on your rank and category, I can help you explore your options further. Feel free to ask about branch preferences, risk assessment, or specific colleges."
 
         try:
             prompt = self._build_followup_prompt(rank, category, user_query, safe, moderate, ambitious)
-            response = self.model.generate_content(prompt)
+            response = self._generate("followup_response", prompt)
             return response.text.strip()
         except Exception as e:
             print(f"Error generating follow-up response: {e}")
+            self._record_fallback("followup_response", self._failure_reason(e))
             return "I understand you're asking about that aspect of your options. Based on your profile, I recommend focusing on your safe options while keeping moderate choices as realistic targets. Would you like me to elaborate on any specific area?"
 
     def generate_full_report(
@@ -116,7 +226,8 @@ class LLMService:
         query: Optional[str],
         safe: List[RecommendationItem],
         moderate: List[RecommendationItem],
-        ambitious: List[RecommendationItem]
+        ambitious: List[RecommendationItem],
+        year: int = 2024
     ) -> str:
         """
         Generate Layer 3: Detailed counseling report with reasoning.
@@ -128,20 +239,22 @@ class LLMService:
             safe: List of safe recommendations
             moderate: List of moderate recommendations
             ambitious: List of ambitious recommendations
+            year: Counseling year the recommendations were filtered for
         
         Returns:
             Detailed counseling report string
         """
         if not self.enabled:
             print("LOG: LLM not enabled/configured. Using fallback report.")
-            return self._fallback_full_report(rank, category, query, safe, moderate, ambitious)
+            self._record_fallback("full_report", "disabled")
+            return self._fallback_full_report(rank, category, query, safe, moderate, ambitious, year)
         
         try:
             print(f"LOG: Attempting LLM generation for Rank {rank}...")
-            prompt = self._build_full_report_prompt(rank, category, query, safe, moderate, ambitious)
+            prompt = self._build_full_report_prompt(rank, category, query, safe, moderate, ambitious, year)
             print(f"LOG: Full Report Prompt Length: {len(prompt)}")
             
-            response = self.model.generate_content(prompt)
+            response = self._generate("full_report", prompt)
             
             # Check for safety blocking or empty response
             try:
@@ -151,19 +264,23 @@ class LLMService:
                 print("LOG: LLM response blocked by safety filters. Using fallback.")
                 if hasattr(response, 'prompt_feedback'):
                     print(f"LOG: Block Reason: {response.prompt_feedback}")
-                return self._fallback_full_report(rank, category, query, safe, moderate, ambitious)
+                self._record_fallback("full_report", "blocked")
+                return self._fallback_full_report(rank, category, query, safe, moderate, ambitious, year)
                 
             if not text:
                 print("LOG: LLM returned empty text. Using fallback.")
-                return self._fallback_full_report(rank, category, query, safe, moderate, ambitious)
+                self._record_fallback("full_report", "empty")
+                return self._fallback_full_report(rank, category, query, safe, moderate, ambitious, year)
                 
             print(f"LOG: Successfully generated report via LLM. Length: {len(text)}")
             return text
             
         except Exception as e:
             print(f"LOG: Error generating full report: {e}. Using fallback.")
-            return self._fallback_full_report(rank, category, query, safe, moderate, ambitious)
+            self._record_fallback("full_report", self._failure_reason(e))
+            return self._fallback_full_report(rank, category, query, safe, moderate, ambitious, year)
     
+    @STAGE_SECONDS.labels(stage="prompt_build").time()
     def _build_summary_prompt(
         self,
         rank: int,
@@ -212,6 +329,7 @@ Provide your counselor summary:"""
 
         return prompt
 
+    @STAGE_SECONDS.labels(stage="prompt_build").time()
     def _build_followup_prompt(
         self,
         rank: int,
@@ -268,6 +386,7 @@ Respond as an experienced counselor would speak:"""
 
         return prompt
 
+    @STAGE_SECONDS.labels(stage="prompt_build").time()
     def _build_full_report_prompt(
         self,
         rank: int,
@@ -275,7 +394,8 @@ Respond as an experienced counselor would speak:"""
         query: Optional[str],
         safe: List[RecommendationItem],
         moderate: List[RecommendationItem],
-        ambitious: List[RecommendationItem]
+        ambitious: List[RecommendationItem],
+        year: int = 2024
     ) -> str:
         """Build prompt for Layer 3: Full Counseling Report (detailed)."""
 
@@ -310,7 +430,7 @@ This report will be read by both students and parents, so it must be clear, calm
 ### INPUT CONTEXT (Provided to You)
 - Student Rank: {rank}
 - Category: {category}
-- Counseling Year: 2024
+- Counseling Year: {year}
 {user_query_context}
 - SAFE Recommendations: {safe_text}
 - MODERATE Recommendations: {moderate_text}
@@ -448,6 +568,7 @@ Deliver the report as a clean, well-formatted document using clear headings and
 
         return prompt
     
+    @STAGE_SECONDS.labels(stage="fallback").time()
     def _fallback_summary(
         self,
         safe: List[RecommendationItem],
@@ -466,6 +587,7 @@ Deliver the report as a clean, well-formatted document using clear headings and
         else:
             return f"You have {moderate_count} MODERATE and {ambitious_count} AMBITIOUS options. Consider a strategic approach with clear preferences."
 
+    @STAGE_SECONDS.labels(stage="fallback").time()
     def _fallback_full_report(
         self,
         rank: int,
@@ -473,10 +595,48 @@ Deliver the report as a clean, well-formatted document using clear headings and
         query: Optional[str],
         safe: List[RecommendationItem],
         moderate: List[RecommendationItem],
-        ambitious: List[RecommendationItem]
+        ambitious: List[RecommendationItem],
+        year: int = 2024
     ) -> str:
         """Call the deterministic fallback report generator."""
-        return generate_fallback_report(rank, category, query, safe, moderate, ambitious)
+        return generate_fallback_report(rank, category, query, safe, moderate, ambitious, year)
+
+    def summarize_conversation(self, previous_summary: str, messages: List[dict]) -> str:
+        """
+        Fold messages that aged out of the chat window into the rolling summary.
+        Returns an empty string when the LLM is unavailable so the caller can
+        use its deterministic fold instead.
+        """
+        if not self.enabled:
+            return ""
+
+        transcript = "\n".join(
+            f"{'Student' if m['role'] == 'user' else 'Counselor'}: {m['content']}" for m in messages
+        )
+        max_words = CHAT_SUMMARY_TOKEN_BUDGET * CHARS_PER_TOKEN // 6
+
+        prompt = f"""You maintain a running summary of a counseling chat between an IIT JEE admission counselor and a student.
+
+Current Summary:
+{previous_summary or "(empty)"}
+
+New Messages To Fold In:
+{transcript}
+
+INSTRUCTIONS:
+1. Return the updated summary only, in at most {max_words} words.
+2. Keep the student's stated preferences, questions asked, and any colleges or branches discussed.
+3. Drop greetings, repetition and generic advice.
+
+Updated Summary:"""
+
+        try:
+            print(f"LOG: Updating conversation summary (Prompt Length: {len(prompt)})")
+            response = self._generate("summarize_conversation", prompt)
+            return response.text.strip()
+        except Exception as e:
+            print(f"LOG: Error summarizing conversation: {e}")
+            return ""
 
     def generate_chat_response(
         self,
@@ -484,51 +644,28 @@ Deliver the report as a clean, well-formatted document using clear headings and
         category: str,
         message: str,
         history_str: str,
-        recommendations: RecommendationResponse
+        recommendations: RecommendationResponse,
+        mentioned: Optional[List[dict]] = None
     ) -> str:
         """
         Generate a conversational response maintaining context.
+        `mentioned` holds cutoff rows of the institutes and branches named
+        in the message (see the rank filter services' get_mentioned_cutoffs).
         """
         print(f"LOG: Generating chat response for query: '{message}'")
         
         if not self.enabled:
             print("LOG: LLM disabled (no API Key). Using fallback.")
+            self._record_fallback("chat_response", "disabled")
+            if mentioned:
+                return self._mentioned_response(rank, mentioned)
             return "I apologize, but my AI capabilities are currently unavailable. I can still help you review your safe, moderate, and ambitious options if you navigate back to the report."
             
         try:
-            # summarize options for context
-            safe_summary = ", ".join([f"{i.iit} {i.branch}" for i in recommendations.safe[:3]])
-            mod_summary = ", ".join([f"{i.iit} {i.branch}" for i in recommendations.moderate[:3]])
-            amb_summary = ", ".join([f"{i.iit} {i.branch}" for i in recommendations.ambitious[:3]])
-            
-            prompt = f"""You are an expert IIT JEE admission counselor having a continuous conversation with a student.
-            
-Student Profile:
-- Rank: {rank}
-- Category: {category}
-
-Current Recommendations Context:
-- Top Safe Options: {safe_summary}... ({len(recommendations.safe)} total)
-- Top Moderate Options: {mod_summary}... ({len(recommendations.moderate)} total)
-- Top Ambitious Options: {amb_summary}... ({len(recommendations.ambitious)} total)
-
-Recent Conversation History:
-{history_str}
-
-User's New Message: {message}
-
-INSTRUCTIONS:
-1. Answer the user's question directly based on the context provided.
-2. Refer back to the specific colleges mentioned in the recommendations if relevant.
-3. Be professional, encouraging, and realistic.
-4. If the user asks for a comparison, compare based on general reputation and the specific data provided.
-5. Do NOT generate a new full report. Just answer the specific question.
-6. Keep the tone conversational.
-
-Response:"""
+            prompt = self._build_chat_prompt(rank, category, message, history_str, recommendations, mentioned)
             
             print(f"LOG: Sending Prompt to LLM (Length: {len(prompt)})")
-            response = self.model.generate_content(prompt)
+            response = self._generate("chat_response", prompt)
             
             if not response.text:
                 print("LOG: LLM returned empty text.")
@@ -541,9 +678,12 @@ Response:"""
             print(f"LOG: Error generating chat response: {e}")
             if hasattr(e, 'response'): # Check for safety blocks
                 print(f"LOG: Block Reason: {e.response.prompt_feedback}")
+            self._record_fallback("chat_response", self._failure_reason(e))
             
             # Simple rule-based fallback if LLM fails
             msg_lower = message.lower()
+            if mentioned:
+                return self._mentioned_response(rank, mentioned)
             if "safe" in msg_lower:
                 top_safe = recommendations.safe[:3]
                 names = ", ".join([i.iit for i in top_safe])
@@ -558,3 +698,61 @@ Response:"""
                 return "When choosing a branch, prioritize your interest. If you want a specific career path (like CS), value the branch. If you are undecided, a better IIT might offer more exposure."
             
             return "I apologize, but I'm having trouble connecting to my knowledge base right now. Please refer to the detailed table in the Full Report for specific closing ranks."
+
+    @STAGE_SECONDS.labels(stage="prompt_build").time()
+    def _build_chat_prompt(
+        self,
+        rank: int,
+        category: str,
+        message: str,
+        history_str: str,
+        recommendations: RecommendationResponse,
+        mentioned: Optional[List[dict]] = None
+    ) -> str:
+        """Build the chat prompt: profile, top options per bucket, named cutoffs and recent history."""
+        # summarize options for context
+        safe_summary = ", ".join([f"{i.iit} {i.branch}" for i in recommendations.safe[:3]])
+        mod_summary = ", ".join([f"{i.iit} {i.branch}" for i in recommendations.moderate[:3]])
+        amb_summary = ", ".join([f"{i.iit} {i.branch}" for i in recommendations.ambitious[:3]])
+        mentioned_block = ""
+        if mentioned:
+            mentioned_block = "\nCutoffs for the options named in the message (historical data, nearest to the student's rank):\n"
+            mentioned_block += "\n".join(f"- {self._format_mentioned(row)}" for row in mentioned) + "\n"
+        
+        prompt = f"""You are an expert IIT JEE admission counselor having a continuous conversation with a student.
+            
+Student Profile:
+- Rank: {rank}
+- Category: {category}
+
+Current Recommendations Context:
+- Top Safe Options: {safe_summary}... ({len(recommendations.safe)} total)
+- Top Moderate Options: {mod_summary}... ({len(recommendations.moderate)} total)
+- Top Ambitious Options: {amb_summary}... ({len(recommendations.ambitious)} total)
+{mentioned_block}
+Recent Conversation History:
+{history_str}
+
+User's New Message: {message}
+
+INSTRUCTIONS:
+1. Answer the user's question directly based on the context provided.
+2. Refer back to the specific colleges mentioned in the recommendations if relevant.
+3. Be professional, encouraging, and realistic.
+4. If the user asks for a comparison, compare based on general reputation and the specific data provided.
+5. Do NOT generate a new full report. Just answer the specific question.
+6. Keep the tone conversational.
+
+Response:"""
+        
+        return prompt
+
+    @staticmethod
+    def _format_mentioned(row: dict) -> str:
+        quota = f", {row['quota']} quota" if row.get("quota") else ""
+        return f"{row['institute']} - {row['branch']}: closing rank {row['closing_rank']} (round {row['round']}{quota})"
+
+    @STAGE_SECONDS.labels(stage="fallback").time()
+    def _mentioned_response(self, rank: int, mentioned: List[dict]) -> str:
+        lines = "\n".join(f"- {self._format_mentioned(row)}" for row in mentioned[:5])
+        return f"Here are the historical closing ranks for the options you mentioned (your rank: {rank}):\n{lines}"
@@ -0,0 +1,198 @@
+"""
+Monte Carlo admission outlook for a candidate's recommended options.
+
+Admission probabilities (admission_model.py) score every seat on its own,
+but cutoffs do not float independently: more seats or a shifted rank
+distribution move most closing ranks of a year the same way. The
+simulation splits each row's log-scale spread into a shock shared by all
+seats, carrying MC_COMMON_SHARE of the year-to-year variance, and the
+seat's own logistic noise carrying the rest:
+
+    log c_i = center_i + common * Z + s_i * E_i
+    common^2 = MC_COMMON_SHARE * ADMISSION_YEAR_SPREAD^2,   s_i^2 = spread_i^2 - common^2
+
+A batch is MC_DRAWS shocks Z by the N candidate seats. Given Z the seats
+are independent, so the admission probability of a seat in a draw is a
+logistic in closed form and E is integrated out rather than sampled:
+
+    frequency_i = mean_d sigmoid((center_i + common * Z_d - log rank) / s_i * LOGISTIC_SCALE)
+    P(at least one of S) = 1 - mean_d prod_{i in S} (1 - p_id)
+
+The second quantity is what the shared shock makes meaningful: the chance
+of landing at least one option of a bucket is lower than independent
+seats would suggest, because a bad year hits them all. Seats whose
+probability is 0 or 1 to float32 precision for every draw (most safe
+options of a top rank) are settled without entering the batch.
+
+Each option's closing-rank interval is the central MC_INTERVAL of
+simulated log c_i, which depends on the row only through center_i and
+s_i: MC_DRAWS (Z, E) pairs are sampled once per simulation, their
+quantiles taken on a grid of s values, and each seat interpolates on it.
+
+Results depend on the rows and the rank, and the rank enters only through
+log rank, so ranks are snapped to a geometric grid of relative step
+MC_RANK_STEP and simulated at the cell's midpoint; SimulationCache keeps
+results per (rows, rank cell). Draws use a fixed seed, so a repeated
+request gets identical numbers (and a stable ETag).
+"""
+
+import hashlib
+import math
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.metrics import CACHE_REQUESTS
+from app.services.admission_model import LOGISTIC_SCALE, AdmissionModel
+from app.utils.constants import (
+    ADMISSION_YEAR_SPREAD,
+    MC_DRAWS,
+    MC_COMMON_SHARE,
+    MC_INTERVAL,
+    MC_RANK_STEP,
+    CONFIDENCE_SAFE,
+    CONFIDENCE_MODERATE,
+    CONFIDENCE_AMBITIOUS,
+)
+
+# Seed of every simulation (common random numbers across requests)
+MC_SEED = 20240611
+# Seats per batch, bounding a batch to MC_DRAWS * MC_BATCH_SEATS float32 values
+MC_BATCH_SEATS = 256
+# Logit beyond which a seat's probability is 0 or 1 in float32
+SETTLED_LOGIT = 17.0
+# Grid of seat-noise scales the closing-rank quantiles are taken on
+INTERVAL_GRID = 32
+
+BUCKETS = (CONFIDENCE_SAFE, CONFIDENCE_MODERATE, CONFIDENCE_AMBITIOUS)
+
+
+@dataclass
+class Simulation:
+    """Per-option results, aligned with the concatenated rows of the simulated buckets."""
+    rank: int                   # midpoint of the rank cell that was simulated
+    frequency: np.ndarray       # share of draws in which the option admits `rank`
+    closing_low: np.ndarray     # central MC_INTERVAL interval of the simulated closing rank
+    closing_high: np.ndarray
+    at_least_one: Dict[str, float]  # bucket (and "any") -> P(admitted to at least one of its options)
+
+    def split(self, sizes: Sequence[int]) -> Tuple[Tuple[np.ndarray, np.ndarray, np.ndarray], ...]:
+        """(frequency, closing_low, closing_high) of each bucket, for bucket sizes `sizes`."""
+        bounds = np.cumsum(sizes)[:-1]
+        return tuple(zip(*(np.split(values, bounds) for values in (self.frequency, self.closing_low, self.closing_high))))
+
+
+def rank_cell(rank: int) -> int:
+    """Index of the geometric rank cell containing `rank`."""
+    return int(math.log(max(rank, 1)) / math.log1p(MC_RANK_STEP))
+
+
+def cell_rank(cell: int) -> float:
+    """Geometric midpoint of a rank cell."""
+    return math.exp((cell + 0.5) * math.log1p(MC_RANK_STEP))
+
+
+def _closing_intervals(center: np.ndarray, noise: np.ndarray, common: float,
+                       rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+    """Central MC_INTERVAL interval of each seat's simulated closing rank."""
+    if not len(center):
+        return np.empty(0), np.empty(0)
+    shock = common * rng.standard_normal(MC_DRAWS)
+    own = rng.logistic(scale=1.0 / LOGISTIC_SCALE, size=MC_DRAWS)
+    grid = np.geomspace(max(float(noise.min()), 1e-3), max(float(noise.max()), 1e-3), INTERVAL_GRID)
+    tail = (1.0 - MC_INTERVAL) / 2.0
+    low, high = np.quantile(grid[:, None] * own + shock, [tail, 1.0 - tail], axis=1)
+    return np.exp(center + np.interp(noise, grid, low)), np.exp(center + np.interp(noise, grid, high))
+
+
+def simulate(model: AdmissionModel, buckets: Sequence[np.ndarray], rank: int) -> Simulation:
+    """Simulate the rows of `buckets` (safe, moderate, ambitious) for a candidate of `rank`."""
+    rng = np.random.default_rng(MC_SEED)
+    rows = np.concatenate(buckets) if len(buckets) else np.empty(0, dtype=np.int64)
+    rank = cell_rank(rank_cell(rank))
+    common = math.sqrt(MC_COMMON_SHARE) * ADMISSION_YEAR_SPREAD
+    center = model.center[rows].astype(np.float64)
+    spread = LOGISTIC_SCALE / model.slope[rows].astype(np.float64)
+    noise = np.sqrt(np.maximum(spread ** 2 - common ** 2, 1e-6))
+
+    # Half the logit of each seat at a zero shock, and per unit of shock
+    # (sigmoid(x) = (1 + tanh(x / 2)) / 2)
+    slope = (0.5 * LOGISTIC_SCALE / noise).astype(np.float32)
+    logit = ((center - math.log(rank)) * slope).astype(np.float32)
+    shocks = (common * rng.standard_normal(MC_DRAWS)).astype(np.float32)
+    reach = float(np.abs(shocks).max()) * slope
+    settled = np.abs(logit) - reach > SETTLED_LOGIT / 2
+
+    frequency = (logit > 0).astype(np.float64)
+    # P(no admission to the live seats of each bucket) per draw
+    owner = np.repeat(np.arange(len(buckets)), [len(b) for b in buckets])
+    missed = np.ones((len(buckets), MC_DRAWS), dtype=np.float32)
+    live = np.flatnonzero(~settled)
+    for start in range(0, len(live), MC_BATCH_SEATS):
+        seats = live[start:start + MC_BATCH_SEATS]
+        # (seats, draws): tanh of the half logit given the draw's shock
+        t = np.multiply.outer(slope[seats], shocks)
+        t += logit[seats, None]
+        np.tanh(t, out=t)
+        frequency[seats] = 0.5 + 0.5 * t.mean(axis=1, dtype=np.float64)
+        # 1 - p, multiplied into the bucket's miss probability (seats are grouped by bucket)
+        t *= np.float32(-0.5)
+        t += np.float32(0.5)
+        bounds = np.searchsorted(owner[seats], np.arange(len(buckets) + 1))
+        for b in range(len(buckets)):
+            if bounds[b + 1] > bounds[b]:
+                missed[b] *= t[bounds[b]:bounds[b + 1]].prod(axis=0)
+
+    # A settled admitting seat makes its bucket certain
+    missed[np.bincount(owner[settled & (logit > 0)], minlength=len(buckets)) > 0] = 0.0
+    at_least_one = {
+        name: round(1.0 - float(missed[b].mean(dtype=np.float64)), 4) for b, name in enumerate(BUCKETS[:len(buckets)])
+    }
+    at_least_one["any"] = round(1.0 - float(missed.prod(axis=0).mean(dtype=np.float64)), 4)
+
+    closing_low, closing_high = _closing_intervals(center, noise, common, rng)
+    return Simulation(
+        rank=int(round(rank)),
+        frequency=frequency,
+        closing_low=closing_low,
+        closing_high=closing_high,
+        at_least_one=at_least_one
+    )
+
+
+class SimulationCache:
+    """Thread-safe LRU of simulations, keyed by the simulated rows and the rank cell."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, Simulation]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(buckets: Sequence[np.ndarray], rank: int) -> tuple:
+        digest = hashlib.sha1()
+        for rows in buckets:
+            digest.update(np.ascontiguousarray(rows, dtype=np.int64).tobytes())
+            digest.update(b"|")
+        return rank_cell(rank), digest.hexdigest()
+
+    def get(self, key: tuple) -> Optional[Simulation]:
+        with self._lock:
+            simulation = self._entries.get(key)
+            if simulation is not None:
+                self._entries.move_to_end(key)
+            CACHE_REQUESTS.labels(cache="simulation", result="miss" if simulation is None else "hit").inc()
+            return simulation
+
+    def put(self, key: tuple, simulation: Simulation) -> None:
+        with self._lock:
+            self._entries[key] = simulation
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
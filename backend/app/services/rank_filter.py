@@ -3,20 +3,27 @@ Deterministic rank filtering service.
 Categorizes eligible IITs and branches into Safe, Moderate, and Ambitious.
 """
 
+import math
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
-from typing import List, Tuple
+from sqlalchemy import and_, func, null
+from typing import List, Optional, Tuple
 from app.models.cutoff import Cutoff
 from app.models.iit import IIT
 from app.models.branch import Branch
-from app.schemas.response import RecommendationItem
+from app.schemas.response import AdmissionOutlook, RecommendationItem, RecommendationItemList
+from app.services.admission_model import confidence_band, static_probability
+from app.services.cutoff_index import eligible_genders, range_distance, range_fact
+from app.services.snapshot_manager import snapshot_manager
+from app.core.database import live_columns
+from app.core.metrics import STAGE_SECONDS
 from app.utils.constants import (
-    SAFE_THRESHOLD,
-    MODERATE_THRESHOLD,
     MIN_ELIGIBLE_THRESHOLD,
+    RANGE_TOLERANCE,
+    RANGE_MATCH_LIMIT,
     CONFIDENCE_SAFE,
     CONFIDENCE_MODERATE,
     CONFIDENCE_AMBITIOUS,
+    MC_DRAWS,
 )
 
 
@@ -24,12 +31,15 @@ class RankFilterService:
     """Service for filtering and categorizing recommendations based on rank."""
     
     @staticmethod
+    @STAGE_SECONDS.labels(stage="rank_filter").time()
     def get_recommendations(
         db: Session,
         rank: int,
         category: str,
         year: int,
-        round_number: int = 5
+        round_number: int = 5,
+        gender: Optional[str] = None,
+        pwd: bool = False
     ) -> Tuple[List[RecommendationItem], List[RecommendationItem], List[RecommendationItem]]:
         """
         Get eligible recommendations and categorize them.
@@ -40,14 +50,19 @@ class RankFilterService:
             category: Category (GEN, OBC, SC, ST, EWS)
             year: Academic year
             round_number: JOSAA round (default: 6 for final round)
+            gender: Candidate's gender; only FEMALE adds the female-only seats
+            pwd: Match PwD-reserved seats (rank is the PwD category rank) instead of the others
         
         Returns:
             Tuple of (safe_list, moderate_list, ambitious_list)
         """
+        # Serve from the in-memory snapshot when loaded (same semantics as the query below)
+        snapshot = snapshot_manager.current()
+        if snapshot is not None:
+            return snapshot.advanced.recommend(rank, category, year, gender, pwd)
+        
         # Calculate thresholds
         min_eligible_rank = rank * MIN_ELIGIBLE_THRESHOLD
-        safe_threshold_rank = rank * SAFE_THRESHOLD
-        moderate_threshold_rank = rank * MODERATE_THRESHOLD
         
         # Query eligible cutoffs
         # Using round_number for filtering (prefer latest round if available)
@@ -60,6 +75,8 @@ class RankFilterService:
                 and_(
                     Cutoff.year == year,
                     Cutoff.category == category,
+                    Cutoff.gender.in_(eligible_genders(gender)),
+                    Cutoff.pwd == pwd,
                     Cutoff.closing_rank >= min_eligible_rank
                 )
             )
@@ -69,7 +86,7 @@ class RankFilterService:
         # Execute query
         results = query.all()
         
-        # Deduplicate by (iit_id, branch_id) keeping the best (lowest) closing_rank
+        # Deduplicate by (iit_id, branch_id) over the candidate's seat pools keeping the best (lowest) closing_rank
         seen = {}
         for cutoff, iit, branch in results:
             key = (cutoff.iit_id, cutoff.branch_id)
@@ -82,30 +99,32 @@ class RankFilterService:
                     seen[key] = (cutoff, iit, branch)
         
         # Categorize results
-        safe_list = []
-        moderate_list = []
-        ambitious_list = []
+        buckets = {CONFIDENCE_SAFE: [], CONFIDENCE_MODERATE: [], CONFIDENCE_AMBITIOUS: []}
         
         for cutoff, iit, branch in seen.values():
-            item = RecommendationItem(
-                iit=iit.name,
-                branch=branch.branch_name,
-                closing_rank=cutoff.closing_rank,
-                confidence="",  # Will be set below
-                location=iit.location,
-                nirf_rank=iit.nirf_rank
-            )
-            
-            # Categorize based on closing rank
-            if cutoff.closing_rank >= safe_threshold_rank:
-                item.confidence = CONFIDENCE_SAFE
-                safe_list.append(item)
-            elif cutoff.closing_rank >= moderate_threshold_rank:
-                item.confidence = CONFIDENCE_MODERATE
-                moderate_list.append(item)
-            else:
-                item.confidence = CONFIDENCE_AMBITIOUS
-                ambitious_list.append(item)
+            # Without the snapshot's fitted model the closing rank is taken as final
+            probability = float(static_probability(cutoff.closing_rank, rank))
+            confidence = confidence_band(probability)
+            if confidence is None:
+                continue
+            buckets[confidence].append({
+                "iit": iit.name,
+                "branch": branch.branch_name,
+                "closing_rank": cutoff.closing_rank,
+                "confidence": confidence,
+                "admission_probability": round(probability, 3),
+                "location": iit.location,
+                "nirf_rank": iit.nirf_rank,
+                "gender": cutoff.gender
+            })
+        safe_rows = buckets[CONFIDENCE_SAFE]
+        moderate_rows = buckets[CONFIDENCE_MODERATE]
+        ambitious_rows = buckets[CONFIDENCE_AMBITIOUS]
+        
+        # Build response items in bulk (one pydantic-core call per bucket)
+        safe_list = RecommendationItemList.validate_python(safe_rows)
+        moderate_list = RecommendationItemList.validate_python(moderate_rows)
+        ambitious_list = RecommendationItemList.validate_python(ambitious_rows)
         
         # Sort each list by closing_rank (ascending - best ranks first)
         safe_list.sort(key=lambda x: x.closing_rank)
@@ -113,3 +132,97 @@ class RankFilterService:
         ambitious_list.sort(key=lambda x: x.closing_rank)
         
         return safe_list, moderate_list, ambitious_list
+
+    @staticmethod
+    def get_outlook(
+        rank: int,
+        category: str,
+        year: int,
+        gender: Optional[str] = None,
+        pwd: bool = False
+    ) -> Optional[AdmissionOutlook]:
+        """
+        Joint Monte Carlo outlook of the options get_recommendations returns:
+        the chance of admission to at least one option of each bucket. None
+        without an in-memory snapshot (the database path has no fitted model).
+        """
+        snapshot = snapshot_manager.current()
+        if snapshot is None:
+            return None
+        simulation = snapshot.advanced.outlook(rank, category, year, gender, pwd)
+        return AdmissionOutlook(rank=simulation.rank, draws=MC_DRAWS, at_least_one=simulation.at_least_one)
+
+    @staticmethod
+    def get_range_matches(
+        db: Session,
+        rank: int,
+        category: str,
+        year: int,
+        round_number: int = 5,
+        gender: Optional[str] = None,
+        pwd: bool = False,
+        tolerance: float = RANGE_TOLERANCE,
+        limit: int = RANGE_MATCH_LIMIT
+    ) -> List[dict]:
+        """
+        Range query mode: (IIT, branch) seats of a round whose admitted range
+        [opening_rank, closing_rank] contains or nearly contains the rank
+        (overlaps rank * (1 -/+ tolerance)), in the candidate's seat pools.
+        Seats containing the rank come first, then the nearest, then by
+        closing rank; see range_fact for the fields.
+        """
+        snapshot = snapshot_manager.current()
+        if snapshot is not None:
+            return snapshot.advanced.in_range(rank, category, year, round_number, gender, pwd, tolerance, limit)
+        
+        # Integer bounds: ranks are integers and the columns compare as INTEGER
+        low, high = math.ceil(rank * (1 - tolerance)), math.floor(rank * (1 + tolerance))
+        # LEAST ignores NULL, so a missing opening rank leaves the point [closing, closing];
+        # a table created before opening_rank existed treats every seat that way
+        if "opening_rank" in live_columns(db, Cutoff.__tablename__):
+            opening = Cutoff.opening_rank
+            start = func.least(Cutoff.opening_rank, Cutoff.closing_rank)
+        else:
+            opening, start = null(), Cutoff.closing_rank
+        results = (
+            db.query(
+                IIT.name.label("institute"), Branch.branch_name, opening.label("opening_rank"),
+                Cutoff.closing_rank, Cutoff.round, Cutoff.gender
+            )
+            .select_from(Cutoff)
+            .join(IIT, Cutoff.iit_id == IIT.id)
+            .join(Branch, Cutoff.branch_id == Branch.id)
+            .filter(
+                and_(
+                    Cutoff.year == year,
+                    Cutoff.round == round_number,
+                    Cutoff.category == category,
+                    Cutoff.gender.in_(eligible_genders(gender)),
+                    Cutoff.pwd == pwd,
+                    start <= high,
+                    Cutoff.closing_rank >= low
+                )
+            )
+            .all()
+        )
+        results.sort(key=lambda r: (range_distance(r.opening_rank, r.closing_rank, rank), r.closing_rank))
+        return [
+            range_fact(r.institute, r.branch_name, r.opening_rank, r.closing_rank, r.round, r.gender, None, rank)
+            for r in results[:limit]
+        ]
+
+    @staticmethod
+    def get_mentioned_cutoffs(message: str, rank: int, category: str, year: int) -> List[dict]:
+        """
+        Closing ranks of the IITs and branches named in a chat message,
+        resolved with the snapshot's entity dictionary (latest round,
+        nearest to the student's rank first). Empty when no snapshot is
+        loaded or nothing is mentioned.
+        """
+        snapshot = snapshot_manager.current()
+        if snapshot is None:
+            return []
+        mentions = snapshot.entities.find_mentions(message)
+        if not mentions:
+            return []
+        return snapshot.advanced.lookup(mentions, rank, category, year)
@@ -0,0 +1,118 @@
+"""
+In-process cache of computed recommendation responses.
+Lets /api/recommend serve repeat requests and page through large result
+lists without recomputing the filter or calling the LLM again.
+"""
+
+import base64
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from app.core.config import settings
+from app.core.dataset_version import dataset_version
+from app.core.metrics import CACHE_REQUESTS
+from app.schemas.request import RecommendationRequest
+from app.schemas.response import RecommendationResponse
+
+
+class RecommendationCache:
+    """
+    Thread-safe LRU cache with a TTL, keyed by the recommendation request.
+    Each entry carries the dataset version that produced it and is only
+    served under that version, so a result computed across a data reload
+    is never served for the new data.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, str, RecommendationResponse]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(request: RecommendationRequest) -> str:
+        """
+        Stable key over the inputs that determine the full response.
+        `round` is not one of them: recommendations weigh every round.
+        """
+        raw = json.dumps(
+            [
+                request.rank, request.category, request.year, request.gender, request.pwd,
+                (request.query or "").strip()
+            ],
+            separators=(",", ":")
+        )
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, version: Optional[str] = None) -> Optional[RecommendationResponse]:
+        """Cached response of `key` if produced under `version` (default: the current dataset version)."""
+        version = version or dataset_version.current()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                CACHE_REQUESTS.labels(cache="recommendation", result="miss").inc()
+                return None
+            stored_at, stored_version, response = entry
+            if stored_version != version:
+                del self._entries[key]
+                CACHE_REQUESTS.labels(cache="recommendation", result="stale").inc()
+                return None
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                CACHE_REQUESTS.labels(cache="recommendation", result="expired").inc()
+                return None
+            self._entries.move_to_end(key)
+            CACHE_REQUESTS.labels(cache="recommendation", result="hit").inc()
+            return response
+
+    def put(self, key: str, response: RecommendationResponse, version: str) -> None:
+        """
+        Store a response computed under dataset `version`; dropped if the
+        version changed while it was computed (e.g. a reload during LLM calls).
+        """
+        if version != dataset_version.current():
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), version, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def encode_cursor(key: str, bucket: str, offset: int) -> str:
+    """Opaque continuation cursor for one bucket of a cached response."""
+    raw = json.dumps({"k": key, "b": bucket, "o": offset}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str, int]:
+    """Inverse of encode_cursor. Raises ValueError on malformed input or a negative offset."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        key, bucket, offset = data["k"], data["b"], data["o"]
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {e}")
+    if not isinstance(key, str) or not isinstance(bucket, str):
+        raise ValueError("Invalid cursor: malformed key or bucket")
+    if not isinstance(offset, int) or isinstance(offset, bool) or offset < 0:
+        raise ValueError(f"Invalid cursor: offset must be a non-negative integer, got {offset!r}")
+    return key, bucket, offset
+
+
+# Global cache instance shared by the recommendation routes
+recommendation_cache = RecommendationCache(
+    max_entries=settings.RECOMMENDATION_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.RECOMMENDATION_CACHE_TTL_SECONDS
+)
+# Cached results are only valid for the dataset version that produced them:
+# entries are checked against it, and a version change frees them all at once
+dataset_version.subscribe(recommendation_cache.clear)
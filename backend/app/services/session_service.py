@@ -4,18 +4,56 @@ Service for managing chat sessions and counseling state.
 Uses PostgreSQL database storage.
 """
 
+import re
 import uuid
-from typing import Optional, List
+from typing import Any, Callable, List, Mapping, Optional
+from fastapi import BackgroundTasks
 from sqlalchemy.orm import Session
+from app.core.database import SessionLocal
 from app.schemas.session import ChatSession, ChatMessage, Role, SessionState, SessionCreate
 from app.schemas.response import RecommendationResponse
 from app.models.session import Session as SessionModel
+from app.core.metrics import STAGE_SECONDS
+from app.utils.constants import (
+    CHARS_PER_TOKEN,
+    CHAT_HISTORY_TOKEN_BUDGET,
+    CHAT_SUMMARY_TOKEN_BUDGET,
+    CHAT_HISTORY_MAX_MESSAGES,
+)
+
+# (previous_summary, aged_out_messages) -> updated summary
+Summarizer = Callable[[str, List[dict]], str]
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate used for prompt budgeting."""
+    return len(text or "") // CHARS_PER_TOKEN + 1
+
+
+def clip_to_tokens(text: str, budget: int) -> str:
+    """Truncate text so that it fits within `budget` estimated tokens."""
+    max_chars = budget * CHARS_PER_TOKEN
+    if len(text) <= max_chars:
+        return text
+    return text[:max_chars].rstrip() + "..."
+
 
 class SessionService:
     """
     Manages user sessions, chat history, and counseling state using Database.
+
+    History is a token-budgeted window: when messages no longer fit, they age
+    out of `history` and are folded into the session's rolling
+    `history_summary`, so chat prompts stay bounded however long the
+    conversation runs.
     """
+
+    def __init__(self, summarizer: Optional[Summarizer] = None):
+        # Optional LLM-backed summarizer, run after the response (refine_summary);
+        # the deterministic fold stands until it succeeds
+        self.summarizer = summarizer
     
+    @STAGE_SECONDS.labels(stage="session_write").time()
     def create_session(self, db: Session, initial_data: SessionCreate, user_id: Optional[str] = None, source_type: str = 'jee_advanced') -> ChatSession:
         """Create a new counseling session in the database."""
         # Create DB model
@@ -34,20 +72,52 @@ class SessionService:
         db.commit()
         db.refresh(db_session)
         
-        return self._to_schema(db_session)
+        return self._to_schema({
+            "session_id": db_session.session_id,
+            "rank": db_session.rank,
+            "category": db_session.category,
+            "year": db_session.year,
+            "state": db_session.state,
+        })
     
-    def get_session(self, db: Session, session_id: str) -> Optional[ChatSession]:
-        """Retrieve a session by ID."""
+    @STAGE_SECONDS.labels(stage="session_load").time()
+    def get_session(self, db: Session, session_id: str,
+                    include_history: bool = True, include_recommendations: bool = True) -> Optional[ChatSession]:
+        """
+        Retrieve a session by ID.
+        The large JSONB columns are only selected and parsed when asked for;
+        a session read without them has an empty `history` and None
+        `recommendations`.
+        """
+        columns = [
+            SessionModel.session_id,
+            SessionModel.rank,
+            SessionModel.category,
+            SessionModel.year,
+            SessionModel.state,
+            SessionModel.history_summary,
+        ]
+        if include_history:
+            columns.append(SessionModel.history)
+        if include_recommendations:
+            columns.append(SessionModel.recommendations)
         try:
-            db_session = db.query(SessionModel).filter(SessionModel.session_id == session_id).first()
-            if not db_session:
+            row = db.query(*columns).filter(SessionModel.session_id == session_id).first()
+            if not row:
                 return None
-            return self._to_schema(db_session)
+            return self._to_schema(row._mapping)
         except Exception:
             return None
     
-    def add_message(self, db: Session, session_id: str, role: Role, content: str) -> Optional[ChatMessage]:
-        """Add a message to the session history."""
+    @STAGE_SECONDS.labels(stage="session_write").time()
+    def add_message(self, db: Session, session_id: str, role: Role, content: str,
+                    background_tasks: Optional[BackgroundTasks] = None) -> Optional[ChatMessage]:
+        """
+        Add a message to the session history.
+        Messages that age out are folded into the summary deterministically;
+        with `background_tasks`, the summarizer rewrites that fold once the
+        response has been sent.
+        """
         db_session = db.query(SessionModel).filter(SessionModel.session_id == session_id).first()
         if not db_session:
             return None
@@ -60,15 +130,23 @@ class SessionService:
         current_history = list(db_session.history) if db_session.history else []
         current_history.append(message)
         
-        # Enforce history limit (last 20)
-        if len(current_history) > 20:
-            current_history = current_history[-20:]
+        # Enforce the history window; aged-out messages go into the summary
+        current_history, aged_out = self._split_history_window(current_history)
+        if aged_out:
+            previous = db_session.history_summary or ""
+            folded = self._fold_summary(previous, aged_out)
+            db_session.history_summary = folded
             
         db_session.history = current_history
         db.commit()
+
+        # The LLM rewrite of the summary runs after the response, outside this transaction
+        if aged_out and self.summarizer and background_tasks is not None:
+            background_tasks.add_task(self.refine_summary, session_id, previous, aged_out, folded)
         
         return ChatMessage(role=role, content=content)
         
+    @STAGE_SECONDS.labels(stage="session_write").time()
     def update_state(self, db: Session, session_id: str, new_state: SessionState) -> bool:
         """Update the counseling state of a session."""
         db_session = db.query(SessionModel).filter(SessionModel.session_id == session_id).first()
@@ -79,6 +157,7 @@ class SessionService:
         db.commit()
         return True
         
+    @STAGE_SECONDS.labels(stage="session_write").time()
     def set_recommendations(self, db: Session, session_id: str, data: RecommendationResponse) -> bool:
         """Store generated recommendations in the session."""
         db_session = db.query(SessionModel).filter(SessionModel.session_id == session_id).first()
@@ -90,26 +169,111 @@ class SessionService:
         db.commit()
         return True
 
-    def get_formatted_history(self, db: Session, session_id: str) -> str:
-        """Get history formatted for LLM context."""
-        session = self.get_session(db, session_id)
-        if not session:
+    @STAGE_SECONDS.labels(stage="session_load").time()
+    def get_formatted_history(self, db: Session, session_id: str, limit: Optional[int] = None) -> str:
+        """
+        Get history formatted for LLM context: the rolling summary of older
+        turns followed by the recent messages, within the token budget.
+        Only the history columns are selected; recommendations are never loaded.
+        """
+        row = (
+            db.query(SessionModel.history, SessionModel.history_summary)
+            .filter(SessionModel.session_id == session_id)
+            .first()
+        )
+        if not row:
             return ""
+        history, summary = row
+        history = history or []
+        if limit and len(history) > limit:
+            # Messages beyond the limit age out here as they would from the window
+            history, dropped = history[-limit:], history[:-limit]
+            summary = self._fold_summary(summary or "", dropped)
             
         formatted = ""
-        for msg in session.history:
-            role_label = "Student" if msg.role == Role.USER else "Counselor"
-            formatted += f"{role_label}: {msg.content}\n"
+        if summary:
+            formatted += f"Summary of earlier conversation: {summary}\n"
+        for msg in history:
+            role_label = "Student" if msg["role"] == Role.USER else "Counselor"
+            # A single message may exceed the whole window (e.g. the opening summary)
+            content = clip_to_tokens(msg["content"], CHAT_HISTORY_TOKEN_BUDGET)
+            formatted += f"{role_label}: {content}\n"
         return formatted
 
-    def _to_schema(self, db_model: SessionModel) -> ChatSession:
-        """Convert DB model to Pydantic schema."""
+    @staticmethod
+    def _split_history_window(history: List[dict]) -> tuple:
+        """
+        Split history into (window, aged_out). The window keeps the newest
+        messages that fit the token budget and message cap; the latest
+        message is always kept.
+        """
+        used = 0
+        start = len(history)
+        while start > 0:
+            cost = estimate_tokens(history[start - 1]["content"])
+            within_cap = len(history) - start < CHAT_HISTORY_MAX_MESSAGES
+            if start < len(history) and (used + cost > CHAT_HISTORY_TOKEN_BUDGET or not within_cap):
+                break
+            used += cost
+            start -= 1
+        return history[start:], history[:start]
+
+    @staticmethod
+    def _fold_summary(previous: str, aged_out: List[dict]) -> str:
+        """Fold aged-out messages into the rolling summary, within its budget."""
+        return clip_to_tokens(SessionService._deterministic_fold(previous, aged_out).strip(), CHAT_SUMMARY_TOKEN_BUDGET)
+
+    def refine_summary(self, session_id: str, previous: str, aged_out: List[dict], folded: str) -> None:
+        """
+        Replace the deterministic fold `folded` of `aged_out` into `previous`
+        with the summarizer's. Runs as a background task with its own database
+        session; the fold is kept if the summarizer fails or a newer fold has
+        replaced it in the meantime.
+        """
+        try:
+            summary = self.summarizer(previous, aged_out)
+        except Exception as e:
+            print(f"LOG: Summarizer failed, keeping deterministic fold: {e}")
+            return
+        if not summary:
+            return
+
+        db = SessionLocal()
+        try:
+            db_session = db.query(SessionModel).filter(SessionModel.session_id == session_id).first()
+            if db_session is None or (db_session.history_summary or "") != folded:
+                return
+            db_session.history_summary = clip_to_tokens(summary.strip(), CHAT_SUMMARY_TOKEN_BUDGET)
+            db.commit()
+        finally:
+            db.close()
+
+    @staticmethod
+    def _deterministic_fold(previous: str, aged_out: List[dict]) -> str:
+        """
+        Summarize without an LLM: one line per aged-out message holding its
+        first sentence. The oldest lines are dropped once over budget.
+        """
+        lines = [line for line in previous.split("\n") if line]
+        for msg in aged_out:
+            role_label = "Student" if msg["role"] == Role.USER else "Counselor"
+            first_sentence = re.split(r"(?<=[.?!])\s", msg["content"].strip(), maxsplit=1)[0]
+            lines.append(f"- {role_label}: {clip_to_tokens(first_sentence, 40)}")
+        while len(lines) > 1 and estimate_tokens("\n".join(lines)) > CHAT_SUMMARY_TOKEN_BUDGET:
+            lines.pop(0)
+        return "\n".join(lines)
+
+    @staticmethod
+    def _to_schema(values: Mapping[str, Any]) -> ChatSession:
+        """Convert selected session columns (name -> value) to the Pydantic schema."""
+        recommendations = values.get("recommendations")
         return ChatSession(
-            session_id=str(db_model.session_id),
-            rank=db_model.rank,
-            category=db_model.category,
-            year=db_model.year,
-            state=SessionState(db_model.state),
-            history=[ChatMessage(**m) for m in (db_model.history or [])],
-            recommendations=RecommendationResponse(**db_model.recommendations) if db_model.recommendations else None
+            session_id=str(values["session_id"]),
+            rank=values["rank"],
+            category=values["category"],
+            year=values["year"],
+            state=SessionState(values["state"]),
+            history=[ChatMessage(**m) for m in (values.get("history") or [])],
+            history_summary=values.get("history_summary") or "",
+            recommendations=RecommendationResponse(**recommendations) if recommendations else None
         )
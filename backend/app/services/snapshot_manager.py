@@ -0,0 +1,159 @@
+"""
+Owns the live cutoff snapshot and replaces it without downtime.
+
+A reload builds and validates a new CutoffSnapshot off to the side, then
+swaps a single reference. Requests read `snapshot_manager.current()` once
+and keep using that object, so in-flight requests finish on the old data
+while new ones see the new data. A failed reload leaves the live snapshot
+untouched.
+"""
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.dataset_version import dataset_version
+from app.services.cutoff_index import CutoffSnapshot
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotManager:
+    """Loads, swaps and watches the in-memory cutoff snapshot."""
+
+    def __init__(self, data_dir: Optional[str], watch_interval_seconds: int):
+        self.data_dir = data_dir
+        self.watch_interval_seconds = watch_interval_seconds
+        self._snapshot: Optional[CutoffSnapshot] = None
+        # Serializes reloads; readers never take it
+        self._reload_lock = threading.Lock()
+        self._last_error: Optional[str] = None
+        self._reloading = False
+        self._stop = threading.Event()
+        self._watcher: Optional[threading.Thread] = None
+
+    def current(self) -> Optional[CutoffSnapshot]:
+        """Live snapshot, or None when serving from the database."""
+        return self._snapshot
+
+    def years(self) -> List[int]:
+        """
+        Counseling years a request may ask for: the live snapshot's
+        published and projected years, or the configured range without one.
+        """
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot.years
+        return list(range(settings.CUTOFF_MIN_YEAR, settings.CUTOFF_MAX_YEAR + 1))
+
+    def reload(self) -> CutoffSnapshot:
+        """
+        Build, validate and swap in a new snapshot.
+        Raises on failure; the previous snapshot stays live.
+        """
+        if not self.data_dir:
+            raise RuntimeError("CUTOFF_SNAPSHOT_DIR is not configured")
+        with self._reload_lock:
+            self._reloading = True
+            try:
+                start = time.perf_counter()
+                snapshot = CutoffSnapshot.load(self.data_dir)
+                # Single reference assignment: atomic for concurrent readers
+                self._snapshot = snapshot
+                self._last_error = None
+                dataset_version.set(snapshot.version)
+                logger.info(
+                    f"Cutoff snapshot {snapshot.version} loaded from {snapshot.source} "
+                    f"in {time.perf_counter() - start:.2f}s"
+                )
+                return snapshot
+            except Exception as e:
+                self._last_error = str(e)
+                logger.error(f"Cutoff snapshot reload failed, keeping current snapshot: {e}")
+                raise
+            finally:
+                self._reloading = False
+
+    def reload_in_background(self) -> bool:
+        """Start a reload thread. Returns False if a reload is already running."""
+        if self._reload_lock.locked():
+            return False
+        threading.Thread(target=self._safe_reload, name="snapshot-reload", daemon=True).start()
+        return True
+
+    def _safe_reload(self) -> None:
+        try:
+            self.reload()
+        except Exception:
+            # Already logged and recorded in status()
+            pass
+
+    def start(self) -> None:
+        """Initial load plus the directory watcher (if enabled)."""
+        if not self.data_dir or not Path(self.data_dir).is_dir():
+            logger.info("No cutoff snapshot directory; recommendations are served from the database")
+            return
+        self._safe_reload()
+        if self.watch_interval_seconds > 0 and self._watcher is None:
+            self._stop.clear()
+            self._watcher = threading.Thread(target=self._watch, name="snapshot-watcher", daemon=True)
+            self._watcher.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.join(timeout=self.watch_interval_seconds + 1)
+            self._watcher = None
+
+    def _signature(self) -> Tuple:
+        """(name, size, mtime) of the snapshot's watched files."""
+        signature = []
+        for name in CutoffSnapshot.watched_files():
+            try:
+                stat = os.stat(Path(self.data_dir) / name)
+                signature.append((name, stat.st_size, stat.st_mtime_ns))
+            except FileNotFoundError:
+                signature.append((name, None, None))
+        return tuple(signature)
+
+    def _watch(self) -> None:
+        """
+        Poll the source files and reload once they have stopped changing
+        for one full interval (so a half-written export is not picked up).
+        """
+        loaded = self._signature()
+        pending = None
+        while not self._stop.wait(self.watch_interval_seconds):
+            signature = self._signature()
+            if signature == loaded:
+                pending = None
+            elif signature != pending:
+                # Changed since last poll - wait for it to settle
+                pending = signature
+            else:
+                logger.info("Cutoff data files changed; reloading snapshot")
+                self._safe_reload()
+                loaded = signature
+                pending = None
+
+    def status(self) -> dict:
+        snapshot = self._snapshot
+        return {
+            "enabled": bool(self.data_dir),
+            "data_dir": self.data_dir,
+            "watching": self._watcher is not None,
+            "reloading": self._reloading,
+            "last_error": self._last_error,
+            "snapshot": snapshot.stats() if snapshot else None,
+        }
+
+
+# Global snapshot manager instance
+snapshot_manager = SnapshotManager(
+    data_dir=settings.CUTOFF_SNAPSHOT_DIR,
+    watch_interval_seconds=settings.SNAPSHOT_WATCH_INTERVAL_SECONDS
+)
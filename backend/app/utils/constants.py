@@ -2,15 +2,76 @@
 Application-wide constants.
 """
 
-# Rank filtering thresholds (multipliers)
-SAFE_THRESHOLD = 1.15  # closing_rank >= rank * 1.15
-MODERATE_THRESHOLD = 0.95  # closing_rank >= rank * 0.95
-MIN_ELIGIBLE_THRESHOLD = 0.85  # closing_rank >= rank * 0.85
+# JEE Advanced options considered: closing_rank >= rank * 0.85
+MIN_ELIGIBLE_THRESHOLD = 0.85
+
+# Admission probability bands of the recommendation buckets (see
+# app/services/admission_model.py); options below the last are dropped
+SAFE_PROBABILITY = 0.85
+MODERATE_PROBABILITY = 0.35
+MIN_ADMISSION_PROBABILITY = 0.08
+# Year-to-year spread of a seat's closing rank (standard deviation of its log)
+ADMISSION_YEAR_SPREAD = 0.12
+
+# Monte Carlo outlook of the recommendations (see app/services/monte_carlo.py)
+MC_DRAWS = 10_000  # common cutoff shocks per simulation
+MC_COMMON_SHARE = 0.5  # share of ADMISSION_YEAR_SPREAD^2 that moves all seats together
+MC_INTERVAL = 0.9  # central probability of the reported closing-rank interval
+MC_RANK_STEP = 0.005  # ranks within this relative step share a cached simulation
+MC_CACHE_ENTRIES = 1024
+
+# Range queries: seats whose [opening_rank, closing_rank] overlaps rank * (1 -/+ tolerance)
+RANGE_TOLERANCE = 0.05
+RANGE_MATCH_LIMIT = 50
+
+# Choice-list optimizer
+CHOICE_MIN_PROBABILITY = 0.001  # seats less likely than this are left out
+CHOICE_MAX_CHOICES = 50
+CHOICE_MAX_CHOICES_LIMIT = 500
 
 # Category mappings
 VALID_CATEGORIES = ["GEN", "OBC", "SC", "ST", "EWS"]
 
+# Seat pools within a category (the cutoff tables' gender column). Female
+# candidates compete for both, everyone else for gender-neutral seats only.
+GENDER_NEUTRAL = "Gender-Neutral"
+FEMALE_ONLY = "Female-only"
+VALID_GENDERS = ["MALE", "FEMALE", "OTHER"]
+
+# JEE Mains quotas matched unless the request names others: All India, Home
+# State, Other State (the JK, GO and LA domicile quotas must be asked for)
+DEFAULT_MAINS_QUOTAS = ["AI", "HS", "OS"]
+
+# With a home state, JEE Mains seats are matched by eligibility instead: AI
+# seats, HS seats of institutes in that state, OS seats of institutes
+# elsewhere, and the domicile quotas of that state.
+ALL_INDIA_QUOTA = "AI"
+HOME_STATE_QUOTA = "HS"
+OTHER_STATE_QUOTA = "OS"
+DOMICILE_QUOTAS = {"JK": "Jammu and Kashmir", "LA": "Ladakh", "GO": "Goa"}
+
+# Home states, spelled as the institute tables' state column
+VALID_STATES = [
+    "Andhra Pradesh", "Arunachal Pradesh", "Assam", "Bihar", "Chhattisgarh", "Goa", "Gujarat",
+    "Haryana", "Himachal Pradesh", "Jharkhand", "Karnataka", "Kerala", "Madhya Pradesh",
+    "Maharashtra", "Manipur", "Meghalaya", "Mizoram", "Nagaland", "Odisha", "Punjab",
+    "Rajasthan", "Sikkim", "Tamil Nadu", "Telangana", "Tripura", "Uttar Pradesh", "Uttarakhand",
+    "West Bengal", "Andaman and Nicobar Islands", "Chandigarh",
+    "Dadra and Nagar Haveli and Daman and Diu", "Delhi", "Jammu and Kashmir", "Ladakh",
+    "Lakshadweep", "Puducherry",
+]
+
 # Confidence labels
 CONFIDENCE_SAFE = "safe"
 CONFIDENCE_MODERATE = "moderate"
 CONFIDENCE_AMBITIOUS = "ambitious"
+
+# LLM circuit breaker (see app/services/llm_service.py)
+LLM_BREAKER_FAILURES = 5  # failed calls in a row that open the circuit
+LLM_BREAKER_COOLDOWN = 30.0  # seconds calls fail fast before a trial call
+
+# Chat context budgets (approximate tokens, estimated as characters / 4)
+CHARS_PER_TOKEN = 4
+CHAT_HISTORY_TOKEN_BUDGET = 1200  # verbatim recent messages in the chat prompt
+CHAT_SUMMARY_TOKEN_BUDGET = 300  # rolling summary of messages that aged out
+CHAT_HISTORY_MAX_MESSAGES = 20
@@ -0,0 +1,148 @@
+"""
+Entity resolution for institute and branch names.
+
+Loads the dictionary the ingestion pipeline compiles to
+normalized_data/entities.json (see ingestion/entities.py): every known
+alias of an institute or branch ("IIT (BHU) Varanasi", "NIT Trichy",
+"National Institute of Technology Warangal", "CSE", ...) keyed to one
+interned integer id, so resolving a name is a single dict lookup.
+
+Two kinds of alias are kept apart: names match case-insensitively, while
+acronyms ("CSE", "IT", "NITK") only match upper-case words in free text,
+so "is it safe for me" does not mention IT or ME.
+"""
+
+import json
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+ENTITIES_FILE = "entities.json"
+ENTITIES_SCHEMA_VERSION = 1
+
+INSTITUTE = "institutes"
+BRANCH = "branches"
+
+
+def alias_key(text: str) -> str:
+    """
+    Lookup key of a name: case-folded alphanumeric words, "&" read as
+    "and". Must match alias_key in ingestion/entities.py.
+    """
+    text = unicodedata.normalize("NFKC", str(text)).casefold().replace("&", " and ")
+    return " ".join(re.findall(r"[^\W_]+", text))
+
+
+@dataclass(frozen=True)
+class Entity:
+    """A canonical institute or branch and its ids in each family's tables."""
+    id: int
+    name: str
+    families: Dict[str, int]
+    short_name: Optional[str] = None
+
+
+@dataclass
+class Mentions:
+    """Entity ids mentioned in a piece of text, in order of appearance."""
+    institutes: List[int] = field(default_factory=list)
+    branches: List[int] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.institutes or self.branches)
+
+
+class EntityDictionary:
+    """Compiled alias lookups for institutes and branches."""
+
+    def __init__(self, data: Optional[dict] = None):
+        data = data or {}
+        self.entities: Dict[str, Dict[int, Entity]] = {}
+        self._names: Dict[str, Dict[str, int]] = {}
+        self._acronyms: Dict[str, Dict[str, int]] = {}
+        for kind in (INSTITUTE, BRANCH):
+            self.entities[kind] = {
+                entry["id"]: Entity(entry["id"], entry["name"], entry.get("families", {}), entry.get("short_name"))
+                for entry in data.get(kind, [])
+            }
+            aliases = data.get("aliases", {}).get(kind, {})
+            self._names[kind] = aliases.get("names", {})
+            self._acronyms[kind] = aliases.get("acronyms", {})
+        # Longest name alias in words, which bounds the n-grams scanned in free text
+        self._max_words = max(
+            (len(key.split()) for names in self._names.values() for key in names), default=0
+        )
+
+    @classmethod
+    def load(cls, data_dir: str) -> "EntityDictionary":
+        """Dictionary from data_dir/entities.json; empty if it is missing or from another schema."""
+        path = Path(data_dir) / ENTITIES_FILE
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            print(f"LOG: No entity dictionary at {path} ({e}); name resolution disabled")
+            return cls()
+        if data.get("schema_version") != ENTITIES_SCHEMA_VERSION:
+            print(f"LOG: Entity dictionary schema {data.get('schema_version')} != {ENTITIES_SCHEMA_VERSION}; ignored")
+            return cls()
+        return cls(data)
+
+    def __len__(self) -> int:
+        return sum(len(entities) for entities in self.entities.values())
+
+    def resolve(self, kind: str, text: Optional[str]) -> Optional[int]:
+        """Entity id of a name or acronym (any case), or None."""
+        if not text:
+            return None
+        entity_id = self._names[kind].get(alias_key(text))
+        if entity_id is None:
+            entity_id = self._acronyms[kind].get(str(text).strip().upper())
+        return entity_id
+
+    def resolve_institute(self, text: Optional[str]) -> Optional[int]:
+        return self.resolve(INSTITUTE, text)
+
+    def resolve_branch(self, text: Optional[str]) -> Optional[int]:
+        return self.resolve(BRANCH, text)
+
+    def entity(self, kind: str, entity_id: int) -> Optional[Entity]:
+        return self.entities[kind].get(entity_id)
+
+    def find_mentions(self, text: Optional[str]) -> Mentions:
+        """
+        Institutes and branches named in free text. Scans word n-grams
+        left to right, taking the longest alias at each position (so
+        "NIT Warangal" wins over a shorter match inside it).
+        """
+        mentions = Mentions()
+        if not text or not self._max_words:
+            return mentions
+        words = re.findall(r"[^\W_]+", unicodedata.normalize("NFKC", text).replace("&", " and "))
+        keys = [word.casefold() for word in words]
+        position = 0
+        while position < len(words):
+            match: Optional[Tuple[str, int, int]] = None
+            for size in range(min(self._max_words, len(words) - position), 0, -1):
+                key = " ".join(keys[position:position + size])
+                for kind in (INSTITUTE, BRANCH):
+                    if key in self._names[kind]:
+                        match = (kind, self._names[kind][key], size)
+                        break
+                if match:
+                    break
+            if match is None and len(words[position]) > 1 and words[position].isupper():
+                for kind in (INSTITUTE, BRANCH):
+                    if words[position] in self._acronyms[kind]:
+                        match = (kind, self._acronyms[kind][words[position]], 1)
+                        break
+            if match is None:
+                position += 1
+                continue
+            kind, entity_id, size = match
+            found = mentions.institutes if kind == INSTITUTE else mentions.branches
+            if entity_id not in found:
+                found.append(entity_id)
+            position += size
+        return mentions
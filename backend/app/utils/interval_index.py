@@ -0,0 +1,108 @@
+"""
+Static interval index over closed integer intervals [start, end].
+
+A centered interval tree: each node keeps the intervals containing its
+center twice, sorted by start and by end, and passes the intervals lying
+wholly left or right of the center to its children. The center is the
+median midpoint of the node's intervals, so every node holds at least one
+interval and the tree is O(log n) deep. Sets of at most LEAF_SIZE
+intervals become leaves that are filtered with one vectorized comparison
+instead of further nodes. `overlapping(low, high)` reports every interval
+intersecting [low, high] in O(log n + k) for k results, each inner node's
+matches being a sorted-array prefix (one searchsorted).
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+LEAF_SIZE = 32
+
+
+class IntervalIndex:
+    """Positions (into the input arrays) of the intervals overlapping a query range."""
+
+    def __init__(self, starts: np.ndarray, ends: np.ndarray):
+        starts = np.asarray(starts, dtype=np.int64)
+        ends = np.asarray(ends, dtype=np.int64)
+        if starts.shape != ends.shape:
+            raise ValueError("starts and ends must have the same length")
+        self._len = len(starts)
+        # Per node: center, by-start (positions, starts), by-end (positions, negated ends), left, right.
+        # A leaf has center None and keeps (positions, starts) and (positions, ends) unsorted.
+        self._center: List[Optional[float]] = []
+        self._by_start: List[Tuple[np.ndarray, np.ndarray]] = []
+        self._by_end: List[Tuple[np.ndarray, np.ndarray]] = []
+        self._children: List[List[int]] = []
+        if self._len:
+            self._build(starts, ends)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def _build(self, starts: np.ndarray, ends: np.ndarray) -> None:
+        # (positions, parent node, side) of nodes still to build; an explicit stack instead of recursion
+        pending = [(np.arange(len(starts)), -1, 0)]
+        while pending:
+            positions, parent, side = pending.pop()
+            node_starts, node_ends = starts[positions], ends[positions]
+            node = len(self._center)
+            if parent >= 0:
+                self._children[parent][side] = node
+            if len(positions) <= LEAF_SIZE:
+                self._center.append(None)
+                self._by_start.append((positions, node_starts))
+                self._by_end.append((positions, node_ends))
+                self._children.append([-1, -1])
+                continue
+            midpoints = (node_starts + node_ends) / 2
+            center = float(np.partition(midpoints, len(midpoints) // 2)[len(midpoints) // 2])
+            left = node_ends < center
+            right = node_starts > center
+            here = ~(left | right)
+
+            self._center.append(center)
+            kept = positions[here]
+            order = np.argsort(starts[kept], kind="stable")
+            self._by_start.append((kept[order], starts[kept][order]))
+            order = np.argsort(-ends[kept], kind="stable")
+            self._by_end.append((kept[order], -ends[kept][order]))
+            self._children.append([-1, -1])
+            if left.any():
+                pending.append((positions[left], node, 0))
+            if right.any():
+                pending.append((positions[right], node, 1))
+
+    def overlapping(self, low: float, high: float) -> np.ndarray:
+        """Positions of the intervals with start <= high and end >= low, in no particular order."""
+        if not self._len or low > high:
+            return np.empty(0, dtype=np.int64)
+        found = []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            center = self._center[node]
+            left, right = self._children[node]
+            if center is None:
+                positions, node_starts = self._by_start[node]
+                node_ends = self._by_end[node][1]
+                found.append(positions[(node_starts <= high) & (node_ends >= low)])
+            elif high < center:
+                # Every interval here ends at or after the center, so only starts matter
+                positions, node_starts = self._by_start[node]
+                found.append(positions[:np.searchsorted(node_starts, high, side="right")])
+                if left >= 0:
+                    stack.append(left)
+            elif low > center:
+                positions, negated_ends = self._by_end[node]
+                found.append(positions[:np.searchsorted(negated_ends, -low, side="right")])
+                if right >= 0:
+                    stack.append(right)
+            else:
+                found.append(self._by_start[node][0])
+                stack.extend(child for child in (left, right) if child >= 0)
+        return np.concatenate(found)
+
+    def stabbing(self, point: float) -> np.ndarray:
+        """Positions of the intervals containing `point`."""
+        return self.overlapping(point, point)
@@ -0,0 +1,143 @@
+"""
+Benchmark: per-request serialization time of /api/recommend payloads.
+
+Compares the previous path (per-item RecommendationItem construction +
+FastAPI's default response_model serialization) with the fast path
+(bulk RecommendationItemList construction + PydanticJSONResponse).
+model_construct is timed too, for reference.
+
+Builds a realistic payload from ../normalized_data (JEE Advanced cutoffs)
+at a low rank, where almost every row is eligible.
+
+Usage (from backend/):
+    python benchmark_serialization.py [--rank 500] [--category GEN] [--iterations 200]
+"""
+
+import argparse
+import csv
+import json
+import os
+import time
+from pathlib import Path
+
+os.environ.setdefault("DATABASE_URL", "postgresql+psycopg2://benchmark@localhost/benchmark")
+
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from fastapi.testclient import TestClient
+
+from app.core.responses import PydanticJSONResponse
+from app.schemas.response import RecommendationItem, RecommendationItemList, RecommendationResponse
+from app.services.admission_model import confidence_band, static_probability
+from app.utils.constants import MIN_ELIGIBLE_THRESHOLD
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "normalized_data"
+
+
+def load_rows(rank: int, category: str):
+    """Eligible (iit, branch, closing_rank) rows, deduplicated like RankFilterService."""
+    with open(DATA_DIR / "iit.csv", encoding="utf-8") as f:
+        iits = {r["iit_id"]: r for r in csv.DictReader(f)}
+    with open(DATA_DIR / "branch.csv", encoding="utf-8") as f:
+        branches = {r["branch_id"]: r["branch_name"] for r in csv.DictReader(f)}
+
+    best = {}
+    with open(DATA_DIR / "cutoff.csv", encoding="utf-8") as f:
+        for r in csv.DictReader(f):
+            closing = int(r["closing_rank"])
+            if r["category"] != category or closing < rank * MIN_ELIGIBLE_THRESHOLD:
+                continue
+            key = (r["iit_id"], r["branch_id"])
+            if key not in best or closing < best[key]:
+                best[key] = closing
+
+    rows = []
+    for (iit_id, branch_id), closing in best.items():
+        iit = iits[iit_id]
+        rows.append((iit["name"], branches[branch_id], closing, iit["location"], int(iit["nirf_rank"])))
+    return rows
+
+
+def confidence_for(closing: int, rank: int) -> str:
+    return confidence_band(float(static_probability(closing, rank))) or "ambitious"
+
+
+def build_response(rows, rank: int, mode: str) -> RecommendationResponse:
+    """Build the payload with per-item ("init"), "construct" or "bulk" item creation."""
+    buckets = {"safe": [], "moderate": [], "ambitious": []}
+    for iit, branch, closing, location, nirf in rows:
+        confidence = confidence_for(closing, rank)
+        buckets[confidence].append(dict(
+            iit=iit, branch=branch, closing_rank=closing,
+            confidence=confidence, location=location, nirf_rank=nirf
+        ))
+    for name, items in buckets.items():
+        if mode == "bulk":
+            buckets[name] = RecommendationItemList.validate_python(items)
+        elif mode == "construct":
+            buckets[name] = [RecommendationItem.model_construct(**item) for item in items]
+        else:
+            buckets[name] = [RecommendationItem(**item) for item in items]
+    return RecommendationResponse(
+        counselor_summary="summary " * 40,
+        full_report="report " * 1500,
+        **buckets
+    )
+
+
+def time_it(fn, iterations: int) -> float:
+    """Median wall time in milliseconds."""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rank", type=int, default=500)
+    parser.add_argument("--category", default="GEN")
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    rows = load_rows(args.rank, args.category)
+
+    app = FastAPI()
+
+    @app.get("/before", response_model=RecommendationResponse)
+    def before():
+        return build_response(rows, args.rank, "init")
+
+    @app.get("/after", response_model=RecommendationResponse, response_class=PydanticJSONResponse)
+    def after():
+        return PydanticJSONResponse(build_response(rows, args.rank, "bulk"))
+
+    client = TestClient(app)
+    body_before = client.get("/before").content
+    body_after = client.get("/after").content
+    # Both paths must produce the same document
+    assert json.loads(body_before) == json.loads(body_after)
+
+    response = build_response(rows, args.rank, "bulk")
+    results = [
+        ("build items (per-item init)", time_it(lambda: build_response(rows, args.rank, "init"), args.iterations)),
+        ("build items (model_construct)", time_it(lambda: build_response(rows, args.rank, "construct"), args.iterations)),
+        ("build items (bulk TypeAdapter)", time_it(lambda: build_response(rows, args.rank, "bulk"), args.iterations)),
+        ("render (jsonable_encoder + json.dumps)", time_it(
+            lambda: json.dumps(jsonable_encoder(response)).encode(), args.iterations)),
+        ("render (compiled serializer)", time_it(lambda: PydanticJSONResponse(response).body, args.iterations)),
+        ("end-to-end request, before", time_it(lambda: client.get("/before"), args.iterations)),
+        ("end-to-end request, after", time_it(lambda: client.get("/after"), args.iterations)),
+    ]
+
+    print(f"Payload: rank={args.rank} category={args.category} items={len(rows)} bytes={len(body_after)}")
+    print(f"Median over {args.iterations} iterations:")
+    for label, ms in results:
+        print(f"  {label:<42} {ms:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
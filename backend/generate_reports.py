@@ -0,0 +1,232 @@
+"""
+Offline bulk counseling report generation.
+
+Reads a CSV of students and, for each one, runs the same filtering as
+RankFilterService / JeeMainsRankFilterService against a local cutoff
+snapshot (normalized_data/), then renders a report with
+generate_fallback_report or, with --llm, the LLM (bounded concurrency).
+
+Filtering and templated reports run in a multiprocessing pool. Results are
+appended to an NDJSON file as they complete, so an interrupted run can be
+restarted with the same command: students already in the output are
+skipped.
+
+Input CSV columns (header required):
+    rank, category              required
+    id                          optional, defaults to the row number
+    exam                        optional, "advanced" (default) or "mains"
+    year                        optional, default 2024
+    round                       optional, JEE Mains round, default 5
+
+Usage (from backend/):
+    python generate_reports.py students.csv reports.ndjson [--workers 4] [--llm --llm-concurrency 4]
+"""
+
+import argparse
+import csv
+import json
+import os
+import signal
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import Pool
+from pathlib import Path
+
+from app.services.cutoff_index import CutoffSnapshot
+from app.services.fallback_report_generator import generate_fallback_report
+
+DEFAULT_DATA_DIR = Path(__file__).resolve().parent.parent / "normalized_data"
+VALID_CATEGORIES = ["GEN", "OBC", "SC", "ST", "EWS"]
+EXAMS = ("advanced", "mains")
+
+# Snapshot loaded once per worker process
+_snapshot = None
+
+
+def _init_worker(data_dir: str) -> None:
+    global _snapshot
+    # Ctrl-C is handled by the parent, which terminates the pool
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _snapshot = CutoffSnapshot.load(data_dir)
+
+
+def read_students(path: Path):
+    """Parse and validate the input CSV. Returns (students, errors)."""
+    students, errors = [], []
+    with open(path, encoding="utf-8", newline="") as f:
+        for line_no, row in enumerate(csv.DictReader(f), start=2):
+            try:
+                student = {
+                    "id": (row.get("id") or "").strip() or str(line_no - 1),
+                    "exam": (row.get("exam") or "advanced").strip().lower(),
+                    "rank": int(row["rank"]),
+                    "category": row["category"].strip().upper(),
+                    "year": int(row.get("year") or 2024),
+                    "round": int(row.get("round") or 5),
+                }
+            except (KeyError, ValueError, AttributeError) as e:
+                errors.append(f"line {line_no}: {e}")
+                continue
+            if student["rank"] < 1 or student["category"] not in VALID_CATEGORIES or student["exam"] not in EXAMS:
+                errors.append(f"line {line_no}: invalid rank/category/exam")
+                continue
+            students.append(student)
+    return students, errors
+
+
+def completed_ids(output: Path) -> set:
+    """Ids already written; drops a trailing partial line left by an interruption."""
+    done = set()
+    if not output.exists():
+        return done
+    valid_bytes = 0
+    with open(output, "rb") as f:
+        for line in f:
+            try:
+                done.add(json.loads(line)["id"])
+            except (ValueError, KeyError):
+                break
+            valid_bytes += len(line)
+    if valid_bytes < output.stat().st_size:
+        with open(output, "r+b") as f:
+            f.truncate(valid_bytes)
+    return done
+
+
+def recommend(student: dict):
+    """Filtering for one student on the worker's snapshot."""
+    if student["exam"] == "mains":
+        return _snapshot.mains.recommend(
+            student["rank"], student["category"], student["year"], student["round"], ["NIT", "IIIT", "GFTI"]
+        )
+    return _snapshot.advanced.recommend(student["rank"], student["category"], student["year"])
+
+
+def process_templated(student: dict) -> dict:
+    """Worker task: filtering plus the templated report."""
+    safe, moderate, ambitious = recommend(student)
+    report = generate_fallback_report(
+        student["rank"], student["category"], None, safe, moderate, ambitious, student["year"]
+    )
+    return _record(student, safe, moderate, ambitious, report)
+
+
+def process_lists(student: dict):
+    """Worker task for --llm: filtering only, the report is rendered by the parent."""
+    return student, recommend(student)
+
+
+def _record(student: dict, safe, moderate, ambitious, report: str) -> dict:
+    return {
+        **student,
+        "counts": {"safe": len(safe), "moderate": len(moderate), "ambitious": len(ambitious)},
+        "full_report": report,
+    }
+
+
+class Progress:
+    """Periodic progress and throughput lines on stderr."""
+
+    def __init__(self, total: int, skipped: int, interval: float = 2.0):
+        self.total = total
+        self.skipped = skipped
+        self.done = 0
+        self.interval = interval
+        self.start = time.perf_counter()
+        self._last = 0.0
+
+    def tick(self) -> None:
+        self.done += 1
+        if time.perf_counter() - self._last >= self.interval:
+            self.report()
+
+    def report(self) -> None:
+        self._last = time.perf_counter()
+        elapsed = self._last - self.start
+        rate = self.done / elapsed if elapsed > 0 else 0.0
+        remaining = self.total - self.done
+        eta = remaining / rate if rate > 0 else float("inf")
+        print(
+            f"[{self.done + self.skipped}/{self.total + self.skipped}] "
+            f"{rate:,.1f} students/s, elapsed {elapsed:,.1f}s, eta {eta:,.0f}s",
+            file=sys.stderr, flush=True
+        )
+
+
+def run_templated(pending, args, out, progress: Progress) -> None:
+    with Pool(args.workers, initializer=_init_worker, initargs=(str(args.data_dir),)) as pool:
+        for record in pool.imap_unordered(process_templated, pending, chunksize=args.chunksize):
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            out.flush()
+            progress.tick()
+
+
+def run_llm(pending, args, out, progress: Progress) -> None:
+    # Imported lazily: needs the backend settings (.env) and API key
+    from app.services.llm_service import LLMService
+    llm_service = LLMService()
+    # Bounds in-flight LLM calls (and buffered filter results)
+    slots = threading.BoundedSemaphore(args.llm_concurrency)
+    write_lock = threading.Lock()
+
+    def render(student, lists):
+        try:
+            safe, moderate, ambitious = lists
+            report = llm_service.generate_full_report(
+                student["rank"], student["category"], None, safe, moderate, ambitious, student["year"]
+            )
+            with write_lock:
+                out.write(json.dumps(_record(student, safe, moderate, ambitious, report), ensure_ascii=False) + "\n")
+                out.flush()
+                progress.tick()
+        finally:
+            slots.release()
+
+    with Pool(args.workers, initializer=_init_worker, initargs=(str(args.data_dir),)) as pool, \
+            ThreadPoolExecutor(max_workers=args.llm_concurrency) as executor:
+        for student, lists in pool.imap_unordered(process_lists, pending, chunksize=args.chunksize):
+            slots.acquire()
+            executor.submit(render, student, lists)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", type=Path, help="CSV of students")
+    parser.add_argument("output", type=Path, help="NDJSON file, appended to (resumable)")
+    parser.add_argument("--data-dir", type=Path, default=DEFAULT_DATA_DIR, help="normalized_data directory")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunksize", type=int, default=16, help="Students per task sent to a worker")
+    parser.add_argument("--llm", action="store_true", help="Render reports with the LLM instead of the template")
+    parser.add_argument("--llm-concurrency", type=int, default=4, help="Maximum concurrent LLM calls")
+    args = parser.parse_args()
+
+    students, errors = read_students(args.input)
+    for error in errors:
+        print(f"Skipping {error}", file=sys.stderr)
+
+    done = completed_ids(args.output)
+    pending = [s for s in students if s["id"] not in done]
+    print(
+        f"{len(students)} students, {len(students) - len(pending)} already done, {len(pending)} to process",
+        file=sys.stderr
+    )
+    if not pending:
+        return
+
+    progress = Progress(total=len(pending), skipped=len(students) - len(pending))
+    with open(args.output, "a", encoding="utf-8") as out:
+        try:
+            if args.llm:
+                run_llm(pending, args, out, progress)
+            else:
+                run_templated(pending, args, out, progress)
+        except KeyboardInterrupt:
+            print("Interrupted; re-run the same command to resume.", file=sys.stderr)
+            sys.exit(130)
+    progress.report()
+
+
+if __name__ == "__main__":
+    main()
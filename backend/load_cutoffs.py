@@ -0,0 +1,223 @@
+"""
+Bulk-load the normalized cutoff tables into Postgres.
+
+Each CSV in normalized_data/ is streamed with COPY FROM STDIN into a
+session-local shadow table shaped like the live table (one transaction
+per table). Once all of a family's shadows are loaded and their row
+counts verified, a single transaction replaces the contents of the
+family's live tables from the shadows, so readers see either the old or
+the new data, never a mix.
+
+The live tables are refilled (TRUNCATE + INSERT ... SELECT) rather than
+renamed: the jee_mains_cutoffs view and the foreign keys are bound to the
+live tables and would otherwise keep pointing at the old ones.
+
+Usage (from backend/, with DATABASE_URL set):
+    python load_cutoffs.py [--data-dir ../normalized_data] [--families iit nit iiit cfi]
+"""
+
+import argparse
+import csv
+import io
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import inspect
+
+from app.core.database import engine
+from app.models import IIT, Branch, Cutoff, NIT, NITBranch, NITCutoff, IIIT, IIITBranch, IIITCutoff, CFI, CFIBranch, CFICutoff
+
+# Family -> (CSV file, model) in load order: dimensions before cutoffs
+LOAD_PLAN = {
+    "iit": [("iit.csv", IIT), ("branch.csv", Branch), ("cutoff.csv", Cutoff)],
+    "nit": [("nit.csv", NIT), ("nit_branch.csv", NITBranch), ("nit_cutoff.csv", NITCutoff)],
+    "iiit": [("iiit.csv", IIIT), ("iiit_branch.csv", IIITBranch), ("iiit_cutoff.csv", IIITCutoff)],
+    "cfi": [("cfi.csv", CFI), ("cfi_branch.csv", CFIBranch), ("cfi_cutoff.csv", CFICutoff)],
+}
+
+COPY_BATCH_ROWS = 10000
+
+
+class CsvProjection(io.TextIOBase):
+    """
+    Readable CSV text holding only `columns` of a CSV file, produced lazily
+    in batches so COPY can stream files of any size.
+    """
+
+    def __init__(self, path: Path, columns: List[str]):
+        self._file = open(path, encoding="utf-8", newline="")
+        reader = csv.reader(self._file)
+        header = next(reader, [])
+        missing = [c for c in columns if c not in header]
+        if missing:
+            self._file.close()
+            raise ValueError(f"{path.name} is missing columns: {', '.join(missing)}")
+        self._positions = [header.index(c) for c in columns]
+        self._reader = reader
+        self._buffer = ""
+        self.rows = 0
+
+    def _next_batch(self) -> str:
+        out = io.StringIO()
+        writer = csv.writer(out, lineterminator="\n")
+        for row in self._reader:
+            writer.writerow([row[i] for i in self._positions])
+            self.rows += 1
+            if self.rows % COPY_BATCH_ROWS == 0:
+                break
+        return out.getvalue()
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: Optional[int] = -1) -> str:
+        while size is None or size < 0 or len(self._buffer) < size:
+            batch = self._next_batch()
+            if not batch:
+                break
+            self._buffer += batch
+        if size is None or size < 0:
+            size = len(self._buffer)
+        chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+        return chunk
+
+    def readline(self, size: Optional[int] = -1) -> str:
+        # psycopg2 only uses read(); kept for file-like completeness
+        while "\n" not in self._buffer:
+            batch = self._next_batch()
+            if not batch:
+                break
+            self._buffer += batch
+        end = self._buffer.find("\n") + 1 or len(self._buffer)
+        line, self._buffer = self._buffer[:end], self._buffer[end:]
+        return line
+
+    def close(self) -> None:
+        self._file.close()
+        super().close()
+
+
+def shadow_name(table: str) -> str:
+    return f"{table}__shadow"
+
+
+def copy_table(cursor, path: Path, table: str, columns: List[str]) -> Tuple[int, float]:
+    """COPY a CSV into the table's shadow; returns (rows, seconds)."""
+    start = time.perf_counter()
+    cursor.execute(f"DROP TABLE IF EXISTS {shadow_name(table)}")
+    cursor.execute(f"CREATE TEMP TABLE {shadow_name(table)} (LIKE {table} INCLUDING DEFAULTS)")
+    stream = CsvProjection(path, columns)
+    try:
+        cursor.copy_expert(
+            f"COPY {shadow_name(table)} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+            stream
+        )
+    finally:
+        stream.close()
+    cursor.execute(f"SELECT count(*) FROM {shadow_name(table)}")
+    loaded = cursor.fetchone()[0]
+    if loaded != stream.rows:
+        raise RuntimeError(f"{table}: staged {loaded} rows, expected {stream.rows}")
+    return loaded, time.perf_counter() - start
+
+
+def swap_family(cursor, models) -> float:
+    """Replace the live tables' contents with their shadows (caller commits)."""
+    start = time.perf_counter()
+    tables = [model.__table__.name for model in models]
+    cursor.execute(f"LOCK TABLE {', '.join(tables)} IN ACCESS EXCLUSIVE MODE")
+    cursor.execute(f"TRUNCATE {', '.join(tables)}")
+    for model in models:
+        table = model.__table__.name
+        cursor.execute(f"INSERT INTO {table} SELECT * FROM {shadow_name(table)}")
+        cursor.execute(f"DROP TABLE {shadow_name(table)}")
+        # Ids come from the CSVs; move any serial sequence past them
+        for key in model.__table__.primary_key.columns:
+            cursor.execute(
+                f"SELECT setval(seq, COALESCE((SELECT max({key.name}) FROM {table}), 0) + 1, false) "
+                f"FROM pg_get_serial_sequence('{table}', '{key.name}') AS seq WHERE seq IS NOT NULL"
+            )
+    return time.perf_counter() - start
+
+
+def missing_columns(families: List[str]) -> Dict[str, List[str]]:
+    """Model columns absent from the live tables of `families`, by table."""
+    inspector = inspect(engine)
+    missing = {}
+    for family in families:
+        for _, model in LOAD_PLAN[family]:
+            table = model.__table__
+            live = {column["name"] for column in inspector.get_columns(table.name)}
+            absent = [c.name for c in table.columns if c.name not in live]
+            if absent:
+                missing[table.name] = absent
+    return missing
+
+
+def load_family(connection, data_dir: Path, family: str) -> Dict[str, int]:
+    plan = LOAD_PLAN[family]
+    counts = {}
+    cursor = connection.cursor()
+    try:
+        for file_name, model in plan:
+            table = model.__table__
+            # Columns of the live table that the CSV provides (e.g. cfi.csv's nirf_rank has no column)
+            with open(data_dir / file_name, encoding="utf-8", newline="") as f:
+                header = next(csv.reader(f), [])
+            columns = [c.name for c in table.columns if c.name in header]
+            rows, seconds = copy_table(cursor, data_dir / file_name, table.name, columns)
+            connection.commit()
+            counts[table.name] = rows
+            print(f"  {table.name:<16} {rows:>8} rows staged in {seconds:6.2f}s ({rows / max(seconds, 1e-9):,.0f} rows/s)")
+
+        seconds = swap_family(cursor, [model for _, model in plan])
+        connection.commit()
+        total = sum(counts.values())
+        print(f"  {family}: swapped {total} rows in {seconds:.2f}s ({total / max(seconds, 1e-9):,.0f} rows/s)")
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        cursor.close()
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--data-dir", default="../normalized_data")
+    parser.add_argument("--families", nargs="+", choices=list(LOAD_PLAN), default=list(LOAD_PLAN))
+    args = parser.parse_args()
+
+    data_dir = Path(args.data_dir)
+    missing = [name for family in args.families for name, _ in LOAD_PLAN[family] if not (data_dir / name).exists()]
+    if missing:
+        parser.error(f"missing files in {data_dir}: {', '.join(missing)}")
+
+    # Create any live table that does not exist yet (never alters existing ones:
+    # a table missing model columns must go through migrate_cutoffs.py first)
+    for family in args.families:
+        for _, model in LOAD_PLAN[family]:
+            model.__table__.create(engine, checkfirst=True)
+    stale = missing_columns(args.families)
+    if stale:
+        parser.error(
+            "live tables lack model columns, run migrate_cutoffs.py first: "
+            + "; ".join(f"{table} ({', '.join(columns)})" for table, columns in stale.items())
+        )
+
+    start = time.perf_counter()
+    total = 0
+    connection = engine.raw_connection()
+    try:
+        for family in args.families:
+            print(f"Loading {family}...")
+            total += sum(load_family(connection, data_dir, family).values())
+    finally:
+        connection.close()
+    seconds = time.perf_counter() - start
+    print(f"Loaded {total} rows in {seconds:.2f}s ({total / max(seconds, 1e-9):,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+from pathlib import Path
+
+from app.core.database import engine
+from sqlalchemy import text
+
+# (column, DDL type) pairs added to every cutoff table after its initial setup
+CUTOFF_COLUMNS = [
+    ("gender", "TEXT NOT NULL DEFAULT 'Gender-Neutral'"),
+    ("pwd", "BOOLEAN NOT NULL DEFAULT FALSE"),
+    ("opening_rank", "INTEGER"),
+]
+CUTOFF_TABLES = ["cutoffs", "nit_cutoffs", "iiit_cutoffs", "cfi_cutoffs"]
+
+# (column, DDL type) pairs added to every institute table after its initial setup
+INSTITUTE_COLUMNS = [
+    ("state", "TEXT"),
+]
+INSTITUTE_TABLES = ["iits", "nits", "iiits", "cfis"]
+
+# The unified views select the new columns; they are dropped (dependents first)
+# and recreated, since CREATE OR REPLACE VIEW cannot change a view's columns
+VIEW_SCRIPT = Path(__file__).resolve().parent.parent / "normalized_data" / "create_unified_view.sql"
+VIEWS = ["jee_mains_cutoffs", "jee_mains_branches", "jee_mains_institutes"]
+VIEW_TABLES = ["nits", "nit_branches", "nit_cutoffs", "iiits", "iiit_branches", "iiit_cutoffs",
+               "cfis", "cfi_branches", "cfi_cutoffs"]
+
+def add_columns(connection, table, columns):
+    for column, ddl_type in columns:
+        # Check if column exists
+        result = connection.execute(text(
+            "SELECT column_name FROM information_schema.columns WHERE table_name=:table AND column_name=:column;"
+        ), {"table": table, "column": column})
+        if result.fetchone():
+            print(f"Column '{table}.{column}' already exists.")
+        else:
+            print(f"Adding '{table}.{column}' column...")
+            connection.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {ddl_type};"))
+            connection.commit()
+            print(f"Migration successful: Added '{table}.{column}' column.")
+
+def table_exists(connection, table):
+    result = connection.execute(text(
+        "SELECT table_name FROM information_schema.tables WHERE table_name=:table AND table_type='BASE TABLE';"
+    ), {"table": table})
+    return result.fetchone() is not None
+
+def migrate_db():
+    print("Running migration to add new columns to cutoff and institute tables...")
+    try:
+        with engine.connect() as connection:
+            for tables, columns in ((CUTOFF_TABLES, CUTOFF_COLUMNS), (INSTITUTE_TABLES, INSTITUTE_COLUMNS)):
+                for table in tables:
+                    # Missing tables are created with every column by load_cutoffs.py
+                    if not table_exists(connection, table):
+                        print(f"Table '{table}' does not exist, skipping.")
+                        continue
+                    add_columns(connection, table, columns)
+
+            if all(table_exists(connection, table) for table in VIEW_TABLES):
+                print("Recreating the unified JEE Mains views...")
+                for view in VIEWS:
+                    connection.execute(text(f"DROP VIEW IF EXISTS {view};"))
+                connection.exec_driver_sql(VIEW_SCRIPT.read_text(encoding="utf-8"))
+                connection.commit()
+                print("Migration successful: Recreated the unified views.")
+    except Exception as e:
+        print(f"Migration failed: {e}")
+
+if __name__ == "__main__":
+    migrate_db()
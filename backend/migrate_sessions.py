@@ -1,22 +1,28 @@
-
 from app.core.database import SessionLocal, engine
 from sqlalchemy import text
 
+# (column, DDL type) pairs added to the sessions table after its initial setup
+SESSION_COLUMNS = [
+    ("source_type", "VARCHAR DEFAULT 'jee_advanced'"),
+    ("history_summary", "TEXT"),
+]
+
 def migrate_db():
-    print("Running migration to add source_type column to sessions table...")
+    print("Running migration to add new columns to sessions table...")
     try:
         with engine.connect() as connection:
-            # Check if column exists
-            result = connection.execute(text(
-                "SELECT column_name FROM information_schema.columns WHERE table_name='sessions' AND column_name='source_type';"
-            ))
-            if result.fetchone():
-                print("Column 'source_type' already exists.")
-            else:
-                print("Adding 'source_type' column...")
-                connection.execute(text("ALTER TABLE sessions ADD COLUMN source_type VARCHAR DEFAULT 'jee_advanced';"))
-                connection.commit()
-                print("Migration successful: Added 'source_type' column.")
+            for column, ddl_type in SESSION_COLUMNS:
+                # Check if column exists
+                result = connection.execute(text(
+                    "SELECT column_name FROM information_schema.columns WHERE table_name='sessions' AND column_name=:column;"
+                ), {"column": column})
+                if result.fetchone():
+                    print(f"Column '{column}' already exists.")
+                else:
+                    print(f"Adding '{column}' column...")
+                    connection.execute(text(f"ALTER TABLE sessions ADD COLUMN {column} {ddl_type};"))
+                    connection.commit()
+                    print(f"Migration successful: Added '{column}' column.")
     except Exception as e:
         print(f"Migration failed: {e}")
 
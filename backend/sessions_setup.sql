@@ -13,6 +13,7 @@ create table if not exists public.sessions (
   
   -- JSONB for rich data
   history jsonb default '[]'::jsonb,
+  history_summary text, -- rolling summary of messages that aged out of history
   recommendations jsonb,
   
   created_at timestamp with time zone default timezone('utc'::text, now()) not null,
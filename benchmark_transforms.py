@@ -0,0 +1,128 @@
+"""
+Timing comparison: row-wise vs vectorized cutoff-table construction.
+
+For each data family (IIT, NIT, IIIT, CFI) this loads the row_Data inputs,
+builds the institute and branch mappings with the ingestion engine, then
+times the engine's (vectorized) per-round parsing plus create_cutoff_table
+against the original row-by-row implementation kept below as a reference,
+and checks both produce identical CSV output.
+
+Usage (from the repo root):
+    python benchmark_transforms.py [--repeat 3]
+"""
+
+import argparse
+import time
+
+import pandas as pd
+
+from ingestion import FAMILIES, build_family
+from ingestion.common import create_branch_table, create_cutoff_table, derive_gender, is_pwd_seat, parse_round
+from ingestion.engine import RANK_DATA_PATH
+
+
+def reference_cutoff_table(cutoff_dfs, institute_mapping, branch_mapping, id_column, normalize, derive,
+                           with_quota=True):
+    """Original row-wise implementation (df.iterrows and a dict per row)."""
+    records = []
+    for idx, df in enumerate(cutoff_dfs[:5]):
+        for _, row in df.iterrows():
+            name = normalize(row['Institute'])
+            if not name or name not in institute_mapping:
+                continue
+            program = row['Academic Program']
+            if pd.isna(program):
+                continue
+            branch_id = None
+            for key in branch_mapping:
+                if key in str(program):
+                    branch_id = branch_mapping[key]
+                    break
+            if not branch_id:
+                continue
+            category = derive(row)
+            closing_rank_str = str(row['Closing Rank']).strip()
+            if closing_rank_str.upper().endswith('P') or closing_rank_str == 'nan':
+                continue
+            try:
+                closing_rank = int(float(closing_rank_str))
+            except (ValueError, TypeError):
+                continue
+            opening_rank_str = str(row['Opening Rank']).strip()
+            try:
+                opening_rank = None if opening_rank_str.upper().endswith('P') else int(float(opening_rank_str))
+            except (ValueError, TypeError):
+                opening_rank = None
+            record = {
+                id_column: institute_mapping[name],
+                'branch_id': branch_id,
+                'year': 2024,
+                'category': category,
+                'gender': derive_gender(row['Gender']),
+                'pwd': is_pwd_seat(row['Seat Type']),
+                'opening_rank': opening_rank,
+                'closing_rank': closing_rank,
+                'round': idx + 1,
+            }
+            if with_quota:
+                record['quota'] = row.get('Quota', '')
+            records.append(record)
+    df = pd.DataFrame(records)
+    df['opening_rank'] = df['opening_rank'].astype('Int64')
+    df['cutoff_id'] = range(1, len(df) + 1)
+    return df
+
+
+def families():
+    rank_df = pd.read_csv(RANK_DATA_PATH)
+    for config in FAMILIES.values():
+        rounds = [(round_number, pd.read_csv(path)) for _, round_number, path in config.round_paths() if path.exists()]
+        raw_dfs = [raw for _, raw in rounds]
+        parsed = [parse_round(config, raw, round_number) for round_number, raw in rounds]
+        institutes = build_family(config, parsed, rank_df if config.uses_rank_data else None)[0]
+        institute_map = dict(zip(institutes['name'], institutes[config.id_column]))
+        branch_map = create_branch_table(config, pd.concat(parsed)['program'].dropna().unique())[1]
+
+        def vectorized(config=config, rounds=rounds, institute_map=institute_map, branch_map=branch_map):
+            parsed = pd.concat([parse_round(config, raw, n) for n, raw in rounds], ignore_index=True)
+            return create_cutoff_table(config, parsed, institute_map, branch_map)
+
+        def reference(config=config, raw_dfs=raw_dfs, institute_map=institute_map, branch_map=branch_map):
+            return reference_cutoff_table(
+                raw_dfs, institute_map, branch_map, config.id_column, config.normalize_name,
+                lambda r: config.derive_category(r.get('Seat Type'), r.get('Quota'), r.get('Gender')),
+                with_quota=config.include_quota
+            )[config.output_columns()]
+
+        yield config.label, raw_dfs, vectorized, reference
+
+
+def best_of(fn, repeat: int):
+    """(best wall time in seconds, last result)."""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'family':<6} {'raw rows':>9} {'cutoffs':>8} {'row-wise':>10} {'vectorized':>11} {'speedup':>8}")
+    for name, raw_dfs, vectorized, reference in families():
+        reference_time, expected = best_of(reference, args.repeat)
+        vectorized_time, actual = best_of(vectorized, args.repeat)
+        # Same rows, order, ids and CSV rendering as the original
+        assert actual.to_csv(index=False) == expected.to_csv(index=False), f"{name}: output differs"
+        print(
+            f"{name:<6} {sum(len(df) for df in raw_dfs):>9} {len(actual):>8} "
+            f"{reference_time:>9.3f}s {vectorized_time:>10.3f}s {reference_time / vectorized_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+"""
+Ingestion engine: turns the raw JoSAA round files in row_Data/ into the
+normalized institute, branch and cutoff tables in normalized_data/.
+
+    python -m ingestion [--families iit nit ...] [--workers N]
+"""
+
+from .common import FamilyConfig
+from .engine import FAMILIES, build_family, run
+
+__all__ = ["FAMILIES", "FamilyConfig", "build_family", "run"]
@@ -0,0 +1,36 @@
+"""
+Rebuild normalized_data/ from row_Data/.
+
+Usage (from the repo root):
+    python -m ingestion [--families iit nit iiit cfi] [--workers N] [--output-dir normalized_data] [--full]
+    python -m ingestion --stream [--chunk-rows 5000]
+
+Only round files that are new or changed since the last run (per the
+manifest in the output directory) are processed; --full rebuilds everything.
+--stream rebuilds the affected families chunk by chunk in bounded memory
+and reports each stage's peak memory.
+"""
+
+import argparse
+
+from .engine import FAMILIES, OUTPUT_DIR, run
+from .streaming import CHUNK_ROWS
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--families", nargs="+", choices=list(FAMILIES), default=list(FAMILIES))
+    parser.add_argument("--workers", type=int, default=None, help="Process pool size (default: CPU count; 1 = serial)")
+    parser.add_argument("--output-dir", default=OUTPUT_DIR)
+    parser.add_argument("--full", action="store_true", help="Ignore the manifest and rebuild from scratch")
+    parser.add_argument("--stream", action="store_true", help="Rebuild in fixed-size chunks with bounded memory")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS, help="Raw rows per chunk with --stream")
+    args = parser.parse_args()
+    if args.chunk_rows < 1:
+        parser.error("--chunk-rows must be positive")
+    run(args.families, workers=args.workers, output_dir=args.output_dir, full=args.full,
+        stream=args.stream, chunk_rows=args.chunk_rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""
+CFI family: JEE Main cutoffs for the Centrally Funded Technical Institutes
+(GFTIs).
+"""
+
+import re
+from typing import Dict, Iterable, Optional, Tuple
+
+import pandas as pd
+
+from .common import FamilyConfig
+from .states import institute_states, location_label
+
+CFI_DATA_DIR = "row_Data/CFI_row_data"
+
+def normalize_name(name):
+    if pd.isna(name): return None
+    return name.strip()
+
+def extract_branch(program):
+    if pd.isna(program): return None, None, None
+    program = program.strip()
+    dt = "B.Tech" # Simplified
+    
+    match = re.match(r"^(.+?)\s*\([^)]+\)", program)
+    bn = match.group(1).strip() if match else re.split(r'[,\(]', program)[0].strip()
+    sn = bn[:3].upper()
+    return bn, sn, dt
+
+def derive_cat(seat, quota, gender=None):
+    seat = str(seat).upper()
+    if "OPEN" in seat and "PWD" not in seat: return "GEN"
+    if "OBC" in seat: return "OBC"
+    if "SC" in seat: return "SC"
+    if "ST" in seat: return "ST"
+    if "EWS" in seat: return "EWS"
+    return "GEN"
+
+NIRF_RANK_MAPPING = {
+    "Assam University, Silchar": 399,
+    "Birla Institute of Technology, Deoghar Off-Campus": 399,
+    "Birla Institute of Technology, Mesra, Ranchi": 51,
+    "Birla Institute of Technology, Patna Off-Campus": 399,
+    "CU Jharkhand": 399,
+    "Central University of Haryana": 399,
+    "Central University of Jammu": 399,
+    "Central University of Rajasthan, Rajasthan": 399,
+    "Central institute of Technology Kokrajar, Assam": 399,
+    "Chhattisgarh Swami Vivekanada Technical University, Bhilai (CSVTU Bhilai)": 399, # User said: Chhattisgarh Swami Vivekanada Technical University, Bhilai
+    "Gati Shakti Vishwavidyalaya, Vadodara": 399,
+    "Ghani Khan Choudhary Institute of Engineering and Technology, Malda, West Bengal": 399,
+    "Gurukula Kangri Vishwavidyalaya, Haridwar": 399,
+    "Indian Institute of Carpet Technology, Bhadohi": 399,
+    "Indian Institute of Handloom Technology(IIHT), Varanasi": 399,
+    "Indian Institute of Handloom Technology, Salem": 399,
+    "Institute of Chemical Technology, Mumbai: Indian Oil Odisha Campus, Bhubaneswar": 399,
+    "Institute of Engineering and Technology, Dr. H. S. Gour University. Sagar (A Central University)": 399,
+    "Institute of Infrastructure, Technology, Research and Management-Ahmedabad": 399,
+    "International Institute of Information Technology, Bhubaneswar": 201,
+    "International Institute of Information Technology, Naya Raipur": 202,
+    "Islamic University of Science and Technology Kashmir": 151,
+    "J.K. Institute of Applied Physics & Technology, Department of Electronics & Communication, University of Allahabad- Allahabad": 399,
+    "Jawaharlal Nehru University, Delhi": 203,
+    "Mizoram University, Aizawl": 399,
+    "National Institute of Advanced Manufacturing Technology, Ranchi": 204,
+    "National Institute of Electronics and Information Technology, Ajmer (Rajasthan)": 399,
+    "National Institute of Electronics and Information Technology, Aurangabad (Maharashtra)": 399,
+    "National Institute of Electronics and Information Technology, Gorakhpur (UP)": 399,
+    "National Institute of Electronics and Information Technology, Patna (Bihar)": 399,
+    "National Institute of Electronics and Information Technology, Ropar (Punjab)": 399,
+    "National Institute of Food Technology Entrepreneurship and Management, Kundli": 101,
+    "National Institute of Food Technology Entrepreneurship and Management, Thanjavur": 102,
+    "North Eastern Regional Institute of Science and Technology, Nirjuli-791109 (Itanagar),Arunachal Pradesh": 152,
+    "North-Eastern Hill University, Shillong": 399,
+    "Puducherry Technological University, Puducherry": 399,
+    "Punjab Engineering College, Chandigarh": 103,
+    "Rajiv Gandhi National Aviation University, Fursatganj, Amethi (UP)": 399,
+    "Sant Longowal Institute of Engineering and Technology": 79,
+    "School of Engineering, Tezpur University, Napaam, Tezpur": 153,
+    "School of Planning & Architecture, Bhopal": 11,
+    "School of Planning & Architecture, New Delhi": 8,
+    "School of Planning & Architecture: Vijayawada": 19,
+    "School of Studies of Engineering and Technology, Guru Ghasidas Vishwavidyalaya, Bilaspur": 154,
+    "Shri G. S. Institute of Technology and Science Indore": 399,
+    "Shri Mata Vaishno Devi University, Katra, Jammu & Kashmir": 155,
+    "University of Hyderabad": 74
+}
+
+# Other names students (and the placement tables) use (entity dictionary only; see ingestion.entities)
+INSTITUTE_ALIASES = {
+    "BIT Mesra": "Birla Institute of Technology, Mesra, Ranchi",
+    "IITRAM": "Institute of Infrastructure, Technology, Research and Management-Ahmedabad",
+    "Institute of Infrastructure Technology Research and Management (IITRAM)":
+        "Institute of Infrastructure, Technology, Research and Management-Ahmedabad",
+    "J.K. Institute of Applied Physics and Technology":
+        "J.K. Institute of Applied Physics & Technology, Department of Electronics & Communication, "
+        "University of Allahabad- Allahabad",
+    "NIFTEM": "National Institute of Food Technology Entrepreneurship and Management, Kundli",
+    "National Institute of Food Technology Entrepreneurship and Management (NIFTEM)":
+        "National Institute of Food Technology Entrepreneurship and Management, Kundli",
+    "PEC Chandigarh": "Punjab Engineering College, Chandigarh",
+    "Punjab Engineering College (Deemed to be University)": "Punjab Engineering College, Chandigarh",
+    "Tezpur University": "School of Engineering, Tezpur University, Napaam, Tezpur",
+    "School of Engineering, Tezpur University": "School of Engineering, Tezpur University, Napaam, Tezpur",
+    "SMVDU": "Shri Mata Vaishno Devi University, Katra, Jammu & Kashmir",
+    "Shri Mata Vaishno Devi University": "Shri Mata Vaishno Devi University, Katra, Jammu & Kashmir",
+    "Central University of Rajasthan": "Central University of Rajasthan, Rajasthan",
+    "Central University of Jharkhand": "CU Jharkhand",
+    "Assam University": "Assam University, Silchar",
+    "Mizoram University": "Mizoram University, Aizawl",
+    "SGSITS Indore": "Shri G. S. Institute of Technology and Science Indore",
+}
+
+# States of the institutes rank_data.csv does not list under their cutoff name
+INSTITUTE_STATES = {
+    "School of Planning & Architecture, New Delhi": "Delhi",
+    "School of Planning & Architecture, Bhopal": "Madhya Pradesh",
+    "School of Planning & Architecture: Vijayawada": "Andhra Pradesh",
+    "Birla Institute of Technology, Mesra, Ranchi": "Jharkhand",
+    "National Institute of Food Technology Entrepreneurship and Management, Kundli": "Haryana",
+    "Punjab Engineering College, Chandigarh": "Chandigarh",
+    "Islamic University of Science and Technology Kashmir": "Jammu and Kashmir",
+    "North Eastern Regional Institute of Science and Technology, Nirjuli-791109 (Itanagar),Arunachal Pradesh":
+        "Arunachal Pradesh",
+    "School of Engineering, Tezpur University, Napaam, Tezpur": "Assam",
+    "School of Studies of Engineering and Technology, Guru Ghasidas Vishwavidyalaya, Bilaspur": "Chhattisgarh",
+    "Shri Mata Vaishno Devi University, Katra, Jammu & Kashmir": "Jammu and Kashmir",
+    "International Institute of Information Technology, Bhubaneswar": "Odisha",
+    "International Institute of Information Technology, Naya Raipur": "Chhattisgarh",
+    "Jawaharlal Nehru University, Delhi": "Delhi",
+    "Assam University, Silchar": "Assam",
+    "Birla Institute of Technology, Deoghar Off-Campus": "Jharkhand",
+    "Birla Institute of Technology, Patna Off-Campus": "Bihar",
+    "CU Jharkhand": "Jharkhand",
+    "Central University of Haryana": "Haryana",
+    "Central University of Jammu": "Jammu and Kashmir",
+    "Central University of Rajasthan, Rajasthan": "Rajasthan",
+    "Central institute of Technology Kokrajar, Assam": "Assam",
+    "Chhattisgarh Swami Vivekanada Technical University, Bhilai (CSVTU Bhilai)": "Chhattisgarh",
+    "Gati Shakti Vishwavidyalaya, Vadodara": "Gujarat",
+    "Ghani Khan Choudhary Institute of Engineering and Technology, Malda, West Bengal": "West Bengal",
+    "Gurukula Kangri Vishwavidyalaya, Haridwar": "Uttarakhand",
+    "Indian Institute of Carpet Technology, Bhadohi": "Uttar Pradesh",
+    "Indian Institute of Handloom Technology(IIHT), Varanasi": "Uttar Pradesh",
+    "Indian Institute of Handloom Technology, Salem": "Tamil Nadu",
+    "Institute of Chemical Technology, Mumbai: Indian Oil Odisha Campus, Bhubaneswar": "Odisha",
+    "Institute of Engineering and Technology, Dr. H. S. Gour University. Sagar (A Central University)":
+        "Madhya Pradesh",
+    "Institute of Infrastructure, Technology, Research and Management-Ahmedabad": "Gujarat",
+    "J.K. Institute of Applied Physics & Technology, Department of Electronics & Communication, "
+    "University of Allahabad- Allahabad": "Uttar Pradesh",
+    "Mizoram University, Aizawl": "Mizoram",
+    "National Institute of Electronics and Information Technology, Ajmer (Rajasthan)": "Rajasthan",
+    "National Institute of Electronics and Information Technology, Aurangabad (Maharashtra)": "Maharashtra",
+    "National Institute of Electronics and Information Technology, Gorakhpur (UP)": "Uttar Pradesh",
+    "National Institute of Electronics and Information Technology, Patna (Bihar)": "Bihar",
+    "National Institute of Electronics and Information Technology, Ropar (Punjab)": "Punjab",
+    "North-Eastern Hill University, Shillong": "Meghalaya",
+    "Puducherry Technological University, Puducherry": "Puducherry",
+    "Rajiv Gandhi National Aviation University, Fursatganj, Amethi (UP)": "Uttar Pradesh",
+    "Shri G. S. Institute of Technology and Science Indore": "Madhya Pradesh",
+}
+
+def create_cfi_table(names: Iterable[str], rank_df: Optional[pd.DataFrame] = None) -> Tuple[pd.DataFrame, Dict[str, int]]:
+    cfi_recs = []
+    for n in sorted(set(names)):
+        rank = NIRF_RANK_MAPPING.get(n, 399) # Default to 399 if not mapped (or check closely)
+        cfi_recs.append({'name': n, 'location': 'India', 'nirf_rank': rank})
+        
+    cfi_df = pd.DataFrame(cfi_recs)
+    cfi_df.insert(2, 'state', institute_states(cfi_df['name'], rank_df, INSTITUTE_STATES))
+    cfi_df['location'] = [location_label(None, state) for state in cfi_df['state']]
+    # Sort by Rank then Name
+    cfi_df = cfi_df.sort_values(['nirf_rank', 'name'])
+    cfi_df['cfi_id'] = range(1, len(cfi_df) + 1)
+    
+    return cfi_df, dict(zip(cfi_df['name'], cfi_df['cfi_id']))
+
+
+FAMILY = FamilyConfig(
+    key="cfi",
+    label="CFI",
+    data_dir=CFI_DATA_DIR,
+    round_glob="josaa_round*_cfi_results.csv",
+    id_column="cfi_id",
+    normalize_name=normalize_name,
+    extract_branch=extract_branch,
+    derive_category=derive_cat,
+    create_institute_table=create_cfi_table,
+    uses_rank_data=True,
+    institute_csv="cfi.csv",
+    branch_csv="cfi_branch.csv",
+    cutoff_csv="cfi_cutoff.csv",
+    institute_aliases=INSTITUTE_ALIASES,
+)
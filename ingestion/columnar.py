@@ -0,0 +1,320 @@
+"""
+Columnar binary output: one aligned .npy bundle per family.
+
+    normalized_data/columnar/<family>/
+        meta.json                  schema version, row counts, projected year, sha256 of the
+                                   CSVs it mirrors
+        strings.json               string columns of the dimension tables (row order, institute
+                                   state '' when unknown) and
+                                   the dictionaries of the coded cutoff columns
+        institutes.<column>.npy    id, nirf_rank (-1 = unranked)
+        branches.branch_id.npy
+        cutoffs.<column>.npy       cutoff_id, institute_id, branch_id, year, round,
+                                   opening_rank (-1 = missing), closing_rank, pwd (bool),
+                                   category, gender, quota (dictionary codes)
+        projected.<column>.npy     the same columns for the projected year (see projections.py)
+
+Every .npy is a plain little-endian array, so readers can np.load it with
+mmap_mode="r" instead of parsing the CSVs.
+
+The backend serves one table per exam, so every run also merges the
+family bundles into exam bundles holding the rows exactly as the table
+keeps them:
+
+    normalized_data/columnar/exams/<exam>/
+        meta.json                  schema version, row count, projected years, sha256 of the CSVs
+        strings.json               institute dimension, branch names and the shared dictionaries
+        <column>.npy               institute, branch (positions in those dimensions), year, round,
+                                   opening_rank, closing_rank, pwd, category, gender, quota,
+                                   institute_type (shared dictionary codes)
+
+Exam rows are sorted by closing rank (stable, in family and table
+order), so the backend memory-maps the columns as they are.
+"""
+
+import json
+import shutil
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .common import FamilyConfig
+from .manifest import file_sha256
+from .projections import projected_csv
+
+COLUMNAR_DIR = "columnar"
+COLUMNAR_SCHEMA_VERSION = 5
+
+CUTOFF_DTYPES = {
+    'cutoff_id': np.int32,
+    'institute_id': np.int32,
+    'branch_id': np.int32,
+    'year': np.int16,
+    'round': np.int16,
+    'opening_rank': np.int32,
+    'closing_rank': np.int32,
+    'pwd': np.bool_,
+}
+# Stored value of a missing opening rank
+MISSING_RANK = -1
+CODED_COLUMNS = ('category', 'gender', 'quota')
+TABLES = ('cutoffs', 'projected')
+
+EXAMS_DIR = "exams"
+EXAM_SCHEMA_VERSION = 1
+# Families of each exam table with their institute type, in table order (see the backend's cutoff_index.py)
+EXAMS = {
+    'advanced': (('IIT', 'iit'),),
+    'mains': (('NIT', 'nit'), ('IIIT', 'iiit'), ('GFTI', 'cfi')),
+}
+EXAM_DTYPES = {
+    'institute': np.int32,
+    'branch': np.int32,
+    'year': np.int16,
+    'round': np.int16,
+    'opening_rank': np.int32,
+    'closing_rank': np.int32,
+    'category': np.int16,
+    'gender': np.int16,
+    'pwd': np.bool_,
+    'quota': np.int16,
+    'institute_type': np.int16,
+}
+
+
+def bundle_dir(output_dir: str, config: FamilyConfig) -> Path:
+    return Path(output_dir) / COLUMNAR_DIR / config.key
+
+
+class BundleWriter:
+    """
+    Writes a family's bundle incrementally: cutoff and projected rows are
+    appended in chunks as they are produced (spilled to raw column files, so memory stays
+    bounded by the chunk size) and the dimension tables are written by
+    close(), once the CSVs are final.
+    """
+
+    def __init__(self, config: FamilyConfig, output_dir: str):
+        self.config = config
+        self.output_dir = output_dir
+        self.target = bundle_dir(output_dir, config)
+        self.staging = self.target.with_name(self.target.name + ".tmp")
+        shutil.rmtree(self.staging, ignore_errors=True)
+        self.staging.mkdir(parents=True)
+        self.rows = {table: 0 for table in TABLES}
+        # Dictionaries in first-seen order, matching how the backend encodes the CSVs
+        self.dictionaries: Dict[str, Dict[str, int]] = {column: {} for column in CODED_COLUMNS}
+        self._dtypes = dict(CUTOFF_DTYPES, **{column: np.int16 for column in CODED_COLUMNS})
+        self._spills = {
+            (table, column): open(self._spill_path(table, column), 'wb') for table in TABLES for column in self._dtypes
+        }
+
+    def _spill_path(self, table: str, column: str) -> Path:
+        return self.staging / f"{table}.{column}.bin"
+
+    def append_cutoffs(self, cutoffs: pd.DataFrame) -> None:
+        self._append('cutoffs', cutoffs)
+
+    def append_projected(self, projected: pd.DataFrame) -> None:
+        self._append('projected', projected)
+
+    def _append(self, table: str, rows: pd.DataFrame) -> None:
+        source = rows.rename(columns={self.config.id_column: 'institute_id'})
+        columns = {
+            column: source[column].fillna(MISSING_RANK).to_numpy(dtype) if column == 'opening_rank'
+            else source[column].to_numpy(dtype)
+            for column, dtype in CUTOFF_DTYPES.items()
+        }
+        for column in CODED_COLUMNS:
+            if column in source:
+                values = source[column].astype(object).fillna('').astype(str)
+            else:
+                values = pd.Series('', index=source.index)  # e.g. IIT cutoffs carry no quota
+            dictionary = self.dictionaries[column]
+            for value in values.unique():
+                dictionary.setdefault(value, len(dictionary))
+            columns[column] = values.map(dictionary).to_numpy(np.int16)
+        for column, values in columns.items():
+            self._spills[table, column].write(np.ascontiguousarray(values).tobytes())
+        self.rows[table] += len(source)
+
+    def close(self, institutes: pd.DataFrame, branches: pd.DataFrame, projected_year: Optional[int] = None) -> Path:
+        """Finish the bundle next to the (already written) CSVs and swap it in, replacing any previous one."""
+        config, staging = self.config, self.staging
+        for (table, column), spill_file in self._spills.items():
+            spill_file.close()
+            spill = self._spill_path(table, column)
+            with open(staging / f"{table}.{column}.npy", 'wb') as out, open(spill, 'rb') as data:
+                header = {'descr': np.lib.format.dtype_to_descr(np.dtype(self._dtypes[column])),
+                          'fortran_order': False, 'shape': (self.rows[table],)}
+                np.lib.format.write_array_header_1_0(out, header)
+                shutil.copyfileobj(data, out)
+            spill.unlink()
+
+        arrays: Dict[str, np.ndarray] = {
+            'institutes.id': institutes[config.id_column].to_numpy(np.int32),
+            'institutes.nirf_rank': institutes['nirf_rank'].fillna(-1).to_numpy(np.int32),
+            'branches.branch_id': branches['branch_id'].to_numpy(np.int32),
+        }
+        for name, values in arrays.items():
+            np.save(staging / f"{name}.npy", np.ascontiguousarray(values))
+
+        strings = {
+            'institutes': {
+                'name': institutes['name'].astype(str).tolist(),
+                'location': institutes['location'].fillna('').astype(str).tolist(),
+                'state': institutes['state'].fillna('').astype(str).tolist(),
+            },
+            'branches': {
+                column: branches[column].fillna('').astype(str).tolist()
+                for column in ('branch_name', 'short_name', 'degree_type')
+            },
+            'dictionaries': {column: list(values) for column, values in self.dictionaries.items()},
+        }
+        (staging / "strings.json").write_text(json.dumps(strings, ensure_ascii=False), encoding='utf-8')
+
+        sources = (config.institute_csv, config.branch_csv, config.cutoff_csv, projected_csv(config))
+        meta = {
+            'schema_version': COLUMNAR_SCHEMA_VERSION,
+            'family': config.key,
+            'rows': {'institutes': len(institutes), 'branches': len(branches), **self.rows},
+            'projected_year': projected_year,
+            'sources': {name: file_sha256(Path(self.output_dir) / name) for name in sources},
+        }
+        (staging / "meta.json").write_text(json.dumps(meta, indent=2) + "\n", encoding='utf-8')
+
+        return _swap_in(staging, self.target)
+
+
+def _swap_in(staging: Path, target: Path) -> Path:
+    """Replace `target` with the finished `staging` directory so readers never see a half-written bundle."""
+    previous = target.with_name(target.name + ".old")
+    shutil.rmtree(previous, ignore_errors=True)
+    if target.exists():
+        target.rename(previous)
+    staging.rename(target)
+    shutil.rmtree(previous, ignore_errors=True)
+    return target
+
+
+def write_bundle(config: FamilyConfig, output_dir: str, institutes: pd.DataFrame, branches: pd.DataFrame,
+                 cutoffs: pd.DataFrame, projected: pd.DataFrame) -> Path:
+    """Write the family's bundle next to its (already written) CSVs, replacing any previous one."""
+    writer = BundleWriter(config, output_dir)
+    writer.append_cutoffs(cutoffs)
+    writer.append_projected(projected)
+    projected_year = int(projected['year'].iloc[0]) if len(projected) else None
+    return writer.close(institutes, branches, projected_year)
+
+
+def _shared_codes(values: List[str], vocab: List[str]) -> np.ndarray:
+    """Codes of `values` in the shared `vocab`, extending it in first-seen order."""
+    lookup = {value: code for code, value in enumerate(vocab)}
+    for value in values:
+        if value not in lookup:
+            lookup[value] = len(vocab)
+            vocab.append(value)
+    return np.array([lookup[value] for value in values], dtype=np.int16)
+
+
+def _id_lookup(ids: np.ndarray, positions: np.ndarray) -> np.ndarray:
+    """Array mapping id -> position (-1 for unknown ids)."""
+    lookup = np.full(int(ids.max()) + 1 if len(ids) else 0, -1, dtype=np.int32)
+    lookup[ids] = positions
+    return lookup
+
+
+def _remap(lookup: np.ndarray, ids: np.ndarray, context: str) -> np.ndarray:
+    if len(ids) and (int(ids.min()) < 0 or int(ids.max()) >= len(lookup)):
+        raise ValueError(f"{context}: id out of range")
+    positions = lookup[ids]
+    if len(positions) and int(positions.min()) < 0:
+        raise ValueError(f"{context}: unknown id")
+    return positions
+
+
+def write_exam_bundle(output_dir: str, exam: str) -> Optional[Path]:
+    """
+    Merge the family bundles of `exam` into its exam bundle, replacing any
+    previous one. Returns None (and removes a stale exam bundle) when a
+    family bundle is missing.
+    """
+    root = Path(output_dir) / COLUMNAR_DIR
+    target = root / EXAMS_DIR / exam
+    if not all((root / family / "meta.json").exists() for _, family in EXAMS[exam]):
+        shutil.rmtree(target, ignore_errors=True)
+        return None
+
+    institutes = {'name': [], 'location': [], 'state': [], 'nirf_rank': [], 'institute_type': []}
+    branch_names: List[str] = []
+    branch_lookup: Dict[str, int] = {}
+    vocab: Dict[str, List[str]] = {column: [] for column in CODED_COLUMNS + ('institute_type',)}
+    parts: Dict[str, list] = {column: [] for column in EXAM_DTYPES}
+    sources: Dict[str, str] = {}
+    projected_years = set()
+
+    for institute_type, family in EXAMS[exam]:
+        bundle = root / family
+        meta = json.loads((bundle / "meta.json").read_text(encoding='utf-8'))
+        strings = json.loads((bundle / "strings.json").read_text(encoding='utf-8'))
+        sources.update(meta['sources'])
+
+        def column(name: str) -> np.ndarray:
+            return np.load(bundle / f"{name}.npy", mmap_mode='r')
+
+        # Institute ids -> positions in the combined institute dimension
+        ids = column('institutes.id')
+        offset = len(institutes['name'])
+        for name in ('name', 'location', 'state'):
+            institutes[name].extend(strings['institutes'][name])
+        institutes['nirf_rank'].extend(column('institutes.nirf_rank').tolist())
+        institutes['institute_type'].extend([institute_type] * len(ids))
+        institute_index = _id_lookup(ids, offset + np.arange(len(ids), dtype=np.int32))
+
+        # Branches are shared by name across families
+        positions = []
+        for name in strings['branches']['branch_name']:
+            if name not in branch_lookup:
+                branch_lookup[name] = len(branch_names)
+                branch_names.append(name)
+            positions.append(branch_lookup[name])
+        branch_index = _id_lookup(column('branches.branch_id'), np.array(positions, dtype=np.int32))
+
+        for table in TABLES:
+            closing_rank = column(f'{table}.closing_rank')
+            parts['institute'].append(_remap(institute_index, column(f'{table}.institute_id'), f"{family} {table} institute"))
+            parts['branch'].append(_remap(branch_index, column(f'{table}.branch_id'), f"{family} {table} branch"))
+            for name in ('year', 'round', 'opening_rank', 'pwd'):
+                parts[name].append(column(f'{table}.{name}'))
+            parts['closing_rank'].append(closing_rank)
+            for coded in CODED_COLUMNS:
+                # Family dictionary codes -> shared codes
+                parts[coded].append(_shared_codes(strings['dictionaries'][coded], vocab[coded])[column(f'{table}.{coded}')])
+            parts['institute_type'].append(
+                np.repeat(_shared_codes([institute_type], vocab['institute_type']), len(closing_rank))
+            )
+        if meta.get('projected_year') is not None:
+            projected_years.add(meta['projected_year'])
+
+    columns = {name: np.concatenate(chunks).astype(EXAM_DTYPES[name], copy=False) for name, chunks in parts.items()}
+    order = np.argsort(columns['closing_rank'], kind='stable')
+
+    staging = target.with_name(target.name + ".tmp")
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir(parents=True)
+    for name, values in columns.items():
+        np.save(staging / f"{name}.npy", np.ascontiguousarray(values[order]))
+    (staging / "strings.json").write_text(json.dumps(
+        {'institutes': institutes, 'branch_names': branch_names, 'vocab': vocab}, ensure_ascii=False
+    ), encoding='utf-8')
+    meta = {
+        'schema_version': EXAM_SCHEMA_VERSION,
+        'exam': exam,
+        'rows': len(order),
+        'projected_years': sorted(projected_years),
+        'sources': dict(sorted(sources.items())),
+    }
+    (staging / "meta.json").write_text(json.dumps(meta, indent=2) + "\n", encoding='utf-8')
+    return _swap_in(staging, target)
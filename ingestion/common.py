@@ -0,0 +1,234 @@
+"""
+Shared transformation steps for all institute families.
+
+Every family goes through the same stages; the family-specific parts
+(name normalization, branch extraction, category derivation, institute
+table) come from its FamilyConfig.
+"""
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Counseling year of round files placed directly in a family's data_dir;
+# files of other years live in data_dir/<year>/ under the same names
+YEAR = 2024
+
+# Output columns that may be missing (pandas' nullable integer type)
+NULLABLE_COLUMNS = {'opening_rank': 'Int64'}
+
+# Seat pools of the Gender column. Female candidates compete for both pools,
+# everyone else only for gender-neutral seats.
+GENDER_NEUTRAL = 'Gender-Neutral'
+FEMALE_ONLY = 'Female-only'
+
+
+@dataclass
+class FamilyConfig:
+    """Per-family settings for the ingestion engine."""
+    key: str                      # "iit", "nit", ...
+    label: str                    # "IIT", "NIT", ...
+    data_dir: str
+    round_glob: str               # e.g. "josaa_round*_iit_results.csv"; the number after "round" is the round
+                                  # (matched in data_dir for YEAR and in data_dir/<year>/ for other years)
+    id_column: str                # institute id column, e.g. "iit_id"
+    normalize_name: Callable[[str], Optional[str]]
+    extract_branch: Callable[[str], Tuple[Optional[str], Optional[str], Optional[str]]]
+    derive_category: Callable[[str, str, str], str]
+    # (normalized institute names, rank_df or None) -> (institute table, name -> id)
+    create_institute_table: Callable[[Iterable[str], Optional[pd.DataFrame]], Tuple[pd.DataFrame, Dict[str, int]]]
+    institute_csv: str
+    branch_csv: str
+    cutoff_csv: str
+    branch_columns: List[str] = field(default_factory=lambda: ['branch_name', 'short_name', 'degree_type', 'branch_id'])
+    cutoff_columns: Optional[List[str]] = None  # Default: id, branch_id, year, category, gender, pwd, opening_rank,
+                                                # closing_rank, round, quota, cutoff_id
+    include_quota: bool = True
+    uses_rank_data: bool = False
+    round_files: Dict[int, str] = field(default_factory=dict)  # Files not matching round_glob, by round
+    # Entity dictionary (see entities.py): alias -> canonical institute name, branch name -> abbreviation
+    institute_aliases: Dict[str, str] = field(default_factory=dict)
+    branch_abbreviations: Dict[str, str] = field(default_factory=dict)
+
+    def round_paths(self) -> List[Tuple[int, int, Path]]:
+        """(year, round number, path) of every round file present, in year and round order."""
+        paths = {}
+        directories = [(YEAR, Path(self.data_dir))] + [
+            (int(directory.name), directory) for directory in Path(self.data_dir).glob('[12][0-9][0-9][0-9]')
+            if directory.is_dir()
+        ]
+        for year, directory in directories:
+            for path in directory.glob(self.round_glob):
+                match = re.search(r'round(\d+)', path.name)
+                if match:
+                    paths[year, int(match.group(1))] = path
+            for round_number, name in self.round_files.items():
+                if (directory / name).exists():
+                    paths[year, round_number] = directory / name
+        return [(year, round_number, path) for (year, round_number), path in sorted(paths.items())]
+
+    def output_columns(self) -> List[str]:
+        if self.cutoff_columns:
+            return self.cutoff_columns
+        columns = [self.id_column, 'branch_id', 'year', 'category', 'gender', 'pwd', 'opening_rank', 'closing_rank', 'round']
+        return columns + (['quota'] if self.include_quota else []) + ['cutoff_id']
+
+
+def parse_ranks(ranks: pd.Series) -> pd.Series:
+    """
+    Opening or closing ranks as floats; NaN for missing values, unparseable
+    values and PwD preparatory ranks like "50P" (skipped for now).
+    """
+    values = ranks.astype(str).str.strip()
+    values = values.mask(values.str.upper().str.endswith('P'))
+    numeric = pd.to_numeric(values, errors='coerce')
+    return numeric.where(np.isfinite(numeric))
+
+
+def derive_gender(gender: str) -> str:
+    """Seat pool of a Gender value ("Female-only (including Supernumerary)" or "Gender-Neutral")."""
+    return FEMALE_ONLY if 'FEMALE' in str(gender).upper() else GENDER_NEUTRAL
+
+
+def is_pwd_seat(seat_type: str) -> bool:
+    """Whether a Seat Type is reserved for PwD candidates, e.g. "OBC-NCL (PwD)"."""
+    return 'PWD' in str(seat_type).upper()
+
+
+def parse_round(config: FamilyConfig, raw: pd.DataFrame, round_number: int, year: int = YEAR) -> pd.DataFrame:
+    """
+    Per-round-file stage: normalize names, derive categories and seat pools
+    and parse ranks. Lookups run once per distinct value and are merged back.
+    """
+    institutes = pd.DataFrame({'Institute': raw['Institute'].dropna().unique()})
+    institutes['institute'] = institutes['Institute'].map(config.normalize_name)
+    parsed = raw.merge(institutes, on='Institute', how='left')
+
+    seat_keys = ['Seat Type', 'Quota', 'Gender']
+    seats = parsed[seat_keys].drop_duplicates()
+    seats['category'] = [config.derive_category(*values) for values in seats.itertuples(index=False)]
+    seats['gender_pool'] = seats['Gender'].map(derive_gender)
+    seats['pwd'] = seats['Seat Type'].map(is_pwd_seat)
+    parsed = parsed.merge(seats, on=seat_keys, how='left')
+
+    return pd.DataFrame({
+        'institute': parsed['institute'],
+        'program': parsed['Academic Program'],
+        'seat_type': parsed['Seat Type'],
+        'quota': parsed['Quota'],
+        'gender': parsed['gender_pool'],
+        'pwd': parsed['pwd'],
+        'category': parsed['category'],
+        'opening_rank': parse_ranks(parsed['Opening Rank']),
+        'closing_rank': parse_ranks(parsed['Closing Rank']),
+        'year': year,
+        'round': round_number,
+    })
+
+
+def create_branch_table(config: FamilyConfig, programs: Iterable[str]) -> Tuple[pd.DataFrame, Dict[str, int]]:
+    """Branch master table from all distinct academic programs, plus program -> branch_id."""
+    programs = set(programs)
+    branches_data = []
+    for program in sorted(programs):
+        branch_name, short_name, degree_type = config.extract_branch(program)
+        if branch_name:
+            branches_data.append({
+                'branch_name': branch_name,
+                'short_name': short_name,
+                'degree_type': degree_type
+            })
+
+    branches_df = pd.DataFrame(branches_data)
+    branches_df = branches_df.drop_duplicates(subset=['branch_name'], keep='first').reset_index(drop=True)
+    branches_df['branch_id'] = range(1, len(branches_df) + 1)
+
+    # Map each branch name and every program containing it to the branch
+    branch_mapping = {}
+    for branch_name, branch_id in zip(branches_df['branch_name'], branches_df['branch_id']):
+        branch_mapping[branch_name] = branch_id
+        for program in programs:
+            if branch_name in program:
+                branch_mapping[program] = branch_id
+
+    return branches_df[config.branch_columns], branch_mapping
+
+
+def extend_institute_table(config: FamilyConfig, institutes: pd.DataFrame, names: Iterable[str],
+                           rank_df: Optional[pd.DataFrame] = None) -> Tuple[pd.DataFrame, Dict[str, int]]:
+    """Append institutes not yet in the table (new ids after the current maximum); existing ids are kept."""
+    known = set(institutes['name'])
+    new_names = set(names) - known
+    if new_names:
+        rebuilt, _ = config.create_institute_table(known | new_names, rank_df)
+        additions = rebuilt[rebuilt['name'].isin(new_names)].copy()
+        next_id = int(institutes[config.id_column].max()) + 1 if len(institutes) else 1
+        additions[config.id_column] = range(next_id, next_id + len(additions))
+        institutes = pd.concat([institutes, additions[institutes.columns]], ignore_index=True)
+    return institutes, dict(zip(institutes['name'], institutes[config.id_column]))
+
+
+def extend_branch_table(config: FamilyConfig, branches: pd.DataFrame,
+                        programs: Iterable[str]) -> Tuple[pd.DataFrame, Dict[str, int]]:
+    """Append branches of unseen programs; existing ids are kept."""
+    known = set(branches['branch_name'])
+    additions = []
+    for program in sorted(set(programs)):
+        branch_name, short_name, degree_type = config.extract_branch(program)
+        if branch_name and branch_name not in known:
+            additions.append({'branch_name': branch_name, 'short_name': short_name, 'degree_type': degree_type})
+            known.add(branch_name)
+    if additions:
+        additions = pd.DataFrame(additions)
+        next_id = int(branches['branch_id'].max()) + 1 if len(branches) else 1
+        additions['branch_id'] = range(next_id, next_id + len(additions))
+        branches = pd.concat([branches, additions[branches.columns]], ignore_index=True)
+
+    # Branch names in id order: find_branch_id then picks the lowest-id branch
+    # contained in a program, as with the mapping from create_branch_table
+    ordered = branches.sort_values('branch_id')
+    return branches, dict(zip(ordered['branch_name'], ordered['branch_id']))
+
+
+def find_branch_id(program: str, branch_mapping: Dict[str, int]) -> Optional[int]:
+    """First branch_mapping key contained in the program name (mapping order)."""
+    for key in branch_mapping:
+        if key in str(program):
+            return branch_mapping[key]
+    return None
+
+
+def create_cutoff_table(config: FamilyConfig, parsed: pd.DataFrame, institute_mapping: Dict[str, int],
+                        branch_mapping: Dict[str, int]) -> pd.DataFrame:
+    """Cutoff fact table from the parsed rounds (in year and round order)."""
+    institutes = pd.DataFrame({'institute': parsed['institute'].dropna().unique()})
+    institutes[config.id_column] = institutes['institute'].map(institute_mapping)
+    parsed = parsed.merge(institutes.dropna(), on='institute', how='left')
+
+    programs = pd.DataFrame({'program': parsed['program'].dropna().unique()})
+    programs['branch_id'] = programs['program'].map(lambda program: find_branch_id(program, branch_mapping))
+    parsed = parsed.merge(programs.dropna(subset=['branch_id']), on='program', how='left')
+
+    parsed = parsed.dropna(subset=[config.id_column, 'branch_id', 'closing_rank'])
+
+    cutoff_df = pd.DataFrame({
+        config.id_column: parsed[config.id_column].astype('int64'),
+        'branch_id': parsed['branch_id'].astype('int64'),
+        'year': parsed['year'].astype('int64'),
+        'category': parsed['category'].astype('category'),
+        # Seat pools within the category: gender-neutral / female-only and PwD-reserved seats
+        'gender': parsed['gender'].astype('category'),
+        'pwd': parsed['pwd'].astype(bool),
+        # A row's opening rank can be a preparatory rank while its closing rank is not: kept as missing
+        'opening_rank': parsed['opening_rank'].astype('Int64'),
+        'closing_rank': parsed['closing_rank'].astype('int64'),
+        'round': parsed['round'].astype('int64'),
+        'quota': parsed['quota'].astype('category'),
+    }).reset_index(drop=True)
+    cutoff_df['cutoff_id'] = range(1, len(cutoff_df) + 1)
+
+    return cutoff_df[config.output_columns()]
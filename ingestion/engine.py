@@ -0,0 +1,309 @@
+"""
+Parallel ingestion engine for the JoSAA cutoff families.
+
+Stage 1 parses every round file of every selected family in a process pool
+(read, name normalization, category derivation, rank parsing). Stage 2
+builds each family's institute, branch and cutoff tables - one task per
+family - and writes them to normalized_data/ as CSV and a columnar
+.npy bundle (see columnar.py). Results are always merged in
+the declared family/round order, never in completion order, so the output
+is identical for any number of workers.
+
+Runs are incremental: a content-hash manifest (see manifest.py) records
+each input file, and only new or changed round files are parsed. Their
+rows replace the file's previous rows with new cutoff_ids after the
+current maximum; institutes and branches seen for the first time are
+appended, so existing ids never move. `full=True` (or a missing manifest,
+missing outputs or a schema version bump) rebuilds a family from scratch.
+
+Every write also projects each family's cutoffs one year past its latest
+year (see projections.py). Every run merges the family bundles into one
+bundle per exam, sorted by closing rank, which the backend memory-maps. After any change the entity dictionary (see
+entities.py) is recompiled from all families' institute and branch tables.
+Every run then rebuilds the institute facts (placements and fees, see
+institute_facts.py) against it.
+
+`stream=True` rebuilds each family that needs work chunk by chunk in
+bounded memory instead (see streaming.py), one task per family.
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from . import cfi, iiit, iit, nit
+from .common import (
+    NULLABLE_COLUMNS, FamilyConfig, create_branch_table, create_cutoff_table, extend_branch_table, extend_institute_table, parse_round,
+)
+from .columnar import EXAMS, bundle_dir, write_bundle, write_exam_bundle
+from .entities import ENTITIES_FILE, write_entities
+from .institute_facts import write_facts
+from .manifest import changed_inputs, family_entry, id_range, input_entry, load_manifest, save_manifest
+from .projections import project_table, projected_csv, write_projected
+from .streaming import CHUNK_ROWS, format_peaks, stream_family
+
+RANK_DATA_PATH = "row_Data/rank_data.csv"
+OUTPUT_DIR = "normalized_data"
+
+FAMILIES: Dict[str, FamilyConfig] = {
+    family.key: family for family in (iit.FAMILY, nit.FAMILY, iiit.FAMILY, cfi.FAMILY)
+}
+
+
+def parse_file(key: str, year: int, round_number: int, path: str) -> pd.DataFrame:
+    """Stage 1 task: one round file of one family."""
+    return parse_round(FAMILIES[key], pd.read_csv(path), round_number, year)
+
+
+def build_family(config: FamilyConfig, parsed_rounds: List[pd.DataFrame],
+                 rank_df: Optional[pd.DataFrame] = None) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """(institutes, branches, cutoffs) for a family from its parsed rounds in year and round order."""
+    parsed = pd.concat(parsed_rounds, ignore_index=True)
+    institutes, institute_mapping = config.create_institute_table(parsed['institute'].dropna().unique(), rank_df)
+    branches, branch_mapping = create_branch_table(config, parsed['program'].dropna().unique())
+    cutoffs = create_cutoff_table(config, parsed, institute_mapping, branch_mapping)
+    return institutes, branches, cutoffs
+
+
+def write_family(config: FamilyConfig, output_dir: str, institutes: pd.DataFrame, branches: pd.DataFrame,
+                 cutoffs: pd.DataFrame) -> None:
+    institutes.to_csv(Path(output_dir) / config.institute_csv, index=False)
+    branches.to_csv(Path(output_dir) / config.branch_csv, index=False)
+    cutoffs.to_csv(Path(output_dir) / config.cutoff_csv, index=False)
+    projected = project_table(config, cutoffs)
+    write_projected(config, output_dir, projected)
+    write_bundle(config, output_dir, institutes, branches, cutoffs, projected)
+
+
+def read_output(output_dir: str, file_name: str) -> pd.DataFrame:
+    # Only empty cells are missing; names like "NA" stay strings
+    return pd.read_csv(Path(output_dir) / file_name, keep_default_na=False, na_values=[''], dtype=NULLABLE_COLUMNS)
+
+
+def outputs_exist(config: FamilyConfig, output_dir: str) -> bool:
+    names = (config.institute_csv, config.branch_csv, config.cutoff_csv, projected_csv(config))
+    paths = [Path(output_dir) / name for name in names]
+    paths.append(bundle_dir(output_dir, config) / "meta.json")
+    return all(path.exists() for path in paths)
+
+
+def build_and_write(key: str, inputs: List[dict], parsed_rounds: List[pd.DataFrame],
+                    output_dir: str) -> Tuple[Dict[str, int], dict]:
+    """Stage 2 task (full rebuild): build and write one family; returns row counts and its manifest entry."""
+    config = FAMILIES[key]
+    rank_df = pd.read_csv(RANK_DATA_PATH) if config.uses_rank_data else None
+    institutes, branches, cutoffs = build_family(config, parsed_rounds, rank_df)
+    write_family(config, output_dir, institutes, branches, cutoffs)
+
+    ranges = {
+        entry['file']: id_range(
+            cutoffs.loc[(cutoffs['year'] == entry['year']) & (cutoffs['round'] == entry['round']), 'cutoff_id']
+        )
+        for entry in inputs
+    }
+    counts = {'institutes': len(institutes), 'branches': len(branches), 'cutoffs': len(cutoffs)}
+    return counts, family_entry(inputs, ranges, len(cutoffs) + 1)
+
+
+def update_and_write(key: str, inputs: List[dict], changed: List[dict], parsed_rounds: List[pd.DataFrame],
+                     previous: dict, output_dir: str) -> Tuple[Dict[str, int], dict]:
+    """
+    Stage 2 task (incremental): splice the rows of changed inputs into the
+    existing outputs. Rows of unchanged inputs keep their cutoff_ids; rows of
+    changed or removed inputs are dropped, and changed inputs get new ids
+    from the manifest's next_cutoff_id.
+    """
+    config = FAMILIES[key]
+    institutes = read_output(output_dir, config.institute_csv)
+    branches = read_output(output_dir, config.branch_csv)
+    cutoffs = read_output(output_dir, config.cutoff_csv)
+
+    current = {entry['file'] for entry in inputs}
+    replaced = {entry['file'] for entry in changed}
+    keep = pd.Series(False, index=cutoffs.index)
+    ranges = {}
+    for entry in previous['inputs']:
+        if entry['file'] in current and entry['file'] not in replaced and entry['cutoff_ids']:
+            first, last = entry['cutoff_ids']
+            keep |= cutoffs['cutoff_id'].between(first, last)
+            ranges[entry['file']] = entry['cutoff_ids']
+    cutoffs = cutoffs[keep]
+
+    next_cutoff_id = previous['next_cutoff_id']
+    added = []
+    if parsed_rounds:
+        parsed = pd.concat(parsed_rounds, ignore_index=True)
+        rank_df = pd.read_csv(RANK_DATA_PATH) if config.uses_rank_data else None
+        institutes, institute_mapping = extend_institute_table(
+            config, institutes, parsed['institute'].dropna().unique(), rank_df
+        )
+        branches, branch_mapping = extend_branch_table(config, branches, parsed['program'].dropna().unique())
+        for entry, frame in zip(changed, parsed_rounds):
+            table = create_cutoff_table(config, frame, institute_mapping, branch_mapping)
+            table['cutoff_id'] = range(next_cutoff_id, next_cutoff_id + len(table))
+            ranges[entry['file']] = id_range(table['cutoff_id'])
+            next_cutoff_id += len(table)
+            added.append(table)
+    cutoffs = pd.concat([cutoffs] + added, ignore_index=True)
+
+    write_family(config, output_dir, institutes, branches, cutoffs)
+    counts = {'institutes': len(institutes), 'branches': len(branches), 'cutoffs': len(cutoffs)}
+    return counts, family_entry(inputs, ranges, next_cutoff_id)
+
+
+def write_task(key: str, inputs: List[dict], to_parse: List[dict], parsed_rounds: List[pd.DataFrame],
+               previous: Optional[dict], output_dir: str) -> Tuple[Dict[str, int], dict]:
+    if previous is None:
+        return build_and_write(key, inputs, parsed_rounds, output_dir)
+    return update_and_write(key, inputs, to_parse, parsed_rounds, previous, output_dir)
+
+
+def stream_task(key: str, inputs: List[dict], output_dir: str,
+                chunk_rows: int) -> Tuple[Dict[str, int], dict, Dict[str, int]]:
+    """Streaming task: rebuild one family chunk by chunk; also returns its per-stage peak memory."""
+    config = FAMILIES[key]
+    rank_df = pd.read_csv(RANK_DATA_PATH) if config.uses_rank_data else None
+    return stream_family(config, inputs, output_dir, rank_df, chunk_rows)
+
+
+def _map(pool: Optional[ProcessPoolExecutor], fn, *iterables) -> list:
+    """Ordered map over the pool, or in-process when running serially."""
+    return list(pool.map(fn, *iterables) if pool else map(fn, *iterables))
+
+
+def plan(keys: List[str], manifest: Dict[str, dict], output_dir: str,
+         full: bool = False) -> Dict[str, Tuple[List[dict], List[dict], Optional[dict]]]:
+    """
+    key -> (inputs, inputs to parse, previous manifest entry or None for a
+    full rebuild), for every family with work to do.
+    """
+    plans = {}
+    for key in keys:
+        config = FAMILIES[key]
+        inputs = [input_entry(path, year, round_number) for year, round_number, path in config.round_paths()]
+        if not inputs:
+            print(f"  No {config.label} round files found, skipping")
+            continue
+        previous = None if full else manifest.get(key)
+        if previous is None or not outputs_exist(config, output_dir):
+            plans[key] = (inputs, inputs, None)
+            continue
+        to_parse = changed_inputs(inputs, previous)
+        removed = {entry['file'] for entry in previous['inputs']} - {entry['file'] for entry in inputs}
+        if to_parse or removed:
+            plans[key] = (inputs, to_parse, previous)
+        else:
+            print(f"  {config.label}: up to date")
+    return plans
+
+
+def run(families: Optional[Iterable[str]] = None, workers: Optional[int] = None,
+        output_dir: str = OUTPUT_DIR, full: bool = False, stream: bool = False,
+        chunk_rows: int = CHUNK_ROWS) -> Dict[str, Dict[str, int]]:
+    """
+    Bring the normalized tables of the given families (default: all) up to
+    date with row_Data/; `full` rebuilds them from scratch. `stream`
+    rebuilds the families that need work in chunks of `chunk_rows` raw rows
+    and reports the peak memory of each stage.
+
+    workers=1 runs everything in-process; otherwise a pool of `workers`
+    processes (default: CPU count) is used for both stages.
+    """
+    keys = list(families or FAMILIES)
+    unknown = [key for key in keys if key not in FAMILIES]
+    if unknown:
+        raise ValueError(f"Unknown families: {', '.join(unknown)} (expected: {', '.join(FAMILIES)})")
+    Path(output_dir).mkdir(exist_ok=True)
+
+    start = time.perf_counter()
+    manifest = load_manifest(output_dir)
+    plans = plan(keys, manifest, output_dir, full)
+    if stream:
+        return _run_streaming(plans, manifest, workers, output_dir, chunk_rows, start)
+    tasks = [
+        (key, entry['year'], entry['round'], entry['file'])
+        for key, (_, to_parse, _) in plans.items() for entry in to_parse
+    ]
+
+    workers = workers or os.cpu_count() or 1
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 and plans else None
+    try:
+        parsed = _map(pool, parse_file, *zip(*tasks)) if tasks else []
+        print(f"Parsed {len(tasks)} round files in {time.perf_counter() - start:.2f}s ({workers} workers)")
+
+        rounds_by_family = {key: [] for key in plans}
+        for (key, _, _, _), frame in zip(tasks, parsed):
+            rounds_by_family[key].append(frame)
+
+        args = [
+            (key, inputs, to_parse, rounds_by_family[key], previous, output_dir)
+            for key, (inputs, to_parse, previous) in plans.items()
+        ]
+        results = _map(pool, write_task, *zip(*args)) if args else []
+    finally:
+        if pool:
+            pool.shutdown()
+
+    summary = {}
+    for (key, inputs, to_parse, _, previous, _), (counts, entry) in zip(args, results):
+        manifest[key] = entry
+        summary[key] = counts
+        mode = "rebuilt" if previous is None else f"updated {len(to_parse)}/{len(inputs)} round files"
+        print(
+            f"  {FAMILIES[key].label}: {mode}; {counts['institutes']} institutes, "
+            f"{counts['branches']} branches, {counts['cutoffs']} cutoffs"
+        )
+    _finish(summary, manifest, output_dir, start)
+    return summary
+
+
+def _run_streaming(plans: Dict[str, Tuple[List[dict], List[dict], Optional[dict]]], manifest: Dict[str, dict],
+                   workers: Optional[int], output_dir: str, chunk_rows: int, start: float) -> Dict[str, Dict[str, int]]:
+    args = [(key, inputs, output_dir, chunk_rows) for key, (inputs, _, _) in plans.items()]
+    workers = min(workers or os.cpu_count() or 1, max(len(args), 1))
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        results = _map(pool, stream_task, *zip(*args)) if args else []
+    finally:
+        if pool:
+            pool.shutdown()
+
+    summary = {}
+    for (key, _, _, _), (counts, entry, peaks) in zip(args, results):
+        manifest[key] = entry
+        summary[key] = counts
+        print(
+            f"  {FAMILIES[key].label}: streamed {counts['chunks']} chunks of <= {chunk_rows} rows; "
+            f"{counts['institutes']} institutes, {counts['branches']} branches, {counts['cutoffs']} cutoffs"
+        )
+        print(f"    peak memory: {format_peaks(peaks)}")
+    _finish(summary, manifest, output_dir, start)
+    return summary
+
+
+def _finish(summary: Dict[str, Dict[str, int]], manifest: Dict[str, dict], output_dir: str, start: float) -> None:
+    if summary:
+        save_manifest(output_dir, manifest)
+    # Exam bundles merge several families; rebuilding them is cheap, so every run does
+    for exam in EXAMS:
+        path = write_exam_bundle(output_dir, exam)
+        if path:
+            print(f"  {exam} exam bundle written to {path}")
+    # The entity dictionary spans all families, so any rebuilt family recompiles it
+    if summary or not (Path(output_dir) / ENTITIES_FILE).exists():
+        path = write_entities(FAMILIES.values(), output_dir)
+        if path:
+            print(f"  Entity dictionary written to {path}")
+    # Placement and fee sources are not in the manifest, and the table is small: rebuild it every run
+    entities_path = Path(output_dir) / ENTITIES_FILE
+    if entities_path.exists():
+        entities = json.loads(entities_path.read_text(encoding='utf-8'))
+        path, institutes, unresolved = write_facts(entities, output_dir)
+        print(f"  Institute facts for {institutes} institutes written to {path}"
+              + (f" ({len(unresolved)} rows for unknown institutes skipped)" if unresolved else ""))
+    print(f"Ingestion complete in {time.perf_counter() - start:.2f}s -> {output_dir}/")
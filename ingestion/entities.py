@@ -0,0 +1,206 @@
+"""
+Entity-resolution dictionary: every known spelling of an institute or
+branch, compiled to one interned integer id per entity.
+
+Written to normalized_data/entities.json after each ingestion run and
+loaded by the backend (app/utils/entity_resolution.py), so ingestion,
+the filter services and chat parsing resolve names the same way:
+
+    {
+      "schema_version": 1,
+      "institutes": [{"id": 1, "name": ..., "families": {"iit": 4}}, ...],
+      "branches":   [{"id": 1, "name": ..., "short_name": ..., "families": {"iit": 48, "nit": 24}}, ...],
+      "aliases": {
+        "institutes": {"names": {alias key: id}, "acronyms": {ACRONYM: id}},
+        "branches":   {"names": {alias key: id}, "acronyms": {ACRONYM: id}}
+      }
+    }
+
+Institutes are one entity per canonical name (an institute listed by two
+families is one entity); branches are one entity per branch name across
+families. Alias keys come from alias_key(). Aliases are added in order of
+trust: canonical names, then the families' explicit aliases and
+abbreviations, then generated short forms ("NIT Warangal", comma-less
+variants). A canonical name that is itself an acronym (a branch called
+"CSE") ranks after the explicit abbreviations. An earlier alias is never
+overridden; a generated alias that would name two entities is left out.
+"""
+
+import json
+import re
+import unicodedata
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from .common import FamilyConfig
+
+ENTITIES_FILE = "entities.json"
+ENTITIES_SCHEMA_VERSION = 1
+
+# Long form -> short form used in generated aliases
+SHORT_FORMS = (
+    ("Indian Institute of Information Technology", "IIIT"),
+    ("Indian Institute of Technology", "IIT"),
+    ("National Institute of Technology", "NIT"),
+)
+
+# Everyday names of branches; abbreviations come from the families
+COMMON_BRANCH_ALIASES = {
+    "Computer Science": "Computer Science and Engineering",
+    "Comp Sci": "Computer Science and Engineering",
+    "CS": "Computer Science and Engineering",
+    "Electronics": "Electronics and Communication Engineering",
+    "EEE": "Electrical and Electronics Engineering",
+    "Mechanical": "Mechanical Engineering",
+    "Mech": "Mechanical Engineering",
+    "Civil": "Civil Engineering",
+    "Electrical": "Electrical Engineering",
+    "Chemical": "Chemical Engineering",
+    "Aerospace": "Aerospace Engineering",
+    "Metallurgy": "Metallurgical and Materials Engineering",
+    "Maths and Computing": "Mathematics and Computing",
+    "MnC": "Mathematics and Computing",
+}
+
+
+def alias_key(text: str) -> str:
+    """
+    Lookup key of a name: case-folded alphanumeric words, "&" read as
+    "and". app/utils/entity_resolution.py must compute the same key.
+    """
+    text = unicodedata.normalize("NFKC", str(text)).casefold().replace("&", " and ")
+    return " ".join(re.findall(r"[^\W_]+", text))
+
+
+def acronym_key(text: str) -> Optional[str]:
+    """Key of an all-caps abbreviation such as "CSE" or "NITK", else None."""
+    text = str(text).strip()
+    return text.upper() if re.fullmatch(r"[A-Z][A-Za-z0-9]{1,7}", text) and text[1:].upper() == text[1:] else None
+
+
+def name_variants(name: str) -> List[str]:
+    """Generated spellings: without commas, and short forms like "NIT Warangal" or "IIIT Sri City"."""
+    variants = [name.replace(",", " ")]
+    for long_form, short_form in SHORT_FORMS:
+        start = name.find(long_form)
+        if start < 0:
+            continue
+        place = name[start + len(long_form):]
+        place = re.sub(rf"\(\s*{short_form}\s*\)", " ", place).strip(" ,:-")
+        if not place:
+            continue
+        variants.append(f"{short_form} {place}")
+        parts = [part.strip() for part in place.split(",") if part.strip()]
+        if len(parts) > 1:
+            variants.extend(f"{short_form} {part}" for part in parts)
+    return variants
+
+
+class _AliasTable:
+    """Alias key -> entity id, filled tier by tier (see module docstring)."""
+
+    def __init__(self):
+        self.names: Dict[str, int] = {}
+        self.acronyms: Dict[str, int] = {}
+
+    def add(self, alias: str, entity_id: int) -> None:
+        """Explicit alias: kept unless an earlier alias has the same key."""
+        acronym = acronym_key(alias)
+        if acronym:
+            self.acronyms.setdefault(acronym, entity_id)
+        else:
+            key = alias_key(alias)
+            if key:
+                self.names.setdefault(key, entity_id)
+
+    def add_generated(self, candidates: Dict[str, set]) -> None:
+        """Generated aliases (key -> entity ids): only unambiguous keys not already taken."""
+        for key, ids in candidates.items():
+            if key and len(ids) == 1:
+                self.names.setdefault(key, next(iter(ids)))
+
+    def to_dict(self) -> dict:
+        return {'names': self.names, 'acronyms': self.acronyms}
+
+
+def compile_entities(families: Iterable[FamilyConfig], tables: Dict[str, tuple]) -> dict:
+    """
+    Entity dictionary from each family's (institutes, branches) tables,
+    visiting families in the given order.
+    """
+    institutes: Dict[str, dict] = {}
+    branches: Dict[str, dict] = {}
+    families = [config for config in families if config.key in tables]
+
+    for config in families:
+        institute_df, branch_df = tables[config.key]
+        for name, institute_id in zip(institute_df['name'], institute_df[config.id_column]):
+            entity = institutes.setdefault(name, {'id': len(institutes) + 1, 'name': name, 'families': {}})
+            entity['families'][config.key] = int(institute_id)
+        for name, short_name, branch_id in zip(branch_df['branch_name'], branch_df['short_name'], branch_df['branch_id']):
+            if pd.isna(name):
+                continue
+            entity = branches.setdefault(name, {
+                'id': len(branches) + 1, 'name': name,
+                'short_name': None if pd.isna(short_name) else short_name, 'families': {},
+            })
+            entity['families'][config.key] = int(branch_id)
+
+    institute_aliases = _AliasTable()
+    for name, entity in institutes.items():
+        if not acronym_key(name):
+            institute_aliases.add(name, entity['id'])
+    for config in families:
+        for alias, name in config.institute_aliases.items():
+            if name in institutes:
+                institute_aliases.add(alias, institutes[name]['id'])
+    # Canonical names that are themselves acronyms rank below the explicit ones
+    for name, entity in institutes.items():
+        if acronym_key(name):
+            institute_aliases.add(name, entity['id'])
+    generated: Dict[str, set] = {}
+    for name, entity in institutes.items():
+        for variant in name_variants(name):
+            generated.setdefault(alias_key(variant), set()).add(entity['id'])
+    institute_aliases.add_generated(generated)
+
+    branch_aliases = _AliasTable()
+    for name, entity in branches.items():
+        if not acronym_key(name):
+            branch_aliases.add(name, entity['id'])
+    for alias, name in COMMON_BRANCH_ALIASES.items():
+        if name in branches:
+            branch_aliases.add(alias, branches[name]['id'])
+    for config in families:
+        # Family abbreviation tables map branch name -> abbreviation; the first family to use one wins
+        for name, abbreviation in config.branch_abbreviations.items():
+            if name in branches:
+                branch_aliases.add(abbreviation, branches[name]['id'])
+    for name, entity in branches.items():
+        if acronym_key(name):
+            branch_aliases.add(name, entity['id'])
+
+    return {
+        'schema_version': ENTITIES_SCHEMA_VERSION,
+        'institutes': list(institutes.values()),
+        'branches': list(branches.values()),
+        'aliases': {'institutes': institute_aliases.to_dict(), 'branches': branch_aliases.to_dict()},
+    }
+
+
+def write_entities(families: Iterable[FamilyConfig], output_dir: str) -> Optional[Path]:
+    """Compile the dictionary from the institute and branch CSVs present in output_dir."""
+    families = list(families)
+    tables = {}
+    for config in families:
+        paths = [Path(output_dir) / config.institute_csv, Path(output_dir) / config.branch_csv]
+        if all(path.exists() for path in paths):
+            tables[config.key] = tuple(pd.read_csv(path, keep_default_na=False, na_values=['']) for path in paths)
+    if not tables:
+        return None
+    entities = compile_entities(families, tables)
+    path = Path(output_dir) / ENTITIES_FILE
+    path.write_text(json.dumps(entities, ensure_ascii=False, indent=1) + "\n", encoding='utf-8')
+    return path
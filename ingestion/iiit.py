@@ -0,0 +1,160 @@
+"""
+IIIT family: JEE Main cutoffs for the Indian Institutes of Information
+Technology.
+"""
+
+import re
+from typing import Dict, Iterable, Optional, Tuple
+
+import pandas as pd
+
+from .common import FamilyConfig
+from .states import institute_states, location_label
+
+IIIT_DATA_DIR = "row_Data/IIIT_row_data"
+
+BRANCH_ABBREVIATIONS = {
+    "Computer Science": "CSE",
+    "Computer Science and Engineering": "CSE",
+    "Electronics and Communication Engineering": "ECE",
+    "Information Technology": "IT",
+    # Add more as discovered
+}
+
+def normalize_institute_name(name: str) -> str:
+    if pd.isna(name): return None
+    return name.strip()
+
+def extract_branch_info(academic_program: str):
+    if pd.isna(academic_program): return None, None, None
+    academic_program = academic_program.strip()
+    
+    degree_type = "B.Tech"
+    if "B.Tech" in academic_program: degree_type = "B.Tech"
+    elif "M.Tech" in academic_program and "Integrated" in academic_program: degree_type = "Integrated M.Tech"
+    
+    match = re.match(r"^(.+?)\s*\([^)]+\)", academic_program)
+    branch_name = match.group(1).strip() if match else re.split(r'[,\(]', academic_program)[0].strip()
+    branch_name = re.sub(r'\s+', ' ', branch_name)
+    
+    short_name = None
+    for key, abbrev in BRANCH_ABBREVIATIONS.items():
+        if key in branch_name:
+            short_name = abbrev
+            break
+    if not short_name:
+        short_name = branch_name[:3].upper()
+        
+    return branch_name, short_name, degree_type
+
+def derive_category(seat_type, quota, gender):
+    seat_type = str(seat_type).strip().upper()
+    if "OPEN" in seat_type and "PWD" not in seat_type: return "GEN"
+    elif "OBC" in seat_type: return "OBC"
+    elif "SC" in seat_type: return "SC"
+    elif "ST" in seat_type: return "ST"
+    elif "EWS" in seat_type: return "EWS"
+    return "GEN"
+
+NIRF_RANK_MAPPING = {
+    "Atal Bihari Vajpayee Indian Institute of Information Technology & Management Gwalior": 96,
+    "Indian Institute of Information Technology, Allahabad": 101,
+    "Pt. Dwarka Prasad Mishra Indian Institute of Information Technology, Design & Manufacture Jabalpur": 102,
+    "Indian Institute of Information Technology, Design & Manufacturing, Kancheepuram": 151,
+    "Indian Institute of Information Technology Guwahati": 201,
+    "Indian Institute of Information Technology (IIIT) Nagpur": 399,
+    "Indian Institute of Information Technology (IIIT) Pune": 399,
+    "Indian Institute of Information Technology (IIIT) Ranchi": 399,
+    "Indian Institute of Information Technology (IIIT), Sri City, Chittoor": 399,
+    "Indian Institute of Information Technology (IIIT)Kota, Rajasthan": 399,
+    "Indian Institute of Information Technology Bhagalpur": 399,
+    "Indian Institute of Information Technology Bhopal": 399,
+    "Indian Institute of Information Technology Design & Manufacturing Kurnool, Andhra Pradesh": 399,
+    "Indian Institute of Information Technology Lucknow": 399,
+    "Indian Institute of Information Technology Surat": 399,
+    "Indian Institute of Information Technology Tiruchirappalli": 399,
+    "Indian Institute of Information Technology(IIIT) Dharwad": 399,
+    "Indian Institute of Information Technology(IIIT) Kalyani, West Bengal": 399,
+    "Indian Institute of Information Technology(IIIT) Kilohrad, Sonepat, Haryana": 399,
+    "Indian Institute of Information Technology(IIIT) Kottayam": 399,
+    "Indian Institute of Information Technology(IIIT) Una, Himachal Pradesh": 399,
+    "Indian Institute of Information Technology(IIIT), Vadodara, Gujrat": 399,
+    "Indian Institute of Information Technology, Agartala": 399,
+    "Indian Institute of Information Technology, Vadodara International Campus Diu (IIITVICD)": 399
+}
+
+# Other names students (and the placement tables) use (entity dictionary only; see ingestion.entities)
+INSTITUTE_ALIASES = {
+    "IIITDM Jabalpur": "Pt. Dwarka Prasad Mishra Indian Institute of Information Technology, Design & Manufacture Jabalpur",
+    "Indian Institute of Information Technology Design and Manufacturing, Jabalpur":
+        "Pt. Dwarka Prasad Mishra Indian Institute of Information Technology, Design & Manufacture Jabalpur",
+    "IIITDM Kancheepuram": "Indian Institute of Information Technology, Design & Manufacturing, Kancheepuram",
+    "Indian Institute of Information Technology Design and Manufacturing, Chennai":
+        "Indian Institute of Information Technology, Design & Manufacturing, Kancheepuram",
+    "IIITDM Kurnool": "Indian Institute of Information Technology Design & Manufacturing Kurnool, Andhra Pradesh",
+}
+
+# States of the IIITs rank_data.csv does not list under their cutoff name
+INSTITUTE_STATES = {
+    "Pt. Dwarka Prasad Mishra Indian Institute of Information Technology, Design & Manufacture Jabalpur": "Madhya Pradesh",
+    "Indian Institute of Information Technology (IIIT) Nagpur": "Maharashtra",
+    "Indian Institute of Information Technology (IIIT) Pune": "Maharashtra",
+    "Indian Institute of Information Technology (IIIT) Ranchi": "Jharkhand",
+    "Indian Institute of Information Technology (IIIT), Sri City, Chittoor": "Andhra Pradesh",
+    "Indian Institute of Information Technology (IIIT)Kota, Rajasthan": "Rajasthan",
+    "Indian Institute of Information Technology Bhagalpur": "Bihar",
+    "Indian Institute of Information Technology Bhopal": "Madhya Pradesh",
+    "Indian Institute of Information Technology Design & Manufacturing Kurnool, Andhra Pradesh": "Andhra Pradesh",
+    "Indian Institute of Information Technology Lucknow": "Uttar Pradesh",
+    "Indian Institute of Information Technology Surat": "Gujarat",
+    "Indian Institute of Information Technology Tiruchirappalli": "Tamil Nadu",
+    "Indian Institute of Information Technology(IIIT) Dharwad": "Karnataka",
+    "Indian Institute of Information Technology(IIIT) Kalyani, West Bengal": "West Bengal",
+    "Indian Institute of Information Technology(IIIT) Kilohrad, Sonepat, Haryana": "Haryana",
+    "Indian Institute of Information Technology(IIIT) Kottayam": "Kerala",
+    "Indian Institute of Information Technology(IIIT) Una, Himachal Pradesh": "Himachal Pradesh",
+    "Indian Institute of Information Technology(IIIT), Vadodara, Gujrat": "Gujarat",
+    "Indian Institute of Information Technology, Agartala": "Tripura",
+    "Indian Institute of Information Technology, Vadodara International Campus Diu (IIITVICD)":
+        "Dadra and Nagar Haveli and Daman and Diu",
+}
+
+def create_iiit_table(institute_names: Iterable[str], rank_df: Optional[pd.DataFrame] = None) -> Tuple[pd.DataFrame, Dict[str, int]]:
+    all_names = {
+        name for name in institute_names
+        if "Indian Institute of Information Technology" in name or "IIIT" in name
+    }
+                
+    records = []
+    for name in sorted(all_names):
+        # Default to 399 or 0 if somehow missed
+        rank = NIRF_RANK_MAPPING.get(name, 399) 
+        records.append({'name': name, 'location': 'India', 'nirf_rank': rank})
+        
+    df = pd.DataFrame(records)
+    df.insert(2, 'state', institute_states(df['name'], rank_df, INSTITUTE_STATES))
+    df['location'] = [location_label(None, state) for state in df['state']]
+    # Sort by Rank then Name
+    df = df.sort_values(['nirf_rank', 'name'])
+    df['iiit_id'] = range(1, len(df) + 1)
+    return df, dict(zip(df['name'], df['iiit_id']))
+
+
+FAMILY = FamilyConfig(
+    key="iiit",
+    label="IIIT",
+    data_dir=IIIT_DATA_DIR,
+    round_glob="josaa_round*_iiit_results.csv",
+    round_files={1: "Indian_Institute_of_Information_Technology.csv"},
+    id_column="iiit_id",
+    normalize_name=normalize_institute_name,
+    extract_branch=extract_branch_info,
+    derive_category=derive_category,
+    create_institute_table=create_iiit_table,
+    uses_rank_data=True,
+    institute_csv="iiit.csv",
+    branch_csv="iiit_branch.csv",
+    cutoff_csv="iiit_cutoff.csv",
+    institute_aliases=INSTITUTE_ALIASES,
+    branch_abbreviations=BRANCH_ABBREVIATIONS,
+)
@@ -0,0 +1,287 @@
+"""
+IIT family: JEE Advanced cutoffs for the Indian Institutes of Technology.
+
+Names, branches and categories are normalized here; the shared stages live
+in ingestion.common.
+"""
+
+import re
+from typing import Dict, Iterable, Optional, Tuple
+
+import pandas as pd
+
+from .common import FamilyConfig
+from .states import canonical_state
+
+IIT_DATA_DIR = "row_Data/IIT_row_data"
+
+# Institute name mapping (short -> full normalized)
+INSTITUTE_NAME_MAPPING = {
+    "IIT Madras": "Indian Institute of Technology Madras",
+    "IIT Delhi": "Indian Institute of Technology Delhi",
+    "IIT Bombay": "Indian Institute of Technology Bombay",
+    "IIT Kanpur": "Indian Institute of Technology Kanpur",
+    "IIT Kharagpur": "Indian Institute of Technology Kharagpur",
+    "IIT Roorkee": "Indian Institute of Technology Roorkee",
+    "IIT Guwahati": "Indian Institute of Technology Guwahati",
+    "IIT Hyderabad": "Indian Institute of Technology Hyderabad",
+    "IIT (BHU) Varanasi": "Indian Institute of Technology (BHU) Varanasi",
+    "IIT Dhanbad (ISM)": "Indian Institute of Technology Dhanbad",
+    "IIT Indore": "Indian Institute of Technology Indore",
+    "IIT Gandhinagar": "Indian Institute of Technology Gandhinagar",
+    "IIT Ropar": "Indian Institute of Technology Ropar",
+    "IIT Jodhpur": "Indian Institute of Technology Jodhpur",
+    "IIT Mandi": "Indian Institute of Technology Mandi",
+    "IIT Patna": "Indian Institute of Technology Patna",
+    "IIT Bhubaneswar": "Indian Institute of Technology Bhubaneswar",
+    "IIT Tirupati": "Indian Institute of Technology Tirupati",
+    "IIT Jammu": "Indian Institute of Technology Jammu",
+    "IIT Palakkad": "Indian Institute of Technology Palakkad",
+    "IIT Bhilai": "Indian Institute of Technology Bhilai",
+    "IIT Dharwad": "Indian Institute of Technology Dharwad",
+    "IIT Goa": "Indian Institute of Technology Goa",
+}
+
+# Other names students use (entity dictionary only; see ingestion.entities)
+INSTITUTE_ALIASES = {
+    "IIT BHU": "Indian Institute of Technology (BHU) Varanasi",
+    "BHU Varanasi": "Indian Institute of Technology (BHU) Varanasi",
+    "IIT Varanasi": "Indian Institute of Technology (BHU) Varanasi",
+    "IIT ISM": "Indian Institute of Technology Dhanbad",
+    "IIT (ISM) Dhanbad": "Indian Institute of Technology Dhanbad",
+    "ISM Dhanbad": "Indian Institute of Technology Dhanbad",
+    "IIT KGP": "Indian Institute of Technology Kharagpur",
+    "IITB": "Indian Institute of Technology Bombay",
+    "IITD": "Indian Institute of Technology Delhi",
+    "IITM": "Indian Institute of Technology Madras",
+    "IITK": "Indian Institute of Technology Kanpur",
+    "IITR": "Indian Institute of Technology Roorkee",
+    "IITG": "Indian Institute of Technology Guwahati",
+    "IITH": "Indian Institute of Technology Hyderabad",
+}
+
+# Branch name to abbreviation mapping
+BRANCH_ABBREVIATIONS = {
+    "Civil Engineering": "CE",
+    "Computer Science and Engineering": "CSE",
+    "Electrical Engineering": "EE",
+    "Electronics and Communication Engineering": "ECE",
+    "Mechanical Engineering": "ME",
+    "Chemical Engineering": "CHE",
+    "Aerospace Engineering": "AE",
+    "Biotechnology": "BT",
+    "Engineering Physics": "EP",
+    "Materials Science and Engineering": "MSE",
+    "Metallurgical and Materials Engineering": "MME",
+    "Industrial and Systems Engineering": "ISE",
+    "Agricultural and Food Engineering": "AFE",
+    "Ocean Engineering and Naval Architecture": "OENA",
+    "Mathematics and Computing": "MNC",
+    "Data Science and Artificial Intelligence": "DSAI",
+    "Artificial Intelligence and Data Science": "AIDS",
+    "Artificial Intelligence": "AI",
+    "Data Science": "DS",
+    "Energy Engineering": "ENE",
+    "Environmental Engineering": "ENV",
+    "Mining Engineering": "MIN",
+    "Petroleum Engineering": "PE",
+    "Geological Engineering": "GE",
+    "Applied Geology": "AG",
+    "Applied Geophysics": "AGP",
+    "Architecture": "ARCH",
+    "Design": "DES",
+    "Textile Technology": "TT",
+    "Manufacturing Science and Engineering": "MSE",
+}
+
+def normalize_institute_name(name: str) -> str:
+    """Normalize institute name to a consistent format."""
+    if pd.isna(name):
+        return None
+    
+    name = name.strip()
+    
+    # Check direct mapping first
+    if name in INSTITUTE_NAME_MAPPING:
+        return INSTITUTE_NAME_MAPPING[name]
+    
+    # Handle "Indian Institute of Technology" variations
+    if "Indian Institute of Technology" in name:
+        # Normalize Dhanbad/ISM variations to consistent name
+        if "Dhanbad" in name or "(ISM)" in name:
+            return "Indian Institute of Technology Dhanbad"
+        # Handle "(BHU)" special case
+        if "(BHU)" in name or "BHU" in name:
+            return "Indian Institute of Technology (BHU) Varanasi"
+        # Extract location from full name (e.g., "Indian Institute of Technology Bhubaneswar")
+        if name.startswith("Indian Institute of Technology"):
+            return name  # Already normalized
+    
+    # Handle "IIT" prefix variations
+    match = re.match(r"IIT\s+(.+?)(?:\s*\(|$)", name, re.IGNORECASE)
+    if match:
+        location = match.group(1).strip()
+        # Handle special cases
+        if "BHU" in location or "Varanasi" in location:
+            return "Indian Institute of Technology (BHU) Varanasi"
+        if "Dhanbad" in location or "ISM" in location:
+            return "Indian Institute of Technology Dhanbad"
+        # Standard format
+        return f"Indian Institute of Technology {location}"
+    
+    return name
+
+def extract_branch_info(academic_program: str) -> Tuple[str, str, str]:
+    """
+    Extract branch name, short name, and degree type from academic program.
+    Returns: (branch_name, short_name, degree_type)
+    """
+    if pd.isna(academic_program):
+        return None, None, None
+    
+    academic_program = academic_program.strip()
+    
+    # Extract degree type (B.Tech, BS, Dual, etc.)
+    degree_type = None
+    if "Bachelor of Technology" in academic_program or "B.Tech" in academic_program:
+        degree_type = "B.Tech"
+    elif "Bachelor of Science" in academic_program or "BS" in academic_program:
+        degree_type = "BS"
+    elif "Dual" in academic_program:
+        degree_type = "Dual"
+    elif "Bachelor" in academic_program:
+        degree_type = "B.Tech"  # Default
+    else:
+        degree_type = "B.Tech"  # Default assumption
+    
+    # Extract branch name (before the parenthesis or comma)
+    # Pattern: "Branch Name (Years, Degree Type)"
+    match = re.match(r"^(.+?)\s*\([^)]+\)", academic_program)
+    if match:
+        branch_name = match.group(1).strip()
+    else:
+        # Fallback: take everything before comma or parenthesis
+        branch_name = re.split(r'[,\(]', academic_program)[0].strip()
+    
+    # Normalize branch name
+    branch_name = re.sub(r'\s+', ' ', branch_name)  # Remove extra spaces
+    
+    # Generate short name
+    short_name = None
+    for key, abbrev in BRANCH_ABBREVIATIONS.items():
+        if key in branch_name:
+            short_name = abbrev
+            break
+    
+    # If no abbreviation found, create one from first letters
+    if not short_name:
+        words = branch_name.split()
+        if len(words) >= 2:
+            short_name = ''.join([w[0].upper() for w in words[:3]])
+        else:
+            short_name = branch_name[:3].upper()
+    
+    return branch_name, short_name, degree_type
+
+def derive_category(seat_type: str, quota: str, gender: str) -> str:
+    """
+    Derive category from Seat Type, Quota, and Gender.
+    Returns standardized category: GEN, OBC, SC, ST, EWS
+    """
+    if pd.isna(seat_type):
+        return "GEN"
+    
+    seat_type = str(seat_type).strip().upper()
+    quota = str(quota).strip().upper() if not pd.isna(quota) else ""
+    
+    # Map seat types to categories
+    if "OPEN" in seat_type and "PWD" not in seat_type:
+        return "GEN"
+    elif "OBC" in seat_type:
+        return "OBC"
+    elif "SC" in seat_type:
+        return "SC"
+    elif "ST" in seat_type:
+        return "ST"
+    elif "EWS" in seat_type:
+        return "EWS"
+    elif quota == "OBC-NCL":
+        return "OBC"
+    elif quota == "EWS":
+        return "EWS"
+    else:
+        return "GEN"  # Default
+
+def create_iit_table(institute_names: Iterable[str], rank_df: Optional[pd.DataFrame]) -> Tuple[pd.DataFrame, Dict[str, int]]:
+    """Create IIT master table from rank data and the (normalized) cutoff institute names."""
+    # Filter only IITs from rank data
+    iit_pattern = r'^IIT\s+'
+    iit_mask = rank_df['Institute'].str.match(iit_pattern, case=False, na=False)
+    iit_rank_df = rank_df[iit_mask].copy()
+    
+    # Normalize institute names
+    iit_rank_df['normalized_name'] = iit_rank_df['Institute'].apply(normalize_institute_name)
+    
+    # Create IIT table from rank data
+    iit_records = []
+    seen_names = set()
+    
+    for _, row in iit_rank_df.iterrows():
+        normalized_name = row['normalized_name']
+        if normalized_name not in seen_names:
+            iit_records.append({
+                'name': normalized_name,
+                'location': f"{row['City']}, {row['State']}",
+                'state': canonical_state(row['State']),
+                'nirf_rank': row['Rank']
+            })
+            seen_names.add(normalized_name)
+    
+    # Location and state of IITs not in ranking
+    iit_location_map = {
+        "Indian Institute of Technology Goa": ("Ponda", "Goa"),
+        # Add more mappings as needed
+    }
+    
+    # Add IITs from cutoff data that aren't in ranking data
+    for inst_name in sorted(institute_names):
+        if inst_name.startswith("Indian Institute of Technology") and inst_name not in seen_names:
+            city, state = iit_location_map.get(inst_name, (None, None))
+            iit_records.append({
+                'name': inst_name,
+                'location': f"{city}, {state}" if state else "India",
+                'state': state,
+                'nirf_rank': 201  # Default rank for missing IITs
+            })
+            seen_names.add(inst_name)
+    
+    # Create DataFrame and assign IDs
+    iit_table = pd.DataFrame(iit_records)
+    iit_table = iit_table.sort_values('name')  # Sort for consistent ordering
+    iit_table['iit_id'] = range(1, len(iit_table) + 1)
+    iit_table = iit_table[['iit_id', 'name', 'location', 'state', 'nirf_rank']]
+    
+    return iit_table, dict(zip(iit_table['name'], iit_table['iit_id']))
+
+
+FAMILY = FamilyConfig(
+    key="iit",
+    label="IIT",
+    data_dir=IIT_DATA_DIR,
+    round_glob="josaa_round*_iit_results.csv",
+    id_column="iit_id",
+    normalize_name=normalize_institute_name,
+    extract_branch=extract_branch_info,
+    derive_category=derive_category,
+    create_institute_table=create_iit_table,
+    uses_rank_data=True,
+    institute_csv="iit.csv",
+    branch_csv="branch.csv",
+    cutoff_csv="cutoff.csv",
+    branch_columns=['branch_id', 'branch_name', 'short_name', 'degree_type'],
+    cutoff_columns=['cutoff_id', 'iit_id', 'branch_id', 'year', 'category', 'gender', 'pwd', 'opening_rank',
+                    'closing_rank', 'round'],
+    include_quota=False,
+    institute_aliases={**INSTITUTE_NAME_MAPPING, **INSTITUTE_ALIASES},
+    branch_abbreviations=BRANCH_ABBREVIATIONS,
+)
@@ -0,0 +1,181 @@
+"""
+Institute facts: placement packages and fee bands, keyed by entity id.
+
+The placement and fee tables come from different scrapes and disagree on
+format: packages are lakhs per annum ("23.50"), "INR 6.5 LPA" strings or
+raw rupees ("2578000"), fees are "₹1,00,000 + ₹12,000" (tuition plus other
+fees per semester). parse_amount turns every cell into whole rupees. Some
+files also leave commas in institute names unquoted, so read_rows folds
+surplus leading fields back into the name.
+
+Each row's institute is resolved with the compiled entity dictionary (see
+entities.py), so a fact attaches to the institute whichever family lists
+it. The table is written to normalized_data/institute_facts.csv:
+
+    institute_id, name, average_package, highest_package,
+    fee_above_5l, fee_1l_to_5l, fee_below_1l, fee_reserved
+
+(amounts in rupees, empty when unknown). The fee columns are the JoSAA
+income bands of GEN/OBC/EWS candidates (family income above 5 lakh,
+1-5 lakh, below 1 lakh) and the SC/ST/PwD band. Rows naming an
+institute outside the cutoff tables are skipped and counted.
+"""
+
+import csv
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from .entities import acronym_key, alias_key, name_variants
+
+FACTS_FILE = "institute_facts.csv"
+FACT_COLUMNS = ['average_package', 'highest_package', 'fee_above_5l', 'fee_1l_to_5l', 'fee_below_1l', 'fee_reserved']
+
+LAKH = 100_000
+CRORE = 10_000_000
+# Unit words that override a source's default unit
+UNITS = {'lpa': LAKH, 'lakh': LAKH, 'lakhs': LAKH, 'l': LAKH, 'cr': CRORE, 'crore': CRORE, 'cpa': CRORE}
+
+
+@dataclass(frozen=True)
+class FactSource:
+    """
+    One input table: its name column, value columns (source -> fact
+    column), unit of bare numbers and optional place column (a city or
+    campus tried as "<name>, <place>" first).
+    """
+    path: str
+    name_column: str
+    columns: Dict[str, str]
+    unit: int = 1
+    place_column: Optional[str] = None
+
+
+# In order of trust: a fact already set by an earlier source is kept
+SOURCES = (
+    FactSource("wasted/placement_data/iit_placement.csv", "Institute",
+               {"Average Package (LPA)": "average_package", "Highest Package (LPA)": "highest_package"}, LAKH),
+    FactSource("wasted/nit/NITs_Placement_Data.csv", "institute",
+               {"Average Domestic Package (LPA)": "average_package",
+                "Highest Domestic Package (LPA)": "highest_package"}, LAKH),
+    FactSource("wasted/placement_data/IIITs_Colleges_Placements.csv", "College",
+               {"Average Package": "average_package", "Highest Package": "highest_package"}),
+    FactSource("wasted/placement_data/gfti_placement.csv", "Institute Name",
+               {"Average Package (INR)": "average_package", "Highest Package (INR)": "highest_package"},
+               place_column="Location"),
+    FactSource("row_Data/fees_data.csv", "Institute",
+               {"Gen/OBC/EWS (>₹5L)": "fee_above_5l", "Gen/OBC/EWS (₹1–5L)": "fee_1l_to_5l",
+                "Gen/OBC/EWS (<₹1L)": "fee_below_1l", "SC/ST/PwD": "fee_reserved"}),
+)
+
+# A number, or a range "5-6" (read as its midpoint), and an optional unit word
+_AMOUNT = re.compile(r"(\d[\d,]*(?:\.\d+)?)(?:\s*[-–]\s*(\d[\d,]*(?:\.\d+)?))?\s*([a-z]+)?")
+
+
+def parse_amount(value, unit: int = 1) -> Optional[int]:
+    """
+    Whole rupees of a cell: the sum of its "+"-separated amounts, each in
+    its own unit word (LPA, lakh, Cr) or else `unit`; a range counts as its
+    midpoint. None for empty or non-numeric cells such as "Not Available".
+    """
+    if value is None or pd.isna(value):
+        return None
+    total = 0.0
+    for part in str(value).casefold().split('+'):
+        match = _AMOUNT.search(part)
+        if not match:
+            return None
+        low, high, word = match.groups()
+        number = float(low.replace(',', ''))
+        if high:
+            number = (number + float(high.replace(',', ''))) / 2
+        total += number * UNITS.get(word or '', unit)
+    return int(round(total))
+
+
+def read_rows(path: Path) -> Iterator[Dict[str, str]]:
+    """
+    CSV rows as header -> value. A row with more fields than the header
+    has unquoted commas in its first (name) column; the surplus fields are
+    joined back into it.
+    """
+    with open(path, encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        for fields in reader:
+            if not fields:
+                continue
+            surplus = len(fields) - len(header)
+            if surplus > 0:
+                fields = [", ".join(field.strip() for field in fields[:surplus + 1])] + fields[surplus + 1:]
+            yield dict(zip(header, (field.strip() for field in fields)))
+
+
+class InstituteResolver:
+    """Institute name -> entity id with the compiled dictionary's aliases."""
+
+    def __init__(self, entities: dict):
+        aliases = entities['aliases']['institutes']
+        self.names: Dict[str, int] = aliases['names']
+        self.acronyms: Dict[str, int] = aliases['acronyms']
+        self.canonical = {entity['id']: entity['name'] for entity in entities['institutes']}
+
+    def resolve(self, name: str, place: Optional[str] = None) -> Optional[int]:
+        """
+        Tries "<name>, <place>", then the name, each as written, without
+        commas and in its short form ("IIT Bombay"). Shorter fragments of a
+        name are not tried: "IIIT Design and Manufacturing" would name
+        several institutes.
+        """
+        names = [f"{name}, {place}", name] if place else [name]
+        candidates = [variant for full in names for variant in [full] + name_variants(full)[:2]]
+        for candidate in candidates:
+            entity_id = self.names.get(alias_key(candidate))
+            if entity_id is None and acronym_key(candidate):
+                entity_id = self.acronyms.get(acronym_key(candidate))
+            if entity_id is not None:
+                return entity_id
+        return None
+
+
+def compile_facts(entities: dict, base_dir: str = ".") -> Tuple[pd.DataFrame, List[str]]:
+    """Facts table (one row per institute with any fact, in entity id order) and the unresolved names."""
+    resolver = InstituteResolver(entities)
+    facts: Dict[int, Dict[str, int]] = {}
+    unresolved: List[str] = []
+    for source in SOURCES:
+        path = Path(base_dir) / source.path
+        if not path.exists():
+            continue
+        for row in read_rows(path):
+            name = row.get(source.name_column, "")
+            place = row.get(source.place_column) if source.place_column else None
+            entity_id = resolver.resolve(name, place) if name else None
+            if entity_id is None:
+                unresolved.append(name)
+                continue
+            values = facts.setdefault(entity_id, {})
+            for column, fact in source.columns.items():
+                amount = parse_amount(row.get(column), source.unit)
+                if amount is not None:
+                    values.setdefault(fact, amount)
+
+    records = [
+        {'institute_id': entity_id, 'name': resolver.canonical[entity_id], **values}
+        for entity_id, values in sorted(facts.items()) if values
+    ]
+    table = pd.DataFrame(records, columns=['institute_id', 'name'] + FACT_COLUMNS)
+    for column in FACT_COLUMNS:
+        table[column] = table[column].astype('Int64')
+    return table, unresolved
+
+
+def write_facts(entities: dict, output_dir: str, base_dir: str = ".") -> Tuple[Path, int, List[str]]:
+    """Compile and write institute_facts.csv; returns (path, institutes, unresolved names)."""
+    table, unresolved = compile_facts(entities, base_dir)
+    path = Path(output_dir) / FACTS_FILE
+    table.to_csv(path, index=False)
+    return path, len(table), unresolved
@@ -0,0 +1,72 @@
+"""
+Content-hash manifest for incremental ingestion.
+
+Stored next to the outputs (normalized_data/ingest_manifest.json). For each
+family it records every input round file with its sha256, year, round number
+and the cutoff_id range its rows occupy, plus the next free cutoff_id. A rerun
+compares hashes and reprocesses only new or changed files.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+# Bump when parsing or output layout changes; a mismatch forces a full rebuild
+SCHEMA_VERSION = 7
+MANIFEST_FILE = "ingest_manifest.json"
+
+
+def file_sha256(path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_manifest(output_dir: str) -> Dict[str, dict]:
+    """Family entries of the manifest; empty if missing, unreadable or from another schema version."""
+    path = Path(output_dir) / MANIFEST_FILE
+    try:
+        manifest = json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if manifest.get('schema_version') != SCHEMA_VERSION:
+        print(f"  Manifest schema {manifest.get('schema_version')} != {SCHEMA_VERSION}, rebuilding everything")
+        return {}
+    return manifest.get('families', {})
+
+
+def save_manifest(output_dir: str, families: Dict[str, dict]) -> None:
+    manifest = {'schema_version': SCHEMA_VERSION, 'families': dict(sorted(families.items()))}
+    path = Path(output_dir) / MANIFEST_FILE
+    path.write_text(json.dumps(manifest, indent=2) + "\n", encoding='utf-8')
+
+
+def input_entry(path: Path, year: int, round_number: int) -> dict:
+    return {'file': path.as_posix(), 'year': year, 'round': round_number, 'sha256': file_sha256(path)}
+
+
+def changed_inputs(inputs: List[dict], previous: dict) -> List[dict]:
+    """Inputs that are new or whose content, year or round changed since the previous run."""
+    old = {entry['file']: entry for entry in previous['inputs']}
+    fields = ('sha256', 'year', 'round')
+    return [
+        entry for entry in inputs
+        if entry['file'] not in old or any(old[entry['file']][key] != entry[key] for key in fields)
+    ]
+
+
+def family_entry(inputs: List[dict], id_ranges: Dict[str, Optional[List[int]]], next_cutoff_id: int) -> dict:
+    """Manifest entry; id_ranges maps input file -> [first, last] cutoff_id (None if it produced no rows)."""
+    return {
+        'inputs': [dict(entry, cutoff_ids=id_ranges.get(entry['file'])) for entry in inputs],
+        'next_cutoff_id': next_cutoff_id,
+    }
+
+
+def id_range(cutoff_ids: pd.Series) -> Optional[List[int]]:
+    return [int(cutoff_ids.min()), int(cutoff_ids.max())] if len(cutoff_ids) else None
@@ -0,0 +1,249 @@
+"""
+NIT family: JEE Main cutoffs for the National Institutes of Technology.
+
+Names, branches and categories are normalized here; the shared stages live
+in ingestion.common.
+"""
+
+import re
+from typing import Dict, Iterable, Optional, Tuple
+
+import pandas as pd
+
+from .common import FamilyConfig
+from .states import institute_states, location_label
+
+NIT_DATA_DIR = "row_Data/NIT_row_data"
+
+# Other names students use (entity dictionary only; see ingestion.entities)
+INSTITUTE_ALIASES = {
+    "NIT Trichy": "National Institute of Technology, Tiruchirappalli",
+    "NITT": "National Institute of Technology, Tiruchirappalli",
+    "NITK": "National Institute of Technology Karnataka, Surathkal",
+    "NITK Surathkal": "National Institute of Technology Karnataka, Surathkal",
+    "NITW": "National Institute of Technology, Warangal",
+    "NIT Allahabad": "Motilal Nehru National Institute of Technology Allahabad",
+    "NIT Prayagraj": "Motilal Nehru National Institute of Technology Allahabad",
+    "MNNIT": "Motilal Nehru National Institute of Technology Allahabad",
+    "MNNIT Allahabad": "Motilal Nehru National Institute of Technology Allahabad",
+    "MNIT": "Malaviya National Institute of Technology Jaipur",
+    "MNIT Jaipur": "Malaviya National Institute of Technology Jaipur",
+    "VNIT": "Visvesvaraya National Institute of Technology, Nagpur",
+    "VNIT Nagpur": "Visvesvaraya National Institute of Technology, Nagpur",
+    "SVNIT": "Sardar Vallabhbhai National Institute of Technology, Surat",
+    "SVNIT Surat": "Sardar Vallabhbhai National Institute of Technology, Surat",
+    "MANIT": "Maulana Azad National Institute of Technology Bhopal",
+    "MANIT Bhopal": "Maulana Azad National Institute of Technology Bhopal",
+    "NIT Jalandhar": "Dr. B R Ambedkar National Institute of Technology, Jalandhar",
+    "National Institute of Technology, Tiruchirapalli": "National Institute of Technology, Tiruchirappalli",
+    "National Institute of Technology, Srinagar (Garhwal), Uttarkhand": "National Institute of Technology, Uttarakhand",
+    "National Institute of Technology, Yupia, Arunachal Pradesh": "National Institute of Technology Arunachal Pradesh",
+    "NIT Yupia": "National Institute of Technology Arunachal Pradesh",
+    "National Institute of Technology, Hamirpur, HP": "National Institute of Technology Hamirpur",
+    "National Institute of Technology, Hazaratbal, Srinagar": "National Institute of Technology, Srinagar",
+    "National Institute of Technology, Jamshedpur, Jharkhand": "National Institute of Technology, Jamshedpur",
+    "National Institute of Technology, Agartala, Tripura": "National Institute of Technology Agartala",
+    "National Institute of Technology, Tadepalligudem, Andhra Pradesh": "National Institute of Technology, Andhra Pradesh",
+    "NIT Tadepalligudem": "National Institute of Technology, Andhra Pradesh",
+}
+
+# Branch name to abbreviation mapping (reused and expanded if needed)
+BRANCH_ABBREVIATIONS = {
+    "Civil Engineering": "CE",
+    "Computer Science and Engineering": "CSE",
+    "Electrical Engineering": "EE",
+    "Electronics and Communication Engineering": "ECE",
+    "Mechanical Engineering": "ME",
+    "Chemical Engineering": "CHE",
+    "Aerospace Engineering": "AE",
+    "Biotechnology": "BT",
+    "Engineering Physics": "EP",
+    "Materials Science and Engineering": "MSE",
+    "Metallurgical and Materials Engineering": "MME",
+    "Industrial and Systems Engineering": "ISE",
+    "Agricultural and Food Engineering": "AFE",
+    "Ocean Engineering and Naval Architecture": "OENA",
+    "Mathematics and Computing": "MNC",
+    "Data Science and Artificial Intelligence": "DSAI",
+    "Artificial Intelligence and Data Science": "AIDS",
+    "Artificial Intelligence": "AI",
+    "Data Science": "DS",
+    "Energy Engineering": "ENE",
+    "Environmental Engineering": "ENV",
+    "Mining Engineering": "MIN",
+    "Petroleum Engineering": "PE",
+    "Geological Engineering": "GE",
+    "Applied Geology": "AG",
+    "Applied Geophysics": "AGP",
+    "Architecture": "ARCH",
+    "Design": "DES",
+    "Textile Technology": "TT",
+    "Manufacturing Science and Engineering": "MSE",
+    "Production Engineering": "PE",
+    "Information Technology": "IT",
+}
+
+def normalize_institute_name(name: str) -> str:
+    """Normalize institute name to a consistent format."""
+    if pd.isna(name):
+        return None
+    name = name.strip()
+    # Basic normalization for NIT names if needed
+    # Most NIT names in data seem to be "National Institute of Technology, [Location]"
+    # or "Dr. B R Ambedkar National Institute of Technology, Jalandhar"
+    return name
+
+def extract_branch_info(academic_program: str) -> Tuple[str, str, str]:
+    """
+    Extract branch name, short name, and degree type from academic program.
+    Returns: (branch_name, short_name, degree_type)
+    """
+    if pd.isna(academic_program):
+        return None, None, None
+    
+    academic_program = academic_program.strip()
+    
+    # Extract degree type
+    degree_type = "B.Tech" # Default
+    if "Bachelor of Technology" in academic_program or "B.Tech" in academic_program:
+        degree_type = "B.Tech"
+    elif "Bachelor of Architecture" in academic_program or "B.Arch" in academic_program:
+        degree_type = "B.Arch"
+    elif "Bachelor of Science" in academic_program or "BS" in academic_program:
+        degree_type = "BS"
+    elif "Dual" in academic_program or "Integrated" in academic_program:
+        degree_type = "Dual/Integrated"
+    elif "Master" in academic_program:
+        degree_type = "M.Tech" # Should not be in UG cutoff data normally but just in case
+        
+    
+    # Extract branch name
+    match = re.match(r"^(.+?)\s*\([^)]+\)", academic_program)
+    if match:
+        branch_name = match.group(1).strip()
+    else:
+        branch_name = re.split(r'[,\(]', academic_program)[0].strip()
+    
+    branch_name = re.sub(r'\s+', ' ', branch_name)
+    
+    # Generate short name
+    short_name = None
+    for key, abbrev in BRANCH_ABBREVIATIONS.items():
+        if key in branch_name:
+            short_name = abbrev
+            break
+            
+    if not short_name:
+        words = branch_name.split()
+        if len(words) >= 2:
+            short_name = ''.join([w[0].upper() for w in words[:3]])
+        else:
+            short_name = branch_name[:3].upper()
+            
+    return branch_name, short_name, degree_type
+
+def derive_category(seat_type: str, quota: str, gender: str) -> str:
+    """Derive category from Seat Type, Quota, and Gender."""
+    if pd.isna(seat_type):
+        return "GEN"
+    seat_type = str(seat_type).strip().upper()
+    
+    # Map seat types
+    if "OPEN" in seat_type and "PWD" not in seat_type:
+        return "GEN"
+    elif "OBC" in seat_type:
+        return "OBC"
+    elif "SC" in seat_type:
+        return "SC"
+    elif "ST" in seat_type:
+        return "ST"
+    elif "EWS" in seat_type:
+        return "EWS"
+    else:
+        return "GEN"
+
+
+NIRF_RANK_MAPPING = {
+    "National Institute of Technology, Tiruchirappalli": 9,
+    "National Institute of Technology, Rourkela": 13,
+    "National Institute of Technology Karnataka, Surathkal": 17,
+    "National Institute of Technology Calicut": 21,
+    "National Institute of Technology, Warangal": 28,
+    "Malaviya National Institute of Technology Jaipur": 42,
+    "Visvesvaraya National Institute of Technology, Nagpur": 44,
+    "National Institute of Technology Durgapur": 49,
+    "National Institute of Technology, Silchar": 50,
+    "National Institute of Technology Patna": 53,
+    "Dr. B R Ambedkar National Institute of Technology, Jalandhar": 55,
+    "Motilal Nehru National Institute of Technology Allahabad": 62,
+    "National Institute of Technology Delhi": 65,
+    "Sardar Vallabhbhai National Institute of Technology, Surat": 66,
+    "National Institute of Technology, Srinagar": 73,
+    "Maulana Azad National Institute of Technology Bhopal": 81,
+    "National Institute of Technology, Jamshedpur": 82,
+    "National Institute of Technology Meghalaya": 83,
+    "National Institute of Technology, Kurukshetra": 85,
+    "National Institute of Technology Raipur": 86,
+    "National Institute of Technology Hamirpur": 97,
+    "National Institute of Technology Puducherry": 99,
+    "National Institute of Technology Agartala": 101,
+    "National Institute of Technology Arunachal Pradesh": 102,
+    "National Institute of Technology Goa": 103,
+    "National Institute of Technology, Mizoram": 104,
+    "National Institute of Technology Nagaland": 105,
+    "National Institute of Technology, Manipur": 151,
+    "National Institute of Technology Sikkim": 152,
+    "National Institute of Technology, Uttarakhand": 153,
+    "National Institute of Technology, Andhra Pradesh": 201
+}
+
+# States of the NITs rank_data.csv does not list under their cutoff name
+INSTITUTE_STATES = {
+    "Motilal Nehru National Institute of Technology Allahabad": "Uttar Pradesh",
+    "National Institute of Technology, Andhra Pradesh": "Andhra Pradesh",
+}
+
+def create_nit_table(institute_names: Iterable[str], rank_df: Optional[pd.DataFrame] = None) -> Tuple[pd.DataFrame, Dict[str, int]]:
+    """Create NIT master table from the (normalized) cutoff institute names."""
+    nit_records = []
+    for inst_name in sorted(set(institute_names)):
+        # Filter for NITs
+        if "National Institute of Technology" not in inst_name and "NIT" not in inst_name:
+            continue
+        parts = inst_name.replace(",", "").split()
+        location = parts[-1] if parts else "India"
+        
+        # Mapping keys must match the normalized name exactly; 0 when unranked
+        nit_records.append({
+            'name': inst_name,
+            'location': location,
+            'nirf_rank': NIRF_RANK_MAPPING.get(inst_name, 0)
+        })
+            
+    nit_table = pd.DataFrame(nit_records)
+    nit_table.insert(2, 'state', institute_states(nit_table['name'], rank_df, INSTITUTE_STATES))
+    nit_table['location'] = [location_label(city, state) for city, state in zip(nit_table['location'], nit_table['state'])]
+    nit_table = nit_table.sort_values('nirf_rank') # Sort by rank for Nicer CSV
+    nit_table['nit_id'] = range(1, len(nit_table) + 1)
+    
+    return nit_table, dict(zip(nit_table['name'], nit_table['nit_id']))
+
+
+FAMILY = FamilyConfig(
+    key="nit",
+    label="NIT",
+    data_dir=NIT_DATA_DIR,
+    round_glob="josaa_round*_nit_results.csv",
+    round_files={1: "National_Institute_of_Technology.csv"},
+    id_column="nit_id",
+    normalize_name=normalize_institute_name,
+    extract_branch=extract_branch_info,
+    derive_category=derive_category,
+    create_institute_table=create_nit_table,
+    uses_rank_data=True,
+    institute_csv="nit.csv",
+    branch_csv="nit_branch.csv",
+    cutoff_csv="nit_cutoff.csv",
+    institute_aliases=INSTITUTE_ALIASES,
+    branch_abbreviations=BRANCH_ABBREVIATIONS,
+)
@@ -0,0 +1,126 @@
+"""
+Year-over-year cutoff projections for the upcoming counseling year.
+
+A series is one (institute, branch, category, seat pool, quota) of a
+family's cutoff table. Its level in a year is the largest closing rank of the year's last
+round. Every series gets a least-squares line through log(level) over the
+years it has data for, computed for all series at once with bincount
+sums; the line's one-year step is the series' projection factor:
+
+    factor = exp(slope), clipped to [MIN_FACTOR, MAX_FACTOR]
+
+A series seen in a single year keeps factor 1. The projected table is
+every row of the latest year, with year = latest + 1 and its opening
+and closing ranks scaled by its series' factor (at least 1); cutoff_id
+stays the id of the row it was projected from. It is written as its own
+cutoff CSV under normalized_data/projected/ and into the family's
+columnar bundle.
+
+All steps take the cutoff table as an iterable of chunks, so the
+streaming path (see streaming.py) can project without loading it whole.
+"""
+
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .common import FamilyConfig
+
+PROJECTED_DIR = "projected"
+MIN_FACTOR = 0.5
+MAX_FACTOR = 2.0
+
+
+def projected_csv(config: FamilyConfig) -> str:
+    """Path of the family's projected cutoff CSV, relative to the output directory."""
+    return f"{PROJECTED_DIR}/{config.cutoff_csv}"
+
+
+def series_keys(config: FamilyConfig) -> List[str]:
+    columns = config.output_columns()
+    return [config.id_column, 'branch_id', 'category', 'gender', 'pwd'] + (['quota'] if 'quota' in columns else [])
+
+
+def _final_round_levels(frame: pd.DataFrame, keys: List[str]) -> pd.DataFrame:
+    """(keys, year) -> last round and the largest `level` in it."""
+    group = keys + ['year']
+    last = frame.groupby(group, dropna=False, observed=True)['round'].transform('max')
+    final = frame[frame['round'] == last]
+    return final.groupby(group, dropna=False, observed=True, as_index=False).agg(
+        round=('round', 'max'), level=('level', 'max')
+    )
+
+
+def series_levels(config: FamilyConfig, chunks: Iterable[pd.DataFrame]) -> pd.DataFrame:
+    """Level of every series in every year, folded chunk by chunk."""
+    keys = series_keys(config)
+    levels = None
+    for chunk in chunks:
+        partial = _final_round_levels(
+            chunk[keys + ['year', 'round', 'closing_rank']].rename(columns={'closing_rank': 'level'}), keys
+        )
+        levels = partial if levels is None else _final_round_levels(pd.concat([levels, partial]), keys)
+    if levels is None:
+        return pd.DataFrame(columns=keys + ['year', 'round', 'level'])
+    return levels
+
+
+def projection_factors(config: FamilyConfig, levels: pd.DataFrame) -> pd.DataFrame:
+    """One row per series: its keys, the number of years with data and the projection factor."""
+    keys = series_keys(config)
+    codes = levels.groupby(keys, dropna=False, observed=True, sort=False).ngroup().to_numpy()
+    if not len(codes):
+        return pd.DataFrame(columns=keys + ['years', 'factor'])
+    # Centered years keep the normal equations well conditioned
+    x = levels['year'].to_numpy(np.float64) - float(levels['year'].max())
+    y = np.log(levels['level'].to_numpy(np.float64))
+    n = np.bincount(codes).astype(np.float64)
+    sum_x, sum_y = np.bincount(codes, x), np.bincount(codes, y)
+    sum_xx, sum_xy = np.bincount(codes, x * x), np.bincount(codes, x * y)
+    denominator = n * sum_xx - sum_x ** 2
+    slope = np.divide(n * sum_xy - sum_x * sum_y, denominator,
+                      out=np.zeros_like(denominator), where=denominator > 0)
+
+    first = np.unique(codes, return_index=True)[1]
+    factors = levels.iloc[first][keys].reset_index(drop=True)
+    factors['years'] = n.astype(np.int64)
+    factors['factor'] = np.clip(np.exp(slope), MIN_FACTOR, MAX_FACTOR)
+    return factors
+
+
+def latest_year(levels: pd.DataFrame) -> Optional[int]:
+    return int(levels['year'].max()) if len(levels) else None
+
+
+def project_chunk(config: FamilyConfig, chunk: pd.DataFrame, factors: pd.DataFrame, year: int) -> pd.DataFrame:
+    """Projected rows for the chunk's rows of `year`, labelled year + 1."""
+    rows = chunk[chunk['year'] == year]
+    factor = rows[series_keys(config)].merge(
+        factors[series_keys(config) + ['factor']], on=series_keys(config), how='left'
+    )['factor'].fillna(1.0).to_numpy()
+    projected = rows.copy()
+    projected['year'] = year + 1
+    projected['closing_rank'] = np.maximum(
+        np.rint(rows['closing_rank'].to_numpy(np.float64) * factor), 1
+    ).astype(np.int64)
+    opening = rows['opening_rank'].astype('Float64').to_numpy(np.float64, na_value=np.nan)
+    projected['opening_rank'] = pd.array(np.maximum(np.rint(opening * factor), 1)).astype('Int64')
+    return projected[config.output_columns()]
+
+
+def project_table(config: FamilyConfig, cutoffs: pd.DataFrame) -> pd.DataFrame:
+    """Projected table of an in-memory cutoff table (empty if it has no rows)."""
+    levels = series_levels(config, [cutoffs])
+    year = latest_year(levels)
+    if year is None:
+        return cutoffs.iloc[:0][config.output_columns()]
+    return project_chunk(config, cutoffs, projection_factors(config, levels), year)
+
+
+def write_projected(config: FamilyConfig, output_dir: str, projected: pd.DataFrame) -> Path:
+    path = Path(output_dir) / projected_csv(config)
+    path.parent.mkdir(exist_ok=True)
+    projected.to_csv(path, index=False)
+    return path
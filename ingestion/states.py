@@ -0,0 +1,64 @@
+"""
+State of each institute, for home-state (HS/OS) quota eligibility.
+
+rank_data.csv gives the State of the ranked institutes; a cutoff name
+matches a rank row when its alias key equals the key of the row's
+Institute, alone or followed by its City. Institutes it does not list (or
+lists under another spelling) come from the family's explicit
+`institute_states`, which takes precedence. State names are canonicalized
+with STATE_ALIASES so every family and the backend spell them the same.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from .entities import alias_key
+
+STATE_ALIASES = {
+    "Pondicherry": "Puducherry",
+    "Orissa": "Odisha",
+    "Jammu & Kashmir": "Jammu and Kashmir",
+    "NCT of Delhi": "Delhi",
+}
+
+
+def canonical_state(state) -> Optional[str]:
+    if state is None or pd.isna(state) or not str(state).strip():
+        return None
+    state = str(state).strip()
+    return STATE_ALIASES.get(state, state)
+
+
+def rank_data_states(rank_df: Optional[pd.DataFrame]) -> Dict[str, str]:
+    """Alias key of each rank_data.csv Institute (and Institute + City) -> its state; the first row wins."""
+    states: Dict[str, str] = {}
+    if rank_df is None:
+        return states
+    for institute, city, state in zip(rank_df['Institute'], rank_df['City'], rank_df['State']):
+        state = canonical_state(state)
+        if state is None:
+            continue
+        states.setdefault(alias_key(institute), state)
+        if not pd.isna(city):
+            states.setdefault(alias_key(f"{institute} {city}"), state)
+    return states
+
+
+def institute_states(names: Iterable[str], rank_df: Optional[pd.DataFrame],
+                     explicit: Dict[str, str]) -> List[Optional[str]]:
+    """State of each institute name (None when unknown)."""
+    ranked = rank_data_states(rank_df)
+    return [canonical_state(explicit.get(name)) or ranked.get(alias_key(name)) for name in names]
+
+
+def location_label(city: Optional[str], state: Optional[str]) -> str:
+    """
+    Display location: "City, State"; the state alone if the city is
+    unknown or part of its name; the city alone (or "India") without a state.
+    """
+    if not state:
+        return city or "India"
+    if not city or city in state:
+        return state
+    return f"{city}, {state}"
@@ -0,0 +1,150 @@
+"""
+Streaming ingestion: rebuild a family from its raw round files in
+fixed-size chunks, so peak memory is bounded by the chunk size and the
+(small) dimension tables rather than by the total number of rows.
+
+    dimensions   read only the Institute / Academic Program columns, chunk
+                 by chunk, and build the institute and branch tables
+    normalize    parse_round on each chunk of each round file
+    map ids      create_cutoff_table on the chunk; cutoff_ids continue
+                 from the previous chunk
+    emit         append the chunk to the cutoff CSV and the columnar bundle
+    project      reread the cutoff CSV in chunks, twice: fold the series
+                 levels, then write the projected rows (see projections.py)
+
+The output is identical to a batch rebuild (engine.build_and_write). Each
+stage's peak traced memory (tracemalloc) is recorded across all chunks.
+"""
+
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from .common import NULLABLE_COLUMNS, FamilyConfig, create_branch_table, create_cutoff_table, parse_round
+from .columnar import BundleWriter
+from .manifest import family_entry
+from .projections import latest_year, project_chunk, projected_csv, projection_factors, series_levels
+
+CHUNK_ROWS = 5000
+STAGES = ("dimensions", "normalize", "map ids", "emit", "project")
+
+
+class StageMemory:
+    """Peak traced memory (bytes) per stage, over every time the stage ran."""
+
+    def __init__(self):
+        self.peaks: Dict[str, int] = {stage: 0 for stage in STAGES}
+        self._started = not tracemalloc.is_tracing()
+        if self._started:
+            tracemalloc.start()
+
+    def measure(self, stage: str, fn, *args):
+        tracemalloc.reset_peak()
+        result = fn(*args)
+        self.peaks[stage] = max(self.peaks[stage], tracemalloc.get_traced_memory()[1])
+        return result
+
+    def stop(self) -> Dict[str, int]:
+        if self._started:
+            tracemalloc.stop()
+        return self.peaks
+
+
+def read_chunks(path: Path, chunk_rows: int, columns: Optional[List[str]] = None):
+    # Every column as text: type inference per chunk could otherwise differ between chunks
+    return pd.read_csv(path, chunksize=chunk_rows, usecols=columns, dtype=str)
+
+
+def read_output_chunks(path: Path, chunk_rows: int):
+    """Chunks of an output CSV; only empty cells are missing, as in engine.read_output."""
+    return pd.read_csv(path, chunksize=chunk_rows, keep_default_na=False, na_values=[''], dtype=NULLABLE_COLUMNS)
+
+
+def collect_dimensions(config: FamilyConfig, paths: List[Path], chunk_rows: int) -> Tuple[List[str], set]:
+    """Normalized institute names (first-seen order, as in a batch rebuild) and distinct programs."""
+    names: Dict[str, None] = {}
+    programs = set()
+    for path in paths:
+        for chunk in read_chunks(path, chunk_rows, ['Institute', 'Academic Program']):
+            for raw_name in chunk['Institute'].dropna().unique():
+                name = config.normalize_name(raw_name)
+                if name is not None and not pd.isna(name):
+                    names.setdefault(name, None)
+            programs.update(chunk['Academic Program'].dropna().unique())
+    return list(names), programs
+
+
+def stream_family(config: FamilyConfig, inputs: List[dict], output_dir: str, rank_df: Optional[pd.DataFrame] = None,
+                  chunk_rows: int = CHUNK_ROWS) -> Tuple[Dict[str, int], dict, Dict[str, int]]:
+    """Rebuild one family chunk by chunk; returns row counts, its manifest entry and per-stage peak memory."""
+    memory = StageMemory()
+    try:
+        names, programs = memory.measure(
+            "dimensions", collect_dimensions, config, [Path(entry['file']) for entry in inputs], chunk_rows
+        )
+        institutes, institute_mapping = config.create_institute_table(names, rank_df)
+        branches, branch_mapping = create_branch_table(config, programs)
+        institutes.to_csv(Path(output_dir) / config.institute_csv, index=False)
+        branches.to_csv(Path(output_dir) / config.branch_csv, index=False)
+
+        cutoff_path = Path(output_dir) / config.cutoff_csv
+        bundle = BundleWriter(config, output_dir)
+        next_cutoff_id = 1
+        chunks = 0
+        ranges = {}
+        with open(cutoff_path, 'w', encoding='utf-8', newline='') as out:
+            pd.DataFrame(columns=config.output_columns()).to_csv(out, index=False)
+            for entry in inputs:
+                first_id = next_cutoff_id
+                for raw in read_chunks(Path(entry['file']), chunk_rows):
+                    parsed = memory.measure("normalize", parse_round, config, raw, entry['round'], entry['year'])
+                    del raw
+                    table = memory.measure(
+                        "map ids", create_cutoff_table, config, parsed, institute_mapping, branch_mapping
+                    )
+                    del parsed
+                    table['cutoff_id'] = range(next_cutoff_id, next_cutoff_id + len(table))
+                    next_cutoff_id += len(table)
+                    memory.measure("emit", emit_chunk, out, bundle, table)
+                    chunks += 1
+                ranges[entry['file']] = [first_id, next_cutoff_id - 1] if next_cutoff_id > first_id else None
+        projected_year = memory.measure("project", project_family, config, output_dir, bundle, chunk_rows)
+        bundle.close(institutes, branches, projected_year)
+    finally:
+        peaks = memory.stop()
+
+    counts = {
+        'institutes': len(institutes), 'branches': len(branches), 'cutoffs': next_cutoff_id - 1, 'chunks': chunks,
+    }
+    return counts, family_entry(inputs, ranges, next_cutoff_id), peaks
+
+
+def project_family(config: FamilyConfig, output_dir: str, bundle: BundleWriter, chunk_rows: int) -> Optional[int]:
+    """Write the projected table from the finished cutoff CSV; returns the projected year."""
+    cutoff_path = Path(output_dir) / config.cutoff_csv
+    levels = series_levels(config, read_output_chunks(cutoff_path, chunk_rows))
+    year = latest_year(levels)
+    factors = projection_factors(config, levels)
+    projected_path = Path(output_dir) / projected_csv(config)
+    projected_path.parent.mkdir(exist_ok=True)
+    with open(projected_path, 'w', encoding='utf-8', newline='') as out:
+        pd.DataFrame(columns=config.output_columns()).to_csv(out, index=False)
+        if year is None:
+            return None
+        for chunk in read_output_chunks(cutoff_path, chunk_rows):
+            emit_chunk(out, bundle, project_chunk(config, chunk, factors, year), projected=True)
+    return year + 1
+
+
+def emit_chunk(out, bundle: BundleWriter, table: pd.DataFrame, projected: bool = False) -> None:
+    table.to_csv(out, index=False, header=False)
+    if projected:
+        bundle.append_projected(table)
+    else:
+        bundle.append_cutoffs(table)
+
+
+def format_peaks(peaks: Dict[str, int]) -> str:
+    return ", ".join(f"{stage} {peak / 2 ** 20:.1f} MiB" for stage, peak in peaks.items())
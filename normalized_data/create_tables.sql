@@ -1,4 +1,4 @@
--- SQL Script to Create Tables for NIT, IIIT, and CFI (GFTI) Data
+-- SQL Script to Create Tables for NIT, IIIT, CFI (GFTI) and IIT Data
 -- Run this in your Supabase SQL Editor before uploading CSV files.
 
 -- ==========================================
@@ -10,6 +10,7 @@ CREATE TABLE IF NOT EXISTS nits (
     nit_id INTEGER PRIMARY KEY,
     name TEXT NOT NULL,
     location TEXT,
+    state TEXT,
     nirf_rank INTEGER
 );
 
@@ -28,6 +29,9 @@ CREATE TABLE IF NOT EXISTS nit_cutoffs (
     branch_id INTEGER NOT NULL REFERENCES nit_branches(branch_id),
     year INTEGER NOT NULL,
     category TEXT NOT NULL,
+    gender TEXT NOT NULL DEFAULT 'Gender-Neutral',
+    pwd BOOLEAN NOT NULL DEFAULT FALSE,
+    opening_rank INTEGER,
     closing_rank INTEGER NOT NULL,
     round INTEGER NOT NULL,
     quota TEXT
@@ -47,6 +51,7 @@ CREATE TABLE IF NOT EXISTS iiits (
     iiit_id INTEGER PRIMARY KEY,
     name TEXT NOT NULL,
     location TEXT,
+    state TEXT,
     nirf_rank INTEGER
 );
 
@@ -65,6 +70,9 @@ CREATE TABLE IF NOT EXISTS iiit_cutoffs (
     branch_id INTEGER NOT NULL REFERENCES iiit_branches(branch_id),
     year INTEGER NOT NULL,
     category TEXT NOT NULL,
+    gender TEXT NOT NULL DEFAULT 'Gender-Neutral',
+    pwd BOOLEAN NOT NULL DEFAULT FALSE,
+    opening_rank INTEGER,
     closing_rank INTEGER NOT NULL,
     round INTEGER NOT NULL,
     quota TEXT
@@ -82,6 +90,7 @@ CREATE TABLE IF NOT EXISTS cfis (
     cfi_id INTEGER PRIMARY KEY,
     name TEXT NOT NULL,
     location TEXT,
+    state TEXT,
     nirf_rank INTEGER
 );
 
@@ -100,6 +109,9 @@ CREATE TABLE IF NOT EXISTS cfi_cutoffs (
     branch_id INTEGER NOT NULL REFERENCES cfi_branches(branch_id),
     year INTEGER NOT NULL,
     category TEXT NOT NULL,
+    gender TEXT NOT NULL DEFAULT 'Gender-Neutral',
+    pwd BOOLEAN NOT NULL DEFAULT FALSE,
+    opening_rank INTEGER,
     closing_rank INTEGER NOT NULL,
     round INTEGER NOT NULL,
     quota TEXT
@@ -107,3 +119,42 @@ CREATE TABLE IF NOT EXISTS cfi_cutoffs (
 
 CREATE INDEX IF NOT EXISTS idx_cfi_cutoffs_cfi_id ON cfi_cutoffs(cfi_id);
 CREATE INDEX IF NOT EXISTS idx_cfi_cutoffs_branch_id ON cfi_cutoffs(branch_id);
+
+-- ==========================================
+-- 4. IIT (JEE Advanced) Tables
+-- ==========================================
+
+-- Table: iits
+CREATE TABLE IF NOT EXISTS iits (
+    iit_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    location TEXT,
+    state TEXT,
+    nirf_rank INTEGER
+);
+
+-- Table: branches
+CREATE TABLE IF NOT EXISTS branches (
+    branch_id INTEGER PRIMARY KEY,
+    branch_name TEXT NOT NULL,
+    short_name TEXT,
+    degree_type TEXT
+);
+
+-- Table: cutoffs
+CREATE TABLE IF NOT EXISTS cutoffs (
+    cutoff_id INTEGER PRIMARY KEY,
+    iit_id INTEGER NOT NULL REFERENCES iits(iit_id),
+    branch_id INTEGER NOT NULL REFERENCES branches(branch_id),
+    year INTEGER NOT NULL,
+    category TEXT NOT NULL,
+    gender TEXT NOT NULL DEFAULT 'Gender-Neutral',
+    pwd BOOLEAN NOT NULL DEFAULT FALSE,
+    opening_rank INTEGER,
+    closing_rank INTEGER NOT NULL,
+    round INTEGER NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_cutoffs_iit_id ON cutoffs(iit_id);
+CREATE INDEX IF NOT EXISTS idx_cutoffs_branch_id ON cutoffs(branch_id);
+CREATE INDEX IF NOT EXISTS idx_cutoffs_category ON cutoffs(category);
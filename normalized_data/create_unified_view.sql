@@ -8,6 +8,7 @@ SELECT
     nit_id as id, 
     name, 
     location, 
+    state, 
     nirf_rank, 
     'NIT' as institute_type 
 FROM nits
@@ -16,6 +17,7 @@ SELECT
     iiit_id as id, 
     name, 
     location, 
+    state, 
     nirf_rank, 
     'IIIT' as institute_type 
 FROM iiits
@@ -24,6 +26,7 @@ SELECT
     cfi_id as id, 
     name, 
     location, 
+    state, 
     nirf_rank, 
     'GFTI' as institute_type 
 FROM cfis;
@@ -45,11 +48,17 @@ SELECT
     c.cutoff_id,
     c.nit_id as institute_id,
     i.name as institute_name,
+    i.state as institute_state,
+    i.location as institute_location,
+    i.nirf_rank,
     'NIT' as institute_type,
     c.branch_id,
     b.branch_name,
     c.year,
     c.category,
+    c.gender,
+    c.pwd,
+    c.opening_rank,
     c.closing_rank,
     c.round,
     c.quota
@@ -63,11 +72,17 @@ SELECT
     c.cutoff_id,
     c.iiit_id as institute_id,
     i.name as institute_name,
+    i.state as institute_state,
+    i.location as institute_location,
+    i.nirf_rank,
     'IIIT' as institute_type,
     c.branch_id,
     b.branch_name,
     c.year,
     c.category,
+    c.gender,
+    c.pwd,
+    c.opening_rank,
     c.closing_rank,
     c.round,
     c.quota
@@ -81,11 +96,17 @@ SELECT
     c.cutoff_id,
     c.cfi_id as institute_id,
     i.name as institute_name,
+    i.state as institute_state,
+    i.location as institute_location,
+    i.nirf_rank,
     'GFTI' as institute_type,
     c.branch_id,
     b.branch_name,
     c.year,
     c.category,
+    c.gender,
+    c.pwd,
+    c.opening_rank,
     c.closing_rank,
     c.round,
     c.quota
@@ -1,1116 +0,0 @@
-INSERT INTO cfis (cfi_id, name, location) VALUES
-(1, 'School of Planning & Architecture, New Delhi', 'India'),
-(2, 'School of Planning & Architecture, Bhopal', 'India'),
-(3, 'School of Planning & Architecture: Vijayawada', 'India'),
-(4, 'Birla Institute of Technology, Mesra, Ranchi', 'India'),
-(5, 'University of Hyderabad', 'India'),
-(6, 'Sant Longowal Institute of Engineering and Technology', 'India'),
-(7, 'National Institute of Food Technology Entrepreneurship and Management, Kundli', 'India'),
-(8, 'National Institute of Food Technology Entrepreneurship and Management, Thanjavur', 'India'),
-(9, 'Punjab Engineering College, Chandigarh', 'India'),
-(10, 'Islamic University of Science and Technology Kashmir', 'India'),
-(11, 'North Eastern Regional Institute of Science and Technology, Nirjuli-791109 (Itanagar),Arunachal Pradesh', 'India'),
-(12, 'School of Engineering, Tezpur University, Napaam, Tezpur', 'India'),
-(13, 'School of Studies of Engineering and Technology, Guru Ghasidas Vishwavidyalaya, Bilaspur', 'India'),
-(14, 'Shri Mata Vaishno Devi University, Katra, Jammu & Kashmir', 'India'),
-(15, 'International Institute of Information Technology, Bhubaneswar', 'India'),
-(16, 'International Institute of Information Technology, Naya Raipur', 'India'),
-(17, 'Jawaharlal Nehru University, Delhi', 'India'),
-(18, 'National Institute of Advanced Manufacturing Technology, Ranchi', 'India'),
-(19, 'Assam University, Silchar', 'India'),
-(20, 'Birla Institute of Technology, Deoghar Off-Campus', 'India'),
-(21, 'Birla Institute of Technology, Patna Off-Campus', 'India'),
-(22, 'CU Jharkhand', 'India'),
-(23, 'Central University of Haryana', 'India'),
-(24, 'Central University of Jammu', 'India'),
-(25, 'Central University of Rajasthan, Rajasthan', 'India'),
-(26, 'Central institute of Technology Kokrajar, Assam', 'India'),
-(27, 'Chhattisgarh Swami Vivekanada Technical University, Bhilai (CSVTU Bhilai)', 'India'),
-(28, 'Gati Shakti Vishwavidyalaya, Vadodara', 'India'),
-(29, 'Ghani Khan Choudhary Institute of Engineering and Technology, Malda, West Bengal', 'India'),
-(30, 'Gurukula Kangri Vishwavidyalaya, Haridwar', 'India'),
-(31, 'Indian Institute of Carpet Technology, Bhadohi', 'India'),
-(32, 'Indian Institute of Handloom Technology(IIHT), Varanasi', 'India'),
-(33, 'Indian Institute of Handloom Technology, Salem', 'India'),
-(34, 'Institute of Chemical Technology, Mumbai: Indian Oil Odisha Campus, Bhubaneswar', 'India'),
-(35, 'Institute of Engineering and Technology, Dr. H. S. Gour University. Sagar (A Central University)', 'India'),
-(36, 'Institute of Infrastructure, Technology, Research and Management-Ahmedabad', 'India'),
-(37, 'J.K. Institute of Applied Physics & Technology, Department of Electronics & Communication, University of Allahabad- Allahabad', 'India'),
-(38, 'Mizoram University, Aizawl', 'India'),
-(39, 'National Institute of Electronics and Information Technology, Ajmer (Rajasthan)', 'India'),
-(40, 'National Institute of Electronics and Information Technology, Aurangabad (Maharashtra)', 'India'),
-(41, 'National Institute of Electronics and Information Technology, Gorakhpur (UP)', 'India'),
-(42, 'National Institute of Electronics and Information Technology, Patna (Bihar)', 'India'),
-(43, 'National Institute of Electronics and Information Technology, Ropar (Punjab)', 'India'),
-(44, 'North-Eastern Hill University, Shillong', 'India'),
-(45, 'Puducherry Technological University, Puducherry', 'India'),
-(46, 'Rajiv Gandhi National Aviation University, Fursatganj, Amethi (UP)', 'India'),
-(47, 'Shri G. S. Institute of Technology and Science Indore', 'India');
-
-INSERT INTO cfi_branches (branch_id, branch_name, short_name, degree_type) VALUES
-(1, 'Aeronautical Engineering', 'AER', 'B.Tech'),
-(2, 'Aerospace Engineering', 'AER', 'B.Tech'),
-(3, 'Agricultural Engineering', 'AGR', 'B.Tech'),
-(4, 'Animation and VFX', 'ANI', 'B.Tech'),
-(5, 'Architecture', 'ARC', 'B.Tech'),
-(6, 'Artificial Intelligence and Data Science', 'ART', 'B.Tech'),
-(7, 'Artificial Intelligence and Machine Learning', 'ART', 'B.Tech'),
-(8, 'B. Tech in Electronics and Communication Engineering with minor in Wearable Electronics', 'B. ', 'B.Tech'),
-(9, 'B.Tech in Artificial Intelligenece and Data Science', 'B.T', 'B.Tech'),
-(10, 'B.Tech in Aviation Engineering', 'B.T', 'B.Tech'),
-(11, 'B.Tech in CSE', 'B.T', 'B.Tech'),
-(12, 'B.Tech in Civil Engineering', 'B.T', 'B.Tech'),
-(13, 'B.Tech in Electrical Engineering', 'B.T', 'B.Tech'),
-(14, 'B.Tech in Electronics & Communication Engineering', 'B.T', 'B.Tech'),
-(15, 'B.Tech in Mathematics and Computing', 'B.T', 'B.Tech'),
-(16, 'B.Tech in Mechanical Engineering', 'B.T', 'B.Tech'),
-(17, 'B.Tech.', 'B.T', 'B.Tech'),
-(18, 'Bachelor of Design', 'BAC', 'B.Tech'),
-(19, 'Bio Medical Engineering', 'BIO', 'B.Tech'),
-(20, 'Bio Technology', 'BIO', 'B.Tech'),
-(21, 'Biomedical Engineering', 'BIO', 'B.Tech'),
-(22, 'Carpet and Textile Technology', 'CAR', 'B.Tech'),
-(23, 'Chemical Engineering', 'CHE', 'B.Tech'),
-(24, 'Chemistry', 'CHE', 'B.Tech'),
-(25, 'Civil Engineering', 'CIV', 'B.Tech'),
-(26, 'Civil and Environmental Engineering', 'CIV', 'B.Tech'),
-(27, 'Computer Engineering', 'COM', 'B.Tech'),
-(28, 'Computer Science Engineering', 'COM', 'B.Tech'),
-(29, 'Computer Science and Engineering', 'COM', 'B.Tech'),
-(30, 'Computer Science and Engineering with Major in Artificial Intelligence', 'COM', 'B.Tech'),
-(31, 'Computer Science and Engineering with minor in AI and ML', 'COM', 'B.Tech'),
-(32, 'Computer Science and Engineering with specialization in Cyber Security', 'COM', 'B.Tech'),
-(33, 'Dairy Engineering', 'DAI', 'B.Tech'),
-(34, 'Data Science and Artificial Intelligence', 'DAT', 'B.Tech'),
-(35, 'Electrical Engineering', 'ELE', 'B.Tech'),
-(36, 'Electrical and Electronics Engineering', 'ELE', 'B.Tech'),
-(37, 'Electronic Engineering', 'ELE', 'B.Tech'),
-(38, 'Electronics Engineering', 'ELE', 'B.Tech'),
-(39, 'Electronics and Communication Engineering', 'ELE', 'B.Tech'),
-(40, 'Electronics and Instrumentation Engineering', 'ELE', 'B.Tech'),
-(41, 'Electronics and Telecommunication Engineering', 'ELE', 'B.Tech'),
-(42, 'Energy Engineering', 'ENE', 'B.Tech'),
-(43, 'Fashion and Apparel Engineering', 'FAS', 'B.Tech'),
-(44, 'Food Engineering and Technology', 'FOO', 'B.Tech'),
-(45, 'Food Technology', 'FOO', 'B.Tech'),
-(46, 'Food Technology and Management', 'FOO', 'B.Tech'),
-(47, 'Handloom and Textile Technology', 'HAN', 'B.Tech'),
-(48, 'Industrial and Production Engineering', 'IND', 'B.Tech'),
-(49, 'Information Technology', 'INF', 'B.Tech'),
-(50, 'Instrumentation Engineering', 'INS', 'B.Tech'),
-(51, 'Instrumentation and Control Engineering', 'INS', 'B.Tech'),
-(52, 'Materials Engineering', 'MAT', 'B.Tech'),
-(53, 'Mathematics', 'MAT', 'B.Tech'),
-(54, 'Mathematics and Computing', 'MAT', 'B.Tech'),
-(55, 'Mechanical Engineering', 'MEC', 'B.Tech'),
-(56, 'Mechatronics Engineering', 'MEC', 'B.Tech'),
-(57, 'Metallurgical and Materials Engineering', 'MET', 'B.Tech'),
-(58, 'Metallurgy and Materials Engineering', 'MET', 'B.Tech'),
-(59, 'Physics', 'PHY', 'B.Tech'),
-(60, 'Planning', 'PLA', 'B.Tech'),
-(61, 'Printing and Packaging Technology', 'PRI', 'B.Tech'),
-(62, 'Production and Industrial Engineering', 'PRO', 'B.Tech'),
-(63, 'Quantitative Economics & Data Science', 'QUA', 'B.Tech'),
-(64, 'Robotics and AI', 'ROB', 'B.Tech');
-
-INSERT INTO cfi_cutoffs (cutoff_id, cfi_id, branch_id, closing_rank, round, quota) VALUES
-(1, 19, 3, 66923, 1, 'AI'),
-(2, 19, 3, 68243, 1, 'AI'),
-(3, 19, 3, 1032, 1, 'AI'),
-(4, 19, 3, 10958, 1, 'AI'),
-(5, 19, 3, 23389, 1, 'AI'),
-(6, 19, 3, 24871, 1, 'AI'),
-(7, 19, 3, 12119, 1, 'AI'),
-(8, 19, 3, 4635, 1, 'AI'),
-(9, 19, 3, 141227, 1, 'HS'),
-(10, 19, 3, 129629, 1, 'HS'),
-(11, 19, 3, 23746, 1, 'HS'),
-(12, 19, 3, 69612, 1, 'HS'),
-(13, 19, 3, 70635, 1, 'HS'),
-(14, 19, 3, 21582, 1, 'HS'),
-(15, 19, 3, 14181, 1, 'HS'),
-(16, 19, 3, 6618, 1, 'HS'),
-(17, 19, 29, 45009, 1, 'AI'),
-(18, 19, 29, 44196, 1, 'AI'),
-(19, 19, 29, 1027, 1, 'AI'),
-(20, 19, 29, 7753, 1, 'AI'),
-(21, 19, 29, 17023, 1, 'AI'),
-(22, 19, 29, 16458, 1, 'AI'),
-(23, 19, 29, 8992, 1, 'AI'),
-(24, 19, 29, 3944, 1, 'AI'),
-(25, 19, 29, 84087, 1, 'HS'),
-(26, 19, 29, 58413, 1, 'HS'),
-(27, 19, 29, 3099, 1, 'HS'),
-(28, 19, 29, 14070, 1, 'HS'),
-(29, 19, 29, 46885, 1, 'HS'),
-(30, 19, 29, 65659, 1, 'HS'),
-(31, 19, 29, 13347, 1, 'HS'),
-(32, 19, 29, 11992, 1, 'HS'),
-(33, 19, 29, 4841, 1, 'HS'),
-(34, 19, 39, 50710, 1, 'AI'),
-(35, 19, 39, 57126, 1, 'AI'),
-(36, 19, 39, 2475, 1, 'AI'),
-(37, 19, 39, 8126, 1, 'AI'),
-(38, 19, 39, 17790, 1, 'AI'),
-(39, 19, 39, 17591, 1, 'AI'),
-(40, 19, 39, 9425, 1, 'AI'),
-(41, 19, 39, 3962, 1, 'AI'),
-(42, 19, 39, 92405, 1, 'HS'),
-(43, 19, 39, 89120, 1, 'HS'),
-(44, 19, 39, 3211, 1, 'HS'),
-(45, 19, 39, 17225, 1, 'HS'),
-(46, 19, 39, 54835, 1, 'HS'),
-(47, 19, 39, 70503, 1, 'HS'),
-(48, 19, 39, 14268, 1, 'HS'),
-(49, 19, 39, 13772, 1, 'HS'),
-(50, 19, 39, 5877, 1, 'HS'),
-(51, 4, 5, 648, 1, 'AI'),
-(52, 4, 5, 265, 1, 'AI'),
-(53, 4, 5, 438, 1, 'AI'),
-(54, 4, 5, 206, 1, 'AI'),
-(55, 4, 5, 56, 1, 'AI'),
-(56, 4, 5, 1527, 1, 'HS'),
-(57, 4, 5, 1169, 1, 'HS'),
-(58, 4, 5, 1292, 1, 'HS'),
-(59, 4, 5, 285, 1, 'HS'),
-(60, 4, 7, 18212, 1, 'AI'),
-(61, 4, 7, 28439, 1, 'AI'),
-(62, 4, 7, 567, 1, 'AI'),
-(63, 4, 7, 3258, 1, 'AI'),
-(64, 4, 7, 8080, 1, 'AI'),
-(65, 4, 7, 578, 1, 'AI'),
-(66, 4, 7, 5686, 1, 'AI'),
-(67, 4, 7, 2984, 1, 'AI'),
-(68, 4, 7, 34355, 1, 'HS'),
-(69, 4, 7, 47214, 1, 'HS'),
-(70, 4, 7, 1058, 1, 'HS'),
-(71, 4, 7, 6743, 1, 'HS'),
-(72, 4, 7, 10115, 1, 'HS'),
-(73, 4, 7, 7998, 1, 'HS'),
-(74, 4, 20, 46939, 1, 'AI'),
-(75, 4, 20, 39577, 1, 'AI'),
-(76, 4, 20, 2889, 1, 'AI'),
-(77, 4, 20, 8391, 1, 'AI'),
-(78, 4, 20, 15947, 1, 'AI'),
-(79, 4, 20, 9657, 1, 'AI'),
-(80, 4, 20, 4899, 1, 'AI'),
-(81, 4, 20, 84818, 1, 'HS'),
-(82, 4, 20, 55797, 1, 'HS'),
-(83, 4, 20, 15011, 1, 'HS'),
-(84, 4, 20, 21755, 1, 'HS'),
-(85, 4, 20, 19837, 1, 'HS'),
-(86, 4, 23, 47248, 1, 'AI'),
-(87, 4, 23, 49373, 1, 'AI'),
-(88, 4, 23, 2083, 1, 'AI'),
-(89, 4, 23, 7620, 1, 'AI'),
-(90, 4, 23, 17577, 1, 'AI'),
-(91, 4, 23, 1294, 1, 'AI'),
-(92, 4, 23, 9729, 1, 'AI'),
-(93, 4, 23, 5123, 1, 'AI'),
-(94, 4, 23, 77379, 1, 'HS'),
-(95, 4, 23, 84314, 1, 'HS'),
-(96, 4, 23, 2582, 1, 'HS'),
-(97, 4, 23, 14693, 1, 'HS'),
-(98, 4, 23, 18718, 1, 'HS'),
-(99, 4, 23, 18271, 1, 'HS'),
-(100, 4, 25, 48654, 1, 'AI'),
-(101, 4, 25, 53180, 1, 'AI'),
-(102, 4, 25, 1093, 1, 'AI'),
-(103, 4, 25, 7825, 1, 'AI'),
-(104, 4, 25, 17267, 1, 'AI'),
-(105, 4, 25, 913, 1, 'AI'),
-(106, 4, 25, 9390, 1, 'AI'),
-(107, 4, 25, 3617, 1, 'AI'),
-(108, 4, 25, 76113, 1, 'HS'),
-(109, 4, 25, 90846, 1, 'HS'),
-(110, 4, 25, 13322, 1, 'HS'),
-(111, 4, 25, 13544, 1, 'HS'),
-(112, 4, 25, 9800, 1, 'HS'),
-(113, 4, 29, 16476, 1, 'AI'),
-(114, 4, 29, 24250, 1, 'AI'),
-(115, 4, 29, 920, 1, 'AI'),
-(116, 4, 29, 3129, 1, 'AI'),
-(117, 4, 29, 7238, 1, 'AI'),
-(118, 4, 29, 546, 1, 'AI'),
-(119, 4, 29, 5561, 1, 'AI'),
-(120, 4, 29, 2420, 1, 'AI'),
-(121, 4, 29, 29002, 1, 'HS'),
-(122, 4, 29, 45510, 1, 'HS'),
-(123, 4, 29, 3658, 1, 'HS'),
-(124, 4, 29, 6624, 1, 'HS'),
-(125, 4, 29, 9803, 1, 'HS'),
-(126, 4, 29, 7077, 1, 'HS'),
-(127, 4, 36, 28399, 1, 'AI'),
-(128, 4, 36, 38953, 1, 'AI'),
-(129, 4, 36, 2098, 1, 'AI'),
-(130, 4, 36, 5236, 1, 'AI'),
-(131, 4, 36, 13978, 1, 'AI'),
-(132, 4, 36, 1296, 1, 'AI'),
-(133, 4, 36, 8298, 1, 'AI'),
-(134, 4, 36, 4296, 1, 'AI'),
-(135, 4, 36, 49025, 1, 'HS'),
-(136, 4, 36, 74925, 1, 'HS'),
-(137, 4, 36, 4066, 1, 'HS'),
-(138, 4, 36, 10051, 1, 'HS'),
-(139, 4, 36, 13901, 1, 'HS'),
-(140, 4, 36, 14634, 1, 'HS'),
-(141, 4, 39, 23407, 1, 'AI'),
-(142, 4, 39, 33123, 1, 'AI'),
-(143, 4, 39, 2013, 1, 'AI'),
-(144, 4, 39, 4522, 1, 'AI'),
-(145, 4, 39, 11481, 1, 'AI'),
-(146, 4, 39, 1335, 1, 'AI'),
-(147, 4, 39, 7314, 1, 'AI'),
-(148, 4, 39, 4139, 1, 'AI'),
-(149, 4, 39, 42550, 1, 'HS'),
-(150, 4, 39, 61254, 1, 'HS'),
-(151, 4, 39, 4020, 1, 'HS'),
-(152, 4, 39, 9528, 1, 'HS'),
-(153, 4, 39, 12626, 1, 'HS'),
-(154, 4, 39, 12784, 1, 'HS'),
-(155, 4, 44, 52305, 1, 'AI'),
-(156, 4, 44, 58726, 1, 'AI'),
-(157, 4, 44, 2803, 1, 'AI'),
-(158, 4, 44, 8403, 1, 'AI'),
-(159, 4, 44, 18921, 1, 'AI'),
-(160, 4, 44, 10486, 1, 'AI'),
-(161, 4, 44, 4900, 1, 'AI'),
-(162, 4, 44, 92424, 1, 'HS'),
-(163, 4, 44, 101650, 1, 'HS'),
-(164, 4, 44, 16103, 1, 'HS'),
-(165, 4, 44, 16422, 1, 'HS'),
-(166, 4, 44, 15267, 1, 'HS'),
-(167, 4, 53, 26412, 1, 'AI'),
-(168, 4, 53, 34777, 1, 'AI'),
-(169, 4, 53, 2921, 1, 'AI'),
-(170, 4, 53, 5553, 1, 'AI'),
-(171, 4, 53, 14002, 1, 'AI'),
-(172, 4, 53, 8612, 1, 'AI'),
-(173, 4, 53, 4351, 1, 'AI'),
-(174, 4, 53, 60003, 1, 'HS'),
-(175, 4, 53, 77022, 1, 'HS'),
-(176, 4, 53, 10320, 1, 'HS'),
-(177, 4, 53, 15808, 1, 'HS'),
-(178, 4, 53, 18028, 1, 'HS'),
-(179, 4, 55, 39483, 1, 'AI'),
-(180, 4, 55, 50136, 1, 'AI'),
-(181, 4, 55, 2820, 1, 'AI'),
-(182, 4, 55, 6582, 1, 'AI'),
-(183, 4, 55, 16233, 1, 'AI'),
-(184, 4, 55, 1398, 1, 'AI'),
-(185, 4, 55, 9297, 1, 'AI'),
-(186, 4, 55, 4541, 1, 'AI'),
-(187, 4, 55, 63964, 1, 'HS'),
-(188, 4, 55, 78487, 1, 'HS'),
-(189, 4, 55, 11447, 1, 'HS'),
-(190, 4, 55, 18503, 1, 'HS'),
-(191, 4, 55, 14434, 1, 'HS'),
-(192, 4, 59, 45477, 1, 'AI'),
-(193, 4, 59, 44975, 1, 'AI'),
-(194, 4, 59, 8386, 1, 'AI'),
-(195, 4, 59, 19203, 1, 'AI'),
-(196, 4, 59, 10249, 1, 'AI'),
-(197, 4, 59, 5170, 1, 'AI'),
-(198, 4, 59, 92572, 1, 'HS'),
-(199, 4, 59, 106297, 1, 'HS'),
-(200, 4, 59, 18789, 1, 'HS'),
-(201, 4, 59, 22736, 1, 'HS'),
-(202, 4, 59, 20387, 1, 'HS'),
-(203, 4, 62, 49244, 1, 'AI'),
-(204, 4, 62, 60268, 1, 'AI'),
-(205, 4, 62, 3139, 1, 'AI'),
-(206, 4, 62, 8219, 1, 'AI'),
-(207, 4, 62, 18309, 1, 'AI'),
-(208, 4, 62, 1442, 1, 'AI'),
-(209, 4, 62, 10831, 1, 'AI'),
-(210, 4, 62, 5255, 1, 'AI'),
-(211, 4, 62, 91410, 1, 'HS'),
-(212, 4, 62, 85163, 1, 'HS'),
-(213, 4, 62, 14863, 1, 'HS'),
-(214, 4, 62, 20239, 1, 'HS'),
-(215, 4, 62, 21780, 1, 'HS'),
-(216, 4, 63, 35457, 1, 'AI'),
-(217, 4, 63, 34841, 1, 'AI'),
-(218, 4, 63, 6008, 1, 'AI'),
-(219, 4, 63, 14819, 1, 'AI'),
-(220, 4, 63, 9040, 1, 'AI'),
-(221, 4, 63, 4389, 1, 'AI'),
-(222, 4, 63, 82470, 1, 'HS'),
-(223, 4, 63, 96524, 1, 'HS'),
-(224, 4, 63, 14176, 1, 'HS'),
-(225, 4, 63, 19398, 1, 'HS'),
-(226, 4, 63, 23546, 1, 'HS'),
-(227, 30, 29, 61724, 1, 'AI'),
-(228, 30, 29, 2781, 1, 'AI'),
-(229, 30, 29, 9860, 1, 'AI'),
-(230, 30, 29, 373, 1, 'AI'),
-(231, 30, 29, 22087, 1, 'AI'),
-(232, 30, 29, 1666, 1, 'AI'),
-(233, 30, 29, 11065, 1, 'AI'),
-(234, 30, 29, 5834, 1, 'AI'),
-(235, 30, 35, 61888, 1, 'AI'),
-(236, 30, 35, 2806, 1, 'AI'),
-(237, 30, 35, 9812, 1, 'AI'),
-(238, 30, 35, 22782, 1, 'AI'),
-(239, 30, 35, 1608, 1, 'AI'),
-(240, 30, 35, 11122, 1, 'AI'),
-(241, 30, 35, 315, 1, 'AI'),
-(242, 30, 35, 4493, 1, 'AI'),
-(243, 30, 39, 70431, 1, 'AI'),
-(244, 30, 39, 2538, 1, 'AI'),
-(245, 30, 39, 10840, 1, 'AI'),
-(246, 30, 39, 24664, 1, 'AI'),
-(247, 30, 39, 12171, 1, 'AI'),
-(248, 30, 39, 5900, 1, 'AI'),
-(249, 30, 55, 79077, 1, 'AI'),
-(250, 30, 55, 11986, 1, 'AI'),
-(251, 30, 55, 27821, 1, 'AI'),
-(252, 30, 55, 13438, 1, 'AI'),
-(253, 30, 55, 6205, 1, 'AI'),
-(254, 31, 22, 85440, 1, 'AI'),
-(255, 31, 22, 81636, 1, 'AI'),
-(256, 31, 22, 3448, 1, 'AI'),
-(257, 31, 22, 13053, 1, 'AI'),
-(258, 31, 22, 29315, 1, 'AI'),
-(259, 31, 22, 29182, 1, 'AI'),
-(260, 31, 22, 14100, 1, 'AI'),
-(261, 31, 22, 13887, 1, 'AI'),
-(262, 31, 22, 5859, 1, 'AI'),
-(263, 36, 25, 64881, 1, 'AI'),
-(264, 36, 25, 3123, 1, 'AI'),
-(265, 36, 25, 10249, 1, 'AI'),
-(266, 36, 25, 22633, 1, 'AI'),
-(267, 36, 25, 1415, 1, 'AI'),
-(268, 36, 25, 12109, 1, 'AI'),
-(269, 36, 25, 4204, 1, 'AI'),
-(270, 36, 27, 37733, 1, 'AI'),
-(271, 36, 27, 1933, 1, 'AI'),
-(272, 36, 27, 5731, 1, 'AI'),
-(273, 36, 27, 15423, 1, 'AI'),
-(274, 36, 27, 977, 1, 'AI'),
-(275, 36, 27, 9234, 1, 'AI'),
-(276, 36, 27, 4016, 1, 'AI'),
-(277, 36, 35, 50717, 1, 'AI'),
-(278, 36, 35, 3225, 1, 'AI'),
-(279, 36, 35, 8056, 1, 'AI'),
-(280, 36, 35, 369, 1, 'AI'),
-(281, 36, 35, 19369, 1, 'AI'),
-(282, 36, 35, 10485, 1, 'AI'),
-(283, 36, 35, 4235, 1, 'AI'),
-(284, 36, 55, 55854, 1, 'AI'),
-(285, 36, 55, 2733, 1, 'AI'),
-(286, 36, 55, 8362, 1, 'AI'),
-(287, 36, 55, 20681, 1, 'AI'),
-(288, 36, 55, 1543, 1, 'AI'),
-(289, 36, 55, 11547, 1, 'AI'),
-(290, 36, 55, 4840, 1, 'AI'),
-(291, 13, 4, 67147, 1, 'AI'),
-(292, 13, 4, 1464, 1, 'AI'),
-(293, 13, 4, 10790, 1, 'AI'),
-(294, 13, 4, 23530, 1, 'AI'),
-(295, 13, 4, 1241, 1, 'AI'),
-(296, 13, 4, 12871, 1, 'AI'),
-(297, 13, 4, 5677, 1, 'AI'),
-(298, 13, 6, 60899, 1, 'AI'),
-(299, 13, 6, 1335, 1, 'AI'),
-(300, 13, 6, 9468, 1, 'AI'),
-(301, 13, 6, 21765, 1, 'AI'),
-(302, 13, 6, 1215, 1, 'AI'),
-(303, 13, 6, 10765, 1, 'AI'),
-(304, 13, 6, 5432, 1, 'AI'),
-(305, 13, 23, 81228, 1, 'AI'),
-(306, 13, 23, 3928, 1, 'AI'),
-(307, 13, 23, 12376, 1, 'AI'),
-(308, 13, 23, 28702, 1, 'AI'),
-(309, 13, 23, 13476, 1, 'AI'),
-(310, 13, 23, 6272, 1, 'AI'),
-(311, 13, 25, 76879, 1, 'AI'),
-(312, 13, 25, 3200, 1, 'AI'),
-(313, 13, 25, 12017, 1, 'AI'),
-(314, 13, 25, 27538, 1, 'AI'),
-(315, 13, 25, 1698, 1, 'AI'),
-(316, 13, 25, 13055, 1, 'AI'),
-(317, 13, 25, 4998, 1, 'AI'),
-(318, 13, 29, 59667, 1, 'AI'),
-(319, 13, 29, 2368, 1, 'AI'),
-(320, 13, 29, 9158, 1, 'AI'),
-(321, 13, 29, 300, 1, 'AI'),
-(322, 13, 29, 21324, 1, 'AI'),
-(323, 13, 29, 1306, 1, 'AI'),
-(324, 13, 29, 10850, 1, 'AI'),
-(325, 13, 29, 4912, 1, 'AI'),
-(326, 13, 35, 73669, 1, 'AI'),
-(327, 13, 35, 11189, 1, 'AI'),
-(328, 13, 35, 25466, 1, 'AI'),
-(329, 13, 35, 11990, 1, 'AI'),
-(330, 13, 35, 6003, 1, 'AI'),
-(331, 13, 39, 63739, 1, 'AI'),
-(332, 13, 39, 1628, 1, 'AI'),
-(333, 13, 39, 10094, 1, 'AI'),
-(334, 13, 39, 23189, 1, 'AI'),
-(335, 13, 39, 1499, 1, 'AI'),
-(336, 13, 39, 11326, 1, 'AI'),
-(337, 13, 39, 4876, 1, 'AI'),
-(338, 13, 48, 85380, 1, 'AI'),
-(339, 13, 48, 13280, 1, 'AI'),
-(340, 13, 48, 29546, 1, 'AI'),
-(341, 13, 48, 14274, 1, 'AI'),
-(342, 13, 48, 6250, 1, 'AI'),
-(343, 13, 49, 67772, 1, 'AI'),
-(344, 13, 49, 2244, 1, 'AI'),
-(345, 13, 49, 10401, 1, 'AI'),
-(346, 13, 49, 23717, 1, 'AI'),
-(347, 13, 49, 1555, 1, 'AI'),
-(348, 13, 49, 11775, 1, 'AI'),
-(349, 13, 49, 5798, 1, 'AI'),
-(350, 13, 55, 77538, 1, 'AI'),
-(351, 13, 55, 11884, 1, 'AI'),
-(352, 13, 55, 27882, 1, 'AI'),
-(353, 13, 55, 13019, 1, 'AI'),
-(354, 13, 55, 5926, 1, 'AI'),
-(355, 37, 29, 39197, 1, 'AI'),
-(356, 37, 29, 1885, 1, 'AI'),
-(357, 37, 29, 6714, 1, 'AI'),
-(358, 37, 29, 16393, 1, 'AI'),
-(359, 37, 29, 1046, 1, 'AI'),
-(360, 37, 29, 8256, 1, 'AI'),
-(361, 37, 29, 3074, 1, 'AI'),
-(362, 37, 39, 51560, 1, 'AI'),
-(363, 37, 39, 3271, 1, 'AI'),
-(364, 37, 39, 7892, 1, 'AI'),
-(365, 37, 39, 19309, 1, 'AI'),
-(366, 37, 39, 1558, 1, 'AI'),
-(367, 37, 39, 9887, 1, 'AI'),
-(368, 37, 39, 4341, 1, 'AI'),
-(369, 40, 29, 42183, 1, 'AI'),
-(370, 40, 29, 1035, 1, 'AI'),
-(371, 40, 29, 6720, 1, 'AI'),
-(372, 40, 29, 15522, 1, 'AI'),
-(373, 40, 29, 754, 1, 'AI'),
-(374, 40, 29, 7985, 1, 'AI'),
-(375, 40, 29, 212, 1, 'AI'),
-(376, 40, 29, 4302, 1, 'AI'),
-(377, 40, 37, 50951, 1, 'AI'),
-(378, 40, 37, 2034, 1, 'AI'),
-(379, 40, 37, 8034, 1, 'AI'),
-(380, 40, 37, 18150, 1, 'AI'),
-(381, 40, 37, 1418, 1, 'AI'),
-(382, 40, 37, 9506, 1, 'AI'),
-(383, 40, 37, 4815, 1, 'AI'),
-(384, 18, 27, 44591, 1, 'AI'),
-(385, 18, 27, 51112, 1, 'AI'),
-(386, 18, 27, 1985, 1, 'AI'),
-(387, 18, 27, 7011, 1, 'AI'),
-(388, 18, 27, 8425, 1, 'AI'),
-(389, 18, 27, 17225, 1, 'AI'),
-(390, 18, 27, 20476, 1, 'AI'),
-(391, 18, 27, 1537, 1, 'AI'),
-(392, 18, 27, 9210, 1, 'AI'),
-(393, 18, 27, 9046, 1, 'AI'),
-(394, 18, 27, 4346, 1, 'AI'),
-(395, 18, 27, 4019, 1, 'AI'),
-(396, 18, 55, 57853, 1, 'AI'),
-(397, 18, 55, 65967, 1, 'AI'),
-(398, 18, 55, 2502, 1, 'AI'),
-(399, 18, 55, 8977, 1, 'AI'),
-(400, 18, 55, 10882, 1, 'AI'),
-(401, 18, 55, 20286, 1, 'AI'),
-(402, 18, 55, 23762, 1, 'AI'),
-(403, 18, 55, 10568, 1, 'AI'),
-(404, 18, 55, 10877, 1, 'AI'),
-(405, 18, 55, 4784, 1, 'AI'),
-(406, 18, 55, 5744, 1, 'AI'),
-(407, 18, 52, 68691, 1, 'AI'),
-(408, 18, 52, 76313, 1, 'AI'),
-(409, 18, 52, 2181, 1, 'AI'),
-(410, 18, 52, 10591, 1, 'AI'),
-(411, 18, 52, 11017, 1, 'AI'),
-(412, 18, 52, 25645, 1, 'AI'),
-(413, 18, 52, 26785, 1, 'AI'),
-(414, 18, 52, 1212, 1, 'AI'),
-(415, 18, 52, 11892, 1, 'AI'),
-(416, 18, 52, 12389, 1, 'AI'),
-(417, 18, 52, 5808, 1, 'AI'),
-(418, 18, 52, 5763, 1, 'AI'),
-(419, 18, 62, 68354, 1, 'AI'),
-(420, 18, 62, 73801, 1, 'AI'),
-(421, 18, 62, 3600, 1, 'AI'),
-(422, 18, 62, 11117, 1, 'AI'),
-(423, 18, 62, 11091, 1, 'AI'),
-(424, 18, 62, 26181, 1, 'AI'),
-(425, 18, 62, 27983, 1, 'AI'),
-(426, 18, 62, 1641, 1, 'AI'),
-(427, 18, 62, 12511, 1, 'AI'),
-(428, 18, 62, 13202, 1, 'AI'),
-(429, 18, 62, 6040, 1, 'AI'),
-(430, 18, 62, 6074, 1, 'AI'),
-(431, 6, 6, 53941, 1, 'AI'),
-(432, 6, 6, 2095, 1, 'AI'),
-(433, 6, 6, 8669, 1, 'AI'),
-(434, 6, 6, 19456, 1, 'AI'),
-(435, 6, 6, 9835, 1, 'AI'),
-(436, 6, 6, 232, 1, 'AI'),
-(437, 6, 6, 5131, 1, 'AI'),
-(438, 6, 23, 74174, 1, 'AI'),
-(439, 6, 23, 4019, 1, 'AI'),
-(440, 6, 23, 11672, 1, 'AI'),
-(441, 6, 23, 27346, 1, 'AI'),
-(442, 6, 23, 1735, 1, 'AI'),
-(443, 6, 23, 13136, 1, 'AI'),
-(444, 6, 23, 6218, 1, 'AI'),
-(445, 6, 24, 67722, 1, 'AI'),
-(446, 6, 24, 10546, 1, 'AI'),
-(447, 6, 24, 25669, 1, 'AI'),
-(448, 6, 24, 12341, 1, 'AI'),
-(449, 6, 24, 6005, 1, 'AI'),
-(450, 6, 25, 77398, 1, 'AI'),
-(451, 6, 25, 4119, 1, 'AI'),
-(452, 6, 25, 12055, 1, 'AI'),
-(453, 6, 25, 27060, 1, 'AI'),
-(454, 6, 25, 13170, 1, 'AI'),
-(455, 6, 25, 4685, 1, 'AI'),
-(456, 6, 29, 51942, 1, 'AI'),
-(457, 6, 29, 1668, 1, 'AI'),
-(458, 6, 29, 8324, 1, 'AI'),
-(459, 6, 29, 19539, 1, 'AI'),
-(460, 6, 29, 854, 1, 'AI'),
-(461, 6, 29, 10383, 1, 'AI'),
-(462, 6, 29, 5221, 1, 'AI'),
-(463, 6, 29, 57074, 1, 'AI'),
-(464, 6, 29, 2896, 1, 'AI'),
-(465, 6, 29, 9037, 1, 'AI'),
-(466, 6, 29, 20429, 1, 'AI'),
-(467, 6, 29, 1510, 1, 'AI'),
-(468, 6, 29, 10834, 1, 'AI'),
-(469, 6, 29, 5128, 1, 'AI'),
-(470, 6, 35, 64954, 1, 'AI'),
-(471, 6, 35, 3952, 1, 'AI'),
-(472, 6, 35, 10660, 1, 'AI'),
-(473, 6, 35, 23164, 1, 'AI'),
-(474, 6, 35, 1688, 1, 'AI'),
-(475, 6, 35, 11985, 1, 'AI'),
-(476, 6, 35, 6141, 1, 'AI'),
-(477, 6, 35, 69898, 1, 'AI'),
-(478, 6, 35, 10683, 1, 'AI'),
-(479, 6, 35, 24885, 1, 'AI'),
-(480, 6, 35, 11845, 1, 'AI'),
-(481, 6, 35, 5298, 1, 'AI'),
-(482, 6, 39, 56483, 1, 'AI'),
-(483, 6, 39, 1920, 1, 'AI'),
-(484, 6, 39, 8615, 1, 'AI'),
-(485, 6, 39, 20415, 1, 'AI'),
-(486, 6, 39, 1217, 1, 'AI'),
-(487, 6, 39, 10905, 1, 'AI'),
-(488, 6, 39, 4875, 1, 'AI'),
-(489, 6, 45, 87172, 1, 'AI'),
-(490, 6, 45, 13490, 1, 'AI'),
-(491, 6, 45, 30103, 1, 'AI'),
-(492, 6, 45, 14096, 1, 'AI'),
-(493, 6, 45, 6517, 1, 'AI'),
-(494, 6, 51, 78277, 1, 'AI'),
-(495, 6, 51, 3757, 1, 'AI'),
-(496, 6, 51, 11826, 1, 'AI'),
-(497, 6, 51, 27764, 1, 'AI'),
-(498, 6, 51, 1681, 1, 'AI'),
-(499, 6, 51, 13219, 1, 'AI'),
-(500, 6, 51, 6269, 1, 'AI'),
-(501, 6, 53, 62164, 1, 'AI'),
-(502, 6, 53, 10823, 1, 'AI'),
-(503, 6, 53, 25148, 1, 'AI'),
-(504, 6, 53, 13017, 1, 'AI'),
-(505, 6, 53, 6310, 1, 'AI'),
-(506, 6, 55, 76329, 1, 'AI'),
-(507, 6, 55, 3996, 1, 'AI'),
-(508, 6, 55, 11915, 1, 'AI'),
-(509, 6, 55, 26885, 1, 'AI'),
-(510, 6, 55, 1702, 1, 'AI'),
-(511, 6, 55, 13045, 1, 'AI'),
-(512, 6, 55, 5868, 1, 'AI'),
-(513, 6, 55, 78783, 1, 'AI'),
-(514, 6, 55, 4034, 1, 'AI'),
-(515, 6, 55, 12090, 1, 'AI'),
-(516, 6, 55, 26938, 1, 'AI'),
-(517, 6, 55, 13100, 1, 'AI'),
-(518, 6, 55, 6199, 1, 'AI'),
-(519, 6, 59, 60942, 1, 'AI'),
-(520, 6, 59, 11080, 1, 'AI'),
-(521, 6, 59, 25778, 1, 'AI'),
-(522, 6, 59, 12672, 1, 'AI'),
-(523, 6, 59, 5086, 1, 'AI'),
-(524, 38, 5, 962, 1, 'AI'),
-(525, 38, 5, 321, 1, 'AI'),
-(526, 38, 5, 241, 1, 'AI'),
-(527, 38, 5, 53, 1, 'AI'),
-(528, 38, 25, 76781, 1, 'AI'),
-(529, 38, 25, 3550, 1, 'AI'),
-(530, 38, 25, 12433, 1, 'AI'),
-(531, 38, 25, 12707, 1, 'AI'),
-(532, 38, 25, 5724, 1, 'AI'),
-(533, 38, 27, 60031, 1, 'AI'),
-(534, 38, 27, 4239, 1, 'AI'),
-(535, 38, 27, 9687, 1, 'AI'),
-(536, 38, 27, 11012, 1, 'AI'),
-(537, 38, 27, 5666, 1, 'AI'),
-(538, 38, 35, 67224, 1, 'AI'),
-(539, 38, 35, 3966, 1, 'AI'),
-(540, 38, 35, 10509, 1, 'AI'),
-(541, 38, 35, 11848, 1, 'AI'),
-(542, 38, 35, 5488, 1, 'AI'),
-(543, 38, 39, 67177, 1, 'AI'),
-(544, 38, 39, 9970, 1, 'AI'),
-(545, 38, 39, 12556, 1, 'AI'),
-(546, 38, 39, 6075, 1, 'AI'),
-(547, 38, 49, 64832, 1, 'AI'),
-(548, 38, 49, 2645, 1, 'AI'),
-(549, 38, 49, 9423, 1, 'AI'),
-(550, 38, 49, 11720, 1, 'AI'),
-(551, 38, 49, 5929, 1, 'AI'),
-(552, 12, 17, 72944, 1, 'AI'),
-(553, 12, 17, 11016, 1, 'AI'),
-(554, 12, 17, 28112, 1, 'AI'),
-(555, 12, 17, 10510, 1, 'AI'),
-(556, 12, 17, 48058, 1, 'AI'),
-(557, 12, 17, 14937, 1, 'AI'),
-(558, 12, 17, 6750, 1, 'AI'),
-(559, 12, 17, 3796, 1, 'AI'),
-(560, 12, 17, 64796, 1, 'AI'),
-(561, 12, 17, 11298, 1, 'AI'),
-(562, 12, 17, 24581, 1, 'AI'),
-(563, 12, 17, 5805, 1, 'AI'),
-(564, 12, 17, 51609, 1, 'AI'),
-(565, 12, 17, 3972, 1, 'AI'),
-(566, 12, 17, 10641, 1, 'AI'),
-(567, 12, 17, 19950, 1, 'AI'),
-(568, 12, 17, 9385, 1, 'AI'),
-(569, 12, 17, 69176, 1, 'AI'),
-(570, 12, 17, 23266, 1, 'AI'),
-(571, 12, 17, 10654, 1, 'AI'),
-(572, 12, 17, 57814, 1, 'AI'),
-(573, 12, 17, 18642, 1, 'AI'),
-(574, 12, 17, 1672, 1, 'AI'),
-(575, 12, 17, 11787, 1, 'AI'),
-(576, 12, 18, 75532, 1, 'AI'),
-(577, 12, 18, 26753, 1, 'AI'),
-(578, 12, 25, 78808, 1, 'AI'),
-(579, 12, 25, 12129, 1, 'AI'),
-(580, 12, 25, 28050, 1, 'AI'),
-(581, 12, 25, 12398, 1, 'AI'),
-(582, 12, 25, 3638, 1, 'AI'),
-(583, 12, 29, 52131, 1, 'AI'),
-(584, 12, 29, 8336, 1, 'AI'),
-(585, 12, 29, 423, 1, 'AI'),
-(586, 12, 29, 19206, 1, 'AI'),
-(587, 12, 29, 9088, 1, 'AI'),
-(588, 12, 29, 2444, 1, 'AI'),
-(589, 12, 35, 65400, 1, 'AI'),
-(590, 12, 35, 2825, 1, 'AI'),
-(591, 12, 35, 10084, 1, 'AI'),
-(592, 12, 35, 23680, 1, 'AI'),
-(593, 12, 35, 11242, 1, 'AI'),
-(594, 12, 39, 61069, 1, 'AI'),
-(595, 12, 39, 9293, 1, 'AI'),
-(596, 12, 39, 21967, 1, 'AI'),
-(597, 12, 39, 9558, 1, 'AI'),
-(598, 12, 39, 3889, 1, 'AI'),
-(599, 12, 44, 83934, 1, 'AI'),
-(600, 12, 44, 13270, 1, 'AI'),
-(601, 12, 44, 28951, 1, 'AI'),
-(602, 12, 44, 1754, 1, 'AI'),
-(603, 12, 44, 13198, 1, 'AI'),
-(604, 12, 44, 6125, 1, 'AI'),
-(605, 12, 55, 69170, 1, 'AI'),
-(606, 12, 55, 10642, 1, 'AI'),
-(607, 12, 55, 24078, 1, 'AI'),
-(608, 12, 55, 11773, 1, 'AI'),
-(609, 12, 55, 3255, 1, 'AI'),
-(610, 2, 5, 367, 1, 'AI'),
-(611, 2, 5, 44, 1, 'AI'),
-(612, 2, 5, 155, 1, 'AI'),
-(613, 2, 5, 352, 1, 'AI'),
-(614, 2, 5, 158, 1, 'AI'),
-(615, 2, 5, 35, 1, 'AI'),
-(616, 2, 60, 411, 1, 'AI'),
-(617, 2, 60, 55, 1, 'AI'),
-(618, 2, 60, 195, 1, 'AI'),
-(619, 2, 60, 281, 1, 'AI'),
-(620, 2, 60, 48, 1, 'AI'),
-(621, 2, 60, 112, 1, 'AI'),
-(622, 2, 60, 64, 1, 'AI'),
-(623, 1, 5, 158, 1, 'AI'),
-(624, 1, 5, 21, 1, 'AI'),
-(625, 1, 5, 74, 1, 'AI'),
-(626, 1, 5, 159, 1, 'AI'),
-(627, 1, 5, 32, 1, 'AI'),
-(628, 1, 5, 79, 1, 'AI'),
-(629, 1, 5, 43, 1, 'AI'),
-(630, 1, 60, 133, 1, 'AI'),
-(631, 1, 60, 21, 1, 'AI'),
-(632, 1, 60, 147, 1, 'AI'),
-(633, 1, 60, 106, 1, 'AI'),
-(634, 1, 60, 10, 1, 'AI'),
-(635, 1, 60, 86, 1, 'AI'),
-(636, 1, 60, 23, 1, 'AI'),
-(637, 3, 5, 478, 1, 'AI'),
-(638, 3, 5, 54, 1, 'AI'),
-(639, 3, 5, 174, 1, 'AI'),
-(640, 3, 5, 281, 1, 'AI'),
-(641, 3, 5, 184, 1, 'AI'),
-(642, 3, 5, 59, 1, 'AI'),
-(643, 3, 60, 467, 1, 'AI'),
-(644, 3, 60, 123, 1, 'AI'),
-(645, 3, 60, 161, 1, 'AI'),
-(646, 3, 60, 290, 1, 'AI'),
-(647, 3, 60, 126, 1, 'AI'),
-(648, 3, 60, 75, 1, 'AI'),
-(649, 14, 5, 929, 1, 'AI'),
-(650, 14, 5, 281, 1, 'AI'),
-(651, 14, 5, 523, 1, 'AI'),
-(652, 14, 5, 315, 1, 'AI'),
-(653, 14, 5, 160, 1, 'AI'),
-(654, 14, 15, 57736, 1, 'AI'),
-(655, 14, 15, 3687, 1, 'AI'),
-(656, 14, 15, 9383, 1, 'AI'),
-(657, 14, 15, 22398, 1, 'AI'),
-(658, 14, 15, 11338, 1, 'AI'),
-(659, 14, 15, 5774, 1, 'AI'),
-(660, 14, 20, 60850, 1, 'AI'),
-(661, 14, 20, 10345, 1, 'AI'),
-(662, 14, 20, 22242, 1, 'AI'),
-(663, 14, 20, 9966, 1, 'AI'),
-(664, 14, 20, 5755, 1, 'AI'),
-(665, 14, 25, 77606, 1, 'AI'),
-(666, 14, 25, 12322, 1, 'AI'),
-(667, 14, 25, 27078, 1, 'AI'),
-(668, 14, 25, 13244, 1, 'AI'),
-(669, 14, 25, 5561, 1, 'AI'),
-(670, 14, 29, 56963, 1, 'AI'),
-(671, 14, 29, 2407, 1, 'AI'),
-(672, 14, 29, 9000, 1, 'AI'),
-(673, 14, 29, 395, 1, 'AI'),
-(674, 14, 29, 20557, 1, 'AI'),
-(675, 14, 29, 1201, 1, 'AI'),
-(676, 14, 29, 10902, 1, 'AI'),
-(677, 14, 29, 5253, 1, 'AI'),
-(678, 14, 35, 69199, 1, 'AI'),
-(679, 14, 35, 10280, 1, 'AI'),
-(680, 14, 35, 24071, 1, 'AI'),
-(681, 14, 35, 12411, 1, 'AI'),
-(682, 14, 35, 5938, 1, 'AI'),
-(683, 14, 39, 67778, 1, 'AI'),
-(684, 14, 39, 4297, 1, 'AI'),
-(685, 14, 39, 10410, 1, 'AI'),
-(686, 14, 39, 24478, 1, 'AI'),
-(687, 14, 39, 12560, 1, 'AI'),
-(688, 14, 39, 6137, 1, 'AI'),
-(689, 14, 55, 70443, 1, 'AI'),
-(690, 14, 55, 10966, 1, 'AI'),
-(691, 14, 55, 24851, 1, 'AI'),
-(692, 14, 55, 12663, 1, 'AI'),
-(693, 14, 55, 4748, 1, 'AI'),
-(694, 14, 64, 58770, 1, 'AI'),
-(695, 14, 64, 2933, 1, 'AI'),
-(696, 14, 64, 9038, 1, 'AI'),
-(697, 14, 64, 21182, 1, 'AI'),
-(698, 14, 64, 10722, 1, 'AI'),
-(699, 14, 64, 1189, 1, 'AI'),
-(700, 16, 29, 17875, 1, 'AI'),
-(701, 16, 29, 27680, 1, 'AI'),
-(702, 16, 29, 1051, 1, 'AI'),
-(703, 16, 29, 2876, 1, 'AI'),
-(704, 16, 29, 4087, 1, 'AI'),
-(705, 16, 29, 6465, 1, 'AI'),
-(706, 16, 29, 12282, 1, 'AI'),
-(707, 16, 29, 543, 1, 'AI'),
-(708, 16, 29, 4358, 1, 'AI'),
-(709, 16, 29, 5442, 1, 'AI'),
-(710, 16, 29, 2714, 1, 'AI'),
-(711, 16, 34, 19939, 1, 'AI'),
-(712, 16, 34, 30109, 1, 'AI'),
-(713, 16, 34, 3194, 1, 'AI'),
-(714, 16, 34, 7575, 1, 'AI'),
-(715, 16, 34, 14723, 1, 'AI'),
-(716, 16, 34, 5136, 1, 'AI'),
-(717, 16, 34, 8333, 1, 'AI'),
-(718, 16, 34, 3197, 1, 'AI'),
-(719, 16, 34, 3670, 1, 'AI'),
-(720, 16, 39, 26786, 1, 'AI'),
-(721, 16, 39, 37582, 1, 'AI'),
-(722, 16, 39, 1784, 1, 'AI'),
-(723, 16, 39, 4273, 1, 'AI'),
-(724, 16, 39, 6062, 1, 'AI'),
-(725, 16, 39, 408, 1, 'AI'),
-(726, 16, 39, 10449, 1, 'AI'),
-(727, 16, 39, 16782, 1, 'AI'),
-(728, 16, 39, 7123, 1, 'AI'),
-(729, 16, 39, 9239, 1, 'AI'),
-(730, 16, 39, 3601, 1, 'AI'),
-(731, 16, 39, 3559, 1, 'AI'),
-(732, 5, 29, 29479, 1, 'AI'),
-(733, 5, 29, 840, 1, 'AI'),
-(734, 5, 29, 5013, 1, 'AI'),
-(735, 5, 29, 12108, 1, 'AI'),
-(736, 5, 29, 483, 1, 'AI'),
-(737, 5, 29, 5381, 1, 'AI'),
-(738, 5, 29, 2534, 1, 'AI'),
-(739, 5, 52, 59393, 1, 'AI'),
-(740, 5, 52, 1455, 1, 'AI'),
-(741, 5, 52, 9597, 1, 'AI'),
-(742, 5, 52, 20987, 1, 'AI'),
-(743, 5, 52, 1263, 1, 'AI'),
-(744, 5, 52, 10509, 1, 'AI'),
-(745, 5, 52, 266, 1, 'AI'),
-(746, 5, 52, 4271, 1, 'AI'),
-(747, 9, 2, 49666, 1, 'HS'),
-(748, 9, 2, 11272, 1, 'HS'),
-(749, 9, 2, 12832, 1, 'HS'),
-(750, 9, 2, 22726, 1, 'OS'),
-(751, 9, 2, 4895, 1, 'OS'),
-(752, 9, 2, 4895, 1, 'OS'),
-(753, 9, 2, 3342, 1, 'OS'),
-(754, 9, 25, 90642, 1, 'HS'),
-(755, 9, 25, 95192, 1, 'HS'),
-(756, 9, 25, 18979, 1, 'HS'),
-(757, 9, 25, 46622, 1, 'OS'),
-(758, 9, 25, 2607, 1, 'OS'),
-(759, 9, 25, 7724, 1, 'OS'),
-(760, 9, 25, 9274, 1, 'OS'),
-(761, 9, 25, 2729, 1, 'OS'),
-(762, 9, 29, 18868, 1, 'HS'),
-(763, 9, 29, 947, 1, 'HS'),
-(764, 9, 29, 9979, 1, 'HS'),
-(765, 9, 29, 3913, 1, 'HS'),
-(766, 9, 29, 11591, 1, 'OS'),
-(767, 9, 29, 551, 1, 'OS'),
-(768, 9, 29, 2003, 1, 'OS'),
-(769, 9, 29, 3078, 1, 'OS'),
-(770, 9, 29, 1683, 1, 'OS'),
-(771, 9, 28, 20061, 1, 'HS'),
-(772, 9, 28, 1621, 1, 'HS'),
-(773, 9, 28, 12582, 1, 'HS'),
-(774, 9, 28, 4570, 1, 'HS'),
-(775, 9, 28, 11966, 1, 'OS'),
-(776, 9, 28, 122, 1, 'OS'),
-(777, 9, 28, 1571, 1, 'OS'),
-(778, 9, 28, 2832, 1, 'OS'),
-(779, 9, 28, 1894, 1, 'OS'),
-(780, 9, 28, 24380, 1, 'HS'),
-(781, 9, 28, 3378, 1, 'HS'),
-(782, 9, 28, 19111, 1, 'HS'),
-(783, 9, 28, 8674, 1, 'HS'),
-(784, 9, 28, 13689, 1, 'OS'),
-(785, 9, 28, 572, 1, 'OS'),
-(786, 9, 28, 2196, 1, 'OS'),
-(787, 9, 28, 3475, 1, 'OS'),
-(788, 9, 28, 2018, 1, 'OS'),
-(789, 9, 35, 44738, 1, 'HS'),
-(790, 9, 35, 44733, 1, 'HS'),
-(791, 9, 35, 12390, 1, 'HS'),
-(792, 9, 35, 25189, 1, 'OS'),
-(793, 9, 35, 1819, 1, 'OS'),
-(794, 9, 35, 3868, 1, 'OS'),
-(795, 9, 35, 317, 1, 'OS'),
-(796, 9, 35, 6188, 1, 'OS'),
-(797, 9, 35, 3225, 1, 'OS'),
-(798, 9, 39, 34343, 1, 'HS'),
-(799, 9, 39, 26387, 1, 'HS'),
-(800, 9, 39, 10491, 1, 'HS'),
-(801, 9, 39, 17892, 1, 'OS'),
-(802, 9, 39, 1101, 1, 'OS'),
-(803, 9, 39, 2707, 1, 'OS'),
-(804, 9, 39, 194, 1, 'OS'),
-(805, 9, 39, 4513, 1, 'OS'),
-(806, 9, 39, 2615, 1, 'OS'),
-(807, 9, 38, 35571, 1, 'HS'),
-(808, 9, 38, 22580, 1, 'HS'),
-(809, 9, 38, 11236, 1, 'HS'),
-(810, 9, 38, 19710, 1, 'OS'),
-(811, 9, 38, 3041, 1, 'OS'),
-(812, 9, 38, 5050, 1, 'OS'),
-(813, 9, 38, 2491, 1, 'OS'),
-(814, 9, 53, 29360, 1, 'HS'),
-(815, 9, 53, 19845, 1, 'HS'),
-(816, 9, 53, 9023, 1, 'HS'),
-(817, 9, 53, 14707, 1, 'OS'),
-(818, 9, 53, 2589, 1, 'OS'),
-(819, 9, 53, 3954, 1, 'OS'),
-(820, 9, 53, 2169, 1, 'OS'),
-(821, 9, 55, 60057, 1, 'HS'),
-(822, 9, 55, 83103, 1, 'HS'),
-(823, 9, 55, 16549, 1, 'HS'),
-(824, 9, 55, 35958, 1, 'OS'),
-(825, 9, 55, 2605, 1, 'OS'),
-(826, 9, 55, 5966, 1, 'OS'),
-(827, 9, 55, 8231, 1, 'OS'),
-(828, 9, 55, 3616, 1, 'OS'),
-(829, 9, 52, 99427, 1, 'HS'),
-(830, 9, 52, 80438, 1, 'HS'),
-(831, 9, 52, 23847, 1, 'HS'),
-(832, 9, 52, 51355, 1, 'OS'),
-(833, 9, 52, 2799, 1, 'OS'),
-(834, 9, 52, 8059, 1, 'OS'),
-(835, 9, 52, 9458, 1, 'OS'),
-(836, 9, 52, 3896, 1, 'OS'),
-(837, 9, 62, 78714, 1, 'HS'),
-(838, 9, 62, 58079, 1, 'HS'),
-(839, 9, 62, 18029, 1, 'HS'),
-(840, 9, 62, 43420, 1, 'OS'),
-(841, 9, 62, 2849, 1, 'OS'),
-(842, 9, 62, 7021, 1, 'OS'),
-(843, 9, 62, 8832, 1, 'OS'),
-(844, 9, 62, 4427, 1, 'OS'),
-(845, 17, 29, 25706, 1, 'AI'),
-(846, 17, 29, 527, 1, 'AI'),
-(847, 17, 29, 4330, 1, 'AI'),
-(848, 17, 29, 10912, 1, 'AI'),
-(849, 17, 29, 322, 1, 'AI'),
-(850, 17, 29, 5056, 1, 'AI'),
-(851, 17, 29, 102, 1, 'AI'),
-(852, 17, 29, 2253, 1, 'AI'),
-(853, 17, 39, 33831, 1, 'AI'),
-(854, 17, 39, 723, 1, 'AI'),
-(855, 17, 39, 5891, 1, 'AI'),
-(856, 17, 39, 13650, 1, 'AI'),
-(857, 17, 39, 728, 1, 'AI'),
-(858, 17, 39, 6059, 1, 'AI'),
-(859, 17, 39, 2991, 1, 'AI'),
-(860, 15, 27, 33062, 1, 'AI'),
-(861, 15, 27, 823, 1, 'AI'),
-(862, 15, 27, 5478, 1, 'AI'),
-(863, 15, 27, 13746, 1, 'AI'),
-(864, 15, 27, 7896, 1, 'AI'),
-(865, 15, 27, 3632, 1, 'AI'),
-(866, 15, 29, 29537, 1, 'AI'),
-(867, 15, 29, 926, 1, 'AI'),
-(868, 15, 29, 4643, 1, 'AI'),
-(869, 15, 29, 12418, 1, 'AI'),
-(870, 15, 29, 620, 1, 'AI'),
-(871, 15, 29, 6955, 1, 'AI'),
-(872, 15, 29, 148, 1, 'AI'),
-(873, 15, 29, 3160, 1, 'AI'),
-(874, 15, 36, 38848, 1, 'AI'),
-(875, 15, 36, 2120, 1, 'AI'),
-(876, 15, 36, 6407, 1, 'AI'),
-(877, 15, 36, 14970, 1, 'AI'),
-(878, 15, 36, 9117, 1, 'AI'),
-(879, 15, 36, 4334, 1, 'AI'),
-(880, 15, 41, 38133, 1, 'AI'),
-(881, 15, 41, 1660, 1, 'AI'),
-(882, 15, 41, 6225, 1, 'AI'),
-(883, 15, 41, 15096, 1, 'AI'),
-(884, 15, 41, 8626, 1, 'AI'),
-(885, 15, 41, 4438, 1, 'AI'),
-(886, 15, 49, 33320, 1, 'AI'),
-(887, 15, 49, 746, 1, 'AI'),
-(888, 15, 49, 5370, 1, 'AI'),
-(889, 15, 49, 13403, 1, 'AI'),
-(890, 15, 49, 7852, 1, 'AI'),
-(891, 15, 49, 3401, 1, 'AI'),
-(892, 26, 25, 60500, 1, 'AI'),
-(893, 26, 25, 78453, 1, 'AI'),
-(894, 26, 25, 23462, 1, 'AI'),
-(895, 26, 25, 12515, 1, 'AI'),
-(896, 26, 29, 50806, 1, 'AI'),
-(897, 26, 29, 54049, 1, 'AI'),
-(898, 26, 29, 2145, 1, 'AI'),
-(899, 26, 29, 7604, 1, 'AI'),
-(900, 26, 29, 17703, 1, 'AI'),
-(901, 26, 29, 9273, 1, 'AI'),
-(902, 26, 39, 57520, 1, 'AI'),
-(903, 26, 39, 61245, 1, 'AI'),
-(904, 26, 39, 20290, 1, 'AI'),
-(905, 26, 44, 73070, 1, 'AI'),
-(906, 26, 44, 76412, 1, 'AI'),
-(907, 26, 44, 23374, 1, 'AI'),
-(908, 26, 44, 12945, 1, 'AI'),
-(909, 26, 50, 65149, 1, 'AI'),
-(910, 26, 50, 22387, 1, 'AI'),
-(911, 26, 50, 5288, 1, 'AI'),
-(912, 45, 23, 55422, 1, 'AI'),
-(913, 45, 23, 9696, 1, 'AI'),
-(914, 45, 23, 16623, 1, 'AI'),
-(915, 45, 23, 1516, 1, 'AI'),
-(916, 45, 23, 7854, 1, 'AI'),
-(917, 45, 25, 66588, 1, 'AI'),
-(918, 45, 25, 2552, 1, 'AI'),
-(919, 45, 25, 10488, 1, 'AI'),
-(920, 45, 25, 24432, 1, 'AI'),
-(921, 45, 25, 11452, 1, 'AI'),
-(922, 45, 25, 4464, 1, 'AI'),
-(923, 45, 25, 250437, 1, 'HS'),
-(924, 45, 25, 93702, 1, 'HS'),
-(925, 45, 25, 33353, 1, 'HS'),
-(926, 45, 29, 44440, 1, 'AI'),
-(927, 45, 29, 7457, 1, 'AI'),
-(928, 45, 29, 286, 1, 'AI'),
-(929, 45, 29, 16353, 1, 'AI'),
-(930, 45, 29, 657, 1, 'AI'),
-(931, 45, 29, 8783, 1, 'AI'),
-(932, 45, 29, 305, 1, 'AI'),
-(933, 45, 29, 4471, 1, 'AI'),
-(934, 45, 29, 130526, 1, 'HS'),
-(935, 45, 29, 59246, 1, 'HS'),
-(936, 45, 29, 53555, 1, 'HS'),
-(937, 45, 29, 19766, 1, 'HS'),
-(938, 45, 36, 41414, 1, 'AI'),
-(939, 45, 36, 8062, 1, 'AI'),
-(940, 45, 36, 15821, 1, 'AI'),
-(941, 45, 36, 9025, 1, 'AI'),
-(942, 45, 39, 48629, 1, 'AI'),
-(943, 45, 39, 1468, 1, 'AI'),
-(944, 45, 39, 7553, 1, 'AI'),
-(945, 45, 39, 17641, 1, 'AI'),
-(946, 45, 39, 9265, 1, 'AI'),
-(947, 45, 39, 4620, 1, 'AI'),
-(948, 45, 39, 176565, 1, 'HS'),
-(949, 45, 39, 78297, 1, 'HS'),
-(950, 45, 39, 65316, 1, 'HS'),
-(951, 45, 39, 25600, 1, 'HS'),
-(952, 45, 39, 9647, 1, 'HS'),
-(953, 45, 40, 50042, 1, 'AI'),
-(954, 45, 40, 2601, 1, 'AI'),
-(955, 45, 40, 17882, 1, 'AI'),
-(956, 45, 40, 7541, 1, 'AI'),
-(957, 45, 40, 4654, 1, 'AI'),
-(958, 45, 49, 42527, 1, 'AI'),
-(959, 45, 49, 7173, 1, 'AI'),
-(960, 45, 49, 16450, 1, 'AI'),
-(961, 45, 49, 2915, 1, 'AI'),
-(962, 45, 55, 61190, 1, 'AI'),
-(963, 45, 55, 9499, 1, 'AI'),
-(964, 45, 55, 375, 1, 'AI'),
-(965, 45, 55, 20522, 1, 'AI'),
-(966, 45, 55, 1381, 1, 'AI'),
-(967, 45, 55, 10739, 1, 'AI'),
-(968, 45, 55, 4852, 1, 'AI'),
-(969, 45, 55, 220216, 1, 'HS'),
-(970, 45, 55, 79135, 1, 'HS'),
-(971, 45, 55, 28507, 1, 'HS'),
-(972, 45, 56, 50562, 1, 'AI'),
-(973, 45, 56, 8700, 1, 'AI'),
-(974, 45, 56, 340, 1, 'AI'),
-(975, 45, 56, 18821, 1, 'AI'),
-(976, 45, 56, 789, 1, 'AI'),
-(977, 45, 56, 10435, 1, 'AI'),
-(978, 45, 56, 4762, 1, 'AI'),
-(979, 45, 56, 201559, 1, 'HS'),
-(980, 45, 56, 75737, 1, 'HS'),
-(981, 45, 56, 16856, 1, 'HS'),
-(982, 29, 26, 204687, 1, 'HS'),
-(983, 29, 26, 213143, 1, 'HS'),
-(984, 29, 26, 32032, 1, 'HS'),
-(985, 29, 26, 94100, 1, 'HS'),
-(986, 29, 26, 94650, 1, 'HS'),
-(987, 29, 26, 28118, 1, 'HS'),
-(988, 29, 26, 6969, 1, 'HS'),
-(989, 29, 26, 77926, 1, 'OS'),
-(990, 29, 26, 80400, 1, 'OS'),
-(991, 29, 26, 12187, 1, 'OS'),
-(992, 29, 26, 27279, 1, 'OS'),
-(993, 29, 26, 27718, 1, 'OS'),
-(994, 29, 26, 10942, 1, 'OS'),
-(995, 29, 26, 6058, 1, 'OS'),
-(996, 29, 28, 110055, 1, 'HS'),
-(997, 29, 28, 62962, 1, 'HS'),
-(998, 29, 28, 19358, 1, 'HS'),
-(999, 29, 28, 66750, 1, 'HS'),
-(1000, 29, 28, 15221, 1, 'HS');
@@ -1,1063 +0,0 @@
-INSERT INTO iiits (iiit_id, name, location, nirf_rank) VALUES
-(1, 'Atal Bihari Vajpayee Indian Institute of Information Technology & Management Gwalior', 'India', 96),
-(2, 'Indian Institute of Information Technology, Allahabad', 'India', 101),
-(3, 'Pt. Dwarka Prasad Mishra Indian Institute of Information Technology, Design & Manufacture Jabalpur', 'India', 102),
-(4, 'Indian Institute of Information Technology, Design & Manufacturing, Kancheepuram', 'India', 151),
-(5, 'Indian Institute of Information Technology Guwahati', 'India', 201),
-(6, 'Indian Institute of Information Technology (IIIT) Nagpur', 'India', 399),
-(7, 'Indian Institute of Information Technology (IIIT) Pune', 'India', 399),
-(8, 'Indian Institute of Information Technology (IIIT) Ranchi', 'India', 399),
-(9, 'Indian Institute of Information Technology (IIIT), Sri City, Chittoor', 'India', 399),
-(10, 'Indian Institute of Information Technology (IIIT)Kota, Rajasthan', 'India', 399),
-(11, 'Indian Institute of Information Technology Bhagalpur', 'India', 399),
-(12, 'Indian Institute of Information Technology Bhopal', 'India', 399),
-(13, 'Indian Institute of Information Technology Design & Manufacturing Kurnool, Andhra Pradesh', 'India', 399),
-(14, 'Indian Institute of Information Technology Lucknow', 'India', 399),
-(15, 'Indian Institute of Information Technology Surat', 'India', 399),
-(16, 'Indian Institute of Information Technology Tiruchirappalli', 'India', 399),
-(17, 'Indian Institute of Information Technology(IIIT) Dharwad', 'India', 399),
-(18, 'Indian Institute of Information Technology(IIIT) Kalyani, West Bengal', 'India', 399),
-(19, 'Indian Institute of Information Technology(IIIT) Kilohrad, Sonepat, Haryana', 'India', 399),
-(20, 'Indian Institute of Information Technology(IIIT) Kottayam', 'India', 399),
-(21, 'Indian Institute of Information Technology(IIIT) Una, Himachal Pradesh', 'India', 399),
-(22, 'Indian Institute of Information Technology(IIIT), Vadodara, Gujrat', 'India', 399),
-(23, 'Indian Institute of Information Technology, Agartala', 'India', 399),
-(24, 'Indian Institute of Information Technology, Vadodara International Campus Diu (IIITVICD)', 'India', 399);
-
-INSERT INTO iiit_branches (branch_id, branch_name, short_name, degree_type) VALUES
-(1, 'Artificial Intelligence', 'ART', 'B.Tech'),
-(2, 'Artificial Intelligence and Data Engineering', 'ART', 'B.Tech'),
-(3, 'Artificial Intelligence and Data Science', 'ART', 'B.Tech'),
-(4, 'B.Tech in Mathematics and Computing', 'B.T', 'B.Tech'),
-(5, 'B.Tech in Mechanical Engineering and M.Tech in AI and Robotics', 'B.T', 'B.Tech'),
-(6, 'B.Tech. in Electronics and Communication Engineering and M.Tech. in Communication Systems', 'ECE', 'B.Tech'),
-(7, 'B.Tech. in Electronics and Communication Engineering and M.Tech. in Microelectronics and VLSI Systems', 'ECE', 'B.Tech'),
-(8, 'CSE', 'CSE', 'B.Tech'),
-(9, 'Computer Science', 'CSE', 'B.Tech'),
-(10, 'Computer Science Engineering', 'CSE', 'B.Tech'),
-(11, 'Computer Science and Artificial Intelligence', 'CSE', 'B.Tech'),
-(12, 'Computer Science and Business', 'CSE', 'B.Tech'),
-(13, 'Computer Science and Engineering', 'CSE', 'B.Tech'),
-(14, 'Computer Science and Engineering with Major in Artificial Intelligence', 'CSE', 'B.Tech'),
-(15, 'Computer Science and Engineering with specialization in Artificial Intelligence and Data Science', 'CSE', 'B.Tech'),
-(16, 'Computer Science and Engineering with specialization in Cyber Security', 'CSE', 'B.Tech'),
-(17, 'Computer Science and Engineering with specialization in Quantum Technologies', 'CSE', 'B.Tech'),
-(18, 'Data Science and Artificial Intelligence', 'DAT', 'B.Tech'),
-(19, 'Design Engineering', 'DES', 'B.Tech'),
-(20, 'Electrical and Electronics Engineering', 'ELE', 'B.Tech'),
-(21, 'Electronics and Communication Engineering', 'ECE', 'B.Tech'),
-(22, 'Electronics and Communication Engineering with specialization in Design and Manufacturing', 'ECE', 'B.Tech'),
-(23, 'Electronics and Communication Engineering with specialization in VLSI and Embedded Systems', 'ECE', 'B.Tech'),
-(24, 'Engineering Physics', 'ENG', 'B.Tech'),
-(25, 'Information Technology', 'IT', 'B.Tech'),
-(26, 'Information Technology-Business Informatics', 'IT', 'B.Tech'),
-(27, 'Integrated B. Tech.', 'INT', 'B.Tech'),
-(28, 'Mathematics and Computing', 'MAT', 'B.Tech'),
-(29, 'Mathematics and Scientific Computing', 'MAT', 'B.Tech'),
-(30, 'Mechanical Engineering', 'MEC', 'B.Tech'),
-(31, 'Mechanical Engineering with specialization in Design and Manufacturing', 'MEC', 'B.Tech'),
-(32, 'Mechatronics and Automation Engineering', 'MEC', 'B.Tech'),
-(33, 'Physics and Computational Engineering', 'PHY', 'B.Tech'),
-(34, 'Smart Manufacturing', 'SMA', 'B.Tech');
-
-INSERT INTO iiit_cutoffs (cutoff_id, iiit_id, branch_id, year, category, closing_rank, round, quota) VALUES
-(1, 1, 9, 2024, 'GEN', 7835, 1, 'AI'),
-(2, 1, 9, 2024, 'GEN', 14651, 1, 'AI'),
-(3, 1, 9, 2024, 'GEN', 129, 1, 'AI'),
-(4, 1, 9, 2024, 'GEN', 481, 1, 'AI'),
-(5, 1, 9, 2024, 'EWS', 1053, 1, 'AI'),
-(6, 1, 9, 2024, 'EWS', 1938, 1, 'AI'),
-(7, 1, 9, 2024, 'OBC', 3233, 1, 'AI'),
-(8, 1, 9, 2024, 'OBC', 6583, 1, 'AI'),
-(9, 1, 9, 2024, 'OBC', 229, 1, 'AI'),
-(10, 1, 9, 2024, 'SC', 1905, 1, 'AI'),
-(11, 1, 9, 2024, 'SC', 3715, 1, 'AI'),
-(12, 1, 9, 2024, 'SC', 97, 1, 'AI'),
-(13, 1, 9, 2024, 'ST', 933, 1, 'AI'),
-(14, 1, 9, 2024, 'ST', 613, 1, 'AI'),
-(15, 1, 9, 2024, 'ST', 84, 1, 'AI'),
-(16, 1, 20, 2024, 'GEN', 15482, 1, 'AI'),
-(17, 1, 20, 2024, 'GEN', 24824, 1, 'AI'),
-(18, 1, 20, 2024, 'GEN', 748, 1, 'AI'),
-(19, 1, 20, 2024, 'EWS', 2155, 1, 'AI'),
-(20, 1, 20, 2024, 'EWS', 4509, 1, 'AI'),
-(21, 1, 20, 2024, 'OBC', 5946, 1, 'AI'),
-(22, 1, 20, 2024, 'OBC', 13366, 1, 'AI'),
-(23, 1, 20, 2024, 'OBC', 639, 1, 'AI'),
-(24, 1, 20, 2024, 'SC', 3855, 1, 'AI'),
-(25, 1, 20, 2024, 'SC', 5994, 1, 'AI'),
-(26, 1, 20, 2024, 'ST', 1749, 1, 'AI'),
-(27, 1, 20, 2024, 'ST', 3010, 1, 'AI'),
-(28, 1, 27, 2024, 'GEN', 12276, 1, 'AI'),
-(29, 1, 27, 2024, 'GEN', 19657, 1, 'AI'),
-(30, 1, 27, 2024, 'GEN', 371, 1, 'AI'),
-(31, 1, 27, 2024, 'GEN', 604, 1, 'AI'),
-(32, 1, 27, 2024, 'EWS', 1777, 1, 'AI'),
-(33, 1, 27, 2024, 'EWS', 3133, 1, 'AI'),
-(34, 1, 27, 2024, 'OBC', 5055, 1, 'AI'),
-(35, 1, 27, 2024, 'OBC', 9676, 1, 'AI'),
-(36, 1, 27, 2024, 'OBC', 300, 1, 'AI'),
-(37, 1, 27, 2024, 'SC', 3511, 1, 'AI'),
-(38, 1, 27, 2024, 'SC', 5372, 1, 'AI'),
-(39, 1, 27, 2024, 'ST', 1594, 1, 'AI'),
-(40, 1, 27, 2024, 'ST', 3499, 1, 'AI'),
-(41, 1, 27, 2024, 'GEN', 14457, 1, 'AI'),
-(42, 1, 27, 2024, 'GEN', 21486, 1, 'AI'),
-(43, 1, 27, 2024, 'GEN', 305, 1, 'AI'),
-(44, 1, 27, 2024, 'EWS', 2063, 1, 'AI'),
-(45, 1, 27, 2024, 'EWS', 3866, 1, 'AI'),
-(46, 1, 27, 2024, 'OBC', 5745, 1, 'AI'),
-(47, 1, 27, 2024, 'OBC', 10281, 1, 'AI'),
-(48, 1, 27, 2024, 'OBC', 1091, 1, 'AI'),
-(49, 1, 27, 2024, 'SC', 3832, 1, 'AI'),
-(50, 1, 27, 2024, 'SC', 6444, 1, 'AI'),
-(51, 1, 27, 2024, 'ST', 2009, 1, 'AI'),
-(52, 1, 27, 2024, 'ST', 2473, 1, 'AI'),
-(53, 1, 29, 2024, 'GEN', 10587, 1, 'AI'),
-(54, 1, 29, 2024, 'GEN', 17248, 1, 'AI'),
-(55, 1, 29, 2024, 'GEN', 629, 1, 'AI'),
-(56, 1, 29, 2024, 'EWS', 1589, 1, 'AI'),
-(57, 1, 29, 2024, 'EWS', 2684, 1, 'AI'),
-(58, 1, 29, 2024, 'OBC', 4475, 1, 'AI'),
-(59, 1, 29, 2024, 'OBC', 8474, 1, 'AI'),
-(60, 1, 29, 2024, 'OBC', 631, 1, 'AI'),
-(61, 1, 29, 2024, 'SC', 3000, 1, 'AI'),
-(62, 1, 29, 2024, 'SC', 3371, 1, 'AI'),
-(63, 1, 29, 2024, 'ST', 1487, 1, 'AI'),
-(64, 1, 29, 2024, 'ST', 2278, 1, 'AI'),
-(65, 10, 1, 2024, 'GEN', 25801, 1, 'AI'),
-(66, 10, 1, 2024, 'GEN', 34100, 1, 'AI'),
-(67, 10, 1, 2024, 'GEN', 1172, 1, 'AI'),
-(68, 10, 1, 2024, 'EWS', 4061, 1, 'AI'),
-(69, 10, 1, 2024, 'EWS', 5282, 1, 'AI'),
-(70, 10, 1, 2024, 'OBC', 10485, 1, 'AI'),
-(71, 10, 1, 2024, 'OBC', 14939, 1, 'AI'),
-(72, 10, 1, 2024, 'OBC', 709, 1, 'AI'),
-(73, 10, 1, 2024, 'SC', 6645, 1, 'AI'),
-(74, 10, 1, 2024, 'SC', 7939, 1, 'AI'),
-(75, 10, 1, 2024, 'ST', 3234, 1, 'AI'),
-(76, 10, 1, 2024, 'ST', 3524, 1, 'AI'),
-(77, 10, 9, 2024, 'GEN', 23800, 1, 'AI'),
-(78, 10, 9, 2024, 'GEN', 31746, 1, 'AI'),
-(79, 10, 9, 2024, 'GEN', 1071, 1, 'AI'),
-(80, 10, 9, 2024, 'GEN', 1671, 1, 'AI'),
-(81, 10, 9, 2024, 'EWS', 3830, 1, 'AI'),
-(82, 10, 9, 2024, 'EWS', 5270, 1, 'AI'),
-(83, 10, 9, 2024, 'EWS', 152, 1, 'AI'),
-(84, 10, 9, 2024, 'OBC', 9992, 1, 'AI'),
-(85, 10, 9, 2024, 'OBC', 15304, 1, 'AI'),
-(86, 10, 9, 2024, 'OBC', 841, 1, 'AI'),
-(87, 10, 9, 2024, 'OBC', 922, 1, 'AI'),
-(88, 10, 9, 2024, 'SC', 6460, 1, 'AI'),
-(89, 10, 9, 2024, 'SC', 7547, 1, 'AI'),
-(90, 10, 9, 2024, 'SC', 205, 1, 'AI'),
-(91, 10, 9, 2024, 'ST', 3085, 1, 'AI'),
-(92, 10, 9, 2024, 'ST', 3771, 1, 'AI'),
-(93, 10, 21, 2024, 'GEN', 30755, 1, 'AI'),
-(94, 10, 21, 2024, 'GEN', 36882, 1, 'AI'),
-(95, 10, 21, 2024, 'GEN', 1321, 1, 'AI'),
-(96, 10, 21, 2024, 'EWS', 5102, 1, 'AI'),
-(97, 10, 21, 2024, 'EWS', 5831, 1, 'AI'),
-(98, 10, 21, 2024, 'OBC', 12674, 1, 'AI'),
-(99, 10, 21, 2024, 'OBC', 17834, 1, 'AI'),
-(100, 10, 21, 2024, 'OBC', 740, 1, 'AI'),
-(101, 10, 21, 2024, 'SC', 7073, 1, 'AI'),
-(102, 10, 21, 2024, 'SC', 7787, 1, 'AI'),
-(103, 10, 21, 2024, 'SC', 88, 1, 'AI'),
-(104, 10, 21, 2024, 'ST', 3136, 1, 'AI'),
-(105, 10, 21, 2024, 'ST', 3642, 1, 'AI'),
-(106, 5, 9, 2024, 'GEN', 19105, 1, 'AI'),
-(107, 5, 9, 2024, 'GEN', 30009, 1, 'AI'),
-(108, 5, 9, 2024, 'GEN', 1089, 1, 'AI'),
-(109, 5, 9, 2024, 'GEN', 1100, 1, 'AI'),
-(110, 5, 9, 2024, 'EWS', 3221, 1, 'AI'),
-(111, 5, 9, 2024, 'EWS', 5610, 1, 'AI'),
-(112, 5, 9, 2024, 'EWS', 279, 1, 'AI'),
-(113, 5, 9, 2024, 'OBC', 7560, 1, 'AI'),
-(114, 5, 9, 2024, 'OBC', 13143, 1, 'AI'),
-(115, 5, 9, 2024, 'OBC', 670, 1, 'AI'),
-(116, 5, 9, 2024, 'SC', 4871, 1, 'AI'),
-(117, 5, 9, 2024, 'SC', 7204, 1, 'AI'),
-(118, 5, 9, 2024, 'SC', 98, 1, 'AI'),
-(119, 5, 9, 2024, 'ST', 2448, 1, 'AI'),
-(120, 5, 9, 2024, 'ST', 3322, 1, 'AI'),
-(121, 5, 21, 2024, 'GEN', 26015, 1, 'AI'),
-(122, 5, 21, 2024, 'GEN', 37709, 1, 'AI'),
-(123, 5, 21, 2024, 'GEN', 1219, 1, 'AI'),
-(124, 5, 21, 2024, 'EWS', 4437, 1, 'AI'),
-(125, 5, 21, 2024, 'EWS', 5684, 1, 'AI'),
-(126, 5, 21, 2024, 'OBC', 10305, 1, 'AI'),
-(127, 5, 21, 2024, 'OBC', 16454, 1, 'AI'),
-(128, 5, 21, 2024, 'OBC', 725, 1, 'AI'),
-(129, 5, 21, 2024, 'SC', 6433, 1, 'AI'),
-(130, 5, 21, 2024, 'SC', 8108, 1, 'AI'),
-(131, 5, 21, 2024, 'ST', 2699, 1, 'AI'),
-(132, 5, 21, 2024, 'ST', 3514, 1, 'AI'),
-(133, 18, 1, 2024, 'GEN', 31407, 1, 'AI'),
-(134, 18, 1, 2024, 'GEN', 34972, 1, 'AI'),
-(135, 18, 1, 2024, 'EWS', 5567, 1, 'AI'),
-(136, 18, 1, 2024, 'OBC', 14046, 1, 'AI'),
-(137, 18, 1, 2024, 'OBC', 18179, 1, 'AI'),
-(138, 18, 1, 2024, 'SC', 4755, 1, 'AI'),
-(139, 18, 1, 2024, 'ST', 3145, 1, 'AI'),
-(140, 18, 9, 2024, 'GEN', 37079, 1, 'AI'),
-(141, 18, 9, 2024, 'GEN', 37359, 1, 'AI'),
-(142, 18, 9, 2024, 'GEN', 1200, 1, 'AI'),
-(143, 18, 9, 2024, 'EWS', 5871, 1, 'AI'),
-(144, 18, 9, 2024, 'EWS', 6876, 1, 'AI'),
-(145, 18, 9, 2024, 'OBC', 14582, 1, 'AI'),
-(146, 18, 9, 2024, 'OBC', 17885, 1, 'AI'),
-(147, 18, 9, 2024, 'OBC', 902, 1, 'AI'),
-(148, 18, 9, 2024, 'SC', 7014, 1, 'AI'),
-(149, 18, 9, 2024, 'SC', 7587, 1, 'AI'),
-(150, 18, 9, 2024, 'SC', 310, 1, 'AI'),
-(151, 18, 9, 2024, 'ST', 4090, 1, 'AI'),
-(152, 18, 9, 2024, 'ST', 4386, 1, 'AI'),
-(153, 18, 9, 2024, 'GEN', 37267, 1, 'AI'),
-(154, 18, 9, 2024, 'GEN', 38822, 1, 'AI'),
-(155, 18, 9, 2024, 'EWS', 5674, 1, 'AI'),
-(156, 18, 9, 2024, 'OBC', 14705, 1, 'AI'),
-(157, 18, 9, 2024, 'OBC', 18373, 1, 'AI'),
-(158, 18, 9, 2024, 'SC', 7383, 1, 'AI'),
-(159, 18, 9, 2024, 'ST', 4025, 1, 'AI'),
-(160, 18, 21, 2024, 'GEN', 39257, 1, 'AI'),
-(161, 18, 21, 2024, 'GEN', 40506, 1, 'AI'),
-(162, 18, 21, 2024, 'GEN', 347, 1, 'AI'),
-(163, 18, 21, 2024, 'EWS', 6331, 1, 'AI'),
-(164, 18, 21, 2024, 'EWS', 7119, 1, 'AI'),
-(165, 18, 21, 2024, 'OBC', 15433, 1, 'AI'),
-(166, 18, 21, 2024, 'OBC', 18618, 1, 'AI'),
-(167, 18, 21, 2024, 'OBC', 1262, 1, 'AI'),
-(168, 18, 21, 2024, 'SC', 8160, 1, 'AI'),
-(169, 18, 21, 2024, 'SC', 5358, 1, 'AI'),
-(170, 18, 21, 2024, 'ST', 4304, 1, 'AI'),
-(171, 19, 9, 2024, 'GEN', 27194, 1, 'AI'),
-(172, 19, 9, 2024, 'GEN', 1225, 1, 'AI'),
-(173, 19, 9, 2024, 'EWS', 4300, 1, 'AI'),
-(174, 19, 9, 2024, 'EWS', 173, 1, 'AI'),
-(175, 19, 9, 2024, 'OBC', 11745, 1, 'AI'),
-(176, 19, 9, 2024, 'OBC', 721, 1, 'AI'),
-(177, 19, 9, 2024, 'SC', 7315, 1, 'AI'),
-(178, 19, 9, 2024, 'ST', 3628, 1, 'AI'),
-(179, 19, 8, 2024, 'GEN', 29823, 1, 'AI'),
-(180, 19, 8, 2024, 'GEN', 1218, 1, 'AI'),
-(181, 19, 8, 2024, 'EWS', 4595, 1, 'AI'),
-(182, 19, 8, 2024, 'OBC', 12531, 1, 'AI'),
-(183, 19, 8, 2024, 'SC', 7570, 1, 'AI'),
-(184, 19, 8, 2024, 'ST', 3751, 1, 'AI'),
-(185, 19, 25, 2024, 'GEN', 30680, 1, 'AI'),
-(186, 19, 25, 2024, 'GEN', 1327, 1, 'AI'),
-(187, 19, 25, 2024, 'EWS', 4872, 1, 'AI'),
-(188, 19, 25, 2024, 'OBC', 12699, 1, 'AI'),
-(189, 19, 25, 2024, 'OBC', 558, 1, 'AI'),
-(190, 19, 25, 2024, 'SC', 7588, 1, 'AI'),
-(191, 19, 25, 2024, 'ST', 3797, 1, 'AI'),
-(192, 21, 9, 2024, 'GEN', 29642, 1, 'AI'),
-(193, 21, 9, 2024, 'GEN', 28384, 1, 'AI'),
-(194, 21, 9, 2024, 'GEN', 925, 1, 'AI'),
-(195, 21, 9, 2024, 'EWS', 4725, 1, 'AI'),
-(196, 21, 9, 2024, 'EWS', 5692, 1, 'AI'),
-(197, 21, 9, 2024, 'EWS', 184, 1, 'AI'),
-(198, 21, 9, 2024, 'OBC', 11776, 1, 'AI'),
-(199, 21, 9, 2024, 'OBC', 13033, 1, 'AI'),
-(200, 21, 9, 2024, 'OBC', 934, 1, 'AI'),
-(201, 21, 9, 2024, 'SC', 7232, 1, 'AI'),
-(202, 21, 9, 2024, 'SC', 6735, 1, 'AI'),
-(203, 21, 9, 2024, 'ST', 3805, 1, 'AI'),
-(204, 21, 9, 2024, 'GEN', 31192, 1, 'AI'),
-(205, 21, 9, 2024, 'GEN', 1413, 1, 'AI'),
-(206, 21, 9, 2024, 'EWS', 4865, 1, 'AI'),
-(207, 21, 9, 2024, 'OBC', 12868, 1, 'AI'),
-(208, 21, 9, 2024, 'SC', 7321, 1, 'AI'),
-(209, 21, 9, 2024, 'ST', 3555, 1, 'AI'),
-(210, 21, 9, 2024, 'GEN', 30961, 1, 'AI'),
-(211, 21, 9, 2024, 'EWS', 4764, 1, 'AI'),
-(212, 21, 9, 2024, 'OBC', 12405, 1, 'AI'),
-(213, 21, 9, 2024, 'SC', 7359, 1, 'AI'),
-(214, 21, 9, 2024, 'ST', 3943, 1, 'AI'),
-(215, 21, 21, 2024, 'GEN', 35148, 1, 'AI'),
-(216, 21, 21, 2024, 'GEN', 33670, 1, 'AI'),
-(217, 21, 21, 2024, 'GEN', 1670, 1, 'AI'),
-(218, 21, 21, 2024, 'EWS', 5633, 1, 'AI'),
-(219, 21, 21, 2024, 'EWS', 371, 1, 'AI'),
-(220, 21, 21, 2024, 'OBC', 14238, 1, 'AI'),
-(221, 21, 21, 2024, 'OBC', 17723, 1, 'AI'),
-(222, 21, 21, 2024, 'OBC', 1202, 1, 'AI'),
-(223, 21, 21, 2024, 'SC', 8583, 1, 'AI'),
-(224, 21, 21, 2024, 'SC', 8229, 1, 'AI'),
-(225, 21, 21, 2024, 'ST', 4368, 1, 'AI'),
-(226, 9, 1, 2024, 'GEN', 25197, 1, 'AI'),
-(227, 9, 1, 2024, 'GEN', 30414, 1, 'AI'),
-(228, 9, 1, 2024, 'GEN', 378, 1, 'AI'),
-(229, 9, 1, 2024, 'EWS', 4052, 1, 'AI'),
-(230, 9, 1, 2024, 'EWS', 4784, 1, 'AI'),
-(231, 9, 1, 2024, 'OBC', 10110, 1, 'AI'),
-(232, 9, 1, 2024, 'OBC', 13421, 1, 'AI'),
-(233, 9, 1, 2024, 'OBC', 357, 1, 'AI'),
-(234, 9, 1, 2024, 'SC', 6095, 1, 'AI'),
-(235, 9, 1, 2024, 'SC', 4673, 1, 'AI'),
-(236, 9, 1, 2024, 'ST', 3354, 1, 'AI'),
-(237, 9, 1, 2024, 'ST', 2771, 1, 'AI'),
-(238, 9, 9, 2024, 'GEN', 24016, 1, 'AI'),
-(239, 9, 9, 2024, 'GEN', 30312, 1, 'AI'),
-(240, 9, 9, 2024, 'GEN', 1266, 1, 'AI'),
-(241, 9, 9, 2024, 'GEN', 826, 1, 'AI'),
-(242, 9, 9, 2024, 'EWS', 3922, 1, 'AI'),
-(243, 9, 9, 2024, 'EWS', 5336, 1, 'AI'),
-(244, 9, 9, 2024, 'EWS', 192, 1, 'AI'),
-(245, 9, 9, 2024, 'OBC', 9854, 1, 'AI'),
-(246, 9, 9, 2024, 'OBC', 12578, 1, 'AI'),
-(247, 9, 9, 2024, 'OBC', 663, 1, 'AI'),
-(248, 9, 9, 2024, 'SC', 7087, 1, 'AI'),
-(249, 9, 9, 2024, 'SC', 7624, 1, 'AI'),
-(250, 9, 9, 2024, 'SC', 261, 1, 'AI'),
-(251, 9, 9, 2024, 'ST', 3413, 1, 'AI'),
-(252, 9, 9, 2024, 'ST', 3829, 1, 'AI'),
-(253, 9, 21, 2024, 'GEN', 29056, 1, 'AI'),
-(254, 9, 21, 2024, 'GEN', 38560, 1, 'AI'),
-(255, 9, 21, 2024, 'GEN', 1377, 1, 'AI'),
-(256, 9, 21, 2024, 'EWS', 5069, 1, 'AI'),
-(257, 9, 21, 2024, 'EWS', 5414, 1, 'AI'),
-(258, 9, 21, 2024, 'OBC', 11517, 1, 'AI'),
-(259, 9, 21, 2024, 'OBC', 15367, 1, 'AI'),
-(260, 9, 21, 2024, 'OBC', 691, 1, 'AI'),
-(261, 9, 21, 2024, 'SC', 7781, 1, 'AI'),
-(262, 9, 21, 2024, 'SC', 8014, 1, 'AI'),
-(263, 9, 21, 2024, 'ST', 3519, 1, 'AI'),
-(264, 9, 21, 2024, 'ST', 4094, 1, 'AI'),
-(265, 22, 1, 2024, 'GEN', 23173, 1, 'AI'),
-(266, 22, 1, 2024, 'GEN', 32709, 1, 'AI'),
-(267, 22, 1, 2024, 'GEN', 704, 1, 'AI'),
-(268, 22, 1, 2024, 'EWS', 3839, 1, 'AI'),
-(269, 22, 1, 2024, 'EWS', 5356, 1, 'AI'),
-(270, 22, 1, 2024, 'OBC', 10344, 1, 'AI'),
-(271, 22, 1, 2024, 'OBC', 15285, 1, 'AI'),
-(272, 22, 1, 2024, 'OBC', 1120, 1, 'AI'),
-(273, 22, 1, 2024, 'SC', 7222, 1, 'AI'),
-(274, 22, 1, 2024, 'SC', 8187, 1, 'AI'),
-(275, 22, 1, 2024, 'ST', 3384, 1, 'AI'),
-(276, 22, 1, 2024, 'ST', 3622, 1, 'AI'),
-(277, 22, 9, 2024, 'GEN', 21060, 1, 'AI'),
-(278, 22, 9, 2024, 'GEN', 28232, 1, 'AI'),
-(279, 22, 9, 2024, 'GEN', 994, 1, 'AI'),
-(280, 22, 9, 2024, 'GEN', 900, 1, 'AI'),
-(281, 22, 9, 2024, 'EWS', 3631, 1, 'AI'),
-(282, 22, 9, 2024, 'EWS', 5020, 1, 'AI'),
-(283, 22, 9, 2024, 'EWS', 179, 1, 'AI'),
-(284, 22, 9, 2024, 'OBC', 9585, 1, 'AI'),
-(285, 22, 9, 2024, 'OBC', 15123, 1, 'AI'),
-(286, 22, 9, 2024, 'OBC', 863, 1, 'AI'),
-(287, 22, 9, 2024, 'OBC', 874, 1, 'AI'),
-(288, 22, 9, 2024, 'SC', 6562, 1, 'AI'),
-(289, 22, 9, 2024, 'SC', 7750, 1, 'AI'),
-(290, 22, 9, 2024, 'ST', 3126, 1, 'AI'),
-(291, 22, 9, 2024, 'ST', 3352, 1, 'AI'),
-(292, 22, 21, 2024, 'GEN', 31029, 1, 'AI'),
-(293, 22, 21, 2024, 'GEN', 38819, 1, 'AI'),
-(294, 22, 21, 2024, 'GEN', 2042, 1, 'AI'),
-(295, 22, 21, 2024, 'EWS', 4557, 1, 'AI'),
-(296, 22, 21, 2024, 'EWS', 5920, 1, 'AI'),
-(297, 22, 21, 2024, 'EWS', 283, 1, 'AI'),
-(298, 22, 21, 2024, 'OBC', 13598, 1, 'AI'),
-(299, 22, 21, 2024, 'OBC', 17815, 1, 'AI'),
-(300, 22, 21, 2024, 'OBC', 1040, 1, 'AI'),
-(301, 22, 21, 2024, 'SC', 8429, 1, 'AI'),
-(302, 22, 21, 2024, 'SC', 9393, 1, 'AI'),
-(303, 22, 21, 2024, 'ST', 3994, 1, 'AI'),
-(304, 22, 21, 2024, 'ST', 4806, 1, 'AI'),
-(305, 22, 25, 2024, 'GEN', 24053, 1, 'AI'),
-(306, 22, 25, 2024, 'GEN', 32279, 1, 'AI'),
-(307, 22, 25, 2024, 'GEN', 1386, 1, 'AI'),
-(308, 22, 25, 2024, 'EWS', 3693, 1, 'AI'),
-(309, 22, 25, 2024, 'EWS', 5294, 1, 'AI'),
-(310, 22, 25, 2024, 'OBC', 10216, 1, 'AI'),
-(311, 22, 25, 2024, 'OBC', 15359, 1, 'AI'),
-(312, 22, 25, 2024, 'OBC', 1143, 1, 'AI'),
-(313, 22, 25, 2024, 'SC', 7490, 1, 'AI'),
-(314, 22, 25, 2024, 'SC', 8447, 1, 'AI'),
-(315, 22, 25, 2024, 'ST', 3579, 1, 'AI'),
-(316, 22, 25, 2024, 'ST', 3705, 1, 'AI'),
-(317, 2, 21, 2024, 'GEN', 7228, 1, 'AI'),
-(318, 2, 21, 2024, 'GEN', 14511, 1, 'AI'),
-(319, 2, 21, 2024, 'GEN', 486, 1, 'AI'),
-(320, 2, 21, 2024, 'GEN', 576, 1, 'AI'),
-(321, 2, 21, 2024, 'EWS', 1066, 1, 'AI'),
-(322, 2, 21, 2024, 'EWS', 2194, 1, 'AI'),
-(323, 2, 21, 2024, 'EWS', 80, 1, 'AI'),
-(324, 2, 21, 2024, 'OBC', 3175, 1, 'AI'),
-(325, 2, 21, 2024, 'OBC', 7806, 1, 'AI'),
-(326, 2, 21, 2024, 'OBC', 246, 1, 'AI'),
-(327, 2, 21, 2024, 'SC', 2107, 1, 'AI'),
-(328, 2, 21, 2024, 'SC', 3637, 1, 'AI'),
-(329, 2, 21, 2024, 'SC', 91, 1, 'AI'),
-(330, 2, 21, 2024, 'ST', 1012, 1, 'AI'),
-(331, 2, 21, 2024, 'ST', 2378, 1, 'AI'),
-(332, 2, 25, 2024, 'GEN', 5177, 1, 'AI'),
-(333, 2, 25, 2024, 'GEN', 10333, 1, 'AI'),
-(334, 2, 25, 2024, 'GEN', 247, 1, 'AI'),
-(335, 2, 25, 2024, 'GEN', 339, 1, 'AI'),
-(336, 2, 25, 2024, 'EWS', 836, 1, 'AI'),
-(337, 2, 25, 2024, 'EWS', 1836, 1, 'AI'),
-(338, 2, 25, 2024, 'EWS', 56, 1, 'AI'),
-(339, 2, 25, 2024, 'OBC', 2409, 1, 'AI'),
-(340, 2, 25, 2024, 'OBC', 4713, 1, 'AI'),
-(341, 2, 25, 2024, 'OBC', 158, 1, 'AI'),
-(342, 2, 25, 2024, 'OBC', 234, 1, 'AI'),
-(343, 2, 25, 2024, 'SC', 1608, 1, 'AI'),
-(344, 2, 25, 2024, 'SC', 2975, 1, 'AI'),
-(345, 2, 25, 2024, 'SC', 50, 1, 'AI'),
-(346, 2, 25, 2024, 'ST', 847, 1, 'AI'),
-(347, 2, 25, 2024, 'ST', 919, 1, 'AI'),
-(348, 2, 25, 2024, 'ST', 110, 1, 'AI'),
-(349, 2, 25, 2024, 'GEN', 5368, 1, 'AI'),
-(350, 2, 25, 2024, 'GEN', 10412, 1, 'AI'),
-(351, 2, 25, 2024, 'GEN', 210, 1, 'AI'),
-(352, 2, 25, 2024, 'EWS', 847, 1, 'AI'),
-(353, 2, 25, 2024, 'EWS', 1845, 1, 'AI'),
-(354, 2, 25, 2024, 'OBC', 2458, 1, 'AI'),
-(355, 2, 25, 2024, 'OBC', 5325, 1, 'AI'),
-(356, 2, 25, 2024, 'OBC', 198, 1, 'AI'),
-(357, 2, 25, 2024, 'SC', 1628, 1, 'AI'),
-(358, 2, 25, 2024, 'SC', 2359, 1, 'AI'),
-(359, 2, 25, 2024, 'ST', 609, 1, 'AI'),
-(360, 2, 25, 2024, 'ST', 1186, 1, 'AI'),
-(361, 4, 5, 2024, 'GEN', 33876, 1, 'AI'),
-(362, 4, 5, 2024, 'GEN', 41751, 1, 'AI'),
-(363, 4, 5, 2024, 'GEN', 1581, 1, 'AI'),
-(364, 4, 5, 2024, 'EWS', 5630, 1, 'AI'),
-(365, 4, 5, 2024, 'EWS', 7356, 1, 'AI'),
-(366, 4, 5, 2024, 'OBC', 11439, 1, 'AI'),
-(367, 4, 5, 2024, 'OBC', 16856, 1, 'AI'),
-(368, 4, 5, 2024, 'OBC', 739, 1, 'AI'),
-(369, 4, 5, 2024, 'SC', 6229, 1, 'AI'),
-(370, 4, 5, 2024, 'SC', 7182, 1, 'AI'),
-(371, 4, 5, 2024, 'ST', 3171, 1, 'AI'),
-(372, 4, 5, 2024, 'ST', 3608, 1, 'AI'),
-(373, 4, 6, 2024, 'GEN', 25266, 1, 'AI'),
-(374, 4, 6, 2024, 'GEN', 34334, 1, 'AI'),
-(375, 4, 6, 2024, 'EWS', 4475, 1, 'AI'),
-(376, 4, 6, 2024, 'OBC', 8559, 1, 'AI'),
-(377, 4, 6, 2024, 'OBC', 11338, 1, 'AI'),
-(378, 4, 6, 2024, 'SC', 5181, 1, 'AI'),
-(379, 4, 6, 2024, 'SC', 6442, 1, 'AI'),
-(380, 4, 6, 2024, 'ST', 1875, 1, 'AI'),
-(381, 4, 7, 2024, 'GEN', 23466, 1, 'AI'),
-(382, 4, 7, 2024, 'GEN', 30829, 1, 'AI'),
-(383, 4, 7, 2024, 'GEN', 1331, 1, 'AI'),
-(384, 4, 7, 2024, 'EWS', 4429, 1, 'AI'),
-(385, 4, 7, 2024, 'OBC', 8726, 1, 'AI'),
-(386, 4, 7, 2024, 'OBC', 10730, 1, 'AI'),
-(387, 4, 7, 2024, 'SC', 4928, 1, 'AI'),
-(388, 4, 7, 2024, 'SC', 6281, 1, 'AI'),
-(389, 4, 7, 2024, 'ST', 2337, 1, 'AI'),
-(390, 4, 9, 2024, 'GEN', 16711, 1, 'AI'),
-(391, 4, 9, 2024, 'GEN', 20684, 1, 'AI'),
-(392, 4, 9, 2024, 'GEN', 458, 1, 'AI'),
-(393, 4, 9, 2024, 'GEN', 472, 1, 'AI'),
-(394, 4, 9, 2024, 'EWS', 2430, 1, 'AI'),
-(395, 4, 9, 2024, 'EWS', 3787, 1, 'AI'),
-(396, 4, 9, 2024, 'EWS', 85, 1, 'AI'),
-(397, 4, 9, 2024, 'OBC', 6002, 1, 'AI'),
-(398, 4, 9, 2024, 'OBC', 8899, 1, 'AI'),
-(399, 4, 9, 2024, 'OBC', 208, 1, 'AI'),
-(400, 4, 9, 2024, 'SC', 3413, 1, 'AI'),
-(401, 4, 9, 2024, 'SC', 4722, 1, 'AI'),
-(402, 4, 9, 2024, 'SC', 119, 1, 'AI'),
-(403, 4, 9, 2024, 'ST', 1805, 1, 'AI'),
-(404, 4, 9, 2024, 'ST', 2205, 1, 'AI'),
-(405, 4, 9, 2024, 'GEN', 20607, 1, 'AI'),
-(406, 4, 9, 2024, 'GEN', 25568, 1, 'AI'),
-(407, 4, 9, 2024, 'GEN', 688, 1, 'AI'),
-(408, 4, 9, 2024, 'EWS', 3371, 1, 'AI'),
-(409, 4, 9, 2024, 'EWS', 4410, 1, 'AI'),
-(410, 4, 9, 2024, 'OBC', 7427, 1, 'AI'),
-(411, 4, 9, 2024, 'OBC', 10516, 1, 'AI'),
-(412, 4, 9, 2024, 'OBC', 313, 1, 'AI'),
-(413, 4, 9, 2024, 'SC', 4534, 1, 'AI'),
-(414, 4, 9, 2024, 'SC', 6159, 1, 'AI'),
-(415, 4, 9, 2024, 'SC', 169, 1, 'AI'),
-(416, 4, 9, 2024, 'ST', 2143, 1, 'AI'),
-(417, 4, 9, 2024, 'ST', 3584, 1, 'AI'),
-(418, 4, 1, 2024, 'GEN', 17950, 1, 'AI'),
-(419, 4, 1, 2024, 'GEN', 20709, 1, 'AI'),
-(420, 4, 1, 2024, 'GEN', 363, 1, 'AI'),
-(421, 4, 1, 2024, 'EWS', 2860, 1, 'AI'),
-(422, 4, 1, 2024, 'EWS', 4261, 1, 'AI'),
-(423, 4, 1, 2024, 'OBC', 6150, 1, 'AI'),
-(424, 4, 1, 2024, 'OBC', 8172, 1, 'AI'),
-(425, 4, 1, 2024, 'OBC', 267, 1, 'AI'),
-(426, 4, 1, 2024, 'SC', 3414, 1, 'AI'),
-(427, 4, 1, 2024, 'SC', 3976, 1, 'AI'),
-(428, 4, 1, 2024, 'ST', 1874, 1, 'AI'),
-(429, 4, 1, 2024, 'ST', 2291, 1, 'AI'),
-(430, 4, 19, 2024, 'GEN', 40225, 1, 'AI'),
-(431, 4, 19, 2024, 'GEN', 2217, 1, 'AI'),
-(432, 4, 19, 2024, 'EWS', 7442, 1, 'AI'),
-(433, 4, 19, 2024, 'OBC', 14681, 1, 'AI'),
-(434, 4, 19, 2024, 'SC', 7077, 1, 'AI'),
-(435, 4, 19, 2024, 'ST', 3562, 1, 'AI'),
-(436, 4, 21, 2024, 'GEN', 23099, 1, 'AI'),
-(437, 4, 21, 2024, 'GEN', 30288, 1, 'AI'),
-(438, 4, 21, 2024, 'GEN', 874, 1, 'AI'),
-(439, 4, 21, 2024, 'GEN', 765, 1, 'AI'),
-(440, 4, 21, 2024, 'EWS', 3907, 1, 'AI'),
-(441, 4, 21, 2024, 'EWS', 4982, 1, 'AI'),
-(442, 4, 21, 2024, 'EWS', 228, 1, 'AI'),
-(443, 4, 21, 2024, 'OBC', 8028, 1, 'AI'),
-(444, 4, 21, 2024, 'OBC', 10405, 1, 'AI'),
-(445, 4, 21, 2024, 'OBC', 494, 1, 'AI'),
-(446, 4, 21, 2024, 'SC', 5281, 1, 'AI'),
-(447, 4, 21, 2024, 'SC', 6174, 1, 'AI'),
-(448, 4, 21, 2024, 'SC', 128, 1, 'AI'),
-(449, 4, 21, 2024, 'ST', 2282, 1, 'AI'),
-(450, 4, 21, 2024, 'ST', 2542, 1, 'AI'),
-(451, 4, 21, 2024, 'ST', 103, 1, 'AI'),
-(452, 4, 24, 2024, 'GEN', 32881, 1, 'AI'),
-(453, 4, 24, 2024, 'EWS', 6398, 1, 'AI'),
-(454, 4, 24, 2024, 'OBC', 11589, 1, 'AI'),
-(455, 4, 24, 2024, 'SC', 6991, 1, 'AI'),
-(456, 4, 24, 2024, 'ST', 3380, 1, 'AI'),
-(457, 4, 30, 2024, 'GEN', 37105, 1, 'AI'),
-(458, 4, 30, 2024, 'GEN', 47940, 1, 'AI'),
-(459, 4, 30, 2024, 'GEN', 1324, 1, 'AI'),
-(460, 4, 30, 2024, 'GEN', 1860, 1, 'AI'),
-(461, 4, 30, 2024, 'EWS', 6553, 1, 'AI'),
-(462, 4, 30, 2024, 'EWS', 8104, 1, 'AI'),
-(463, 4, 30, 2024, 'EWS', 274, 1, 'AI'),
-(464, 4, 30, 2024, 'OBC', 12492, 1, 'AI'),
-(465, 4, 30, 2024, 'OBC', 17148, 1, 'AI'),
-(466, 4, 30, 2024, 'OBC', 619, 1, 'AI'),
-(467, 4, 30, 2024, 'SC', 6685, 1, 'AI'),
-(468, 4, 30, 2024, 'SC', 8589, 1, 'AI'),
-(469, 4, 30, 2024, 'ST', 3039, 1, 'AI'),
-(470, 4, 30, 2024, 'ST', 4444, 1, 'AI'),
-(471, 4, 34, 2024, 'GEN', 43961, 1, 'AI'),
-(472, 4, 34, 2024, 'GEN', 44981, 1, 'AI'),
-(473, 4, 34, 2024, 'GEN', 1957, 1, 'AI'),
-(474, 4, 34, 2024, 'GEN', 1084, 1, 'AI'),
-(475, 4, 34, 2024, 'EWS', 7290, 1, 'AI'),
-(476, 4, 34, 2024, 'EWS', 8143, 1, 'AI'),
-(477, 4, 34, 2024, 'OBC', 14676, 1, 'AI'),
-(478, 4, 34, 2024, 'OBC', 16667, 1, 'AI'),
-(479, 4, 34, 2024, 'OBC', 887, 1, 'AI'),
-(480, 4, 34, 2024, 'SC', 8274, 1, 'AI'),
-(481, 4, 34, 2024, 'SC', 8796, 1, 'AI'),
-(482, 4, 34, 2024, 'ST', 3409, 1, 'AI'),
-(483, 4, 34, 2024, 'ST', 4379, 1, 'AI'),
-(484, 3, 9, 2024, 'GEN', 13297, 1, 'AI'),
-(485, 3, 9, 2024, 'GEN', 22018, 1, 'AI'),
-(486, 3, 9, 2024, 'GEN', 647, 1, 'AI'),
-(487, 3, 9, 2024, 'GEN', 555, 1, 'AI'),
-(488, 3, 9, 2024, 'EWS', 2008, 1, 'AI'),
-(489, 3, 9, 2024, 'EWS', 3707, 1, 'AI'),
-(490, 3, 9, 2024, 'EWS', 125, 1, 'AI'),
-(491, 3, 9, 2024, 'EWS', 195, 1, 'AI'),
-(492, 3, 9, 2024, 'OBC', 4946, 1, 'AI'),
-(493, 3, 9, 2024, 'OBC', 9866, 1, 'AI'),
-(494, 3, 9, 2024, 'OBC', 291, 1, 'AI'),
-(495, 3, 9, 2024, 'SC', 3312, 1, 'AI'),
-(496, 3, 9, 2024, 'SC', 5123, 1, 'AI'),
-(497, 3, 9, 2024, 'SC', 132, 1, 'AI'),
-(498, 3, 9, 2024, 'ST', 1619, 1, 'AI'),
-(499, 3, 9, 2024, 'ST', 1999, 1, 'AI'),
-(500, 3, 9, 2024, 'ST', 11, 1, 'AI'),
-(501, 3, 21, 2024, 'GEN', 17840, 1, 'AI'),
-(502, 3, 21, 2024, 'GEN', 28029, 1, 'AI'),
-(503, 3, 21, 2024, 'GEN', 1069, 1, 'AI'),
-(504, 3, 21, 2024, 'GEN', 1164, 1, 'AI'),
-(505, 3, 21, 2024, 'EWS', 2775, 1, 'AI'),
-(506, 3, 21, 2024, 'EWS', 4210, 1, 'AI'),
-(507, 3, 21, 2024, 'EWS', 175, 1, 'AI'),
-(508, 3, 21, 2024, 'OBC', 6667, 1, 'AI'),
-(509, 3, 21, 2024, 'OBC', 11108, 1, 'AI'),
-(510, 3, 21, 2024, 'OBC', 451, 1, 'AI'),
-(511, 3, 21, 2024, 'OBC', 962, 1, 'AI'),
-(512, 3, 21, 2024, 'SC', 4135, 1, 'AI'),
-(513, 3, 21, 2024, 'SC', 6103, 1, 'AI'),
-(514, 3, 21, 2024, 'SC', 293, 1, 'AI'),
-(515, 3, 21, 2024, 'ST', 2147, 1, 'AI'),
-(516, 3, 21, 2024, 'ST', 2964, 1, 'AI'),
-(517, 3, 30, 2024, 'GEN', 35665, 1, 'AI'),
-(518, 3, 30, 2024, 'GEN', 44699, 1, 'AI'),
-(519, 3, 30, 2024, 'GEN', 2032, 1, 'AI'),
-(520, 3, 30, 2024, 'GEN', 3482, 1, 'AI'),
-(521, 3, 30, 2024, 'EWS', 5926, 1, 'AI'),
-(522, 3, 30, 2024, 'EWS', 6708, 1, 'AI'),
-(523, 3, 30, 2024, 'OBC', 13777, 1, 'AI'),
-(524, 3, 30, 2024, 'OBC', 18619, 1, 'AI'),
-(525, 3, 30, 2024, 'OBC', 937, 1, 'AI'),
-(526, 3, 30, 2024, 'SC', 6565, 1, 'AI'),
-(527, 3, 30, 2024, 'SC', 9490, 1, 'AI'),
-(528, 3, 30, 2024, 'ST', 2859, 1, 'AI'),
-(529, 3, 30, 2024, 'ST', 3544, 1, 'AI'),
-(530, 3, 34, 2024, 'GEN', 43412, 1, 'AI'),
-(531, 3, 34, 2024, 'GEN', 55535, 1, 'AI'),
-(532, 3, 34, 2024, 'GEN', 2596, 1, 'AI'),
-(533, 3, 34, 2024, 'EWS', 6732, 1, 'AI'),
-(534, 3, 34, 2024, 'EWS', 7917, 1, 'AI'),
-(535, 3, 34, 2024, 'OBC', 15752, 1, 'AI'),
-(536, 3, 34, 2024, 'OBC', 19620, 1, 'AI'),
-(537, 3, 34, 2024, 'OBC', 1113, 1, 'AI'),
-(538, 3, 34, 2024, 'SC', 8239, 1, 'AI'),
-(539, 3, 34, 2024, 'SC', 9503, 1, 'AI'),
-(540, 3, 34, 2024, 'ST', 3207, 1, 'AI'),
-(541, 3, 34, 2024, 'ST', 4343, 1, 'AI'),
-(542, 16, 1, 2024, 'GEN', 18196, 1, 'AI'),
-(543, 16, 1, 2024, 'GEN', 375, 1, 'AI'),
-(544, 16, 1, 2024, 'EWS', 3993, 1, 'AI'),
-(545, 16, 1, 2024, 'OBC', 9265, 1, 'AI'),
-(546, 16, 1, 2024, 'OBC', 299, 1, 'AI'),
-(547, 16, 1, 2024, 'SC', 2622, 1, 'AI'),
-(548, 16, 1, 2024, 'ST', 2159, 1, 'AI'),
-(549, 16, 9, 2024, 'GEN', 24734, 1, 'AI'),
-(550, 16, 9, 2024, 'GEN', 33768, 1, 'AI'),
-(551, 16, 9, 2024, 'GEN', 543, 1, 'AI'),
-(552, 16, 9, 2024, 'EWS', 4011, 1, 'AI'),
-(553, 16, 9, 2024, 'EWS', 5796, 1, 'AI'),
-(554, 16, 9, 2024, 'OBC', 9527, 1, 'AI'),
-(555, 16, 9, 2024, 'OBC', 13155, 1, 'AI'),
-(556, 16, 9, 2024, 'OBC', 389, 1, 'AI'),
-(557, 16, 9, 2024, 'OBC', 732, 1, 'AI'),
-(558, 16, 9, 2024, 'SC', 3354, 1, 'AI'),
-(559, 16, 9, 2024, 'SC', 7002, 1, 'AI'),
-(560, 16, 9, 2024, 'ST', 2299, 1, 'AI'),
-(561, 16, 9, 2024, 'ST', 3480, 1, 'AI'),
-(562, 16, 21, 2024, 'GEN', 31337, 1, 'AI'),
-(563, 16, 21, 2024, 'GEN', 41400, 1, 'AI'),
-(564, 16, 21, 2024, 'GEN', 1193, 1, 'AI'),
-(565, 16, 21, 2024, 'GEN', 1521, 1, 'AI'),
-(566, 16, 21, 2024, 'EWS', 5169, 1, 'AI'),
-(567, 16, 21, 2024, 'EWS', 6559, 1, 'AI'),
-(568, 16, 21, 2024, 'EWS', 168, 1, 'AI'),
-(569, 16, 21, 2024, 'OBC', 12132, 1, 'AI'),
-(570, 16, 21, 2024, 'OBC', 15086, 1, 'AI'),
-(571, 16, 21, 2024, 'SC', 6701, 1, 'AI'),
-(572, 16, 21, 2024, 'SC', 7332, 1, 'AI'),
-(573, 16, 21, 2024, 'SC', 282, 1, 'AI'),
-(574, 16, 21, 2024, 'ST', 3046, 1, 'AI'),
-(575, 16, 21, 2024, 'ST', 4382, 1, 'AI'),
-(576, 16, 21, 2024, 'GEN', 28063, 1, 'AI'),
-(577, 16, 21, 2024, 'EWS', 5106, 1, 'AI'),
-(578, 16, 21, 2024, 'OBC', 10573, 1, 'AI'),
-(579, 16, 21, 2024, 'OBC', 406, 1, 'AI'),
-(580, 16, 21, 2024, 'SC', 5604, 1, 'AI'),
-(581, 16, 21, 2024, 'ST', 2204, 1, 'AI'),
-(582, 14, 9, 2024, 'GEN', 8540, 1, 'AI'),
-(583, 14, 9, 2024, 'GEN', 14459, 1, 'AI'),
-(584, 14, 9, 2024, 'GEN', 259, 1, 'AI'),
-(585, 14, 9, 2024, 'EWS', 1269, 1, 'AI'),
-(586, 14, 9, 2024, 'EWS', 137, 1, 'AI'),
-(587, 14, 9, 2024, 'OBC', 3480, 1, 'AI'),
-(588, 14, 9, 2024, 'OBC', 6178, 1, 'AI'),
-(589, 14, 9, 2024, 'OBC', 210, 1, 'AI'),
-(590, 14, 9, 2024, 'SC', 2166, 1, 'AI'),
-(591, 14, 9, 2024, 'SC', 4122, 1, 'AI'),
-(592, 14, 9, 2024, 'ST', 1606, 1, 'AI'),
-(593, 14, 9, 2024, 'ST', 1841, 1, 'AI'),
-(594, 14, 1, 2024, 'GEN', 8844, 1, 'AI'),
-(595, 14, 1, 2024, 'GEN', 14171, 1, 'AI'),
-(596, 14, 1, 2024, 'GEN', 222, 1, 'AI'),
-(597, 14, 1, 2024, 'EWS', 1259, 1, 'AI'),
-(598, 14, 1, 2024, 'EWS', 2537, 1, 'AI'),
-(599, 14, 1, 2024, 'OBC', 3310, 1, 'AI'),
-(600, 14, 1, 2024, 'OBC', 7473, 1, 'AI'),
-(601, 14, 1, 2024, 'OBC', 341, 1, 'AI'),
-(602, 14, 1, 2024, 'SC', 2363, 1, 'AI'),
-(603, 14, 1, 2024, 'SC', 3789, 1, 'AI'),
-(604, 14, 1, 2024, 'ST', 1205, 1, 'AI'),
-(605, 14, 1, 2024, 'ST', 1699, 1, 'AI'),
-(606, 14, 9, 2024, 'GEN', 10105, 1, 'AI'),
-(607, 14, 9, 2024, 'GEN', 18174, 1, 'AI'),
-(608, 14, 9, 2024, 'GEN', 359, 1, 'AI'),
-(609, 14, 9, 2024, 'EWS', 1498, 1, 'AI'),
-(610, 14, 9, 2024, 'EWS', 2721, 1, 'AI'),
-(611, 14, 9, 2024, 'OBC', 4048, 1, 'AI'),
-(612, 14, 9, 2024, 'OBC', 7506, 1, 'AI'),
-(613, 14, 9, 2024, 'OBC', 459, 1, 'AI'),
-(614, 14, 9, 2024, 'OBC', 847, 1, 'AI'),
-(615, 14, 9, 2024, 'SC', 3117, 1, 'AI'),
-(616, 14, 9, 2024, 'SC', 5190, 1, 'AI'),
-(617, 14, 9, 2024, 'ST', 1665, 1, 'AI'),
-(618, 14, 9, 2024, 'ST', 2457, 1, 'AI'),
-(619, 14, 25, 2024, 'GEN', 10165, 1, 'AI'),
-(620, 14, 25, 2024, 'GEN', 16957, 1, 'AI'),
-(621, 14, 25, 2024, 'GEN', 346, 1, 'AI'),
-(622, 14, 25, 2024, 'GEN', 361, 1, 'AI'),
-(623, 14, 25, 2024, 'EWS', 1450, 1, 'AI'),
-(624, 14, 25, 2024, 'EWS', 2789, 1, 'AI'),
-(625, 14, 25, 2024, 'OBC', 4168, 1, 'AI'),
-(626, 14, 25, 2024, 'OBC', 8318, 1, 'AI'),
-(627, 14, 25, 2024, 'OBC', 236, 1, 'AI'),
-(628, 14, 25, 2024, 'SC', 3253, 1, 'AI'),
-(629, 14, 25, 2024, 'SC', 5252, 1, 'AI'),
-(630, 14, 25, 2024, 'ST', 1947, 1, 'AI'),
-(631, 14, 25, 2024, 'ST', 2644, 1, 'AI'),
-(632, 17, 9, 2024, 'GEN', 34726, 1, 'AI'),
-(633, 17, 9, 2024, 'GEN', 38042, 1, 'AI'),
-(634, 17, 9, 2024, 'GEN', 868, 1, 'AI'),
-(635, 17, 9, 2024, 'EWS', 5468, 1, 'AI'),
-(636, 17, 9, 2024, 'EWS', 6586, 1, 'AI'),
-(637, 17, 9, 2024, 'EWS', 126, 1, 'AI'),
-(638, 17, 9, 2024, 'OBC', 13682, 1, 'AI'),
-(639, 17, 9, 2024, 'OBC', 16670, 1, 'AI'),
-(640, 17, 9, 2024, 'OBC', 703, 1, 'AI'),
-(641, 17, 9, 2024, 'SC', 8118, 1, 'AI'),
-(642, 17, 9, 2024, 'SC', 7971, 1, 'AI'),
-(643, 17, 9, 2024, 'SC', 171, 1, 'AI'),
-(644, 17, 9, 2024, 'ST', 3316, 1, 'AI'),
-(645, 17, 9, 2024, 'ST', 2381, 1, 'AI'),
-(646, 17, 1, 2024, 'GEN', 36354, 1, 'AI'),
-(647, 17, 1, 2024, 'GEN', 39861, 1, 'AI'),
-(648, 17, 1, 2024, 'GEN', 1505, 1, 'AI'),
-(649, 17, 1, 2024, 'EWS', 5742, 1, 'AI'),
-(650, 17, 1, 2024, 'EWS', 6171, 1, 'AI'),
-(651, 17, 1, 2024, 'OBC', 14477, 1, 'AI'),
-(652, 17, 1, 2024, 'OBC', 17691, 1, 'AI'),
-(653, 17, 1, 2024, 'OBC', 857, 1, 'AI'),
-(654, 17, 1, 2024, 'SC', 8770, 1, 'AI'),
-(655, 17, 1, 2024, 'SC', 5998, 1, 'AI'),
-(656, 17, 1, 2024, 'SC', 188, 1, 'AI'),
-(657, 17, 1, 2024, 'ST', 3789, 1, 'AI'),
-(658, 17, 1, 2024, 'ST', 2385, 1, 'AI'),
-(659, 17, 21, 2024, 'GEN', 37861, 1, 'AI'),
-(660, 17, 21, 2024, 'GEN', 41807, 1, 'AI'),
-(661, 17, 21, 2024, 'GEN', 1647, 1, 'AI'),
-(662, 17, 21, 2024, 'EWS', 6116, 1, 'AI'),
-(663, 17, 21, 2024, 'EWS', 7094, 1, 'AI'),
-(664, 17, 21, 2024, 'EWS', 235, 1, 'AI'),
-(665, 17, 21, 2024, 'OBC', 15131, 1, 'AI'),
-(666, 17, 21, 2024, 'OBC', 18064, 1, 'AI'),
-(667, 17, 21, 2024, 'OBC', 995, 1, 'AI'),
-(668, 17, 21, 2024, 'SC', 8908, 1, 'AI'),
-(669, 17, 21, 2024, 'SC', 9003, 1, 'AI'),
-(670, 17, 21, 2024, 'ST', 4050, 1, 'AI'),
-(671, 17, 21, 2024, 'ST', 3682, 1, 'AI'),
-(672, 13, 1, 2024, 'GEN', 33418, 1, 'AI'),
-(673, 13, 1, 2024, 'GEN', 37880, 1, 'AI'),
-(674, 13, 1, 2024, 'GEN', 656, 1, 'AI'),
-(675, 13, 1, 2024, 'GEN', 1702, 1, 'AI'),
-(676, 13, 1, 2024, 'EWS', 4942, 1, 'AI'),
-(677, 13, 1, 2024, 'EWS', 5685, 1, 'AI'),
-(678, 13, 1, 2024, 'OBC', 12973, 1, 'AI'),
-(679, 13, 1, 2024, 'OBC', 15627, 1, 'AI'),
-(680, 13, 1, 2024, 'SC', 5843, 1, 'AI'),
-(681, 13, 1, 2024, 'SC', 7261, 1, 'AI'),
-(682, 13, 1, 2024, 'ST', 2454, 1, 'AI'),
-(683, 13, 1, 2024, 'ST', 3017, 1, 'AI'),
-(684, 13, 9, 2024, 'GEN', 30326, 1, 'AI'),
-(685, 13, 9, 2024, 'GEN', 34411, 1, 'AI'),
-(686, 13, 9, 2024, 'GEN', 1103, 1, 'AI'),
-(687, 13, 9, 2024, 'GEN', 1108, 1, 'AI'),
-(688, 13, 9, 2024, 'EWS', 4803, 1, 'AI'),
-(689, 13, 9, 2024, 'EWS', 5489, 1, 'AI'),
-(690, 13, 9, 2024, 'OBC', 11442, 1, 'AI'),
-(691, 13, 9, 2024, 'OBC', 13020, 1, 'AI'),
-(692, 13, 9, 2024, 'OBC', 491, 1, 'AI'),
-(693, 13, 9, 2024, 'SC', 4678, 1, 'AI'),
-(694, 13, 9, 2024, 'SC', 5753, 1, 'AI'),
-(695, 13, 9, 2024, 'ST', 2237, 1, 'AI'),
-(696, 13, 9, 2024, 'ST', 2213, 1, 'AI'),
-(697, 13, 9, 2024, 'GEN', 32506, 1, 'AI'),
-(698, 13, 9, 2024, 'GEN', 35296, 1, 'AI'),
-(699, 13, 9, 2024, 'GEN', 618, 1, 'AI'),
-(700, 13, 9, 2024, 'EWS', 4994, 1, 'AI'),
-(701, 13, 9, 2024, 'OBC', 12062, 1, 'AI'),
-(702, 13, 9, 2024, 'OBC', 15389, 1, 'AI'),
-(703, 13, 9, 2024, 'SC', 4445, 1, 'AI'),
-(704, 13, 9, 2024, 'SC', 7506, 1, 'AI'),
-(705, 13, 9, 2024, 'ST', 2485, 1, 'AI'),
-(706, 13, 21, 2024, 'GEN', 38868, 1, 'AI'),
-(707, 13, 21, 2024, 'GEN', 42290, 1, 'AI'),
-(708, 13, 21, 2024, 'EWS', 5823, 1, 'AI'),
-(709, 13, 21, 2024, 'EWS', 7241, 1, 'AI'),
-(710, 13, 21, 2024, 'OBC', 14091, 1, 'AI'),
-(711, 13, 21, 2024, 'OBC', 16959, 1, 'AI'),
-(712, 13, 21, 2024, 'SC', 6582, 1, 'AI'),
-(713, 13, 21, 2024, 'SC', 7400, 1, 'AI'),
-(714, 13, 21, 2024, 'ST', 2560, 1, 'AI'),
-(715, 13, 21, 2024, 'GEN', 37333, 1, 'AI'),
-(716, 13, 21, 2024, 'GEN', 43793, 1, 'AI'),
-(717, 13, 21, 2024, 'GEN', 1195, 1, 'AI'),
-(718, 13, 21, 2024, 'EWS', 5817, 1, 'AI'),
-(719, 13, 21, 2024, 'EWS', 6987, 1, 'AI'),
-(720, 13, 21, 2024, 'OBC', 13689, 1, 'AI'),
-(721, 13, 21, 2024, 'OBC', 17629, 1, 'AI'),
-(722, 13, 21, 2024, 'OBC', 574, 1, 'AI'),
-(723, 13, 21, 2024, 'OBC', 932, 1, 'AI'),
-(724, 13, 21, 2024, 'SC', 6398, 1, 'AI'),
-(725, 13, 21, 2024, 'SC', 8650, 1, 'AI'),
-(726, 13, 21, 2024, 'SC', 334, 1, 'AI'),
-(727, 13, 21, 2024, 'ST', 2721, 1, 'AI'),
-(728, 13, 21, 2024, 'ST', 2885, 1, 'AI'),
-(729, 13, 30, 2024, 'GEN', 48197, 1, 'AI'),
-(730, 13, 30, 2024, 'GEN', 55871, 1, 'AI'),
-(731, 13, 30, 2024, 'EWS', 6814, 1, 'AI'),
-(732, 13, 30, 2024, 'EWS', 8569, 1, 'AI'),
-(733, 13, 30, 2024, 'OBC', 16275, 1, 'AI'),
-(734, 13, 30, 2024, 'OBC', 20248, 1, 'AI'),
-(735, 13, 30, 2024, 'OBC', 1086, 1, 'AI'),
-(736, 13, 30, 2024, 'SC', 8149, 1, 'AI'),
-(737, 13, 30, 2024, 'SC', 9518, 1, 'AI'),
-(738, 13, 30, 2024, 'ST', 3368, 1, 'AI'),
-(739, 13, 30, 2024, 'ST', 4593, 1, 'AI'),
-(740, 13, 30, 2024, 'GEN', 45861, 1, 'AI'),
-(741, 13, 30, 2024, 'GEN', 53597, 1, 'AI'),
-(742, 13, 30, 2024, 'GEN', 1713, 1, 'AI'),
-(743, 13, 30, 2024, 'EWS', 6850, 1, 'AI'),
-(744, 13, 30, 2024, 'EWS', 8366, 1, 'AI'),
-(745, 13, 30, 2024, 'OBC', 16027, 1, 'AI'),
-(746, 13, 30, 2024, 'OBC', 20243, 1, 'AI'),
-(747, 13, 30, 2024, 'SC', 7866, 1, 'AI'),
-(748, 13, 30, 2024, 'SC', 9566, 1, 'AI'),
-(749, 13, 30, 2024, 'ST', 3082, 1, 'AI'),
-(750, 13, 30, 2024, 'ST', 4273, 1, 'AI'),
-(751, 20, 9, 2024, 'GEN', 33766, 1, 'AI'),
-(752, 20, 9, 2024, 'GEN', 38645, 1, 'AI'),
-(753, 20, 9, 2024, 'GEN', 1656, 1, 'AI'),
-(754, 20, 9, 2024, 'GEN', 1785, 1, 'AI'),
-(755, 20, 9, 2024, 'EWS', 5419, 1, 'AI'),
-(756, 20, 9, 2024, 'EWS', 6737, 1, 'AI'),
-(757, 20, 9, 2024, 'EWS', 250, 1, 'AI'),
-(758, 20, 9, 2024, 'OBC', 12621, 1, 'AI'),
-(759, 20, 9, 2024, 'OBC', 15357, 1, 'AI'),
-(760, 20, 9, 2024, 'OBC', 994, 1, 'AI'),
-(761, 20, 9, 2024, 'OBC', 819, 1, 'AI'),
-(762, 20, 9, 2024, 'SC', 8468, 1, 'AI'),
-(763, 20, 9, 2024, 'SC', 8617, 1, 'AI'),
-(764, 20, 9, 2024, 'SC', 326, 1, 'AI'),
-(765, 20, 9, 2024, 'ST', 4009, 1, 'AI'),
-(766, 20, 9, 2024, 'ST', 4387, 1, 'AI'),
-(767, 20, 9, 2024, 'ST', 43, 1, 'AI'),
-(768, 20, 1, 2024, 'GEN', 29054, 1, 'AI'),
-(769, 20, 1, 2024, 'GEN', 35199, 1, 'AI'),
-(770, 20, 1, 2024, 'GEN', 872, 1, 'AI'),
-(771, 20, 1, 2024, 'EWS', 4877, 1, 'AI'),
-(772, 20, 1, 2024, 'EWS', 5390, 1, 'AI'),
-(773, 20, 1, 2024, 'OBC', 11253, 1, 'AI'),
-(774, 20, 1, 2024, 'OBC', 11989, 1, 'AI'),
-(775, 20, 1, 2024, 'OBC', 556, 1, 'AI'),
-(776, 20, 1, 2024, 'SC', 7034, 1, 'AI'),
-(777, 20, 1, 2024, 'SC', 7233, 1, 'AI'),
-(778, 20, 1, 2024, 'ST', 3471, 1, 'AI'),
-(779, 20, 1, 2024, 'ST', 4255, 1, 'AI'),
-(780, 20, 9, 2024, 'GEN', 34406, 1, 'AI'),
-(781, 20, 9, 2024, 'GEN', 39535, 1, 'AI'),
-(782, 20, 9, 2024, 'GEN', 609, 1, 'AI'),
-(783, 20, 9, 2024, 'EWS', 5357, 1, 'AI'),
-(784, 20, 9, 2024, 'EWS', 6844, 1, 'AI'),
-(785, 20, 9, 2024, 'OBC', 12646, 1, 'AI'),
-(786, 20, 9, 2024, 'OBC', 14308, 1, 'AI'),
-(787, 20, 9, 2024, 'OBC', 692, 1, 'AI'),
-(788, 20, 9, 2024, 'SC', 7990, 1, 'AI'),
-(789, 20, 9, 2024, 'SC', 8943, 1, 'AI'),
-(790, 20, 9, 2024, 'ST', 4134, 1, 'AI'),
-(791, 20, 9, 2024, 'ST', 2065, 1, 'AI'),
-(792, 20, 21, 2024, 'GEN', 35831, 1, 'AI'),
-(793, 20, 21, 2024, 'GEN', 40273, 1, 'AI'),
-(794, 20, 21, 2024, 'GEN', 1842, 1, 'AI'),
-(795, 20, 21, 2024, 'EWS', 5730, 1, 'AI'),
-(796, 20, 21, 2024, 'EWS', 7155, 1, 'AI'),
-(797, 20, 21, 2024, 'OBC', 12986, 1, 'AI'),
-(798, 20, 21, 2024, 'OBC', 16243, 1, 'AI'),
-(799, 20, 21, 2024, 'OBC', 931, 1, 'AI'),
-(800, 20, 21, 2024, 'SC', 8137, 1, 'AI'),
-(801, 20, 21, 2024, 'SC', 9178, 1, 'AI'),
-(802, 20, 21, 2024, 'ST', 4145, 1, 'AI'),
-(803, 20, 21, 2024, 'ST', 3921, 1, 'AI'),
-(804, 8, 4, 2024, 'GEN', 35506, 1, 'AI'),
-(805, 8, 4, 2024, 'GEN', 2471, 1, 'AI'),
-(806, 8, 4, 2024, 'EWS', 5608, 1, 'AI'),
-(807, 8, 4, 2024, 'OBC', 14515, 1, 'AI'),
-(808, 8, 4, 2024, 'SC', 8737, 1, 'AI'),
-(809, 8, 4, 2024, 'ST', 4519, 1, 'AI'),
-(810, 8, 9, 2024, 'GEN', 31909, 1, 'AI'),
-(811, 8, 9, 2024, 'GEN', 1031, 1, 'AI'),
-(812, 8, 9, 2024, 'EWS', 5012, 1, 'AI'),
-(813, 8, 9, 2024, 'EWS', 182, 1, 'AI'),
-(814, 8, 9, 2024, 'OBC', 12777, 1, 'AI'),
-(815, 8, 9, 2024, 'OBC', 741, 1, 'AI'),
-(816, 8, 9, 2024, 'SC', 7963, 1, 'AI'),
-(817, 8, 9, 2024, 'SC', 267, 1, 'AI'),
-(818, 8, 9, 2024, 'ST', 3759, 1, 'AI'),
-(819, 8, 1, 2024, 'GEN', 30554, 1, 'AI'),
-(820, 8, 1, 2024, 'GEN', 1322, 1, 'AI'),
-(821, 8, 1, 2024, 'EWS', 4710, 1, 'AI'),
-(822, 8, 1, 2024, 'OBC', 12675, 1, 'AI'),
-(823, 8, 1, 2024, 'SC', 7478, 1, 'AI'),
-(824, 8, 1, 2024, 'ST', 3473, 1, 'AI'),
-(825, 8, 21, 2024, 'GEN', 38192, 1, 'AI'),
-(826, 8, 21, 2024, 'GEN', 2529, 1, 'AI'),
-(827, 8, 21, 2024, 'EWS', 5947, 1, 'AI'),
-(828, 8, 21, 2024, 'OBC', 15091, 1, 'AI'),
-(829, 8, 21, 2024, 'OBC', 1261, 1, 'AI'),
-(830, 8, 21, 2024, 'SC', 8895, 1, 'AI'),
-(831, 8, 21, 2024, 'ST', 4529, 1, 'AI'),
-(832, 8, 21, 2024, 'GEN', 37950, 1, 'AI'),
-(833, 8, 21, 2024, 'GEN', 2348, 1, 'AI'),
-(834, 8, 21, 2024, 'EWS', 5901, 1, 'AI'),
-(835, 8, 21, 2024, 'OBC', 14493, 1, 'AI'),
-(836, 8, 21, 2024, 'OBC', 1151, 1, 'AI'),
-(837, 8, 21, 2024, 'SC', 8894, 1, 'AI'),
-(838, 8, 21, 2024, 'ST', 4347, 1, 'AI'),
-(839, 6, 9, 2024, 'GEN', 25974, 1, 'AI'),
-(840, 6, 9, 2024, 'GEN', 871, 1, 'AI'),
-(841, 6, 9, 2024, 'EWS', 4162, 1, 'AI'),
-(842, 6, 9, 2024, 'EWS', 149, 1, 'AI'),
-(843, 6, 9, 2024, 'OBC', 9982, 1, 'AI'),
-(844, 6, 9, 2024, 'OBC', 651, 1, 'AI'),
-(845, 6, 9, 2024, 'SC', 6151, 1, 'AI'),
-(846, 6, 9, 2024, 'SC', 90, 1, 'AI'),
-(847, 6, 9, 2024, 'ST', 3361, 1, 'AI'),
-(848, 6, 9, 2024, 'ST', 60, 1, 'AI'),
-(849, 6, 9, 2024, 'GEN', 24516, 1, 'AI'),
-(850, 6, 9, 2024, 'GEN', 356, 1, 'AI'),
-(851, 6, 9, 2024, 'EWS', 3822, 1, 'AI'),
-(852, 6, 9, 2024, 'OBC', 9961, 1, 'AI'),
-(853, 6, 9, 2024, 'OBC', 584, 1, 'AI'),
-(854, 6, 9, 2024, 'SC', 6256, 1, 'AI'),
-(855, 6, 9, 2024, 'SC', 99, 1, 'AI'),
-(856, 6, 9, 2024, 'ST', 3020, 1, 'AI'),
-(857, 6, 9, 2024, 'GEN', 26981, 1, 'AI'),
-(858, 6, 9, 2024, 'GEN', 932, 1, 'AI'),
-(859, 6, 9, 2024, 'EWS', 4245, 1, 'AI'),
-(860, 6, 9, 2024, 'OBC', 10702, 1, 'AI'),
-(861, 6, 9, 2024, 'OBC', 504, 1, 'AI'),
-(862, 6, 9, 2024, 'SC', 7165, 1, 'AI'),
-(863, 6, 9, 2024, 'SC', 245, 1, 'AI'),
-(864, 6, 9, 2024, 'ST', 3334, 1, 'AI'),
-(865, 6, 9, 2024, 'GEN', 28729, 1, 'AI'),
-(866, 6, 9, 2024, 'GEN', 1055, 1, 'AI'),
-(867, 6, 9, 2024, 'EWS', 4715, 1, 'AI'),
-(868, 6, 9, 2024, 'OBC', 11389, 1, 'AI'),
-(869, 6, 9, 2024, 'OBC', 473, 1, 'AI'),
-(870, 6, 9, 2024, 'SC', 7188, 1, 'AI'),
-(871, 6, 9, 2024, 'SC', 244, 1, 'AI'),
-(872, 6, 9, 2024, 'ST', 3447, 1, 'AI'),
-(873, 6, 21, 2024, 'GEN', 34046, 1, 'AI'),
-(874, 6, 21, 2024, 'GEN', 1741, 1, 'AI'),
-(875, 6, 21, 2024, 'EWS', 5334, 1, 'AI'),
-(876, 6, 21, 2024, 'EWS', 324, 1, 'AI'),
-(877, 6, 21, 2024, 'OBC', 13452, 1, 'AI'),
-(878, 6, 21, 2024, 'OBC', 940, 1, 'AI'),
-(879, 6, 21, 2024, 'SC', 8084, 1, 'AI'),
-(880, 6, 21, 2024, 'ST', 3909, 1, 'AI'),
-(881, 6, 21, 2024, 'GEN', 33717, 1, 'AI'),
-(882, 6, 21, 2024, 'GEN', 1487, 1, 'AI'),
-(883, 6, 21, 2024, 'EWS', 5277, 1, 'AI'),
-(884, 6, 21, 2024, 'OBC', 13469, 1, 'AI'),
-(885, 6, 21, 2024, 'OBC', 758, 1, 'AI'),
-(886, 6, 21, 2024, 'SC', 8202, 1, 'AI'),
-(887, 6, 21, 2024, 'SC', 328, 1, 'AI'),
-(888, 6, 21, 2024, 'ST', 4044, 1, 'AI'),
-(889, 7, 9, 2024, 'GEN', 17707, 1, 'AI'),
-(890, 7, 9, 2024, 'GEN', 25825, 1, 'AI'),
-(891, 7, 9, 2024, 'GEN', 496, 1, 'AI'),
-(892, 7, 9, 2024, 'GEN', 418, 1, 'AI'),
-(893, 7, 9, 2024, 'EWS', 2888, 1, 'AI'),
-(894, 7, 9, 2024, 'EWS', 4794, 1, 'AI'),
-(895, 7, 9, 2024, 'EWS', 77, 1, 'AI'),
-(896, 7, 9, 2024, 'OBC', 7411, 1, 'AI'),
-(897, 7, 9, 2024, 'OBC', 12784, 1, 'AI'),
-(898, 7, 9, 2024, 'OBC', 416, 1, 'AI'),
-(899, 7, 9, 2024, 'OBC', 367, 1, 'AI'),
-(900, 7, 9, 2024, 'SC', 4857, 1, 'AI'),
-(901, 7, 9, 2024, 'SC', 6295, 1, 'AI'),
-(902, 7, 9, 2024, 'SC', 207, 1, 'AI'),
-(903, 7, 9, 2024, 'ST', 2574, 1, 'AI'),
-(904, 7, 9, 2024, 'ST', 3527, 1, 'AI'),
-(905, 7, 9, 2024, 'ST', 35, 1, 'AI'),
-(906, 7, 21, 2024, 'GEN', 23113, 1, 'AI'),
-(907, 7, 21, 2024, 'GEN', 33189, 1, 'AI'),
-(908, 7, 21, 2024, 'GEN', 745, 1, 'AI'),
-(909, 7, 21, 2024, 'GEN', 1677, 1, 'AI'),
-(910, 7, 21, 2024, 'EWS', 3849, 1, 'AI'),
-(911, 7, 21, 2024, 'EWS', 4970, 1, 'AI'),
-(912, 7, 21, 2024, 'OBC', 10070, 1, 'AI'),
-(913, 7, 21, 2024, 'OBC', 14200, 1, 'AI'),
-(914, 7, 21, 2024, 'OBC', 647, 1, 'AI'),
-(915, 7, 21, 2024, 'SC', 6388, 1, 'AI'),
-(916, 7, 21, 2024, 'SC', 7728, 1, 'AI'),
-(917, 7, 21, 2024, 'SC', 263, 1, 'AI'),
-(918, 7, 21, 2024, 'ST', 3128, 1, 'AI'),
-(919, 7, 21, 2024, 'ST', 4165, 1, 'AI'),
-(920, 11, 9, 2024, 'GEN', 37751, 1, 'AI'),
-(921, 11, 9, 2024, 'GEN', 41217, 1, 'AI'),
-(922, 11, 9, 2024, 'GEN', 1543, 1, 'AI'),
-(923, 11, 9, 2024, 'EWS', 5740, 1, 'AI'),
-(924, 11, 9, 2024, 'EWS', 7062, 1, 'AI'),
-(925, 11, 9, 2024, 'EWS', 254, 1, 'AI'),
-(926, 11, 9, 2024, 'OBC', 14488, 1, 'AI'),
-(927, 11, 9, 2024, 'OBC', 18314, 1, 'AI'),
-(928, 11, 9, 2024, 'OBC', 845, 1, 'AI'),
-(929, 11, 9, 2024, 'SC', 8750, 1, 'AI'),
-(930, 11, 9, 2024, 'SC', 8528, 1, 'AI'),
-(931, 11, 9, 2024, 'ST', 4281, 1, 'AI'),
-(932, 11, 9, 2024, 'ST', 4511, 1, 'AI'),
-(933, 11, 21, 2024, 'GEN', 40291, 1, 'AI'),
-(934, 11, 21, 2024, 'GEN', 43451, 1, 'AI'),
-(935, 11, 21, 2024, 'GEN', 2560, 1, 'AI'),
-(936, 11, 21, 2024, 'EWS', 6238, 1, 'AI'),
-(937, 11, 21, 2024, 'EWS', 7295, 1, 'AI'),
-(938, 11, 21, 2024, 'OBC', 15417, 1, 'AI'),
-(939, 11, 21, 2024, 'OBC', 18957, 1, 'AI'),
-(940, 11, 21, 2024, 'OBC', 1196, 1, 'AI'),
-(941, 11, 21, 2024, 'SC', 9121, 1, 'AI'),
-(942, 11, 21, 2024, 'SC', 9897, 1, 'AI'),
-(943, 11, 21, 2024, 'ST', 4591, 1, 'AI'),
-(944, 11, 21, 2024, 'ST', 4951, 1, 'AI'),
-(945, 11, 28, 2024, 'GEN', 38171, 1, 'AI'),
-(946, 11, 28, 2024, 'GEN', 2488, 1, 'AI'),
-(947, 11, 28, 2024, 'EWS', 5828, 1, 'AI'),
-(948, 11, 28, 2024, 'EWS', 7151, 1, 'AI'),
-(949, 11, 28, 2024, 'OBC', 15023, 1, 'AI'),
-(950, 11, 28, 2024, 'OBC', 18967, 1, 'AI'),
-(951, 11, 28, 2024, 'SC', 8984, 1, 'AI'),
-(952, 11, 28, 2024, 'ST', 4374, 1, 'AI'),
-(953, 11, 28, 2024, 'ST', 5002, 1, 'AI'),
-(954, 11, 32, 2024, 'GEN', 44374, 1, 'AI'),
-(955, 11, 32, 2024, 'GEN', 49478, 1, 'AI'),
-(956, 11, 32, 2024, 'GEN', 3417, 1, 'AI'),
-(957, 11, 32, 2024, 'EWS', 6685, 1, 'AI'),
-(958, 11, 32, 2024, 'EWS', 8613, 1, 'AI'),
-(959, 11, 32, 2024, 'OBC', 16593, 1, 'AI'),
-(960, 11, 32, 2024, 'OBC', 20799, 1, 'AI'),
-(961, 11, 32, 2024, 'OBC', 1455, 1, 'AI'),
-(962, 11, 32, 2024, 'SC', 9852, 1, 'AI'),
-(963, 11, 32, 2024, 'SC', 9602, 1, 'AI'),
-(964, 11, 32, 2024, 'ST', 4714, 1, 'AI'),
-(965, 12, 4, 2024, 'GEN', 27762, 1, 'AI'),
-(966, 12, 4, 2024, 'GEN', 1909, 1, 'AI'),
-(967, 12, 4, 2024, 'EWS', 4336, 1, 'AI'),
-(968, 12, 4, 2024, 'OBC', 11396, 1, 'AI'),
-(969, 12, 4, 2024, 'OBC', 1348, 1, 'AI'),
-(970, 12, 4, 2024, 'SC', 8102, 1, 'AI'),
-(971, 12, 4, 2024, 'ST', 3874, 1, 'AI'),
-(972, 12, 9, 2024, 'GEN', 24300, 1, 'AI'),
-(973, 12, 9, 2024, 'GEN', 866, 1, 'AI'),
-(974, 12, 9, 2024, 'EWS', 4012, 1, 'AI'),
-(975, 12, 9, 2024, 'EWS', 216, 1, 'AI'),
-(976, 12, 9, 2024, 'OBC', 10027, 1, 'AI'),
-(977, 12, 9, 2024, 'OBC', 519, 1, 'AI'),
-(978, 12, 9, 2024, 'SC', 6543, 1, 'AI'),
-(979, 12, 9, 2024, 'SC', 264, 1, 'AI'),
-(980, 12, 9, 2024, 'ST', 3433, 1, 'AI'),
-(981, 12, 1, 2024, 'GEN', 24372, 1, 'AI'),
-(982, 12, 1, 2024, 'GEN', 1081, 1, 'AI'),
-(983, 12, 1, 2024, 'EWS', 3614, 1, 'AI'),
-(984, 12, 1, 2024, 'OBC', 9857, 1, 'AI'),
-(985, 12, 1, 2024, 'OBC', 666, 1, 'AI'),
-(986, 12, 1, 2024, 'SC', 5672, 1, 'AI'),
-(987, 12, 1, 2024, 'ST', 2820, 1, 'AI'),
-(988, 12, 9, 2024, 'GEN', 30625, 1, 'AI'),
-(989, 12, 9, 2024, 'GEN', 1369, 1, 'AI'),
-(990, 12, 9, 2024, 'EWS', 4592, 1, 'AI'),
-(991, 12, 9, 2024, 'OBC', 12148, 1, 'AI'),
-(992, 12, 9, 2024, 'OBC', 917, 1, 'AI'),
-(993, 12, 9, 2024, 'SC', 7858, 1, 'AI'),
-(994, 12, 9, 2024, 'ST', 3856, 1, 'AI'),
-(995, 12, 9, 2024, 'GEN', 26819, 1, 'AI'),
-(996, 12, 9, 2024, 'GEN', 1141, 1, 'AI'),
-(997, 12, 9, 2024, 'EWS', 4420, 1, 'AI'),
-(998, 12, 9, 2024, 'OBC', 10953, 1, 'AI'),
-(999, 12, 9, 2024, 'OBC', 836, 1, 'AI'),
-(1000, 12, 9, 2024, 'SC', 7039, 1, 'AI');
@@ -1,1114 +0,0 @@
--- SQL INSERT Statements for normalized NIT Data
-
--- NIT Table
-INSERT INTO nits (nit_id, name, location, nirf_rank) VALUES
-(1, 'National Institute of Technology, Tiruchirappalli', 'Tiruchirappalli', 9),
-(2, 'National Institute of Technology, Rourkela', 'Rourkela', 13),
-(3, 'National Institute of Technology Karnataka, Surathkal', 'Surathkal', 17),
-(4, 'National Institute of Technology Calicut', 'Calicut', 21),
-(5, 'National Institute of Technology, Warangal', 'Warangal', 28),
-(6, 'Malaviya National Institute of Technology Jaipur', 'Jaipur', 42),
-(7, 'Visvesvaraya National Institute of Technology, Nagpur', 'Nagpur', 44),
-(8, 'National Institute of Technology Durgapur', 'Durgapur', 49),
-(9, 'National Institute of Technology, Silchar', 'Silchar', 50),
-(10, 'National Institute of Technology Patna', 'Patna', 53),
-(11, 'Dr. B R Ambedkar National Institute of Technology, Jalandhar', 'Jalandhar', 55),
-(12, 'Motilal Nehru National Institute of Technology Allahabad', 'Allahabad', 62),
-(13, 'National Institute of Technology Delhi', 'Delhi', 65),
-(14, 'Sardar Vallabhbhai National Institute of Technology, Surat', 'Surat', 66),
-(15, 'National Institute of Technology, Srinagar', 'Srinagar', 73),
-(16, 'Maulana Azad National Institute of Technology Bhopal', 'Bhopal', 81),
-(17, 'National Institute of Technology, Jamshedpur', 'Jamshedpur', 82),
-(18, 'National Institute of Technology Meghalaya', 'Meghalaya', 83),
-(19, 'National Institute of Technology, Kurukshetra', 'Kurukshetra', 85),
-(20, 'National Institute of Technology Raipur', 'Raipur', 86),
-(21, 'National Institute of Technology Hamirpur', 'Hamirpur', 97),
-(22, 'National Institute of Technology Puducherry', 'Puducherry', 99),
-(23, 'National Institute of Technology Agartala', 'Agartala', 101),
-(24, 'National Institute of Technology Arunachal Pradesh', 'Pradesh', 102),
-(25, 'National Institute of Technology Goa', 'Goa', 103),
-(26, 'National Institute of Technology, Mizoram', 'Mizoram', 104),
-(27, 'National Institute of Technology Nagaland', 'Nagaland', 105),
-(28, 'National Institute of Technology, Manipur', 'Manipur', 151),
-(29, 'National Institute of Technology Sikkim', 'Sikkim', 152),
-(30, 'National Institute of Technology, Uttarakhand', 'Uttarakhand', 153),
-(31, 'National Institute of Technology, Andhra Pradesh', 'Pradesh', 201);
-
--- NIT Branch Table
-INSERT INTO nit_branches (branch_id, branch_name, short_name, degree_type) VALUES
-(1, 'Aerospace Engineering', 'AE', 'B.Tech'),
-(2, 'Architecture', 'ARCH', 'B.Arch'),
-(3, 'Artificial Intelligence', 'AI', 'B.Tech'),
-(4, 'Artificial Intelligence and Data Engineering', 'AI', 'B.Tech'),
-(5, 'Artificial Intelligence and Data Science', 'AIDS', 'B.Tech'),
-(6, 'Artificial Intelligence and Machine Learning', 'AI', 'B.Tech'),
-(7, 'B. Tech. and M. Tech. in Engineering and Computational Mechanics', 'BTA', 'Dual/Integrated'),
-(8, 'B.Tech in Mathematics and Computing', 'MNC', 'B.Tech'),
-(9, 'Bio Medical Engineering', 'BME', 'B.Tech'),
-(10, 'Bio Technology', 'BT', 'B.Tech'),
-(11, 'Biosciences and Bioengineering', 'BAB', 'B.Tech'),
-(12, 'Biotechnology', 'BT', 'Dual/Integrated'),
-(13, 'Biotechnology and Biochemical Engineering', 'BT', 'B.Tech'),
-(14, 'Ceramic Engineering', 'CE', 'B.Tech'),
-(15, 'Ceramic Engineering and M.Tech Industrial Ceramic', 'CEA', 'Dual/Integrated'),
-(16, 'Chemical Engineering', 'CHE', 'B.Tech'),
-(17, 'Chemical Science and Technology', 'CSA', 'B.Tech'),
-(18, 'Chemical Technology', 'CT', 'Dual/Integrated'),
-(19, 'Chemistry', 'CHE', 'BS'),
-(20, 'Civil Engineering', 'CE', 'B.Tech'),
-(21, 'Civil Engineering with Specialization in Construction Technology and Management', 'CE', 'Dual/Integrated'),
-(22, 'Computational Mathematics', 'CM', 'Dual/Integrated'),
-(23, 'Computational and Data Science', 'DS', 'B.Tech'),
-(24, 'Computer Science and Engineering', 'CSE', 'B.Tech'),
-(25, 'Computer Science and Engineering with Specialization in Cyber Security', 'CSE', 'Dual/Integrated'),
-(26, 'Computer Science and Engineering with Specialization in Data Science', 'CSE', 'Dual/Integrated'),
-(27, 'Data Science and Engineering', 'DS', 'B.Tech'),
-(28, 'Electrical Engineering', 'EE', 'B.Tech'),
-(29, 'Electrical Engineering with Specialization In Power System Engineering', 'EE', 'Dual/Integrated'),
-(30, 'Electrical and Electronics Engineering', 'EAE', 'B.Tech'),
-(31, 'Electronics Engineering', 'EE', 'B.Tech'),
-(32, 'Electronics and Communication Engineering', 'ECE', 'B.Tech'),
-(33, 'Electronics and Communication Engineering with Specialization in Microelectronics and VLSI System Design', 'ECE', 'Dual/Integrated'),
-(34, 'Electronics and Instrumentation Engineering', 'EAI', 'B.Tech'),
-(35, 'Electronics and Telecommunication Engineering', 'EAT', 'B.Tech'),
-(36, 'Electronics and VLSI Engineering', 'EAV', 'B.Tech'),
-(37, 'Energy Engineering', 'ENE', 'B.Tech'),
-(38, 'Energy and Electrical Vehicle Engineering', 'EAE', 'B.Tech'),
-(39, 'Engineering Physics', 'EP', 'B.Tech'),
-(40, 'Engineering and Computational Mechanics', 'EAC', 'B.Tech'),
-(41, 'Food Process Engineering', 'FPE', 'B.Tech'),
-(42, 'Industrial Chemistry', 'IC', 'B.Tech'),
-(43, 'Industrial Design', 'DES', 'B.Tech'),
-(44, 'Industrial Internet of Things', 'IIO', 'B.Tech'),
-(45, 'Industrial and Production Engineering', 'PE', 'B.Tech'),
-(46, 'Information Technology', 'IT', 'B.Tech'),
-(47, 'Instrumentation and Control Engineering', 'IAC', 'B.Tech'),
-(48, 'Life Science', 'LS', 'Dual/Integrated'),
-(49, 'Material Science and Engineering', 'MSA', 'Dual/Integrated'),
-(50, 'Materials Engineering', 'ME', 'B.Tech'),
-(51, 'Materials Science and Engineering', 'MSE', 'B.Tech'),
-(52, 'Materials Science and Metallurgical Engineering', 'MSA', 'B.Tech'),
-(53, 'Mathematics & Computing', 'M&C', 'BS'),
-(54, 'Mathematics', 'MAT', 'Dual/Integrated'),
-(55, 'Mathematics and Computing', 'MNC', 'B.Tech'),
-(56, 'Mathematics and Computing Technology', 'MNC', 'Dual/Integrated'),
-(57, 'Mathematics and Data Science', 'DS', 'Dual/Integrated'),
-(58, 'Mechanical Engineering', 'ME', 'B.Tech'),
-(59, 'Mechanical Engineering with Specialization in Manufacturing and Industrial Engineering', 'ME', 'Dual/Integrated'),
-(60, 'Mechatronics and Automation Engineering', 'MAA', 'B.Tech'),
-(61, 'Metallurgical and Materials Engineering', 'MME', 'B.Tech'),
-(62, 'Metallurgy and Materials Engineering', 'MAM', 'B.Tech'),
-(63, 'Microelectronics & VLSI Engineering', 'M&V', 'B.Tech'),
-(64, 'Mining Engineering', 'MIN', 'B.Tech'),
-(65, 'Physics', 'PHY', 'BS'),
-(66, 'Planning', 'PLA', 'B.Tech'),
-(67, 'Production Engineering', 'PE', 'B.Tech'),
-(68, 'Production and Industrial Engineering', 'PAI', 'B.Tech'),
-(69, 'ROBOTICS & AUTOMATION', 'R&A', 'B.Tech'),
-(70, 'SUSTAINABLE ENERGY TECHNOLOGIES', 'SET', 'B.Tech'),
-(71, 'Textile Technology', 'TT', 'B.Tech'),
-(72, 'VLSI Design and Technology', 'DES', 'B.Tech');
-
--- NIT Cutoff Table
-INSERT INTO nit_cutoffs (cutoff_id, nit_id, branch_id, year, category, closing_rank, round, quota) VALUES
-(1, 11, 10, 2024, 'GEN', 65917, 1, 'HS'),
-(2, 11, 10, 2024, 'GEN', 53648, 1, 'HS'),
-(3, 11, 10, 2024, 'EWS', 10180, 1, 'HS'),
-(4, 11, 10, 2024, 'EWS', 16293, 1, 'HS'),
-(5, 11, 10, 2024, 'OBC', 52241, 1, 'HS'),
-(6, 11, 10, 2024, 'OBC', 56151, 1, 'HS'),
-(7, 11, 10, 2024, 'SC', 11090, 1, 'HS'),
-(8, 11, 10, 2024, 'ST', 15566, 1, 'HS'),
-(9, 11, 10, 2024, 'GEN', 41817, 1, 'OS'),
-(10, 11, 10, 2024, 'GEN', 43186, 1, 'OS'),
-(11, 11, 10, 2024, 'EWS', 6634, 1, 'OS'),
-(12, 11, 10, 2024, 'OBC', 13478, 1, 'OS'),
-(13, 11, 10, 2024, 'OBC', 17214, 1, 'OS'),
-(14, 11, 10, 2024, 'SC', 4841, 1, 'OS'),
-(15, 11, 10, 2024, 'SC', 8402, 1, 'OS'),
-(16, 11, 10, 2024, 'ST', 3006, 1, 'OS'),
-(17, 11, 16, 2024, 'GEN', 49650, 1, 'HS'),
-(18, 11, 16, 2024, 'GEN', 54809, 1, 'HS'),
-(19, 11, 16, 2024, 'EWS', 8740, 1, 'HS'),
-(20, 11, 16, 2024, 'EWS', 9600, 1, 'HS'),
-(21, 11, 16, 2024, 'OBC', 42794, 1, 'HS'),
-(22, 11, 16, 2024, 'OBC', 39672, 1, 'HS'),
-(23, 11, 16, 2024, 'SC', 9501, 1, 'HS'),
-(24, 11, 16, 2024, 'SC', 7401, 1, 'HS'),
-(25, 11, 16, 2024, 'SC', 126, 1, 'HS'),
-(26, 11, 16, 2024, 'ST', 43332, 1, 'HS'),
-(27, 11, 16, 2024, 'GEN', 33644, 1, 'OS'),
-(28, 11, 16, 2024, 'GEN', 41891, 1, 'OS'),
-(29, 11, 16, 2024, 'GEN', 1897, 1, 'OS'),
-(30, 11, 16, 2024, 'EWS', 4972, 1, 'OS'),
-(31, 11, 16, 2024, 'EWS', 6450, 1, 'OS'),
-(32, 11, 16, 2024, 'OBC', 10647, 1, 'OS'),
-(33, 11, 16, 2024, 'OBC', 16580, 1, 'OS'),
-(34, 11, 16, 2024, 'SC', 5276, 1, 'OS'),
-(35, 11, 16, 2024, 'SC', 7234, 1, 'OS'),
-(36, 11, 16, 2024, 'ST', 2306, 1, 'OS'),
-(37, 11, 20, 2024, 'GEN', 52004, 1, 'HS'),
-(38, 11, 20, 2024, 'GEN', 58821, 1, 'HS'),
-(39, 11, 20, 2024, 'GEN', 2711, 1, 'HS'),
-(40, 11, 20, 2024, 'EWS', 9381, 1, 'HS'),
-(41, 11, 20, 2024, 'EWS', 9178, 1, 'HS'),
-(42, 11, 20, 2024, 'OBC', 39530, 1, 'HS'),
-(43, 11, 20, 2024, 'OBC', 44470, 1, 'HS'),
-(44, 11, 20, 2024, 'SC', 9466, 1, 'HS'),
-(45, 11, 20, 2024, 'SC', 11172, 1, 'HS'),
-(46, 11, 20, 2024, 'ST', 32136, 1, 'HS'),
-(47, 11, 20, 2024, 'ST', 16264, 1, 'HS'),
-(48, 11, 20, 2024, 'GEN', 37500, 1, 'OS'),
-(49, 11, 20, 2024, 'GEN', 46913, 1, 'OS'),
-(50, 11, 20, 2024, 'GEN', 1098, 1, 'OS'),
-(51, 11, 20, 2024, 'EWS', 5521, 1, 'OS'),
-(52, 11, 20, 2024, 'EWS', 7111, 1, 'OS'),
-(53, 11, 20, 2024, 'OBC', 12040, 1, 'OS'),
-(54, 11, 20, 2024, 'OBC', 18509, 1, 'OS'),
-(55, 11, 20, 2024, 'SC', 5637, 1, 'OS'),
-(56, 11, 20, 2024, 'SC', 1933, 1, 'OS'),
-(57, 11, 20, 2024, 'ST', 1255, 1, 'OS'),
-(58, 11, 20, 2024, 'ST', 3134, 1, 'OS'),
-(59, 11, 24, 2024, 'GEN', 14502, 1, 'HS'),
-(60, 11, 24, 2024, 'GEN', 18113, 1, 'HS'),
-(61, 11, 24, 2024, 'GEN', 686, 1, 'HS'),
-(62, 11, 24, 2024, 'EWS', 2912, 1, 'HS'),
-(63, 11, 24, 2024, 'EWS', 3397, 1, 'HS'),
-(64, 11, 24, 2024, 'OBC', 7779, 1, 'HS'),
-(65, 11, 24, 2024, 'OBC', 10562, 1, 'HS'),
-(66, 11, 24, 2024, 'SC', 3299, 1, 'HS'),
-(67, 11, 24, 2024, 'SC', 3812, 1, 'HS'),
-(68, 11, 24, 2024, 'ST', 3754, 1, 'HS'),
-(69, 11, 24, 2024, 'ST', 9914, 1, 'HS'),
-(70, 11, 24, 2024, 'GEN', 10073, 1, 'OS'),
-(71, 11, 24, 2024, 'GEN', 18149, 1, 'OS'),
-(72, 11, 24, 2024, 'GEN', 241, 1, 'OS'),
-(73, 11, 24, 2024, 'EWS', 1463, 1, 'OS'),
-(74, 11, 24, 2024, 'EWS', 2555, 1, 'OS'),
-(75, 11, 24, 2024, 'OBC', 3642, 1, 'OS'),
-(76, 11, 24, 2024, 'OBC', 6862, 1, 'OS'),
-(77, 11, 24, 2024, 'OBC', 364, 1, 'OS'),
-(78, 11, 24, 2024, 'SC', 1916, 1, 'OS'),
-(79, 11, 24, 2024, 'SC', 3707, 1, 'OS'),
-(80, 11, 24, 2024, 'SC', 104, 1, 'OS'),
-(81, 11, 24, 2024, 'ST', 877, 1, 'OS'),
-(82, 11, 24, 2024, 'ST', 1357, 1, 'OS'),
-(83, 11, 24, 2024, 'ST', 32, 1, 'OS'),
-(84, 11, 27, 2024, 'GEN', 18820, 1, 'HS'),
-(85, 11, 27, 2024, 'GEN', 18504, 1, 'HS'),
-(86, 11, 27, 2024, 'GEN', 1808, 1, 'HS'),
-(87, 11, 27, 2024, 'EWS', 3300, 1, 'HS'),
-(88, 11, 27, 2024, 'EWS', 4736, 1, 'HS'),
-(89, 11, 27, 2024, 'OBC', 16759, 1, 'HS'),
-(90, 11, 27, 2024, 'OBC', 23221, 1, 'HS'),
-(91, 11, 27, 2024, 'SC', 5878, 1, 'HS'),
-(92, 11, 27, 2024, 'SC', 6475, 1, 'HS'),
-(93, 11, 27, 2024, 'ST', 5260, 1, 'HS'),
-(94, 11, 27, 2024, 'ST', 13468, 1, 'HS'),
-(95, 11, 27, 2024, 'GEN', 13847, 1, 'OS'),
-(96, 11, 27, 2024, 'GEN', 19393, 1, 'OS'),
-(97, 11, 27, 2024, 'GEN', 411, 1, 'OS'),
-(98, 11, 27, 2024, 'EWS', 1823, 1, 'OS'),
-(99, 11, 27, 2024, 'EWS', 3846, 1, 'OS'),
-(100, 11, 27, 2024, 'OBC', 5002, 1, 'OS'),
-(101, 11, 27, 2024, 'OBC', 8853, 1, 'OS'),
-(102, 11, 27, 2024, 'SC', 2349, 1, 'OS'),
-(103, 11, 27, 2024, 'SC', 4664, 1, 'OS'),
-(104, 11, 27, 2024, 'ST', 1244, 1, 'OS'),
-(105, 11, 27, 2024, 'ST', 1871, 1, 'OS'),
-(106, 11, 28, 2024, 'GEN', 28694, 1, 'HS'),
-(107, 11, 28, 2024, 'GEN', 26765, 1, 'HS'),
-(108, 11, 28, 2024, 'GEN', 3230, 1, 'HS'),
-(109, 11, 28, 2024, 'EWS', 4630, 1, 'HS'),
-(110, 11, 28, 2024, 'EWS', 7211, 1, 'HS'),
-(111, 11, 28, 2024, 'OBC', 24214, 1, 'HS'),
-(112, 11, 28, 2024, 'OBC', 30017, 1, 'HS'),
-(113, 11, 28, 2024, 'SC', 6943, 1, 'HS'),
-(114, 11, 28, 2024, 'SC', 7357, 1, 'HS'),
-(115, 11, 28, 2024, 'ST', 9740, 1, 'HS'),
-(116, 11, 28, 2024, 'GEN', 18324, 1, 'OS'),
-(117, 11, 28, 2024, 'GEN', 28221, 1, 'OS'),
-(118, 11, 28, 2024, 'GEN', 1102, 1, 'OS'),
-(119, 11, 28, 2024, 'EWS', 2627, 1, 'OS'),
-(120, 11, 28, 2024, 'EWS', 4281, 1, 'OS'),
-(121, 11, 28, 2024, 'OBC', 6442, 1, 'OS'),
-(122, 11, 28, 2024, 'OBC', 12149, 1, 'OS'),
-(123, 11, 28, 2024, 'SC', 3700, 1, 'OS'),
-(124, 11, 28, 2024, 'SC', 6535, 1, 'OS'),
-(125, 11, 28, 2024, 'ST', 1366, 1, 'OS'),
-(126, 11, 28, 2024, 'ST', 2562, 1, 'OS'),
-(127, 11, 32, 2024, 'GEN', 24521, 1, 'HS'),
-(128, 11, 32, 2024, 'GEN', 21429, 1, 'HS'),
-(129, 11, 32, 2024, 'GEN', 1878, 1, 'HS'),
-(130, 11, 32, 2024, 'EWS', 3670, 1, 'HS'),
-(131, 11, 32, 2024, 'EWS', 6717, 1, 'HS'),
-(132, 11, 32, 2024, 'OBC', 20131, 1, 'HS'),
-(133, 11, 32, 2024, 'OBC', 24627, 1, 'HS'),
-(134, 11, 32, 2024, 'SC', 6068, 1, 'HS'),
-(135, 11, 32, 2024, 'SC', 6554, 1, 'HS'),
-(136, 11, 32, 2024, 'ST', 7679, 1, 'HS'),
-(137, 11, 32, 2024, 'ST', 10440, 1, 'HS'),
-(138, 11, 32, 2024, 'GEN', 14476, 1, 'OS'),
-(139, 11, 32, 2024, 'GEN', 21777, 1, 'OS'),
-(140, 11, 32, 2024, 'GEN', 668, 1, 'OS'),
-(141, 11, 32, 2024, 'EWS', 1928, 1, 'OS'),
-(142, 11, 32, 2024, 'EWS', 3766, 1, 'OS'),
-(143, 11, 32, 2024, 'OBC', 5213, 1, 'OS'),
-(144, 11, 32, 2024, 'OBC', 8974, 1, 'OS'),
-(145, 11, 32, 2024, 'OBC', 373, 1, 'OS'),
-(146, 11, 32, 2024, 'SC', 3028, 1, 'OS'),
-(147, 11, 32, 2024, 'SC', 4564, 1, 'OS'),
-(148, 11, 32, 2024, 'ST', 1245, 1, 'OS'),
-(149, 11, 32, 2024, 'ST', 2469, 1, 'OS'),
-(150, 11, 36, 2024, 'GEN', 26658, 1, 'HS'),
-(151, 11, 36, 2024, 'GEN', 25280, 1, 'HS'),
-(152, 11, 36, 2024, 'EWS', 4179, 1, 'HS'),
-(153, 11, 36, 2024, 'OBC', 23520, 1, 'HS'),
-(154, 11, 36, 2024, 'OBC', 25671, 1, 'HS'),
-(155, 11, 36, 2024, 'SC', 849, 1, 'HS'),
-(156, 11, 36, 2024, 'SC', 3296, 1, 'HS'),
-(157, 11, 36, 2024, 'ST', 11575, 1, 'HS'),
-(158, 11, 36, 2024, 'GEN', 15467, 1, 'OS'),
-(159, 11, 36, 2024, 'GEN', 24930, 1, 'OS'),
-(160, 11, 36, 2024, 'EWS', 2263, 1, 'OS'),
-(161, 11, 36, 2024, 'OBC', 5511, 1, 'OS'),
-(162, 11, 36, 2024, 'OBC', 10837, 1, 'OS'),
-(163, 11, 36, 2024, 'SC', 3406, 1, 'OS'),
-(164, 11, 36, 2024, 'SC', 5917, 1, 'OS'),
-(165, 11, 36, 2024, 'ST', 1445, 1, 'OS'),
-(166, 11, 45, 2024, 'GEN', 56804, 1, 'HS'),
-(167, 11, 45, 2024, 'GEN', 62629, 1, 'HS'),
-(168, 11, 45, 2024, 'EWS', 10218, 1, 'HS'),
-(169, 11, 45, 2024, 'EWS', 10416, 1, 'HS'),
-(170, 11, 45, 2024, 'OBC', 49771, 1, 'HS'),
-(171, 11, 45, 2024, 'OBC', 70716, 1, 'HS'),
-(172, 11, 45, 2024, 'SC', 11045, 1, 'HS'),
-(173, 11, 45, 2024, 'SC', 14334, 1, 'HS'),
-(174, 11, 45, 2024, 'GEN', 37762, 1, 'OS'),
-(175, 11, 45, 2024, 'GEN', 51556, 1, 'OS'),
-(176, 11, 45, 2024, 'EWS', 6283, 1, 'OS'),
-(177, 11, 45, 2024, 'EWS', 7685, 1, 'OS'),
-(178, 11, 45, 2024, 'OBC', 13259, 1, 'OS'),
-(179, 11, 45, 2024, 'OBC', 18859, 1, 'OS'),
-(180, 11, 45, 2024, 'SC', 6430, 1, 'OS'),
-(181, 11, 45, 2024, 'SC', 9441, 1, 'OS'),
-(182, 11, 45, 2024, 'ST', 2913, 1, 'OS'),
-(183, 11, 45, 2024, 'ST', 3799, 1, 'OS'),
-(184, 11, 46, 2024, 'GEN', 21752, 1, 'HS'),
-(185, 11, 46, 2024, 'GEN', 23461, 1, 'HS'),
-(186, 11, 46, 2024, 'GEN', 821, 1, 'HS'),
-(187, 11, 46, 2024, 'EWS', 3874, 1, 'HS'),
-(188, 11, 46, 2024, 'OBC', 14397, 1, 'HS'),
-(189, 11, 46, 2024, 'OBC', 17441, 1, 'HS'),
-(190, 11, 46, 2024, 'SC', 5639, 1, 'HS'),
-(191, 11, 46, 2024, 'SC', 4550, 1, 'HS'),
-(192, 11, 46, 2024, 'ST', 8761, 1, 'HS'),
-(193, 11, 46, 2024, 'GEN', 13050, 1, 'OS'),
-(194, 11, 46, 2024, 'GEN', 20820, 1, 'OS'),
-(195, 11, 46, 2024, 'GEN', 505, 1, 'OS'),
-(196, 11, 46, 2024, 'EWS', 1842, 1, 'OS'),
-(197, 11, 46, 2024, 'EWS', 3671, 1, 'OS'),
-(198, 11, 46, 2024, 'OBC', 4787, 1, 'OS'),
-(199, 11, 46, 2024, 'OBC', 8458, 1, 'OS'),
-(200, 11, 46, 2024, 'OBC', 816, 1, 'OS'),
-(201, 11, 46, 2024, 'SC', 2672, 1, 'OS'),
-(202, 11, 46, 2024, 'SC', 4398, 1, 'OS'),
-(203, 11, 46, 2024, 'ST', 1170, 1, 'OS'),
-(204, 11, 46, 2024, 'ST', 2434, 1, 'OS'),
-(205, 11, 46, 2024, 'ST', 33, 1, 'OS'),
-(206, 11, 47, 2024, 'GEN', 38495, 1, 'HS'),
-(207, 11, 47, 2024, 'GEN', 47330, 1, 'HS'),
-(208, 11, 47, 2024, 'EWS', 6872, 1, 'HS'),
-(209, 11, 47, 2024, 'EWS', 7706, 1, 'HS'),
-(210, 11, 47, 2024, 'OBC', 34615, 1, 'HS'),
-(211, 11, 47, 2024, 'OBC', 60462, 1, 'HS'),
-(212, 11, 47, 2024, 'SC', 9573, 1, 'HS'),
-(213, 11, 47, 2024, 'SC', 7831, 1, 'HS'),
-(214, 11, 47, 2024, 'ST', 22132, 1, 'HS'),
-(215, 11, 47, 2024, 'ST', 15588, 1, 'HS'),
-(216, 11, 47, 2024, 'GEN', 26079, 1, 'OS'),
-(217, 11, 47, 2024, 'GEN', 38413, 1, 'OS'),
-(218, 11, 47, 2024, 'GEN', 1050, 1, 'OS'),
-(219, 11, 47, 2024, 'EWS', 3806, 1, 'OS'),
-(220, 11, 47, 2024, 'EWS', 6625, 1, 'OS'),
-(221, 11, 47, 2024, 'EWS', 310, 1, 'OS'),
-(222, 11, 47, 2024, 'OBC', 8201, 1, 'OS'),
-(223, 11, 47, 2024, 'OBC', 15521, 1, 'OS'),
-(224, 11, 47, 2024, 'OBC', 1367, 1, 'OS'),
-(225, 11, 47, 2024, 'SC', 5045, 1, 'OS'),
-(226, 11, 47, 2024, 'SC', 7472, 1, 'OS'),
-(227, 11, 47, 2024, 'ST', 2446, 1, 'OS'),
-(228, 11, 47, 2024, 'ST', 3189, 1, 'OS'),
-(229, 11, 54, 2024, 'GEN', 19925, 1, 'HS'),
-(230, 11, 54, 2024, 'GEN', 24158, 1, 'HS'),
-(231, 11, 54, 2024, 'GEN', 1368, 1, 'HS'),
-(232, 11, 54, 2024, 'EWS', 4142, 1, 'HS'),
-(233, 11, 54, 2024, 'EWS', 5547, 1, 'HS'),
-(234, 11, 54, 2024, 'OBC', 18525, 1, 'HS'),
-(235, 11, 54, 2024, 'OBC', 23380, 1, 'HS'),
-(236, 11, 54, 2024, 'SC', 5698, 1, 'HS'),
-(237, 11, 54, 2024, 'SC', 1390, 1, 'HS'),
-(238, 11, 54, 2024, 'ST', 20545, 1, 'HS'),
-(239, 11, 54, 2024, 'GEN', 13285, 1, 'OS'),
-(240, 11, 54, 2024, 'GEN', 21041, 1, 'OS'),
-(241, 11, 54, 2024, 'GEN', 828, 1, 'OS'),
-(242, 11, 54, 2024, 'GEN', 1300, 1, 'OS'),
-(243, 11, 54, 2024, 'EWS', 1941, 1, 'OS'),
-(244, 11, 54, 2024, 'OBC', 4838, 1, 'OS'),
-(245, 11, 54, 2024, 'OBC', 9610, 1, 'OS'),
-(246, 11, 54, 2024, 'SC', 2660, 1, 'OS'),
-(247, 11, 54, 2024, 'SC', 4366, 1, 'OS'),
-(248, 11, 54, 2024, 'ST', 1401, 1, 'OS'),
-(249, 11, 58, 2024, 'GEN', 42155, 1, 'HS'),
-(250, 11, 58, 2024, 'GEN', 48452, 1, 'HS'),
-(251, 11, 58, 2024, 'EWS', 7506, 1, 'HS'),
-(252, 11, 58, 2024, 'EWS', 9003, 1, 'HS'),
-(253, 11, 58, 2024, 'OBC', 33874, 1, 'HS'),
-(254, 11, 58, 2024, 'OBC', 52625, 1, 'HS'),
-(255, 11, 58, 2024, 'SC', 8542, 1, 'HS'),
-(256, 11, 58, 2024, 'SC', 13786, 1, 'HS'),
-(257, 11, 58, 2024, 'ST', 15704, 1, 'HS'),
-(258, 11, 58, 2024, 'ST', 22446, 1, 'HS'),
-(259, 11, 58, 2024, 'GEN', 27699, 1, 'OS'),
-(260, 11, 58, 2024, 'GEN', 40391, 1, 'OS'),
-(261, 11, 58, 2024, 'GEN', 1217, 1, 'OS'),
-(262, 11, 58, 2024, 'EWS', 4200, 1, 'OS'),
-(263, 11, 58, 2024, 'EWS', 5841, 1, 'OS'),
-(264, 11, 58, 2024, 'EWS', 202, 1, 'OS'),
-(265, 11, 58, 2024, 'OBC', 9299, 1, 'OS'),
-(266, 11, 58, 2024, 'OBC', 17040, 1, 'OS'),
-(267, 11, 58, 2024, 'OBC', 1264, 1, 'OS'),
-(268, 11, 58, 2024, 'SC', 5037, 1, 'OS'),
-(269, 11, 58, 2024, 'SC', 7231, 1, 'OS'),
-(270, 11, 58, 2024, 'ST', 2025, 1, 'OS'),
-(271, 11, 58, 2024, 'ST', 3375, 1, 'OS'),
-(272, 11, 71, 2024, 'GEN', 70398, 1, 'HS'),
-(273, 11, 71, 2024, 'GEN', 70817, 1, 'HS'),
-(274, 11, 71, 2024, 'EWS', 11143, 1, 'HS'),
-(275, 11, 71, 2024, 'EWS', 12630, 1, 'HS'),
-(276, 11, 71, 2024, 'OBC', 51292, 1, 'HS'),
-(277, 11, 71, 2024, 'OBC', 72072, 1, 'HS'),
-(278, 11, 71, 2024, 'SC', 14690, 1, 'HS'),
-(279, 11, 71, 2024, 'SC', 14394, 1, 'HS'),
-(280, 11, 71, 2024, 'GEN', 44936, 1, 'OS'),
-(281, 11, 71, 2024, 'GEN', 54359, 1, 'OS'),
-(282, 11, 71, 2024, 'EWS', 6374, 1, 'OS'),
-(283, 11, 71, 2024, 'EWS', 8078, 1, 'OS'),
-(284, 11, 71, 2024, 'OBC', 14878, 1, 'OS'),
-(285, 11, 71, 2024, 'OBC', 19226, 1, 'OS'),
-(286, 11, 71, 2024, 'OBC', 843, 1, 'OS'),
-(287, 11, 71, 2024, 'SC', 7036, 1, 'OS'),
-(288, 11, 71, 2024, 'SC', 9019, 1, 'OS'),
-(289, 11, 71, 2024, 'ST', 3045, 1, 'OS'),
-(290, 11, 71, 2024, 'ST', 3459, 1, 'OS'),
-(291, 6, 2, 2024, 'GEN', 1481, 1, 'HS'),
-(292, 6, 2, 2024, 'GEN', 744, 1, 'HS'),
-(293, 6, 2, 2024, 'EWS', 758, 1, 'HS'),
-(294, 6, 2, 2024, 'OBC', 824, 1, 'HS'),
-(295, 6, 2, 2024, 'OBC', 648, 1, 'HS'),
-(296, 6, 2, 2024, 'SC', 446, 1, 'HS'),
-(297, 6, 2, 2024, 'SC', 267, 1, 'HS'),
-(298, 6, 2, 2024, 'ST', 135, 1, 'HS'),
-(299, 6, 2, 2024, 'ST', 24, 1, 'HS'),
-(300, 6, 2, 2024, 'GEN', 525, 1, 'OS'),
-(301, 6, 2, 2024, 'GEN', 394, 1, 'OS'),
-(302, 6, 2, 2024, 'GEN', 98, 1, 'OS'),
-(303, 6, 2, 2024, 'EWS', 145, 1, 'OS'),
-(304, 6, 2, 2024, 'EWS', 77, 1, 'OS'),
-(305, 6, 2, 2024, 'OBC', 337, 1, 'OS'),
-(306, 6, 2, 2024, 'OBC', 298, 1, 'OS'),
-(307, 6, 2, 2024, 'SC', 124, 1, 'OS'),
-(308, 6, 2, 2024, 'SC', 80, 1, 'OS'),
-(309, 6, 2, 2024, 'ST', 64, 1, 'OS'),
-(310, 6, 2, 2024, 'ST', 83, 1, 'OS'),
-(311, 6, 3, 2024, 'GEN', 6225, 1, 'HS'),
-(312, 6, 3, 2024, 'EWS', 820, 1, 'HS'),
-(313, 6, 3, 2024, 'EWS', 1373, 1, 'HS'),
-(314, 6, 3, 2024, 'OBC', 2228, 1, 'HS'),
-(315, 6, 3, 2024, 'OBC', 4556, 1, 'HS'),
-(316, 6, 3, 2024, 'SC', 1369, 1, 'HS'),
-(317, 6, 3, 2024, 'SC', 456, 1, 'HS'),
-(318, 6, 3, 2024, 'ST', 471, 1, 'HS'),
-(319, 6, 3, 2024, 'ST', 700, 1, 'HS'),
-(320, 6, 3, 2024, 'GEN', 5555, 1, 'OS'),
-(321, 6, 3, 2024, 'GEN', 9274, 1, 'OS'),
-(322, 6, 3, 2024, 'EWS', 799, 1, 'OS'),
-(323, 6, 3, 2024, 'EWS', 1596, 1, 'OS'),
-(324, 6, 3, 2024, 'OBC', 2090, 1, 'OS'),
-(325, 6, 3, 2024, 'OBC', 3526, 1, 'OS'),
-(326, 6, 3, 2024, 'SC', 1180, 1, 'OS'),
-(327, 6, 3, 2024, 'SC', 1128, 1, 'OS'),
-(328, 6, 3, 2024, 'ST', 456, 1, 'OS'),
-(329, 6, 16, 2024, 'GEN', 24351, 1, 'HS'),
-(330, 6, 16, 2024, 'GEN', 28752, 1, 'HS'),
-(331, 6, 16, 2024, 'GEN', 1577, 1, 'HS'),
-(332, 6, 16, 2024, 'EWS', 3615, 1, 'HS'),
-(333, 6, 16, 2024, 'EWS', 4503, 1, 'HS'),
-(334, 6, 16, 2024, 'EWS', 233, 1, 'HS'),
-(335, 6, 16, 2024, 'OBC', 8302, 1, 'HS'),
-(336, 6, 16, 2024, 'OBC', 12470, 1, 'HS'),
-(337, 6, 16, 2024, 'OBC', 699, 1, 'HS'),
-(338, 6, 16, 2024, 'SC', 4599, 1, 'HS'),
-(339, 6, 16, 2024, 'SC', 6890, 1, 'HS'),
-(340, 6, 16, 2024, 'ST', 1727, 1, 'HS'),
-(341, 6, 16, 2024, 'ST', 1144, 1, 'HS'),
-(342, 6, 16, 2024, 'GEN', 22258, 1, 'OS'),
-(343, 6, 16, 2024, 'GEN', 32097, 1, 'OS'),
-(344, 6, 16, 2024, 'GEN', 1075, 1, 'OS'),
-(345, 6, 16, 2024, 'EWS', 3783, 1, 'OS'),
-(346, 6, 16, 2024, 'EWS', 4937, 1, 'OS'),
-(347, 6, 16, 2024, 'OBC', 8232, 1, 'OS'),
-(348, 6, 16, 2024, 'OBC', 14384, 1, 'OS'),
-(349, 6, 16, 2024, 'OBC', 541, 1, 'OS'),
-(350, 6, 16, 2024, 'SC', 4584, 1, 'OS'),
-(351, 6, 16, 2024, 'SC', 6251, 1, 'OS'),
-(352, 6, 16, 2024, 'ST', 2331, 1, 'OS'),
-(353, 6, 16, 2024, 'ST', 2686, 1, 'OS'),
-(354, 6, 20, 2024, 'GEN', 27034, 1, 'HS'),
-(355, 6, 20, 2024, 'GEN', 35777, 1, 'HS'),
-(356, 6, 20, 2024, 'GEN', 499, 1, 'HS'),
-(357, 6, 20, 2024, 'EWS', 4031, 1, 'HS'),
-(358, 6, 20, 2024, 'EWS', 6659, 1, 'HS'),
-(359, 6, 20, 2024, 'OBC', 9116, 1, 'HS'),
-(360, 6, 20, 2024, 'OBC', 11657, 1, 'HS'),
-(361, 6, 20, 2024, 'SC', 4123, 1, 'HS'),
-(362, 6, 20, 2024, 'SC', 6826, 1, 'HS'),
-(363, 6, 20, 2024, 'SC', 181, 1, 'HS'),
-(364, 6, 20, 2024, 'ST', 329, 1, 'HS'),
-(365, 6, 20, 2024, 'ST', 772, 1, 'HS'),
-(366, 6, 20, 2024, 'GEN', 30890, 1, 'OS'),
-(367, 6, 20, 2024, 'GEN', 43151, 1, 'OS'),
-(368, 6, 20, 2024, 'GEN', 832, 1, 'OS'),
-(369, 6, 20, 2024, 'EWS', 4462, 1, 'OS'),
-(370, 6, 20, 2024, 'EWS', 6185, 1, 'OS'),
-(371, 6, 20, 2024, 'EWS', 268, 1, 'OS'),
-(372, 6, 20, 2024, 'OBC', 10202, 1, 'OS'),
-(373, 6, 20, 2024, 'OBC', 15276, 1, 'OS'),
-(374, 6, 20, 2024, 'SC', 4645, 1, 'OS'),
-(375, 6, 20, 2024, 'SC', 7109, 1, 'OS'),
-(376, 6, 20, 2024, 'SC', 82, 1, 'OS'),
-(377, 6, 20, 2024, 'ST', 1907, 1, 'OS'),
-(378, 6, 20, 2024, 'ST', 2240, 1, 'OS'),
-(379, 6, 24, 2024, 'GEN', 5629, 1, 'HS'),
-(380, 6, 24, 2024, 'GEN', 9393, 1, 'HS'),
-(381, 6, 24, 2024, 'GEN', 396, 1, 'HS'),
-(382, 6, 24, 2024, 'EWS', 766, 1, 'HS'),
-(383, 6, 24, 2024, 'EWS', 1346, 1, 'HS'),
-(384, 6, 24, 2024, 'EWS', 98, 1, 'HS'),
-(385, 6, 24, 2024, 'OBC', 1820, 1, 'HS'),
-(386, 6, 24, 2024, 'OBC', 3752, 1, 'HS'),
-(387, 6, 24, 2024, 'OBC', 199, 1, 'HS'),
-(388, 6, 24, 2024, 'SC', 1272, 1, 'HS'),
-(389, 6, 24, 2024, 'SC', 2196, 1, 'HS'),
-(390, 6, 24, 2024, 'ST', 358, 1, 'HS'),
-(391, 6, 24, 2024, 'ST', 693, 1, 'HS'),
-(392, 6, 24, 2024, 'GEN', 4748, 1, 'OS'),
-(393, 6, 24, 2024, 'GEN', 8485, 1, 'OS'),
-(394, 6, 24, 2024, 'GEN', 138, 1, 'OS'),
-(395, 6, 24, 2024, 'GEN', 130, 1, 'OS'),
-(396, 6, 24, 2024, 'EWS', 647, 1, 'OS'),
-(397, 6, 24, 2024, 'EWS', 1044, 1, 'OS'),
-(398, 6, 24, 2024, 'OBC', 1997, 1, 'OS'),
-(399, 6, 24, 2024, 'OBC', 3427, 1, 'OS'),
-(400, 6, 24, 2024, 'OBC', 74, 1, 'OS'),
-(401, 6, 24, 2024, 'SC', 877, 1, 'OS'),
-(402, 6, 24, 2024, 'SC', 995, 1, 'OS'),
-(403, 6, 24, 2024, 'SC', 34, 1, 'OS'),
-(404, 6, 24, 2024, 'ST', 393, 1, 'OS'),
-(405, 6, 24, 2024, 'ST', 519, 1, 'OS'),
-(406, 6, 28, 2024, 'GEN', 12712, 1, 'HS'),
-(407, 6, 28, 2024, 'GEN', 21027, 1, 'HS'),
-(408, 6, 28, 2024, 'GEN', 1451, 1, 'HS'),
-(409, 6, 28, 2024, 'EWS', 1863, 1, 'HS'),
-(410, 6, 28, 2024, 'EWS', 3185, 1, 'HS'),
-(411, 6, 28, 2024, 'OBC', 4438, 1, 'HS'),
-(412, 6, 28, 2024, 'OBC', 9442, 1, 'HS'),
-(413, 6, 28, 2024, 'OBC', 133, 1, 'HS'),
-(414, 6, 28, 2024, 'SC', 2661, 1, 'HS'),
-(415, 6, 28, 2024, 'SC', 3980, 1, 'HS'),
-(416, 6, 28, 2024, 'SC', 68, 1, 'HS'),
-(417, 6, 28, 2024, 'ST', 712, 1, 'HS'),
-(418, 6, 28, 2024, 'ST', 1514, 1, 'HS'),
-(419, 6, 28, 2024, 'GEN', 12061, 1, 'OS'),
-(420, 6, 28, 2024, 'GEN', 20965, 1, 'OS'),
-(421, 6, 28, 2024, 'GEN', 630, 1, 'OS'),
-(422, 6, 28, 2024, 'EWS', 1813, 1, 'OS'),
-(423, 6, 28, 2024, 'EWS', 3407, 1, 'OS'),
-(424, 6, 28, 2024, 'OBC', 4919, 1, 'OS'),
-(425, 6, 28, 2024, 'OBC', 9590, 1, 'OS'),
-(426, 6, 28, 2024, 'OBC', 361, 1, 'OS'),
-(427, 6, 28, 2024, 'SC', 2664, 1, 'OS'),
-(428, 6, 28, 2024, 'SC', 4746, 1, 'OS'),
-(429, 6, 28, 2024, 'ST', 1039, 1, 'OS'),
-(430, 6, 28, 2024, 'ST', 2165, 1, 'OS'),
-(431, 6, 32, 2024, 'GEN', 9900, 1, 'HS'),
-(432, 6, 32, 2024, 'GEN', 16938, 1, 'HS'),
-(433, 6, 32, 2024, 'GEN', 1246, 1, 'HS'),
-(434, 6, 32, 2024, 'EWS', 1355, 1, 'HS'),
-(435, 6, 32, 2024, 'EWS', 2501, 1, 'HS'),
-(436, 6, 32, 2024, 'OBC', 3446, 1, 'HS'),
-(437, 6, 32, 2024, 'OBC', 5997, 1, 'HS'),
-(438, 6, 32, 2024, 'OBC', 571, 1, 'HS'),
-(439, 6, 32, 2024, 'SC', 2094, 1, 'HS'),
-(440, 6, 32, 2024, 'SC', 3883, 1, 'HS'),
-(441, 6, 32, 2024, 'ST', 580, 1, 'HS'),
-(442, 6, 32, 2024, 'ST', 1450, 1, 'HS'),
-(443, 6, 32, 2024, 'GEN', 8614, 1, 'OS'),
-(444, 6, 32, 2024, 'GEN', 13410, 1, 'OS'),
-(445, 6, 32, 2024, 'GEN', 1187, 1, 'OS'),
-(446, 6, 32, 2024, 'EWS', 1299, 1, 'OS'),
-(447, 6, 32, 2024, 'EWS', 2132, 1, 'OS'),
-(448, 6, 32, 2024, 'EWS', 66, 1, 'OS'),
-(449, 6, 32, 2024, 'OBC', 3535, 1, 'OS'),
-(450, 6, 32, 2024, 'OBC', 6233, 1, 'OS'),
-(451, 6, 32, 2024, 'OBC', 90, 1, 'OS'),
-(452, 6, 32, 2024, 'SC', 2049, 1, 'OS'),
-(453, 6, 32, 2024, 'SC', 2422, 1, 'OS'),
-(454, 6, 32, 2024, 'ST', 648, 1, 'OS'),
-(455, 6, 32, 2024, 'ST', 1064, 1, 'OS'),
-(456, 6, 58, 2024, 'GEN', 19096, 1, 'HS'),
-(457, 6, 58, 2024, 'GEN', 26463, 1, 'HS'),
-(458, 6, 58, 2024, 'GEN', 1308, 1, 'HS'),
-(459, 6, 58, 2024, 'EWS', 2842, 1, 'HS'),
-(460, 6, 58, 2024, 'EWS', 4915, 1, 'HS'),
-(461, 6, 58, 2024, 'OBC', 7080, 1, 'HS'),
-(462, 6, 58, 2024, 'OBC', 12497, 1, 'HS'),
-(463, 6, 58, 2024, 'OBC', 547, 1, 'HS'),
-(464, 6, 58, 2024, 'SC', 3551, 1, 'HS'),
-(465, 6, 58, 2024, 'SC', 7041, 1, 'HS'),
-(466, 6, 58, 2024, 'ST', 1051, 1, 'HS'),
-(467, 6, 58, 2024, 'ST', 1731, 1, 'HS'),
-(468, 6, 58, 2024, 'GEN', 17685, 1, 'OS'),
-(469, 6, 58, 2024, 'GEN', 31262, 1, 'OS'),
-(470, 6, 58, 2024, 'GEN', 1006, 1, 'OS'),
-(471, 6, 58, 2024, 'EWS', 2750, 1, 'OS'),
-(472, 6, 58, 2024, 'EWS', 5284, 1, 'OS'),
-(473, 6, 58, 2024, 'EWS', 256, 1, 'OS'),
-(474, 6, 58, 2024, 'OBC', 6869, 1, 'OS'),
-(475, 6, 58, 2024, 'OBC', 14204, 1, 'OS'),
-(476, 6, 58, 2024, 'SC', 3683, 1, 'OS'),
-(477, 6, 58, 2024, 'SC', 5300, 1, 'OS'),
-(478, 6, 58, 2024, 'SC', 306, 1, 'OS'),
-(479, 6, 58, 2024, 'ST', 1578, 1, 'OS'),
-(480, 6, 58, 2024, 'ST', 2777, 1, 'OS'),
-(481, 6, 50, 2024, 'GEN', 33350, 1, 'HS'),
-(482, 6, 50, 2024, 'GEN', 41140, 1, 'HS'),
-(483, 6, 50, 2024, 'GEN', 2483, 1, 'HS'),
-(484, 6, 50, 2024, 'EWS', 4943, 1, 'HS'),
-(485, 6, 50, 2024, 'EWS', 6434, 1, 'HS'),
-(486, 6, 50, 2024, 'OBC', 11163, 1, 'HS'),
-(487, 6, 50, 2024, 'OBC', 17339, 1, 'HS'),
-(488, 6, 50, 2024, 'SC', 5811, 1, 'HS'),
-(489, 6, 50, 2024, 'SC', 166, 1, 'HS'),
-(490, 6, 50, 2024, 'ST', 1795, 1, 'HS'),
-(491, 6, 50, 2024, 'ST', 2904, 1, 'HS'),
-(492, 6, 50, 2024, 'ST', 71, 1, 'HS'),
-(493, 6, 50, 2024, 'GEN', 32875, 1, 'OS'),
-(494, 6, 50, 2024, 'GEN', 40266, 1, 'OS'),
-(495, 6, 50, 2024, 'GEN', 1277, 1, 'OS'),
-(496, 6, 50, 2024, 'EWS', 4796, 1, 'OS'),
-(497, 6, 50, 2024, 'EWS', 6695, 1, 'OS'),
-(498, 6, 50, 2024, 'OBC', 11818, 1, 'OS'),
-(499, 6, 50, 2024, 'OBC', 16189, 1, 'OS'),
-(500, 6, 50, 2024, 'OBC', 1216, 1, 'OS'),
-(501, 6, 50, 2024, 'SC', 6019, 1, 'OS'),
-(502, 6, 50, 2024, 'SC', 8473, 1, 'OS'),
-(503, 6, 50, 2024, 'ST', 2550, 1, 'OS'),
-(504, 6, 50, 2024, 'ST', 3961, 1, 'OS'),
-(505, 16, 2, 2024, 'GEN', 2157, 1, 'HS'),
-(506, 16, 2, 2024, 'GEN', 879, 1, 'HS'),
-(507, 16, 2, 2024, 'EWS', 310, 1, 'HS'),
-(508, 16, 2, 2024, 'EWS', 221, 1, 'HS'),
-(509, 16, 2, 2024, 'OBC', 2482, 1, 'HS'),
-(510, 16, 2, 2024, 'OBC', 1035, 1, 'HS'),
-(511, 16, 2, 2024, 'SC', 661, 1, 'HS'),
-(512, 16, 2, 2024, 'SC', 253, 1, 'HS'),
-(513, 16, 2, 2024, 'ST', 277, 1, 'HS'),
-(514, 16, 2, 2024, 'ST', 148, 1, 'HS'),
-(515, 16, 2, 2024, 'GEN', 776, 1, 'OS'),
-(516, 16, 2, 2024, 'GEN', 629, 1, 'OS'),
-(517, 16, 2, 2024, 'GEN', 115, 1, 'OS'),
-(518, 16, 2, 2024, 'EWS', 234, 1, 'OS'),
-(519, 16, 2, 2024, 'EWS', 197, 1, 'OS'),
-(520, 16, 2, 2024, 'OBC', 415, 1, 'OS'),
-(521, 16, 2, 2024, 'OBC', 372, 1, 'OS'),
-(522, 16, 2, 2024, 'SC', 212, 1, 'OS'),
-(523, 16, 2, 2024, 'SC', 197, 1, 'OS'),
-(524, 16, 2, 2024, 'ST', 97, 1, 'OS'),
-(525, 16, 2, 2024, 'ST', 74, 1, 'OS'),
-(526, 16, 7, 2024, 'GEN', 30265, 1, 'HS'),
-(527, 16, 7, 2024, 'GEN', 36013, 1, 'HS'),
-(528, 16, 7, 2024, 'EWS', 5092, 1, 'HS'),
-(529, 16, 7, 2024, 'EWS', 5317, 1, 'HS'),
-(530, 16, 7, 2024, 'OBC', 10498, 1, 'HS'),
-(531, 16, 7, 2024, 'OBC', 19518, 1, 'HS'),
-(532, 16, 7, 2024, 'SC', 6463, 1, 'HS'),
-(533, 16, 7, 2024, 'ST', 2966, 1, 'HS'),
-(534, 16, 7, 2024, 'GEN', 20056, 1, 'OS'),
-(535, 16, 7, 2024, 'GEN', 29317, 1, 'OS'),
-(536, 16, 7, 2024, 'EWS', 3139, 1, 'OS'),
-(537, 16, 7, 2024, 'OBC', 7810, 1, 'OS'),
-(538, 16, 7, 2024, 'OBC', 10317, 1, 'OS'),
-(539, 16, 7, 2024, 'SC', 4581, 1, 'OS'),
-(540, 16, 7, 2024, 'SC', 5245, 1, 'OS'),
-(541, 16, 7, 2024, 'ST', 2412, 1, 'OS'),
-(542, 16, 16, 2024, 'GEN', 35187, 1, 'HS'),
-(543, 16, 16, 2024, 'GEN', 33870, 1, 'HS'),
-(544, 16, 16, 2024, 'GEN', 2151, 1, 'HS'),
-(545, 16, 16, 2024, 'EWS', 5145, 1, 'HS'),
-(546, 16, 16, 2024, 'EWS', 5883, 1, 'HS'),
-(547, 16, 16, 2024, 'OBC', 11716, 1, 'HS'),
-(548, 16, 16, 2024, 'OBC', 18713, 1, 'HS'),
-(549, 16, 16, 2024, 'OBC', 1660, 1, 'HS'),
-(550, 16, 16, 2024, 'SC', 6468, 1, 'HS'),
-(551, 16, 16, 2024, 'SC', 9189, 1, 'HS'),
-(552, 16, 16, 2024, 'ST', 3115, 1, 'HS'),
-(553, 16, 16, 2024, 'ST', 3580, 1, 'HS'),
-(554, 16, 16, 2024, 'GEN', 31982, 1, 'OS'),
-(555, 16, 16, 2024, 'GEN', 37626, 1, 'OS'),
-(556, 16, 16, 2024, 'GEN', 827, 1, 'OS'),
-(557, 16, 16, 2024, 'EWS', 4801, 1, 'OS'),
-(558, 16, 16, 2024, 'EWS', 5329, 1, 'OS'),
-(559, 16, 16, 2024, 'OBC', 10460, 1, 'OS'),
-(560, 16, 16, 2024, 'OBC', 15335, 1, 'OS'),
-(561, 16, 16, 2024, 'SC', 5538, 1, 'OS'),
-(562, 16, 16, 2024, 'SC', 6318, 1, 'OS'),
-(563, 16, 16, 2024, 'ST', 2155, 1, 'OS'),
-(564, 16, 16, 2024, 'ST', 3331, 1, 'OS'),
-(565, 16, 20, 2024, 'GEN', 40724, 1, 'HS'),
-(566, 16, 20, 2024, 'GEN', 54665, 1, 'HS'),
-(567, 16, 20, 2024, 'GEN', 2466, 1, 'HS'),
-(568, 16, 20, 2024, 'EWS', 6211, 1, 'HS'),
-(569, 16, 20, 2024, 'EWS', 8284, 1, 'HS'),
-(570, 16, 20, 2024, 'OBC', 13937, 1, 'HS'),
-(571, 16, 20, 2024, 'OBC', 21987, 1, 'HS'),
-(572, 16, 20, 2024, 'SC', 6062, 1, 'HS'),
-(573, 16, 20, 2024, 'SC', 10065, 1, 'HS'),
-(574, 16, 20, 2024, 'ST', 1641, 1, 'HS'),
-(575, 16, 20, 2024, 'ST', 6503, 1, 'HS'),
-(576, 16, 20, 2024, 'GEN', 36084, 1, 'OS'),
-(577, 16, 20, 2024, 'GEN', 47998, 1, 'OS'),
-(578, 16, 20, 2024, 'GEN', 999, 1, 'OS'),
-(579, 16, 20, 2024, 'EWS', 5189, 1, 'OS'),
-(580, 16, 20, 2024, 'EWS', 6989, 1, 'OS'),
-(581, 16, 20, 2024, 'OBC', 12013, 1, 'OS'),
-(582, 16, 20, 2024, 'OBC', 19214, 1, 'OS'),
-(583, 16, 20, 2024, 'OBC', 726, 1, 'OS'),
-(584, 16, 20, 2024, 'SC', 5476, 1, 'OS'),
-(585, 16, 20, 2024, 'SC', 7785, 1, 'OS'),
-(586, 16, 20, 2024, 'ST', 1417, 1, 'OS'),
-(587, 16, 20, 2024, 'ST', 2465, 1, 'OS'),
-(588, 16, 24, 2024, 'GEN', 10863, 1, 'HS'),
-(589, 16, 24, 2024, 'GEN', 19524, 1, 'HS'),
-(590, 16, 24, 2024, 'GEN', 438, 1, 'HS'),
-(591, 16, 24, 2024, 'EWS', 1634, 1, 'HS'),
-(592, 16, 24, 2024, 'EWS', 3142, 1, 'HS'),
-(593, 16, 24, 2024, 'OBC', 4015, 1, 'HS'),
-(594, 16, 24, 2024, 'OBC', 9029, 1, 'HS'),
-(595, 16, 24, 2024, 'OBC', 201, 1, 'HS'),
-(596, 16, 24, 2024, 'SC', 2580, 1, 'HS'),
-(597, 16, 24, 2024, 'SC', 4231, 1, 'HS'),
-(598, 16, 24, 2024, 'SC', 118, 1, 'HS'),
-(599, 16, 24, 2024, 'ST', 1010, 1, 'HS'),
-(600, 16, 24, 2024, 'ST', 1557, 1, 'HS'),
-(601, 16, 24, 2024, 'GEN', 8547, 1, 'OS'),
-(602, 16, 24, 2024, 'GEN', 15103, 1, 'OS'),
-(603, 16, 24, 2024, 'GEN', 172, 1, 'OS'),
-(604, 16, 24, 2024, 'EWS', 1223, 1, 'OS'),
-(605, 16, 24, 2024, 'EWS', 2456, 1, 'OS'),
-(606, 16, 24, 2024, 'EWS', 42, 1, 'OS'),
-(607, 16, 24, 2024, 'OBC', 3141, 1, 'OS'),
-(608, 16, 24, 2024, 'OBC', 6073, 1, 'OS'),
-(609, 16, 24, 2024, 'OBC', 96, 1, 'OS'),
-(610, 16, 24, 2024, 'SC', 1728, 1, 'OS'),
-(611, 16, 24, 2024, 'SC', 3267, 1, 'OS'),
-(612, 16, 24, 2024, 'SC', 57, 1, 'OS'),
-(613, 16, 24, 2024, 'ST', 630, 1, 'OS'),
-(614, 16, 24, 2024, 'ST', 1279, 1, 'OS'),
-(615, 16, 24, 2024, 'ST', 14, 1, 'OS'),
-(616, 16, 28, 2024, 'GEN', 21441, 1, 'HS'),
-(617, 16, 28, 2024, 'GEN', 32070, 1, 'HS'),
-(618, 16, 28, 2024, 'GEN', 1874, 1, 'HS'),
-(619, 16, 28, 2024, 'EWS', 3152, 1, 'HS'),
-(620, 16, 28, 2024, 'EWS', 5203, 1, 'HS'),
-(621, 16, 28, 2024, 'EWS', 384, 1, 'HS'),
-(622, 16, 28, 2024, 'OBC', 7565, 1, 'HS'),
-(623, 16, 28, 2024, 'OBC', 16088, 1, 'HS'),
-(624, 16, 28, 2024, 'OBC', 1028, 1, 'HS'),
-(625, 16, 28, 2024, 'SC', 4216, 1, 'HS'),
-(626, 16, 28, 2024, 'SC', 6191, 1, 'HS'),
-(627, 16, 28, 2024, 'ST', 2363, 1, 'HS'),
-(628, 16, 28, 2024, 'ST', 2815, 1, 'HS'),
-(629, 16, 28, 2024, 'GEN', 18379, 1, 'OS'),
-(630, 16, 28, 2024, 'GEN', 26466, 1, 'OS'),
-(631, 16, 28, 2024, 'GEN', 1057, 1, 'OS'),
-(632, 16, 28, 2024, 'EWS', 2729, 1, 'OS'),
-(633, 16, 28, 2024, 'EWS', 4090, 1, 'OS'),
-(634, 16, 28, 2024, 'OBC', 6243, 1, 'OS'),
-(635, 16, 28, 2024, 'OBC', 12067, 1, 'OS'),
-(636, 16, 28, 2024, 'OBC', 527, 1, 'OS'),
-(637, 16, 28, 2024, 'SC', 3580, 1, 'OS'),
-(638, 16, 28, 2024, 'SC', 6048, 1, 'OS'),
-(639, 16, 28, 2024, 'ST', 1704, 1, 'OS'),
-(640, 16, 28, 2024, 'ST', 2400, 1, 'OS'),
-(641, 16, 32, 2024, 'GEN', 16536, 1, 'HS'),
-(642, 16, 32, 2024, 'GEN', 25119, 1, 'HS'),
-(643, 16, 32, 2024, 'GEN', 1154, 1, 'HS'),
-(644, 16, 32, 2024, 'EWS', 2525, 1, 'HS'),
-(645, 16, 32, 2024, 'EWS', 3537, 1, 'HS'),
-(646, 16, 32, 2024, 'OBC', 5488, 1, 'HS'),
-(647, 16, 32, 2024, 'OBC', 12127, 1, 'HS'),
-(648, 16, 32, 2024, 'OBC', 499, 1, 'HS'),
-(649, 16, 32, 2024, 'SC', 3654, 1, 'HS'),
-(650, 16, 32, 2024, 'SC', 6149, 1, 'HS'),
-(651, 16, 32, 2024, 'SC', 186, 1, 'HS'),
-(652, 16, 32, 2024, 'ST', 1917, 1, 'HS'),
-(653, 16, 32, 2024, 'ST', 1677, 1, 'HS'),
-(654, 16, 32, 2024, 'GEN', 12706, 1, 'OS'),
-(655, 16, 32, 2024, 'GEN', 21715, 1, 'OS'),
-(656, 16, 32, 2024, 'GEN', 477, 1, 'OS'),
-(657, 16, 32, 2024, 'EWS', 1734, 1, 'OS'),
-(658, 16, 32, 2024, 'EWS', 3677, 1, 'OS'),
-(659, 16, 32, 2024, 'OBC', 4863, 1, 'OS'),
-(660, 16, 32, 2024, 'OBC', 7901, 1, 'OS'),
-(661, 16, 32, 2024, 'OBC', 250, 1, 'OS'),
-(662, 16, 32, 2024, 'SC', 2642, 1, 'OS'),
-(663, 16, 32, 2024, 'SC', 4719, 1, 'OS'),
-(664, 16, 32, 2024, 'SC', 235, 1, 'OS'),
-(665, 16, 32, 2024, 'ST', 1313, 1, 'OS'),
-(666, 16, 32, 2024, 'ST', 2023, 1, 'OS'),
-(667, 16, 32, 2024, 'ST', 99, 1, 'OS'),
-(668, 16, 38, 2024, 'GEN', 28034, 1, 'HS'),
-(669, 16, 38, 2024, 'GEN', 39901, 1, 'HS'),
-(670, 16, 38, 2024, 'EWS', 4949, 1, 'HS'),
-(671, 16, 38, 2024, 'EWS', 6972, 1, 'HS'),
-(672, 16, 38, 2024, 'OBC', 12786, 1, 'HS'),
-(673, 16, 38, 2024, 'OBC', 20798, 1, 'HS'),
-(674, 16, 38, 2024, 'SC', 6619, 1, 'HS'),
-(675, 16, 38, 2024, 'ST', 3572, 1, 'HS'),
-(676, 16, 38, 2024, 'GEN', 23117, 1, 'OS'),
-(677, 16, 38, 2024, 'GEN', 30552, 1, 'OS'),
-(678, 16, 38, 2024, 'EWS', 3370, 1, 'OS'),
-(679, 16, 38, 2024, 'OBC', 8270, 1, 'OS'),
-(680, 16, 38, 2024, 'OBC', 14650, 1, 'OS'),
-(681, 16, 38, 2024, 'SC', 4596, 1, 'OS'),
-(682, 16, 38, 2024, 'SC', 7889, 1, 'OS'),
-(683, 16, 38, 2024, 'ST', 2310, 1, 'OS'),
-(684, 16, 52, 2024, 'GEN', 45067, 1, 'HS'),
-(685, 16, 52, 2024, 'GEN', 56839, 1, 'HS'),
-(686, 16, 52, 2024, 'GEN', 2915, 1, 'HS'),
-(687, 16, 52, 2024, 'EWS', 6501, 1, 'HS'),
-(688, 16, 52, 2024, 'EWS', 8876, 1, 'HS'),
-(689, 16, 52, 2024, 'OBC', 15625, 1, 'HS'),
-(690, 16, 52, 2024, 'OBC', 22328, 1, 'HS'),
-(691, 16, 52, 2024, 'OBC', 1812, 1, 'HS'),
-(692, 16, 52, 2024, 'SC', 7840, 1, 'HS'),
-(693, 16, 52, 2024, 'SC', 10338, 1, 'HS'),
-(694, 16, 52, 2024, 'ST', 4217, 1, 'HS'),
-(695, 16, 52, 2024, 'ST', 4455, 1, 'HS'),
-(696, 16, 52, 2024, 'GEN', 39322, 1, 'OS'),
-(697, 16, 52, 2024, 'GEN', 47029, 1, 'OS'),
-(698, 16, 52, 2024, 'GEN', 2116, 1, 'OS'),
-(699, 16, 52, 2024, 'EWS', 5645, 1, 'OS'),
-(700, 16, 52, 2024, 'EWS', 7670, 1, 'OS'),
-(701, 16, 52, 2024, 'OBC', 13739, 1, 'OS'),
-(702, 16, 52, 2024, 'OBC', 18549, 1, 'OS'),
-(703, 16, 52, 2024, 'SC', 6702, 1, 'OS'),
-(704, 16, 52, 2024, 'SC', 8791, 1, 'OS'),
-(705, 16, 52, 2024, 'ST', 2759, 1, 'OS'),
-(706, 16, 52, 2024, 'ST', 4294, 1, 'OS'),
-(707, 16, 54, 2024, 'GEN', 15911, 1, 'HS'),
-(708, 16, 54, 2024, 'GEN', 22952, 1, 'HS'),
-(709, 16, 54, 2024, 'EWS', 2212, 1, 'HS'),
-(710, 16, 54, 2024, 'EWS', 3425, 1, 'HS'),
-(711, 16, 54, 2024, 'OBC', 5163, 1, 'HS'),
-(712, 16, 54, 2024, 'OBC', 9804, 1, 'HS'),
-(713, 16, 54, 2024, 'SC', 3653, 1, 'HS'),
-(714, 16, 54, 2024, 'ST', 1691, 1, 'HS'),
-(715, 16, 54, 2024, 'GEN', 13766, 1, 'OS'),
-(716, 16, 54, 2024, 'GEN', 20707, 1, 'OS'),
-(717, 16, 54, 2024, 'EWS', 2054, 1, 'OS'),
-(718, 16, 54, 2024, 'OBC', 4969, 1, 'OS'),
-(719, 16, 54, 2024, 'OBC', 5532, 1, 'OS'),
-(720, 16, 54, 2024, 'SC', 2943, 1, 'OS'),
-(721, 16, 54, 2024, 'SC', 4027, 1, 'OS'),
-(722, 16, 54, 2024, 'ST', 744, 1, 'OS'),
-(723, 16, 58, 2024, 'GEN', 31264, 1, 'HS'),
-(724, 16, 58, 2024, 'GEN', 44629, 1, 'HS'),
-(725, 16, 58, 2024, 'GEN', 1682, 1, 'HS'),
-(726, 16, 58, 2024, 'EWS', 4648, 1, 'HS'),
-(727, 16, 58, 2024, 'EWS', 6577, 1, 'HS'),
-(728, 16, 58, 2024, 'EWS', 389, 1, 'HS'),
-(729, 16, 58, 2024, 'OBC', 10924, 1, 'HS'),
-(730, 16, 58, 2024, 'OBC', 21435, 1, 'HS'),
-(731, 16, 58, 2024, 'OBC', 1154, 1, 'HS'),
-(732, 16, 58, 2024, 'SC', 5703, 1, 'HS'),
-(733, 16, 58, 2024, 'SC', 9677, 1, 'HS'),
-(734, 16, 58, 2024, 'ST', 2660, 1, 'HS'),
-(735, 16, 58, 2024, 'ST', 3881, 1, 'HS'),
-(736, 16, 58, 2024, 'GEN', 25728, 1, 'OS'),
-(737, 16, 58, 2024, 'GEN', 41699, 1, 'OS'),
-(738, 16, 58, 2024, 'GEN', 1695, 1, 'OS'),
-(739, 16, 58, 2024, 'EWS', 4006, 1, 'OS'),
-(740, 16, 58, 2024, 'EWS', 5791, 1, 'OS'),
-(741, 16, 58, 2024, 'OBC', 8723, 1, 'OS'),
-(742, 16, 58, 2024, 'OBC', 16428, 1, 'OS'),
-(743, 16, 58, 2024, 'OBC', 806, 1, 'OS'),
-(744, 16, 58, 2024, 'SC', 5044, 1, 'OS'),
-(745, 16, 58, 2024, 'SC', 7166, 1, 'OS'),
-(746, 16, 58, 2024, 'SC', 343, 1, 'OS'),
-(747, 16, 58, 2024, 'ST', 2035, 1, 'OS'),
-(748, 16, 58, 2024, 'ST', 2508, 1, 'OS'),
-(749, 16, 58, 2024, 'ST', 98, 1, 'OS'),
-(750, 16, 66, 2024, 'GEN', 1741, 1, 'HS'),
-(751, 16, 66, 2024, 'GEN', 823, 1, 'HS'),
-(752, 16, 66, 2024, 'EWS', 316, 1, 'HS'),
-(753, 16, 66, 2024, 'EWS', 248, 1, 'HS'),
-(754, 16, 66, 2024, 'OBC', 1561, 1, 'HS'),
-(755, 16, 66, 2024, 'OBC', 826, 1, 'HS'),
-(756, 16, 66, 2024, 'SC', 135, 1, 'HS'),
-(757, 16, 66, 2024, 'SC', 198, 1, 'HS'),
-(758, 16, 66, 2024, 'ST', 425, 1, 'HS'),
-(759, 16, 66, 2024, 'GEN', 342, 1, 'OS'),
-(760, 16, 66, 2024, 'GEN', 535, 1, 'OS'),
-(761, 16, 66, 2024, 'EWS', 89, 1, 'OS'),
-(762, 16, 66, 2024, 'OBC', 204, 1, 'OS'),
-(763, 16, 66, 2024, 'OBC', 174, 1, 'OS'),
-(764, 16, 66, 2024, 'SC', 50, 1, 'OS'),
-(765, 16, 66, 2024, 'SC', 82, 1, 'OS'),
-(766, 16, 66, 2024, 'ST', 41, 1, 'OS'),
-(767, 12, 10, 2024, 'GEN', 35329, 1, 'HS'),
-(768, 12, 10, 2024, 'GEN', 42973, 1, 'HS'),
-(769, 12, 10, 2024, 'EWS', 5152, 1, 'HS'),
-(770, 12, 10, 2024, 'EWS', 6098, 1, 'HS'),
-(771, 12, 10, 2024, 'OBC', 12894, 1, 'HS'),
-(772, 12, 10, 2024, 'OBC', 1231, 1, 'HS'),
-(773, 12, 10, 2024, 'SC', 5792, 1, 'HS'),
-(774, 12, 10, 2024, 'SC', 7766, 1, 'HS'),
-(775, 12, 10, 2024, 'SC', 178, 1, 'HS'),
-(776, 12, 10, 2024, 'ST', 4265, 1, 'HS'),
-(777, 12, 10, 2024, 'GEN', 32380, 1, 'OS'),
-(778, 12, 10, 2024, 'GEN', 33107, 1, 'OS'),
-(779, 12, 10, 2024, 'EWS', 5473, 1, 'OS'),
-(780, 12, 10, 2024, 'EWS', 7280, 1, 'OS'),
-(781, 12, 10, 2024, 'OBC', 11102, 1, 'OS'),
-(782, 12, 10, 2024, 'OBC', 16524, 1, 'OS'),
-(783, 12, 10, 2024, 'OBC', 731, 1, 'OS'),
-(784, 12, 10, 2024, 'SC', 6057, 1, 'OS'),
-(785, 12, 10, 2024, 'SC', 6402, 1, 'OS'),
-(786, 12, 10, 2024, 'ST', 2294, 1, 'OS'),
-(787, 12, 10, 2024, 'ST', 2056, 1, 'OS'),
-(788, 12, 16, 2024, 'GEN', 20589, 1, 'HS'),
-(789, 12, 16, 2024, 'GEN', 30210, 1, 'HS'),
-(790, 12, 16, 2024, 'GEN', 427, 1, 'HS'),
-(791, 12, 16, 2024, 'EWS', 2884, 1, 'HS'),
-(792, 12, 16, 2024, 'EWS', 5511, 1, 'HS'),
-(793, 12, 16, 2024, 'OBC', 7261, 1, 'HS'),
-(794, 12, 16, 2024, 'OBC', 12503, 1, 'HS'),
-(795, 12, 16, 2024, 'SC', 3096, 1, 'HS'),
-(796, 12, 16, 2024, 'SC', 6204, 1, 'HS'),
-(797, 12, 16, 2024, 'ST', 2828, 1, 'HS'),
-(798, 12, 16, 2024, 'GEN', 20109, 1, 'OS'),
-(799, 12, 16, 2024, 'GEN', 32378, 1, 'OS'),
-(800, 12, 16, 2024, 'GEN', 899, 1, 'OS'),
-(801, 12, 16, 2024, 'EWS', 2982, 1, 'OS'),
-(802, 12, 16, 2024, 'EWS', 5251, 1, 'OS'),
-(803, 12, 16, 2024, 'EWS', 196, 1, 'OS'),
-(804, 12, 16, 2024, 'OBC', 7223, 1, 'OS'),
-(805, 12, 16, 2024, 'OBC', 11779, 1, 'OS'),
-(806, 12, 16, 2024, 'SC', 3781, 1, 'OS'),
-(807, 12, 16, 2024, 'SC', 5906, 1, 'OS'),
-(808, 12, 16, 2024, 'ST', 1910, 1, 'OS'),
-(809, 12, 20, 2024, 'GEN', 25983, 1, 'HS'),
-(810, 12, 20, 2024, 'GEN', 43457, 1, 'HS'),
-(811, 12, 20, 2024, 'GEN', 884, 1, 'HS'),
-(812, 12, 20, 2024, 'EWS', 3878, 1, 'HS'),
-(813, 12, 20, 2024, 'EWS', 6070, 1, 'HS'),
-(814, 12, 20, 2024, 'OBC', 8653, 1, 'HS'),
-(815, 12, 20, 2024, 'OBC', 14784, 1, 'HS'),
-(816, 12, 20, 2024, 'OBC', 711, 1, 'HS'),
-(817, 12, 20, 2024, 'SC', 3865, 1, 'HS'),
-(818, 12, 20, 2024, 'SC', 4077, 1, 'HS'),
-(819, 12, 20, 2024, 'ST', 3311, 1, 'HS'),
-(820, 12, 20, 2024, 'ST', 3859, 1, 'HS'),
-(821, 12, 20, 2024, 'GEN', 28661, 1, 'OS'),
-(822, 12, 20, 2024, 'GEN', 40028, 1, 'OS'),
-(823, 12, 20, 2024, 'GEN', 736, 1, 'OS'),
-(824, 12, 20, 2024, 'GEN', 1864, 1, 'OS'),
-(825, 12, 20, 2024, 'EWS', 4189, 1, 'OS'),
-(826, 12, 20, 2024, 'EWS', 6681, 1, 'OS'),
-(827, 12, 20, 2024, 'EWS', 188, 1, 'OS'),
-(828, 12, 20, 2024, 'OBC', 9300, 1, 'OS'),
-(829, 12, 20, 2024, 'OBC', 15218, 1, 'OS'),
-(830, 12, 20, 2024, 'SC', 4815, 1, 'OS'),
-(831, 12, 20, 2024, 'SC', 7266, 1, 'OS'),
-(832, 12, 20, 2024, 'ST', 978, 1, 'OS'),
-(833, 12, 20, 2024, 'ST', 1568, 1, 'OS'),
-(834, 12, 24, 2024, 'GEN', 6364, 1, 'HS'),
-(835, 12, 24, 2024, 'GEN', 11813, 1, 'HS'),
-(836, 12, 24, 2024, 'GEN', 189, 1, 'HS'),
-(837, 12, 24, 2024, 'GEN', 245, 1, 'HS'),
-(838, 12, 24, 2024, 'EWS', 1038, 1, 'HS'),
-(839, 12, 24, 2024, 'EWS', 2205, 1, 'HS'),
-(840, 12, 24, 2024, 'OBC', 2482, 1, 'HS'),
-(841, 12, 24, 2024, 'OBC', 5467, 1, 'HS'),
-(842, 12, 24, 2024, 'OBC', 110, 1, 'HS'),
-(843, 12, 24, 2024, 'OBC', 328, 1, 'HS'),
-(844, 12, 24, 2024, 'SC', 1075, 1, 'HS'),
-(845, 12, 24, 2024, 'SC', 2181, 1, 'HS'),
-(846, 12, 24, 2024, 'SC', 23, 1, 'HS'),
-(847, 12, 24, 2024, 'ST', 1143, 1, 'HS'),
-(848, 12, 24, 2024, 'ST', 1455, 1, 'HS'),
-(849, 12, 24, 2024, 'GEN', 4265, 1, 'OS'),
-(850, 12, 24, 2024, 'GEN', 8792, 1, 'OS'),
-(851, 12, 24, 2024, 'GEN', 120, 1, 'OS'),
-(852, 12, 24, 2024, 'EWS', 574, 1, 'OS'),
-(853, 12, 24, 2024, 'EWS', 1307, 1, 'OS'),
-(854, 12, 24, 2024, 'EWS', 49, 1, 'OS'),
-(855, 12, 24, 2024, 'OBC', 1559, 1, 'OS'),
-(856, 12, 24, 2024, 'OBC', 3601, 1, 'OS'),
-(857, 12, 24, 2024, 'OBC', 57, 1, 'OS'),
-(858, 12, 24, 2024, 'SC', 965, 1, 'OS'),
-(859, 12, 24, 2024, 'SC', 1681, 1, 'OS'),
-(860, 12, 24, 2024, 'SC', 28, 1, 'OS'),
-(861, 12, 24, 2024, 'SC', 45, 1, 'OS'),
-(862, 12, 24, 2024, 'ST', 413, 1, 'OS'),
-(863, 12, 24, 2024, 'ST', 1116, 1, 'OS'),
-(864, 12, 24, 2024, 'ST', 22, 1, 'OS'),
-(865, 12, 28, 2024, 'GEN', 10846, 1, 'HS'),
-(866, 12, 28, 2024, 'GEN', 21480, 1, 'HS'),
-(867, 12, 28, 2024, 'GEN', 382, 1, 'HS'),
-(868, 12, 28, 2024, 'EWS', 1475, 1, 'HS'),
-(869, 12, 28, 2024, 'EWS', 3764, 1, 'HS'),
-(870, 12, 28, 2024, 'OBC', 4528, 1, 'HS'),
-(871, 12, 28, 2024, 'OBC', 9960, 1, 'HS'),
-(872, 12, 28, 2024, 'OBC', 219, 1, 'HS'),
-(873, 12, 28, 2024, 'SC', 2318, 1, 'HS'),
-(874, 12, 28, 2024, 'SC', 2544, 1, 'HS'),
-(875, 12, 28, 2024, 'ST', 2121, 1, 'HS'),
-(876, 12, 28, 2024, 'ST', 3636, 1, 'HS'),
-(877, 12, 28, 2024, 'GEN', 10309, 1, 'OS'),
-(878, 12, 28, 2024, 'GEN', 20650, 1, 'OS'),
-(879, 12, 28, 2024, 'GEN', 434, 1, 'OS'),
-(880, 12, 28, 2024, 'GEN', 1067, 1, 'OS'),
-(881, 12, 28, 2024, 'EWS', 1525, 1, 'OS'),
-(882, 12, 28, 2024, 'EWS', 3374, 1, 'OS'),
-(883, 12, 28, 2024, 'OBC', 4310, 1, 'OS'),
-(884, 12, 28, 2024, 'OBC', 8562, 1, 'OS'),
-(885, 12, 28, 2024, 'OBC', 288, 1, 'OS'),
-(886, 12, 28, 2024, 'SC', 2254, 1, 'OS'),
-(887, 12, 28, 2024, 'SC', 4001, 1, 'OS'),
-(888, 12, 28, 2024, 'ST', 1044, 1, 'OS'),
-(889, 12, 28, 2024, 'ST', 1956, 1, 'OS'),
-(890, 12, 32, 2024, 'GEN', 9041, 1, 'HS'),
-(891, 12, 32, 2024, 'GEN', 16318, 1, 'HS'),
-(892, 12, 32, 2024, 'GEN', 282, 1, 'HS'),
-(893, 12, 32, 2024, 'GEN', 1001, 1, 'HS'),
-(894, 12, 32, 2024, 'EWS', 1280, 1, 'HS'),
-(895, 12, 32, 2024, 'EWS', 2883, 1, 'HS'),
-(896, 12, 32, 2024, 'OBC', 3471, 1, 'HS'),
-(897, 12, 32, 2024, 'OBC', 6959, 1, 'HS'),
-(898, 12, 32, 2024, 'OBC', 130, 1, 'HS'),
-(899, 12, 32, 2024, 'SC', 1666, 1, 'HS'),
-(900, 12, 32, 2024, 'SC', 3070, 1, 'HS'),
-(901, 12, 32, 2024, 'ST', 1519, 1, 'HS'),
-(902, 12, 32, 2024, 'ST', 2961, 1, 'HS'),
-(903, 12, 32, 2024, 'GEN', 6710, 1, 'OS'),
-(904, 12, 32, 2024, 'GEN', 13750, 1, 'OS'),
-(905, 12, 32, 2024, 'GEN', 362, 1, 'OS'),
-(906, 12, 32, 2024, 'GEN', 805, 1, 'OS'),
-(907, 12, 32, 2024, 'EWS', 1081, 1, 'OS'),
-(908, 12, 32, 2024, 'EWS', 2118, 1, 'OS'),
-(909, 12, 32, 2024, 'EWS', 136, 1, 'OS'),
-(910, 12, 32, 2024, 'OBC', 2762, 1, 'OS'),
-(911, 12, 32, 2024, 'OBC', 7121, 1, 'OS'),
-(912, 12, 32, 2024, 'OBC', 184, 1, 'OS'),
-(913, 12, 32, 2024, 'SC', 1906, 1, 'OS'),
-(914, 12, 32, 2024, 'SC', 2475, 1, 'OS'),
-(915, 12, 32, 2024, 'ST', 828, 1, 'OS'),
-(916, 12, 32, 2024, 'ST', 1831, 1, 'OS'),
-(917, 12, 40, 2024, 'GEN', 10922, 1, 'HS'),
-(918, 12, 40, 2024, 'GEN', 19937, 1, 'HS'),
-(919, 12, 40, 2024, 'GEN', 545, 1, 'HS'),
-(920, 12, 40, 2024, 'EWS', 1505, 1, 'HS'),
-(921, 12, 40, 2024, 'EWS', 332, 1, 'HS'),
-(922, 12, 40, 2024, 'OBC', 4933, 1, 'HS'),
-(923, 12, 40, 2024, 'OBC', 10183, 1, 'HS'),
-(924, 12, 40, 2024, 'SC', 2424, 1, 'HS'),
-(925, 12, 40, 2024, 'ST', 2548, 1, 'HS'),
-(926, 12, 40, 2024, 'GEN', 10384, 1, 'OS'),
-(927, 12, 40, 2024, 'GEN', 21208, 1, 'OS'),
-(928, 12, 40, 2024, 'EWS', 1332, 1, 'OS'),
-(929, 12, 40, 2024, 'OBC', 4399, 1, 'OS'),
-(930, 12, 40, 2024, 'OBC', 7920, 1, 'OS'),
-(931, 12, 40, 2024, 'SC', 2727, 1, 'OS'),
-(932, 12, 40, 2024, 'SC', 5282, 1, 'OS'),
-(933, 12, 40, 2024, 'ST', 1356, 1, 'OS'),
-(934, 12, 50, 2024, 'GEN', 34121, 1, 'HS'),
-(935, 12, 50, 2024, 'GEN', 45173, 1, 'HS'),
-(936, 12, 50, 2024, 'GEN', 2103, 1, 'HS'),
-(937, 12, 50, 2024, 'EWS', 4874, 1, 'HS'),
-(938, 12, 50, 2024, 'OBC', 11892, 1, 'HS'),
-(939, 12, 50, 2024, 'OBC', 15808, 1, 'HS'),
-(940, 12, 50, 2024, 'SC', 5250, 1, 'HS'),
-(941, 12, 50, 2024, 'ST', 3688, 1, 'HS'),
-(942, 12, 50, 2024, 'GEN', 33173, 1, 'OS'),
-(943, 12, 50, 2024, 'GEN', 42632, 1, 'OS'),
-(944, 12, 50, 2024, 'EWS', 4860, 1, 'OS'),
-(945, 12, 50, 2024, 'OBC', 10473, 1, 'OS'),
-(946, 12, 50, 2024, 'OBC', 17884, 1, 'OS'),
-(947, 12, 50, 2024, 'SC', 6707, 1, 'OS'),
-(948, 12, 50, 2024, 'SC', 8254, 1, 'OS'),
-(949, 12, 50, 2024, 'ST', 2239, 1, 'OS'),
-(950, 12, 58, 2024, 'GEN', 18750, 1, 'HS'),
-(951, 12, 58, 2024, 'GEN', 29232, 1, 'HS'),
-(952, 12, 58, 2024, 'GEN', 343, 1, 'HS'),
-(953, 12, 58, 2024, 'EWS', 2906, 1, 'HS'),
-(954, 12, 58, 2024, 'EWS', 4170, 1, 'HS'),
-(955, 12, 58, 2024, 'EWS', 172, 1, 'HS'),
-(956, 12, 58, 2024, 'OBC', 6757, 1, 'HS'),
-(957, 12, 58, 2024, 'OBC', 13806, 1, 'HS'),
-(958, 12, 58, 2024, 'OBC', 514, 1, 'HS'),
-(959, 12, 58, 2024, 'SC', 3359, 1, 'HS'),
-(960, 12, 58, 2024, 'SC', 4639, 1, 'HS'),
-(961, 12, 58, 2024, 'ST', 2822, 1, 'HS'),
-(962, 12, 58, 2024, 'ST', 3912, 1, 'HS'),
-(963, 12, 58, 2024, 'GEN', 17056, 1, 'OS'),
-(964, 12, 58, 2024, 'GEN', 29637, 1, 'OS'),
-(965, 12, 58, 2024, 'GEN', 854, 1, 'OS'),
-(966, 12, 58, 2024, 'GEN', 1928, 1, 'OS'),
-(967, 12, 58, 2024, 'EWS', 2709, 1, 'OS'),
-(968, 12, 58, 2024, 'EWS', 4665, 1, 'OS'),
-(969, 12, 58, 2024, 'OBC', 6488, 1, 'OS'),
-(970, 12, 58, 2024, 'OBC', 12914, 1, 'OS'),
-(971, 12, 58, 2024, 'OBC', 403, 1, 'OS'),
-(972, 12, 58, 2024, 'SC', 4163, 1, 'OS'),
-(973, 12, 58, 2024, 'SC', 6688, 1, 'OS'),
-(974, 12, 58, 2024, 'ST', 1495, 1, 'OS'),
-(975, 12, 58, 2024, 'ST', 2322, 1, 'OS'),
-(976, 12, 68, 2024, 'GEN', 30471, 1, 'HS'),
-(977, 12, 68, 2024, 'GEN', 47449, 1, 'HS'),
-(978, 12, 68, 2024, 'GEN', 1594, 1, 'HS'),
-(979, 12, 68, 2024, 'EWS', 4537, 1, 'HS'),
-(980, 12, 68, 2024, 'EWS', 7018, 1, 'HS'),
-(981, 12, 68, 2024, 'OBC', 12263, 1, 'HS'),
-(982, 12, 68, 2024, 'SC', 5223, 1, 'HS'),
-(983, 12, 68, 2024, 'SC', 8166, 1, 'HS'),
-(984, 12, 68, 2024, 'ST', 3508, 1, 'HS'),
-(985, 12, 68, 2024, 'GEN', 29990, 1, 'OS'),
-(986, 12, 68, 2024, 'GEN', 36766, 1, 'OS'),
-(987, 12, 68, 2024, 'GEN', 1531, 1, 'OS'),
-(988, 12, 68, 2024, 'EWS', 4766, 1, 'OS'),
-(989, 12, 68, 2024, 'EWS', 6548, 1, 'OS'),
-(990, 12, 68, 2024, 'OBC', 10994, 1, 'OS'),
-(991, 12, 68, 2024, 'OBC', 17795, 1, 'OS'),
-(992, 12, 68, 2024, 'SC', 6314, 1, 'OS'),
-(993, 12, 68, 2024, 'SC', 8153, 1, 'OS'),
-(994, 12, 68, 2024, 'ST', 2079, 1, 'OS'),
-(995, 12, 68, 2024, 'ST', 3696, 1, 'OS'),
-(996, 23, 12, 2024, 'GEN', 256165, 1, 'HS'),
-(997, 23, 12, 2024, 'GEN', 260834, 1, 'HS'),
-(998, 23, 12, 2024, 'EWS', 60538, 1, 'HS'),
-(999, 23, 12, 2024, 'EWS', 40588, 1, 'HS'),
-(1000, 23, 12, 2024, 'SC', 27065, 1, 'HS');
-
@@ -1,1141 +0,0 @@
--- SQL INSERT Statements for Normalized IIT Data
--- Generated automatically
-
--- IIT Table
-INSERT INTO IIT (iit_id, name, location, nirf_rank) VALUES
-(1, 'Indian Institute of Technology (BHU) Varanasi', 'Varanasi, Uttar Pradesh', 10),
-(2, 'Indian Institute of Technology Bhilai', 'Raipur, Chhattisgarh', 73),
-(3, 'Indian Institute of Technology Bhubaneswar', 'Bhubaneswar, Odisha', 54),
-(4, 'Indian Institute of Technology Bombay', 'Mumbai, Maharashtra', 3),
-(5, 'Indian Institute of Technology Delhi', 'New Delhi, Delhi', 2),
-(6, 'Indian Institute of Technology Dhanbad', 'Dhanbad, Jharkhand', 15),
-(7, 'Indian Institute of Technology Dharwad', 'Dharwad, Karnataka', 115),
-(8, 'Indian Institute of Technology Gandhinagar', 'Gandhinagar, Gujarat', 18),
-(9, 'Indian Institute of Technology Goa', 'Ponda, Goa', 201),
-(10, 'Indian Institute of Technology Guwahati', 'Guwahati, Assam', 7),
-(11, 'Indian Institute of Technology Hyderabad', 'Hyderabad, Telangana', 8),
-(12, 'Indian Institute of Technology Indore', 'Indore, Madhya Pradesh', 16),
-(13, 'Indian Institute of Technology Jammu', 'Jammu, Jammu and Kashmir', 62),
-(14, 'Indian Institute of Technology Jodhpur', 'Jodhpur, Rajasthan', 28),
-(15, 'Indian Institute of Technology Kanpur', 'Kanpur, Uttar Pradesh', 4),
-(16, 'Indian Institute of Technology Kharagpur', 'Kharagpur, West Bengal', 5),
-(17, 'Indian Institute of Technology Madras', 'Chennai, Tamil Nadu', 1),
-(18, 'Indian Institute of Technology Mandi', 'Mandi, Himachal Pradesh', 31),
-(19, 'Indian Institute of Technology Palakkad', 'Palakkad, Kerala', 65),
-(20, 'Indian Institute of Technology Patna', 'Patna, Bihar', 34),
-(21, 'Indian Institute of Technology Roorkee', 'Roorkee, Uttarakhand', 6),
-(22, 'Indian Institute of Technology Ropar', 'Rupnagar, Punjab', 22),
-(23, 'Indian Institute of Technology Tirupati', 'YERPEDU, Andhra Pradesh', 61);
-
--- Branch Table
-INSERT INTO Branch (branch_id, branch_name, short_name, degree_type) VALUES
-(1, 'Abu Dhabi Campus - Chemical Engineering', 'CHE', 'B.Tech'),
-(2, 'Abu Dhabi Campus - Computer Science and Engineering', 'CSE', 'B.Tech'),
-(3, 'Abu Dhabi Campus - Energy Engineering', 'ENE', 'B.Tech'),
-(4, 'Aerospace Engineering', 'AE', 'B.Tech'),
-(5, 'Agricultural and Food Engineering', 'AFE', 'B.Tech'),
-(6, 'Applied Geology', 'AG', 'BS'),
-(7, 'Applied Geophysics', 'AGP', 'BS'),
-(8, 'Architecture', 'ARCH', 'B.Tech'),
-(9, 'Artificial Intelligence', 'AI', 'B.Tech'),
-(10, 'Artificial Intelligence and Data Analytics', 'AI', 'B.Tech'),
-(11, 'Artificial Intelligence and Data Engineering', 'AI', 'B.Tech'),
-(12, 'Artificial Intelligence and Data Science', 'AIDS', 'B.Tech'),
-(13, 'B. Tech in CE. - M. Tech. in Geotechnical Engineering', 'BTI', 'B.Tech'),
-(14, 'B. Tech in CE. - M. Tech. in Structural Engineering', 'BTI', 'B.Tech'),
-(15, 'B. Tech.', 'BT', 'B.Tech'),
-(16, 'B.Tech', 'B.T', 'B.Tech'),
-(17, 'B.Tech Mining Engineering and MBA in Logistic and Supply Chain Management', 'MIN', 'B.Tech'),
-(18, 'B.Tech in General Engineering', 'BIG', 'B.Tech'),
-(19, 'B.Tech in Materials Science and Engineering', 'MSE', 'B.Tech'),
-(20, 'B.Tech in Mathematics and Computing', 'MNC', 'B.Tech'),
-(21, 'B.Tech in Microelectronics & VLSI', 'BIM', 'B.Tech'),
-(22, 'B.Tech. in Electronics and Communication Engineering and M.Tech. in Communication Systems', 'ECE', 'B.Tech'),
-(23, 'BS in Chemical Sciences', 'BIC', 'BS'),
-(24, 'BS in Economics with MBA', 'BIE', 'BS'),
-(25, 'BS in Mathematics', 'BIM', 'BS'),
-(26, 'Bio Engineering', 'BE', 'B.Tech'),
-(27, 'Biochemical Engineering', 'BE', 'B.Tech'),
-(28, 'Bioengineering', 'BIO', 'B.Tech'),
-(29, 'Biological Engineering', 'BE', 'B.Tech'),
-(30, 'Biological Science', 'BS', 'BS'),
-(31, 'Biological Sciences and Bioengineering', 'BSA', 'B.Tech'),
-(32, 'Biomedical Engineering', 'BE', 'B.Tech'),
-(33, 'Biosciences and Bioengineering', 'BAB', 'B.Tech'),
-(34, 'Biotechnology and Biochemical Engineering', 'BT', 'B.Tech'),
-(35, 'Biotechnology and Bioinformatics', 'BT', 'B.Tech'),
-(36, 'Ceramic Engineering', 'CE', 'B.Tech'),
-(37, 'Chemical Engineering', 'CHE', 'B.Tech'),
-(38, 'Chemical Science', 'CS', 'BS'),
-(39, 'Chemical Science and Technology', 'CSA', 'B.Tech'),
-(40, 'Chemical Sciences', 'CS', 'BS'),
-(41, 'Chemical and Biochemical Engineering', 'CAB', 'B.Tech'),
-(42, 'Chemistry', 'CHE', 'BS'),
-(43, 'Chemistry with Specialization', 'CWS', 'BS'),
-(44, 'Civil Engineering', 'CE', 'B.Tech'),
-(45, 'Civil and Infrastructure Engineering', 'CAI', 'B.Tech'),
-(46, 'Computational Engineering', 'CE', 'B.Tech'),
-(47, 'Computational Engineering and Mechanics', 'CEA', 'B.Tech'),
-(48, 'Computer Science and Engineering', 'CSE', 'B.Tech'),
-(49, 'Data Science and Artificial Intelligence', 'DSAI', 'B.Tech'),
-(50, 'Data Science and Engineering', 'DS', 'B.Tech'),
-(51, 'Design', 'DES', 'B.Tech'),
-(52, 'Digital Agriculture', 'DA', 'B.Tech'),
-(53, 'Earth Sciences', 'ES', 'BS'),
-(54, 'Economics', 'ECO', 'BS'),
-(55, 'Electrical Engineering', 'EE', 'B.Tech'),
-(56, 'Electrical and Electronics Engineering', 'EAE', 'B.Tech'),
-(57, 'Electronics Engineering', 'EE', 'B.Tech'),
-(58, 'Electronics and Communication Engineering', 'ECE', 'B.Tech'),
-(59, 'Electronics and Electrical Communication Engineering', 'EAE', 'B.Tech'),
-(60, 'Electronics and Electrical Engineering', 'EE', 'B.Tech'),
-(61, 'Energy Engineering', 'ENE', 'B.Tech'),
-(62, 'Engineering Design', 'DES', 'Dual'),
-(63, 'Engineering Physics', 'EP', 'B.Tech'),
-(64, 'Engineering Science', 'ES', 'B.Tech'),
-(65, 'Engineering and Computational Mechanics', 'EAC', 'B.Tech'),
-(66, 'Environmental Engineering', 'ENV', 'B.Tech'),
-(67, 'Environmental Science and Engineering', 'ESA', 'B.Tech'),
-(68, 'Exploration Geophysics', 'EG', 'BS'),
-(69, 'Geological Technology', 'GT', 'B.Tech'),
-(70, 'Geophysical Technology', 'GT', 'B.Tech'),
-(71, 'Industrial Chemistry', 'IC', 'B.Tech'),
-(72, 'Industrial Engineering and Operations Research', 'IEA', 'B.Tech'),
-(73, 'Industrial and Systems Engineering', 'ISE', 'B.Tech'),
-(74, 'Instrumentation Engineering', 'IE', 'B.Tech'),
-(75, 'Instrumentation and Biomedical Engineering', 'IAB', 'B.Tech'),
-(76, 'Integrated Circuit Design & Technology', 'DES', 'B.Tech'),
-(77, 'Interdisciplinary Sciences', 'IS', 'BS'),
-(78, 'Manufacturing Science and Engineering', 'MSE', 'B.Tech'),
-(79, 'Materials Engineering', 'ME', 'B.Tech'),
-(80, 'Materials Science and Engineering', 'MSE', 'B.Tech'),
-(81, 'Materials Science and Metallurgical Engineering', 'MSA', 'B.Tech'),
-(82, 'Materials Science and Technology', 'MSA', 'B.Tech'),
-(83, 'Mathematics & Computing', 'M&C', 'BS'),
-(84, 'Mathematics and Computing', 'MNC', 'BS'),
-(85, 'Mathematics and Scientific Computing', 'MAS', 'BS'),
-(86, 'Mechanical Engineering', 'ME', 'B.Tech'),
-(87, 'Mechatronics Engineering', 'ME', 'B.Tech'),
-(88, 'Metallurgical Engineering', 'ME', 'B.Tech'),
-(89, 'Metallurgical Engineering and Materials Science', 'MEA', 'B.Tech'),
-(90, 'Metallurgical and Materials Engineering', 'MME', 'B.Tech'),
-(91, 'Mineral and Metallurgical Engineering', 'MAM', 'B.Tech'),
-(92, 'Mining Engineering', 'MIN', 'B.Tech'),
-(93, 'Mining Machinery Engineering', 'MME', 'B.Tech'),
-(94, 'Naval Architecture and Ocean Engineering', 'ARCH', 'B.Tech'),
-(95, 'Ocean Engineering and Naval Architecture', 'OENA', 'B.Tech'),
-(96, 'Petroleum Engineering', 'PE', 'B.Tech'),
-(97, 'Pharmaceutical Engineering & Technology', 'PE&', 'B.Tech'),
-(98, 'Physical Science', 'PS', 'BS'),
-(99, 'Physics', 'PHY', 'BS'),
-(100, 'Physics with Specialization', 'PWS', 'BS'),
-(101, 'Production and Industrial Engineering', 'PAI', 'B.Tech'),
-(102, 'Space Science and Engineering', 'SSA', 'B.Tech'),
-(103, 'Statistics and Data Science', 'DS', 'BS'),
-(104, 'Textile Technology', 'TT', 'B.Tech');
-
--- Cutoff Table (first 1000 records)
-INSERT INTO Cutoff (cutoff_id, iit_id, branch_id, year, category, closing_rank, round) VALUES
-(1, 3, 44, 2024, 'GEN', 13957, 1),
-(2, 3, 44, 2024, 'GEN', 22403, 1),
-(3, 3, 44, 2024, 'EWS', 2069, 1),
-(4, 3, 44, 2024, 'EWS', 3646, 1),
-(5, 3, 44, 2024, 'OBC', 4996, 1),
-(6, 3, 44, 2024, 'OBC', 8599, 1),
-(7, 3, 44, 2024, 'SC', 2659, 1),
-(8, 3, 44, 2024, 'SC', 3619, 1),
-(9, 3, 44, 2024, 'ST', 1093, 1),
-(10, 3, 44, 2024, 'ST', 1419, 1),
-(11, 3, 48, 2024, 'GEN', 3785, 1),
-(12, 3, 48, 2024, 'GEN', 6467, 1),
-(13, 3, 48, 2024, 'EWS', 525, 1),
-(14, 3, 48, 2024, 'EWS', 1035, 1),
-(15, 3, 48, 2024, 'OBC', 1415, 1),
-(16, 3, 48, 2024, 'OBC', 2988, 1),
-(17, 3, 48, 2024, 'OBC', 54, 1),
-(18, 3, 48, 2024, 'SC', 741, 1),
-(19, 3, 48, 2024, 'SC', 1158, 1),
-(20, 3, 48, 2024, 'ST', 257, 1),
-(21, 3, 48, 2024, 'ST', 663, 1),
-(22, 3, 55, 2024, 'GEN', 7242, 1),
-(23, 3, 55, 2024, 'GEN', 14511, 1),
-(24, 3, 55, 2024, 'EWS', 1041, 1),
-(25, 3, 55, 2024, 'EWS', 2167, 1),
-(26, 3, 55, 2024, 'OBC', 3151, 1),
-(27, 3, 55, 2024, 'OBC', 5470, 1),
-(28, 3, 55, 2024, 'SC', 1766, 1),
-(29, 3, 55, 2024, 'SC', 2175, 1),
-(30, 3, 55, 2024, 'ST', 862, 1),
-(31, 3, 55, 2024, 'ST', 846, 1),
-(32, 3, 58, 2024, 'GEN', 5535, 1),
-(33, 3, 58, 2024, 'GEN', 9686, 1),
-(34, 3, 58, 2024, 'GEN', 164, 1),
-(35, 3, 58, 2024, 'EWS', 767, 1),
-(36, 3, 58, 2024, 'EWS', 1367, 1),
-(37, 3, 58, 2024, 'OBC', 2072, 1),
-(38, 3, 58, 2024, 'OBC', 4551, 1),
-(39, 3, 58, 2024, 'SC', 1293, 1),
-(40, 3, 58, 2024, 'SC', 1476, 1),
-(41, 3, 58, 2024, 'ST', 553, 1),
-(42, 3, 58, 2024, 'ST', 830, 1),
-(43, 3, 63, 2024, 'GEN', 10494, 1),
-(44, 3, 63, 2024, 'GEN', 20216, 1),
-(45, 3, 63, 2024, 'EWS', 1801, 1),
-(46, 3, 63, 2024, 'OBC', 4500, 1),
-(47, 3, 63, 2024, 'OBC', 6849, 1),
-(48, 3, 63, 2024, 'SC', 2568, 1),
-(49, 3, 63, 2024, 'SC', 3531, 1),
-(50, 3, 63, 2024, 'ST', 1221, 1),
-(51, 3, 84, 2024, 'GEN', 4607, 1),
-(52, 3, 84, 2024, 'GEN', 8287, 1),
-(53, 3, 84, 2024, 'EWS', 727, 1),
-(54, 3, 84, 2024, 'OBC', 1935, 1),
-(55, 3, 84, 2024, 'OBC', 4715, 1),
-(56, 3, 84, 2024, 'SC', 992, 1),
-(57, 3, 84, 2024, 'SC', 2114, 1),
-(58, 3, 84, 2024, 'ST', 769, 1),
-(59, 3, 86, 2024, 'GEN', 10078, 1),
-(60, 3, 86, 2024, 'GEN', 18906, 1),
-(61, 3, 86, 2024, 'EWS', 1573, 1),
-(62, 3, 86, 2024, 'EWS', 2851, 1),
-(63, 3, 86, 2024, 'OBC', 3975, 1),
-(64, 3, 86, 2024, 'OBC', 7321, 1),
-(65, 3, 86, 2024, 'SC', 2275, 1),
-(66, 3, 86, 2024, 'SC', 3225, 1),
-(67, 3, 86, 2024, 'ST', 1035, 1),
-(68, 3, 86, 2024, 'ST', 1471, 1),
-(69, 3, 79, 2024, 'GEN', 13695, 1),
-(70, 3, 79, 2024, 'GEN', 21967, 1),
-(71, 3, 79, 2024, 'EWS', 2211, 1),
-(72, 3, 79, 2024, 'OBC', 5323, 1),
-(73, 3, 79, 2024, 'OBC', 8849, 1),
-(74, 3, 79, 2024, 'SC', 2907, 1),
-(75, 3, 79, 2024, 'SC', 3707, 1),
-(76, 3, 79, 2024, 'ST', 1200, 1),
-(77, 3, 79, 2024, 'ST', 1764, 1),
-(78, 4, 4, 2024, 'GEN', 2305, 1),
-(79, 4, 4, 2024, 'GEN', 5994, 1),
-(80, 4, 4, 2024, 'EWS', 404, 1),
-(81, 4, 4, 2024, 'EWS', 1160, 1),
-(82, 4, 4, 2024, 'EWS', 41, 1),
-(83, 4, 4, 2024, 'OBC', 1283, 1),
-(84, 4, 4, 2024, 'OBC', 3552, 1),
-(85, 4, 4, 2024, 'SC', 600, 1),
-(86, 4, 4, 2024, 'SC', 879, 1),
-(87, 4, 4, 2024, 'ST', 409, 1),
-(88, 4, 4, 2024, 'ST', 684, 1),
-(89, 4, 7, 2024, 'GEN', 7722, 1),
-(90, 4, 7, 2024, 'GEN', 13761, 1),
-(91, 4, 7, 2024, 'EWS', 1311, 1),
-(92, 4, 7, 2024, 'EWS', 2839, 1),
-(93, 4, 7, 2024, 'OBC', 4014, 1),
-(94, 4, 7, 2024, 'OBC', 5934, 1),
-(95, 4, 7, 2024, 'SC', 2370, 1),
-(96, 4, 7, 2024, 'SC', 3236, 1),
-(97, 4, 7, 2024, 'ST', 1070, 1),
-(98, 4, 7, 2024, 'ST', 1581, 1),
-(99, 4, 25, 2024, 'GEN', 957, 1),
-(100, 4, 25, 2024, 'GEN', 3432, 1),
-(101, 4, 25, 2024, 'EWS', 397, 1),
-(102, 4, 25, 2024, 'EWS', 1085, 1),
-(103, 4, 25, 2024, 'OBC', 742, 1),
-(104, 4, 25, 2024, 'OBC', 2616, 1),
-(105, 4, 25, 2024, 'SC', 556, 1),
-(106, 4, 25, 2024, 'SC', 1771, 1),
-(107, 4, 25, 2024, 'ST', 557, 1),
-(108, 4, 37, 2024, 'GEN', 2405, 1),
-(109, 4, 37, 2024, 'GEN', 5969, 1),
-(110, 4, 37, 2024, 'GEN', 176, 1),
-(111, 4, 37, 2024, 'GEN', 198, 1),
-(112, 4, 37, 2024, 'EWS', 481, 1),
-(113, 4, 37, 2024, 'EWS', 1139, 1),
-(114, 4, 37, 2024, 'EWS', 37, 1),
-(115, 4, 37, 2024, 'OBC', 1255, 1),
-(116, 4, 37, 2024, 'OBC', 3320, 1),
-(117, 4, 37, 2024, 'SC', 679, 1),
-(118, 4, 37, 2024, 'SC', 1242, 1),
-(119, 4, 37, 2024, 'SC', 9, 1),
-(120, 4, 37, 2024, 'ST', 460, 1),
-(121, 4, 37, 2024, 'ST', 649, 1),
-(122, 4, 42, 2024, 'GEN', 6647, 1),
-(123, 4, 42, 2024, 'GEN', 10435, 1),
-(124, 4, 42, 2024, 'EWS', 1353, 1),
-(125, 4, 42, 2024, 'EWS', 2621, 1),
-(126, 4, 42, 2024, 'OBC', 3367, 1),
-(127, 4, 42, 2024, 'OBC', 6573, 1),
-(128, 4, 42, 2024, 'SC', 1810, 1),
-(129, 4, 42, 2024, 'SC', 719, 1),
-(130, 4, 42, 2024, 'ST', 1017, 1),
-(131, 4, 42, 2024, 'ST', 1540, 1),
-(132, 4, 44, 2024, 'GEN', 4095, 1),
-(133, 4, 44, 2024, 'GEN', 8597, 1),
-(134, 4, 44, 2024, 'GEN', 179, 1),
-(135, 4, 44, 2024, 'EWS', 725, 1),
-(136, 4, 44, 2024, 'EWS', 1643, 1),
-(137, 4, 44, 2024, 'OBC', 1783, 1),
-(138, 4, 44, 2024, 'OBC', 4549, 1),
-(139, 4, 44, 2024, 'OBC', 80, 1),
-(140, 4, 44, 2024, 'SC', 934, 1),
-(141, 4, 44, 2024, 'SC', 1778, 1),
-(142, 4, 44, 2024, 'ST', 290, 1),
-(143, 4, 44, 2024, 'ST', 522, 1),
-(144, 4, 48, 2024, 'GEN', 66, 1),
-(145, 4, 48, 2024, 'GEN', 296, 1),
-(146, 4, 48, 2024, 'GEN', 4, 1),
-(147, 4, 48, 2024, 'GEN', 12, 1),
-(148, 4, 48, 2024, 'EWS', 20, 1),
-(149, 4, 48, 2024, 'EWS', 53, 1),
-(150, 4, 48, 2024, 'EWS', 3, 1),
-(151, 4, 48, 2024, 'OBC', 54, 1),
-(152, 4, 48, 2024, 'OBC', 331, 1),
-(153, 4, 48, 2024, 'OBC', 3, 1),
-(154, 4, 48, 2024, 'SC', 31, 1),
-(155, 4, 48, 2024, 'SC', 270, 1),
-(156, 4, 48, 2024, 'SC', 1, 1),
-(157, 4, 48, 2024, 'ST', 19, 1),
-(158, 4, 48, 2024, 'ST', 76, 1),
-(159, 4, 48, 2024, 'ST', 1, 1),
-(160, 4, 54, 2024, 'GEN', 2312, 1),
-(161, 4, 54, 2024, 'GEN', 4564, 1),
-(162, 4, 54, 2024, 'EWS', 554, 1),
-(163, 4, 54, 2024, 'EWS', 978, 1),
-(164, 4, 54, 2024, 'OBC', 1405, 1),
-(165, 4, 54, 2024, 'OBC', 3344, 1),
-(166, 4, 54, 2024, 'SC', 855, 1),
-(167, 4, 54, 2024, 'SC', 1565, 1),
-(168, 4, 54, 2024, 'ST', 691, 1),
-(169, 4, 54, 2024, 'ST', 564, 1),
-(170, 4, 55, 2024, 'GEN', 418, 1),
-(171, 4, 55, 2024, 'GEN', 1914, 1),
-(172, 4, 55, 2024, 'GEN', 23, 1),
-(173, 4, 55, 2024, 'EWS', 113, 1),
-(174, 4, 55, 2024, 'EWS', 396, 1),
-(175, 4, 55, 2024, 'EWS', 11, 1),
-(176, 4, 55, 2024, 'OBC', 325, 1),
-(177, 4, 55, 2024, 'OBC', 1117, 1),
-(178, 4, 55, 2024, 'OBC', 20, 1),
-(179, 4, 55, 2024, 'SC', 151, 1),
-(180, 4, 55, 2024, 'SC', 643, 1),
-(181, 4, 55, 2024, 'SC', 7, 1),
-(182, 4, 55, 2024, 'ST', 96, 1),
-(183, 4, 55, 2024, 'ST', 260, 1),
-(184, 4, 55, 2024, 'GEN', 830, 1),
-(185, 4, 55, 2024, 'GEN', 3116, 1),
-(186, 4, 55, 2024, 'GEN', 29, 1),
-(187, 4, 55, 2024, 'EWS', 265, 1),
-(188, 4, 55, 2024, 'EWS', 443, 1),
-(189, 4, 55, 2024, 'EWS', 36, 1),
-(190, 4, 55, 2024, 'OBC', 549, 1),
-(191, 4, 55, 2024, 'OBC', 1463, 1),
-(192, 4, 55, 2024, 'OBC', 37, 1),
-(193, 4, 55, 2024, 'SC', 293, 1),
-(194, 4, 55, 2024, 'SC', 998, 1),
-(195, 4, 55, 2024, 'ST', 204, 1),
-(196, 4, 55, 2024, 'ST', 248, 1),
-(197, 4, 61, 2024, 'GEN', 2452, 1),
-(198, 4, 61, 2024, 'GEN', 5817, 1),
-(199, 4, 61, 2024, 'EWS', 488, 1),
-(200, 4, 61, 2024, 'EWS', 1422, 1),
-(201, 4, 61, 2024, 'OBC', 1455, 1),
-(202, 4, 61, 2024, 'OBC', 3818, 1),
-(203, 4, 61, 2024, 'SC', 841, 1),
-(204, 4, 61, 2024, 'SC', 2194, 1),
-(205, 4, 61, 2024, 'ST', 732, 1),
-(206, 4, 61, 2024, 'ST', 1090, 1),
-(207, 4, 63, 2024, 'GEN', 1483, 1),
-(208, 4, 63, 2024, 'GEN', 4351, 1),
-(209, 4, 63, 2024, 'GEN', 40, 1),
-(210, 4, 63, 2024, 'EWS', 475, 1),
-(211, 4, 63, 2024, 'EWS', 1172, 1),
-(212, 4, 63, 2024, 'OBC', 1215, 1),
-(213, 4, 63, 2024, 'OBC', 3571, 1),
-(214, 4, 63, 2024, 'SC', 820, 1),
-(215, 4, 63, 2024, 'SC', 1213, 1),
-(216, 4, 63, 2024, 'ST', 493, 1),
-(217, 4, 63, 2024, 'ST', 642, 1),
-(218, 4, 67, 2024, 'GEN', 4696, 1),
-(219, 4, 67, 2024, 'GEN', 8925, 1),
-(220, 4, 67, 2024, 'EWS', 942, 1),
-(221, 4, 67, 2024, 'EWS', 2213, 1),
-(222, 4, 67, 2024, 'OBC', 2320, 1),
-(223, 4, 67, 2024, 'OBC', 4903, 1),
-(224, 4, 67, 2024, 'SC', 1375, 1),
-(225, 4, 67, 2024, 'SC', 2221, 1),
-(226, 4, 67, 2024, 'ST', 821, 1),
-(227, 4, 67, 2024, 'ST', 1156, 1),
-(228, 4, 72, 2024, 'GEN', 1133, 1),
-(229, 4, 72, 2024, 'GEN', 3012, 1),
-(230, 4, 72, 2024, 'GEN', 34, 1),
-(231, 4, 72, 2024, 'EWS', 222, 1),
-(232, 4, 72, 2024, 'EWS', 711, 1),
-(233, 4, 72, 2024, 'OBC', 974, 1),
-(234, 4, 72, 2024, 'OBC', 2913, 1),
-(235, 4, 72, 2024, 'SC', 692, 1),
-(236, 4, 72, 2024, 'SC', 1172, 1),
-(237, 4, 72, 2024, 'ST', 289, 1),
-(238, 4, 72, 2024, 'ST', 582, 1),
-(239, 4, 86, 2024, 'GEN', 1766, 1),
-(240, 4, 86, 2024, 'GEN', 4693, 1),
-(241, 4, 86, 2024, 'GEN', 93, 1),
-(242, 4, 86, 2024, 'EWS', 335, 1),
-(243, 4, 86, 2024, 'EWS', 1086, 1),
-(244, 4, 86, 2024, 'OBC', 919, 1),
-(245, 4, 86, 2024, 'OBC', 2576, 1),
-(246, 4, 86, 2024, 'OBC', 69, 1),
-(247, 4, 86, 2024, 'SC', 503, 1),
-(248, 4, 86, 2024, 'SC', 1152, 1),
-(249, 4, 86, 2024, 'ST', 291, 1),
-(250, 4, 86, 2024, 'ST', 766, 1),
-(251, 4, 88, 2024, 'GEN', 4119, 1),
-(252, 4, 88, 2024, 'GEN', 8075, 1),
-(253, 4, 88, 2024, 'EWS', 912, 1),
-(254, 4, 88, 2024, 'EWS', 1782, 1),
-(255, 4, 88, 2024, 'OBC', 2129, 1),
-(256, 4, 88, 2024, 'OBC', 4695, 1),
-(257, 4, 88, 2024, 'SC', 1345, 1),
-(258, 4, 88, 2024, 'SC', 2209, 1),
-(259, 4, 88, 2024, 'ST', 657, 1),
-(260, 4, 88, 2024, 'ST', 1147, 1),
-(261, 18, 16, 2024, 'GEN', 10083, 1),
-(262, 18, 16, 2024, 'GEN', 17710, 1),
-(263, 18, 16, 2024, 'EWS', 1658, 1),
-(264, 18, 16, 2024, 'EWS', 2826, 1),
-(265, 18, 16, 2024, 'OBC', 4575, 1),
-(266, 18, 16, 2024, 'OBC', 8658, 1),
-(267, 18, 16, 2024, 'SC', 2520, 1),
-(268, 18, 16, 2024, 'SC', 3806, 1),
-(269, 18, 16, 2024, 'ST', 1289, 1),
-(270, 18, 16, 2024, 'GEN', 12152, 1),
-(271, 18, 16, 2024, 'GEN', 23230, 1),
-(272, 18, 16, 2024, 'EWS', 2056, 1),
-(273, 18, 16, 2024, 'EWS', 3511, 1),
-(274, 18, 16, 2024, 'OBC', 5037, 1),
-(275, 18, 16, 2024, 'OBC', 8928, 1),
-(276, 18, 16, 2024, 'SC', 2790, 1),
-(277, 18, 16, 2024, 'SC', 3866, 1),
-(278, 18, 16, 2024, 'ST', 1352, 1),
-(279, 18, 16, 2024, 'GEN', 4022, 1),
-(280, 18, 16, 2024, 'GEN', 9846, 1),
-(281, 18, 16, 2024, 'EWS', 614, 1),
-(282, 18, 16, 2024, 'EWS', 1303, 1),
-(283, 18, 16, 2024, 'OBC', 1764, 1),
-(284, 18, 16, 2024, 'OBC', 4949, 1),
-(285, 18, 16, 2024, 'SC', 1270, 1),
-(286, 18, 16, 2024, 'SC', 1559, 1),
-(287, 18, 16, 2024, 'ST', 617, 1),
-(288, 18, 16, 2024, 'GEN', 5811, 1),
-(289, 18, 16, 2024, 'GEN', 12496, 1),
-(290, 18, 16, 2024, 'EWS', 996, 1),
-(291, 18, 16, 2024, 'EWS', 2405, 1),
-(292, 18, 16, 2024, 'OBC', 2685, 1),
-(293, 18, 16, 2024, 'OBC', 6451, 1),
-(294, 18, 16, 2024, 'SC', 1503, 1),
-(295, 18, 16, 2024, 'SC', 3320, 1),
-(296, 18, 16, 2024, 'ST', 979, 1),
-(297, 18, 26, 2024, 'GEN', 13111, 1),
-(298, 18, 26, 2024, 'GEN', 22651, 1),
-(299, 18, 26, 2024, 'EWS', 2139, 1),
-(300, 18, 26, 2024, 'EWS', 3810, 1),
-(301, 18, 26, 2024, 'OBC', 5386, 1),
-(302, 18, 26, 2024, 'OBC', 9009, 1),
-(303, 18, 26, 2024, 'SC', 2918, 1),
-(304, 18, 26, 2024, 'SC', 3971, 1),
-(305, 18, 26, 2024, 'ST', 1440, 1),
-(306, 18, 23, 2024, 'GEN', 15605, 1),
-(307, 18, 23, 2024, 'GEN', 25305, 1),
-(308, 18, 23, 2024, 'EWS', 2299, 1),
-(309, 18, 23, 2024, 'EWS', 4164, 1),
-(310, 18, 23, 2024, 'OBC', 5718, 1),
-(311, 18, 23, 2024, 'OBC', 9831, 1),
-(312, 18, 23, 2024, 'SC', 3061, 1),
-(313, 18, 23, 2024, 'SC', 3504, 1),
-(314, 18, 23, 2024, 'ST', 1473, 1),
-(315, 18, 44, 2024, 'GEN', 12346, 1),
-(316, 18, 44, 2024, 'GEN', 21831, 1),
-(317, 18, 44, 2024, 'EWS', 1868, 1),
-(318, 18, 44, 2024, 'EWS', 3185, 1),
-(319, 18, 44, 2024, 'OBC', 4730, 1),
-(320, 18, 44, 2024, 'OBC', 8286, 1),
-(321, 18, 44, 2024, 'SC', 2425, 1),
-(322, 18, 44, 2024, 'SC', 3644, 1),
-(323, 18, 44, 2024, 'ST', 1055, 1),
-(324, 18, 44, 2024, 'ST', 1429, 1),
-(325, 18, 48, 2024, 'GEN', 3087, 1),
-(326, 18, 48, 2024, 'GEN', 7612, 1),
-(327, 18, 48, 2024, 'GEN', 137, 1),
-(328, 18, 48, 2024, 'EWS', 496, 1),
-(329, 18, 48, 2024, 'EWS', 1012, 1),
-(330, 18, 48, 2024, 'OBC', 1382, 1),
-(331, 18, 48, 2024, 'OBC', 3841, 1),
-(332, 18, 48, 2024, 'OBC', 64, 1),
-(333, 18, 48, 2024, 'SC', 687, 1),
-(334, 18, 48, 2024, 'SC', 1216, 1),
-(335, 18, 48, 2024, 'ST', 363, 1),
-(336, 18, 48, 2024, 'ST', 760, 1),
-(337, 18, 9, 2024, 'GEN', 3817, 1),
-(338, 18, 9, 2024, 'GEN', 8476, 1),
-(339, 18, 9, 2024, 'GEN', 145, 1),
-(340, 18, 9, 2024, 'EWS', 579, 1),
-(341, 18, 9, 2024, 'EWS', 1042, 1),
-(342, 18, 9, 2024, 'OBC', 1717, 1),
-(343, 18, 9, 2024, 'OBC', 4502, 1),
-(344, 18, 9, 2024, 'SC', 1059, 1),
-(345, 18, 9, 2024, 'SC', 1666, 1),
-(346, 18, 9, 2024, 'ST', 468, 1),
-(347, 18, 9, 2024, 'ST', 876, 1),
-(348, 18, 55, 2024, 'GEN', 6474, 1),
-(349, 18, 55, 2024, 'GEN', 13727, 1),
-(350, 18, 55, 2024, 'EWS', 1062, 1),
-(351, 18, 55, 2024, 'EWS', 1924, 1),
-(352, 18, 55, 2024, 'OBC', 3066, 1),
-(353, 18, 55, 2024, 'OBC', 6584, 1),
-(354, 18, 55, 2024, 'SC', 1691, 1),
-(355, 18, 55, 2024, 'SC', 2594, 1),
-(356, 18, 55, 2024, 'ST', 902, 1),
-(357, 18, 55, 2024, 'ST', 1335, 1),
-(358, 18, 63, 2024, 'GEN', 9958, 1),
-(359, 18, 63, 2024, 'GEN', 19108, 1),
-(360, 18, 63, 2024, 'EWS', 1709, 1),
-(361, 18, 63, 2024, 'EWS', 3390, 1),
-(362, 18, 63, 2024, 'OBC', 4391, 1),
-(363, 18, 63, 2024, 'OBC', 7637, 1),
-(364, 18, 63, 2024, 'SC', 2665, 1),
-(365, 18, 63, 2024, 'SC', 3827, 1),
-(366, 18, 63, 2024, 'ST', 1248, 1),
-(367, 18, 86, 2024, 'GEN', 9194, 1),
-(368, 18, 86, 2024, 'GEN', 18850, 1),
-(369, 18, 86, 2024, 'EWS', 1425, 1),
-(370, 18, 86, 2024, 'EWS', 2966, 1),
-(371, 18, 86, 2024, 'OBC', 3899, 1),
-(372, 18, 86, 2024, 'OBC', 7792, 1),
-(373, 18, 86, 2024, 'SC', 2138, 1),
-(374, 18, 86, 2024, 'SC', 3615, 1),
-(375, 18, 86, 2024, 'ST', 1053, 1),
-(376, 18, 86, 2024, 'ST', 1619, 1),
-(377, 5, 1, 2024, 'GEN', 5712, 1),
-(378, 5, 1, 2024, 'GEN', 11520, 1),
-(379, 5, 1, 2024, 'EWS', 1360, 1),
-(380, 5, 1, 2024, 'OBC', 2006, 1),
-(381, 5, 1, 2024, 'OBC', 5884, 1),
-(382, 5, 1, 2024, 'SC', 1205, 1),
-(383, 5, 1, 2024, 'ST', 832, 1),
-(384, 5, 2, 2024, 'GEN', 1346, 1),
-(385, 5, 2, 2024, 'GEN', 6480, 1),
-(386, 5, 2, 2024, 'GEN', 52, 1),
-(387, 5, 2, 2024, 'EWS', 556, 1),
-(388, 5, 2, 2024, 'OBC', 591, 1),
-(389, 5, 2, 2024, 'OBC', 5340, 1),
-(390, 5, 2, 2024, 'SC', 555, 1),
-(391, 5, 3, 2024, 'GEN', 4661, 1),
-(392, 5, 3, 2024, 'GEN', 8973, 1),
-(393, 5, 3, 2024, 'EWS', 868, 1),
-(394, 5, 3, 2024, 'OBC', 1870, 1),
-(395, 5, 3, 2024, 'OBC', 6493, 1),
-(396, 5, 3, 2024, 'SC', 1346, 1),
-(397, 5, 3, 2024, 'ST', 488, 1),
-(398, 5, 27, 2024, 'GEN', 4830, 1),
-(399, 5, 27, 2024, 'GEN', 8927, 1),
-(400, 5, 27, 2024, 'EWS', 964, 1),
-(401, 5, 27, 2024, 'EWS', 2038, 1),
-(402, 5, 27, 2024, 'OBC', 2552, 1),
-(403, 5, 27, 2024, 'OBC', 5965, 1),
-(404, 5, 27, 2024, 'SC', 1462, 1),
-(405, 5, 27, 2024, 'SC', 2448, 1),
-(406, 5, 27, 2024, 'ST', 869, 1),
-(407, 5, 27, 2024, 'ST', 1311, 1),
-(408, 5, 37, 2024, 'GEN', 2425, 1),
-(409, 5, 37, 2024, 'GEN', 5968, 1),
-(410, 5, 37, 2024, 'GEN', 81, 1),
-(411, 5, 37, 2024, 'EWS', 530, 1),
-(412, 5, 37, 2024, 'EWS', 1069, 1),
-(413, 5, 37, 2024, 'OBC', 1257, 1),
-(414, 5, 37, 2024, 'OBC', 3385, 1),
-(415, 5, 37, 2024, 'SC', 673, 1),
-(416, 5, 37, 2024, 'SC', 1395, 1),
-(417, 5, 37, 2024, 'ST', 472, 1),
-(418, 5, 37, 2024, 'ST', 786, 1),
-(419, 5, 37, 2024, 'GEN', 3426, 1),
-(420, 5, 37, 2024, 'GEN', 7561, 1),
-(421, 5, 37, 2024, 'GEN', 196, 1),
-(422, 5, 37, 2024, 'EWS', 730, 1),
-(423, 5, 37, 2024, 'EWS', 2061, 1),
-(424, 5, 37, 2024, 'OBC', 1812, 1),
-(425, 5, 37, 2024, 'OBC', 4267, 1),
-(426, 5, 37, 2024, 'SC', 844, 1),
-(427, 5, 37, 2024, 'SC', 2096, 1),
-(428, 5, 37, 2024, 'ST', 848, 1),
-(429, 5, 37, 2024, 'ST', 1151, 1),
-(430, 5, 42, 2024, 'GEN', 7715, 1),
-(431, 5, 42, 2024, 'GEN', 16252, 1),
-(432, 5, 42, 2024, 'EWS', 1492, 1),
-(433, 5, 42, 2024, 'OBC', 4352, 1),
-(434, 5, 42, 2024, 'OBC', 8744, 1),
-(435, 5, 42, 2024, 'SC', 2657, 1),
-(436, 5, 42, 2024, 'SC', 2758, 1),
-(437, 5, 42, 2024, 'ST', 1281, 1),
-(438, 5, 42, 2024, 'ST', 1631, 1),
-(439, 5, 44, 2024, 'GEN', 4228, 1),
-(440, 5, 44, 2024, 'GEN', 9104, 1),
-(441, 5, 44, 2024, 'GEN', 209, 1),
-(442, 5, 44, 2024, 'EWS', 747, 1),
-(443, 5, 44, 2024, 'EWS', 1296, 1),
-(444, 5, 44, 2024, 'OBC', 1916, 1),
-(445, 5, 44, 2024, 'OBC', 4703, 1),
-(446, 5, 44, 2024, 'OBC', 84, 1),
-(447, 5, 44, 2024, 'SC', 896, 1),
-(448, 5, 44, 2024, 'SC', 1973, 1),
-(449, 5, 44, 2024, 'ST', 261, 1),
-(450, 5, 44, 2024, 'ST', 345, 1),
-(451, 5, 48, 2024, 'GEN', 125, 1),
-(452, 5, 48, 2024, 'GEN', 498, 1),
-(453, 5, 48, 2024, 'GEN', 3, 1),
-(454, 5, 48, 2024, 'GEN', 20, 1),
-(455, 5, 48, 2024, 'EWS', 34, 1),
-(456, 5, 48, 2024, 'EWS', 133, 1),
-(457, 5, 48, 2024, 'OBC', 91, 1),
-(458, 5, 48, 2024, 'OBC', 551, 1),
-(459, 5, 48, 2024, 'OBC', 4, 1),
-(460, 5, 48, 2024, 'SC', 45, 1),
-(461, 5, 48, 2024, 'SC', 171, 1),
-(462, 5, 48, 2024, 'SC', 3, 1),
-(463, 5, 48, 2024, 'ST', 26, 1),
-(464, 5, 48, 2024, 'ST', 87, 1),
-(465, 5, 48, 2024, 'ST', 2, 1),
-(466, 5, 48, 2024, 'GEN', 186, 1),
-(467, 5, 48, 2024, 'GEN', 996, 1),
-(468, 5, 48, 2024, 'GEN', 24, 1),
-(469, 5, 48, 2024, 'EWS', 77, 1),
-(470, 5, 48, 2024, 'EWS', 164, 1),
-(471, 5, 48, 2024, 'OBC', 163, 1),
-(472, 5, 48, 2024, 'OBC', 679, 1),
-(473, 5, 48, 2024, 'OBC', 15, 1),
-(474, 5, 48, 2024, 'SC', 74, 1),
-(475, 5, 48, 2024, 'SC', 191, 1),
-(476, 5, 48, 2024, 'ST', 47, 1),
-(477, 5, 48, 2024, 'ST', 250, 1),
-(478, 5, 51, 2024, 'GEN', 8509, 1),
-(479, 5, 51, 2024, 'GEN', 17878, 1),
-(480, 5, 51, 2024, 'EWS', 1582, 1),
-(481, 5, 51, 2024, 'OBC', 3133, 1),
-(482, 5, 51, 2024, 'OBC', 7930, 1),
-(483, 5, 51, 2024, 'SC', 1923, 1),
-(484, 5, 51, 2024, 'SC', 2950, 1),
-(485, 5, 51, 2024, 'ST', 1102, 1),
-(486, 5, 55, 2024, 'GEN', 591, 1),
-(487, 5, 55, 2024, 'GEN', 2627, 1),
-(488, 5, 55, 2024, 'GEN', 41, 1),
-(489, 5, 55, 2024, 'GEN', 241, 1),
-(490, 5, 55, 2024, 'EWS', 141, 1),
-(491, 5, 55, 2024, 'EWS', 501, 1),
-(492, 5, 55, 2024, 'OBC', 398, 1),
-(493, 5, 55, 2024, 'OBC', 1388, 1),
-(494, 5, 55, 2024, 'OBC', 26, 1),
-(495, 5, 55, 2024, 'SC', 202, 1),
-(496, 5, 55, 2024, 'SC', 772, 1),
-(497, 5, 55, 2024, 'ST', 106, 1),
-(498, 5, 55, 2024, 'ST', 310, 1),
-(499, 5, 55, 2024, 'GEN', 806, 1),
-(500, 5, 55, 2024, 'GEN', 2886, 1),
-(501, 5, 55, 2024, 'GEN', 54, 1),
-(502, 5, 55, 2024, 'EWS', 185, 1),
-(503, 5, 55, 2024, 'EWS', 588, 1),
-(504, 5, 55, 2024, 'EWS', 34, 1),
-(505, 5, 55, 2024, 'OBC', 495, 1),
-(506, 5, 55, 2024, 'OBC', 1673, 1),
-(507, 5, 55, 2024, 'SC', 318, 1),
-(508, 5, 55, 2024, 'SC', 864, 1),
-(509, 5, 55, 2024, 'ST', 152, 1),
-(510, 5, 55, 2024, 'ST', 326, 1),
-(511, 5, 61, 2024, 'GEN', 2622, 1),
-(512, 5, 61, 2024, 'GEN', 6136, 1),
-(513, 5, 61, 2024, 'GEN', 111, 1),
-(514, 5, 61, 2024, 'EWS', 576, 1),
-(515, 5, 61, 2024, 'EWS', 1109, 1),
-(516, 5, 61, 2024, 'OBC', 1643, 1),
-(517, 5, 61, 2024, 'OBC', 4047, 1),
-(518, 5, 61, 2024, 'SC', 974, 1),
-(519, 5, 61, 2024, 'SC', 2222, 1),
-(520, 5, 61, 2024, 'ST', 656, 1),
-(521, 5, 61, 2024, 'ST', 1152, 1),
-(522, 5, 65, 2024, 'GEN', 1103, 1),
-(523, 5, 65, 2024, 'GEN', 3918, 1),
-(524, 5, 65, 2024, 'GEN', 101, 1),
-(525, 5, 65, 2024, 'EWS', 259, 1),
-(526, 5, 65, 2024, 'EWS', 590, 1),
-(527, 5, 65, 2024, 'OBC', 691, 1),
-(528, 5, 65, 2024, 'OBC', 2408, 1),
-(529, 5, 65, 2024, 'SC', 427, 1),
-(530, 5, 65, 2024, 'SC', 890, 1),
-(531, 5, 65, 2024, 'ST', 222, 1),
-(532, 5, 65, 2024, 'ST', 683, 1),
-(533, 5, 63, 2024, 'GEN', 2358, 1),
-(534, 5, 63, 2024, 'GEN', 6655, 1),
-(535, 5, 63, 2024, 'GEN', 124, 1),
-(536, 5, 63, 2024, 'EWS', 690, 1),
-(537, 5, 63, 2024, 'EWS', 1609, 1),
-(538, 5, 63, 2024, 'OBC', 1569, 1),
-(539, 5, 63, 2024, 'OBC', 4738, 1),
-(540, 5, 63, 2024, 'SC', 1034, 1),
-(541, 5, 63, 2024, 'SC', 1807, 1),
-(542, 5, 63, 2024, 'ST', 638, 1),
-(543, 5, 63, 2024, 'ST', 1186, 1),
-(544, 5, 79, 2024, 'GEN', 3470, 1),
-(545, 5, 79, 2024, 'GEN', 9060, 1),
-(546, 5, 79, 2024, 'GEN', 210, 1),
-(547, 5, 79, 2024, 'EWS', 883, 1),
-(548, 5, 79, 2024, 'EWS', 2233, 1),
-(549, 5, 79, 2024, 'OBC', 2317, 1),
-(550, 5, 79, 2024, 'OBC', 4991, 1),
-(551, 5, 79, 2024, 'SC', 1380, 1),
-(552, 5, 79, 2024, 'SC', 2169, 1),
-(553, 5, 79, 2024, 'ST', 768, 1),
-(554, 5, 79, 2024, 'ST', 1338, 1),
-(555, 5, 84, 2024, 'GEN', 316, 1),
-(556, 5, 84, 2024, 'GEN', 1234, 1),
-(557, 5, 84, 2024, 'GEN', 27, 1),
-(558, 5, 84, 2024, 'EWS', 87, 1),
-(559, 5, 84, 2024, 'EWS', 283, 1),
-(560, 5, 84, 2024, 'EWS', 9, 1),
-(561, 5, 84, 2024, 'OBC', 211, 1),
-(562, 5, 84, 2024, 'OBC', 813, 1),
-(563, 5, 84, 2024, 'OBC', 27, 1),
-(564, 5, 84, 2024, 'OBC', 70, 1),
-(565, 5, 84, 2024, 'SC', 124, 1),
-(566, 5, 84, 2024, 'SC', 500, 1),
-(567, 5, 84, 2024, 'ST', 58, 1),
-(568, 5, 84, 2024, 'ST', 253, 1),
-(569, 5, 84, 2024, 'GEN', 353, 1),
-(570, 5, 84, 2024, 'GEN', 2258, 1),
-(571, 5, 84, 2024, 'GEN', 33, 1),
-(572, 5, 84, 2024, 'EWS', 103, 1),
-(573, 5, 84, 2024, 'EWS', 454, 1),
-(574, 5, 84, 2024, 'OBC', 317, 1),
-(575, 5, 84, 2024, 'OBC', 1107, 1),
-(576, 5, 84, 2024, 'SC', 154, 1),
-(577, 5, 84, 2024, 'SC', 636, 1),
-(578, 5, 84, 2024, 'ST', 100, 1),
-(579, 5, 86, 2024, 'GEN', 1862, 1),
-(580, 5, 86, 2024, 'GEN', 5178, 1),
-(581, 5, 86, 2024, 'GEN', 184, 1),
-(582, 5, 86, 2024, 'EWS', 370, 1),
-(583, 5, 86, 2024, 'EWS', 1210, 1),
-(584, 5, 86, 2024, 'OBC', 966, 1),
-(585, 5, 86, 2024, 'OBC', 3162, 1),
-(586, 5, 86, 2024, 'SC', 588, 1),
-(587, 5, 86, 2024, 'SC', 1418, 1),
-(588, 5, 86, 2024, 'ST', 341, 1),
-(589, 5, 86, 2024, 'ST', 877, 1),
-(590, 5, 101, 2024, 'GEN', 3027, 1),
-(591, 5, 101, 2024, 'GEN', 7302, 1),
-(592, 5, 101, 2024, 'EWS', 797, 1),
-(593, 5, 101, 2024, 'EWS', 1624, 1),
-(594, 5, 101, 2024, 'OBC', 1948, 1),
-(595, 5, 101, 2024, 'OBC', 5279, 1),
-(596, 5, 101, 2024, 'SC', 1306, 1),
-(597, 5, 101, 2024, 'SC', 2416, 1),
-(598, 5, 101, 2024, 'ST', 836, 1),
-(599, 5, 101, 2024, 'ST', 1101, 1),
-(600, 5, 104, 2024, 'GEN', 5608, 1),
-(601, 5, 104, 2024, 'GEN', 10923, 1),
-(602, 5, 104, 2024, 'EWS', 1162, 1),
-(603, 5, 104, 2024, 'EWS', 2424, 1),
-(604, 5, 104, 2024, 'OBC', 3016, 1),
-(605, 5, 104, 2024, 'OBC', 6368, 1),
-(606, 5, 104, 2024, 'SC', 1687, 1),
-(607, 5, 104, 2024, 'SC', 2781, 1),
-(608, 5, 104, 2024, 'ST', 937, 1),
-(609, 5, 104, 2024, 'ST', 1641, 1),
-(610, 12, 37, 2024, 'GEN', 7508, 1),
-(611, 12, 37, 2024, 'GEN', 15214, 1),
-(612, 12, 37, 2024, 'EWS', 1257, 1),
-(613, 12, 37, 2024, 'EWS', 2612, 1),
-(614, 12, 37, 2024, 'OBC', 3233, 1),
-(615, 12, 37, 2024, 'OBC', 6755, 1),
-(616, 12, 37, 2024, 'SC', 1974, 1),
-(617, 12, 37, 2024, 'SC', 2553, 1),
-(618, 12, 37, 2024, 'ST', 985, 1),
-(619, 12, 37, 2024, 'ST', 1385, 1),
-(620, 12, 44, 2024, 'GEN', 9821, 1),
-(621, 12, 44, 2024, 'GEN', 16727, 1),
-(622, 12, 44, 2024, 'EWS', 1535, 1),
-(623, 12, 44, 2024, 'EWS', 2653, 1),
-(624, 12, 44, 2024, 'OBC', 3728, 1),
-(625, 12, 44, 2024, 'OBC', 7580, 1),
-(626, 12, 44, 2024, 'SC', 1985, 1),
-(627, 12, 44, 2024, 'SC', 2824, 1),
-(628, 12, 44, 2024, 'ST', 842, 1),
-(629, 12, 44, 2024, 'ST', 1321, 1),
-(630, 12, 48, 2024, 'GEN', 1628, 1),
-(631, 12, 48, 2024, 'GEN', 3922, 1),
-(632, 12, 48, 2024, 'GEN', 69, 1),
-(633, 12, 48, 2024, 'EWS', 216, 1),
-(634, 12, 48, 2024, 'EWS', 593, 1),
-(635, 12, 48, 2024, 'EWS', 13, 1),
-(636, 12, 48, 2024, 'OBC', 571, 1),
-(637, 12, 48, 2024, 'OBC', 2012, 1),
-(638, 12, 48, 2024, 'OBC', 55, 1),
-(639, 12, 48, 2024, 'SC', 312, 1),
-(640, 12, 48, 2024, 'SC', 819, 1),
-(641, 12, 48, 2024, 'ST', 154, 1),
-(642, 12, 48, 2024, 'ST', 387, 1),
-(643, 12, 55, 2024, 'GEN', 3673, 1),
-(644, 12, 55, 2024, 'GEN', 7489, 1),
-(645, 12, 55, 2024, 'GEN', 208, 1),
-(646, 12, 55, 2024, 'EWS', 543, 1),
-(647, 12, 55, 2024, 'EWS', 1320, 1),
-(648, 12, 55, 2024, 'OBC', 1565, 1),
-(649, 12, 55, 2024, 'OBC', 4023, 1),
-(650, 12, 55, 2024, 'SC', 978, 1),
-(651, 12, 55, 2024, 'SC', 1938, 1),
-(652, 12, 55, 2024, 'ST', 492, 1),
-(653, 12, 55, 2024, 'ST', 912, 1),
-(654, 12, 63, 2024, 'GEN', 6736, 1),
-(655, 12, 63, 2024, 'GEN', 16482, 1),
-(656, 12, 63, 2024, 'EWS', 1666, 1),
-(657, 12, 63, 2024, 'OBC', 3380, 1),
-(658, 12, 63, 2024, 'OBC', 7062, 1),
-(659, 12, 63, 2024, 'SC', 2152, 1),
-(660, 12, 63, 2024, 'SC', 3343, 1),
-(661, 12, 63, 2024, 'ST', 1242, 1),
-(662, 12, 84, 2024, 'GEN', 2008, 1),
-(663, 12, 84, 2024, 'GEN', 5553, 1),
-(664, 12, 84, 2024, 'GEN', 135, 1),
-(665, 12, 84, 2024, 'EWS', 325, 1),
-(666, 12, 84, 2024, 'EWS', 632, 1),
-(667, 12, 84, 2024, 'OBC', 896, 1),
-(668, 12, 84, 2024, 'OBC', 2488, 1),
-(669, 12, 84, 2024, 'SC', 660, 1),
-(670, 12, 84, 2024, 'SC', 1459, 1),
-(671, 12, 84, 2024, 'ST', 350, 1),
-(672, 12, 84, 2024, 'ST', 780, 1),
-(673, 12, 86, 2024, 'GEN', 6741, 1),
-(674, 12, 86, 2024, 'GEN', 15160, 1),
-(675, 12, 86, 2024, 'EWS', 1118, 1),
-(676, 12, 86, 2024, 'EWS', 2452, 1),
-(677, 12, 86, 2024, 'OBC', 2776, 1),
-(678, 12, 86, 2024, 'OBC', 6741, 1),
-(679, 12, 86, 2024, 'SC', 1649, 1),
-(680, 12, 86, 2024, 'SC', 2922, 1),
-(681, 12, 86, 2024, 'ST', 759, 1),
-(682, 12, 86, 2024, 'ST', 1218, 1),
-(683, 12, 88, 2024, 'GEN', 10500, 1),
-(684, 12, 88, 2024, 'GEN', 19295, 1),
-(685, 12, 88, 2024, 'EWS', 1714, 1),
-(686, 12, 88, 2024, 'EWS', 3256, 1),
-(687, 12, 88, 2024, 'OBC', 4383, 1),
-(688, 12, 88, 2024, 'OBC', 8462, 1),
-(689, 12, 88, 2024, 'SC', 2625, 1),
-(690, 12, 88, 2024, 'SC', 3427, 1),
-(691, 12, 88, 2024, 'ST', 1205, 1),
-(692, 12, 88, 2024, 'ST', 1677, 1),
-(693, 12, 102, 2024, 'GEN', 6548, 1),
-(694, 12, 102, 2024, 'GEN', 12563, 1),
-(695, 12, 102, 2024, 'EWS', 1223, 1),
-(696, 12, 102, 2024, 'OBC', 2696, 1),
-(697, 12, 102, 2024, 'OBC', 6205, 1),
-(698, 12, 102, 2024, 'SC', 1221, 1),
-(699, 12, 102, 2024, 'SC', 2634, 1),
-(700, 12, 102, 2024, 'ST', 795, 1),
-(701, 16, 4, 2024, 'GEN', 4487, 1),
-(702, 16, 4, 2024, 'GEN', 11367, 1),
-(703, 16, 4, 2024, 'EWS', 871, 1),
-(704, 16, 4, 2024, 'EWS', 1802, 1),
-(705, 16, 4, 2024, 'OBC', 2185, 1),
-(706, 16, 4, 2024, 'OBC', 4641, 1),
-(707, 16, 4, 2024, 'SC', 1090, 1),
-(708, 16, 4, 2024, 'SC', 2074, 1),
-(709, 16, 4, 2024, 'ST', 581, 1),
-(710, 16, 4, 2024, 'ST', 1112, 1),
-(711, 16, 5, 2024, 'GEN', 10340, 1),
-(712, 16, 5, 2024, 'GEN', 18381, 1),
-(713, 16, 5, 2024, 'EWS', 1659, 1),
-(714, 16, 5, 2024, 'EWS', 3224, 1),
-(715, 16, 5, 2024, 'OBC', 4322, 1),
-(716, 16, 5, 2024, 'OBC', 7538, 1),
-(717, 16, 5, 2024, 'SC', 2531, 1),
-(718, 16, 5, 2024, 'SC', 3714, 1),
-(719, 16, 5, 2024, 'ST', 1275, 1),
-(720, 16, 5, 2024, 'ST', 1464, 1),
-(721, 16, 6, 2024, 'GEN', 12343, 1),
-(722, 16, 6, 2024, 'GEN', 20949, 1),
-(723, 16, 6, 2024, 'EWS', 2099, 1),
-(724, 16, 6, 2024, 'EWS', 3579, 1),
-(725, 16, 6, 2024, 'OBC', 5221, 1),
-(726, 16, 6, 2024, 'OBC', 9476, 1),
-(727, 16, 6, 2024, 'SC', 2919, 1),
-(728, 16, 6, 2024, 'SC', 4072, 1),
-(729, 16, 6, 2024, 'ST', 1454, 1),
-(730, 16, 6, 2024, 'ST', 2055, 1),
-(731, 16, 8, 2024, 'GEN', 17823, 1),
-(732, 16, 8, 2024, 'GEN', 22987, 1),
-(733, 16, 8, 2024, 'EWS', 2817, 1),
-(734, 16, 8, 2024, 'EWS', 4066, 1),
-(735, 16, 8, 2024, 'OBC', 6719, 1),
-(736, 16, 8, 2024, 'SC', 3363, 1),
-(737, 16, 8, 2024, 'SC', 3680, 1),
-(738, 16, 8, 2024, 'ST', 1736, 1),
-(739, 16, 8, 2024, 'ST', 1830, 1),
-(740, 16, 9, 2024, 'GEN', 839, 1),
-(741, 16, 9, 2024, 'GEN', 2901, 1),
-(742, 16, 9, 2024, 'GEN', 117, 1),
-(743, 16, 9, 2024, 'EWS', 138, 1),
-(744, 16, 9, 2024, 'EWS', 342, 1),
-(745, 16, 9, 2024, 'OBC', 352, 1),
-(746, 16, 9, 2024, 'OBC', 1146, 1),
-(747, 16, 9, 2024, 'OBC', 38, 1),
-(748, 16, 9, 2024, 'SC', 250, 1),
-(749, 16, 9, 2024, 'SC', 527, 1),
-(750, 16, 9, 2024, 'ST', 90, 1),
-(751, 16, 9, 2024, 'ST', 144, 1),
-(752, 16, 27, 2024, 'GEN', 8021, 1),
-(753, 16, 27, 2024, 'GEN', 12574, 1),
-(754, 16, 27, 2024, 'EWS', 1371, 1),
-(755, 16, 27, 2024, 'EWS', 2580, 1),
-(756, 16, 27, 2024, 'OBC', 3598, 1),
-(757, 16, 27, 2024, 'OBC', 7216, 1),
-(758, 16, 27, 2024, 'SC', 2213, 1),
-(759, 16, 27, 2024, 'SC', 3218, 1),
-(760, 16, 27, 2024, 'ST', 918, 1),
-(761, 16, 27, 2024, 'ST', 1729, 1),
-(762, 16, 37, 2024, 'GEN', 4818, 1),
-(763, 16, 37, 2024, 'GEN', 11140, 1),
-(764, 16, 37, 2024, 'EWS', 902, 1),
-(765, 16, 37, 2024, 'EWS', 1930, 1),
-(766, 16, 37, 2024, 'OBC', 2255, 1),
-(767, 16, 37, 2024, 'OBC', 5031, 1),
-(768, 16, 37, 2024, 'SC', 1359, 1),
-(769, 16, 37, 2024, 'SC', 2087, 1),
-(770, 16, 37, 2024, 'ST', 721, 1),
-(771, 16, 37, 2024, 'ST', 1239, 1),
-(772, 16, 42, 2024, 'GEN', 11713, 1),
-(773, 16, 42, 2024, 'GEN', 20264, 1),
-(774, 16, 42, 2024, 'EWS', 1925, 1),
-(775, 16, 42, 2024, 'EWS', 3331, 1),
-(776, 16, 42, 2024, 'OBC', 5129, 1),
-(777, 16, 42, 2024, 'OBC', 8806, 1),
-(778, 16, 42, 2024, 'SC', 2892, 1),
-(779, 16, 42, 2024, 'SC', 3576, 1),
-(780, 16, 42, 2024, 'ST', 1394, 1),
-(781, 16, 42, 2024, 'ST', 1977, 1),
-(782, 16, 44, 2024, 'GEN', 7079, 1),
-(783, 16, 44, 2024, 'GEN', 15037, 1),
-(784, 16, 44, 2024, 'EWS', 1184, 1),
-(785, 16, 44, 2024, 'EWS', 2279, 1),
-(786, 16, 44, 2024, 'OBC', 2943, 1),
-(787, 16, 44, 2024, 'OBC', 5694, 1),
-(788, 16, 44, 2024, 'SC', 1657, 1),
-(789, 16, 44, 2024, 'SC', 2669, 1),
-(790, 16, 44, 2024, 'ST', 562, 1),
-(791, 16, 44, 2024, 'ST', 781, 1),
-(792, 16, 48, 2024, 'GEN', 450, 1),
-(793, 16, 48, 2024, 'GEN', 1908, 1),
-(794, 16, 48, 2024, 'GEN', 22, 1),
-(795, 16, 48, 2024, 'GEN', 70, 1),
-(796, 16, 48, 2024, 'EWS', 78, 1),
-(797, 16, 48, 2024, 'EWS', 231, 1),
-(798, 16, 48, 2024, 'EWS', 7, 1),
-(799, 16, 48, 2024, 'OBC', 209, 1),
-(800, 16, 48, 2024, 'OBC', 779, 1),
-(801, 16, 48, 2024, 'OBC', 14, 1),
-(802, 16, 48, 2024, 'SC', 102, 1),
-(803, 16, 48, 2024, 'SC', 389, 1),
-(804, 16, 48, 2024, 'SC', 6, 1),
-(805, 16, 48, 2024, 'ST', 68, 1),
-(806, 16, 48, 2024, 'ST', 138, 1),
-(807, 16, 48, 2024, 'ST', 4, 1),
-(808, 16, 54, 2024, 'GEN', 5782, 1),
-(809, 16, 54, 2024, 'GEN', 12733, 1),
-(810, 16, 54, 2024, 'EWS', 995, 1),
-(811, 16, 54, 2024, 'EWS', 2143, 1),
-(812, 16, 54, 2024, 'OBC', 2586, 1),
-(813, 16, 54, 2024, 'OBC', 5904, 1),
-(814, 16, 54, 2024, 'SC', 1804, 1),
-(815, 16, 54, 2024, 'SC', 3000, 1),
-(816, 16, 54, 2024, 'ST', 1006, 1),
-(817, 16, 54, 2024, 'ST', 1539, 1),
-(818, 16, 55, 2024, 'GEN', 1885, 1),
-(819, 16, 55, 2024, 'GEN', 5388, 1),
-(820, 16, 55, 2024, 'GEN', 154, 1),
-(821, 16, 55, 2024, 'EWS', 333, 1),
-(822, 16, 55, 2024, 'EWS', 644, 1),
-(823, 16, 55, 2024, 'OBC', 820, 1),
-(824, 16, 55, 2024, 'OBC', 2547, 1),
-(825, 16, 55, 2024, 'OBC', 75, 1),
-(826, 16, 55, 2024, 'SC', 550, 1),
-(827, 16, 55, 2024, 'SC', 1290, 1),
-(828, 16, 55, 2024, 'ST', 219, 1),
-(829, 16, 55, 2024, 'ST', 624, 1),
-(830, 16, 59, 2024, 'GEN', 1426, 1),
-(831, 16, 59, 2024, 'GEN', 4665, 1),
-(832, 16, 59, 2024, 'GEN', 60, 1),
-(833, 16, 59, 2024, 'GEN', 123, 1),
-(834, 16, 59, 2024, 'EWS', 257, 1),
-(835, 16, 59, 2024, 'EWS', 505, 1),
-(836, 16, 59, 2024, 'OBC', 640, 1),
-(837, 16, 59, 2024, 'OBC', 1798, 1),
-(838, 16, 59, 2024, 'OBC', 56, 1),
-(839, 16, 59, 2024, 'SC', 388, 1),
-(840, 16, 59, 2024, 'SC', 892, 1),
-(841, 16, 59, 2024, 'ST', 175, 1),
-(842, 16, 59, 2024, 'ST', 392, 1),
-(843, 16, 68, 2024, 'GEN', 11850, 1),
-(844, 16, 68, 2024, 'GEN', 20249, 1),
-(845, 16, 68, 2024, 'EWS', 2006, 1),
-(846, 16, 68, 2024, 'EWS', 3723, 1),
-(847, 16, 68, 2024, 'OBC', 5095, 1),
-(848, 16, 68, 2024, 'OBC', 8732, 1),
-(849, 16, 68, 2024, 'SC', 2913, 1),
-(850, 16, 68, 2024, 'SC', 4112, 1),
-(851, 16, 68, 2024, 'ST', 1453, 1),
-(852, 16, 68, 2024, 'ST', 2040, 1),
-(853, 16, 73, 2024, 'GEN', 4113, 1),
-(854, 16, 73, 2024, 'GEN', 10161, 1),
-(855, 16, 73, 2024, 'EWS', 856, 1),
-(856, 16, 73, 2024, 'EWS', 1505, 1),
-(857, 16, 73, 2024, 'OBC', 2077, 1),
-(858, 16, 73, 2024, 'OBC', 4998, 1),
-(859, 16, 73, 2024, 'SC', 1354, 1),
-(860, 16, 73, 2024, 'SC', 2622, 1),
-(861, 16, 73, 2024, 'ST', 857, 1),
-(862, 16, 73, 2024, 'ST', 1333, 1),
-(863, 16, 74, 2024, 'GEN', 2561, 1),
-(864, 16, 74, 2024, 'GEN', 6124, 1),
-(865, 16, 74, 2024, 'GEN', 156, 1),
-(866, 16, 74, 2024, 'EWS', 463, 1),
-(867, 16, 74, 2024, 'EWS', 1400, 1),
-(868, 16, 74, 2024, 'OBC', 1207, 1),
-(869, 16, 74, 2024, 'OBC', 3619, 1),
-(870, 16, 74, 2024, 'SC', 943, 1),
-(871, 16, 74, 2024, 'SC', 2095, 1),
-(872, 16, 74, 2024, 'ST', 774, 1),
-(873, 16, 74, 2024, 'ST', 1007, 1),
-(874, 16, 78, 2024, 'GEN', 6063, 1),
-(875, 16, 78, 2024, 'GEN', 13721, 1),
-(876, 16, 78, 2024, 'EWS', 1267, 1),
-(877, 16, 78, 2024, 'EWS', 2173, 1),
-(878, 16, 78, 2024, 'OBC', 3116, 1),
-(879, 16, 78, 2024, 'OBC', 6324, 1),
-(880, 16, 78, 2024, 'SC', 1937, 1),
-(881, 16, 78, 2024, 'SC', 3292, 1),
-(882, 16, 78, 2024, 'ST', 1052, 1),
-(883, 16, 78, 2024, 'ST', 1589, 1),
-(884, 16, 84, 2024, 'GEN', 1320, 1),
-(885, 16, 84, 2024, 'GEN', 4275, 1),
-(886, 16, 84, 2024, 'GEN', 47, 1),
-(887, 16, 84, 2024, 'EWS', 264, 1),
-(888, 16, 84, 2024, 'EWS', 559, 1),
-(889, 16, 84, 2024, 'OBC', 697, 1),
-(890, 16, 84, 2024, 'OBC', 2525, 1),
-(891, 16, 84, 2024, 'SC', 536, 1),
-(892, 16, 84, 2024, 'SC', 965, 1),
-(893, 16, 84, 2024, 'ST', 336, 1),
-(894, 16, 84, 2024, 'ST', 602, 1),
-(895, 16, 86, 2024, 'GEN', 3599, 1),
-(896, 16, 86, 2024, 'GEN', 9386, 1),
-(897, 16, 86, 2024, 'GEN', 238, 1),
-(898, 16, 86, 2024, 'EWS', 585, 1),
-(899, 16, 86, 2024, 'EWS', 1617, 1),
-(900, 16, 86, 2024, 'OBC', 1590, 1),
-(901, 16, 86, 2024, 'OBC', 4687, 1),
-(902, 16, 86, 2024, 'SC', 1035, 1),
-(903, 16, 86, 2024, 'SC', 1998, 1),
-(904, 16, 86, 2024, 'ST', 538, 1),
-(905, 16, 86, 2024, 'ST', 1153, 1),
-(906, 16, 79, 2024, 'GEN', 7031, 1),
-(907, 16, 79, 2024, 'GEN', 15081, 1),
-(908, 16, 79, 2024, 'EWS', 1318, 1),
-(909, 16, 79, 2024, 'EWS', 2553, 1),
-(910, 16, 79, 2024, 'OBC', 3173, 1),
-(911, 16, 79, 2024, 'OBC', 6828, 1),
-(912, 16, 79, 2024, 'SC', 2015, 1),
-(913, 16, 79, 2024, 'SC', 3206, 1),
-(914, 16, 79, 2024, 'ST', 960, 1),
-(915, 16, 79, 2024, 'ST', 1423, 1),
-(916, 16, 92, 2024, 'GEN', 9669, 1),
-(917, 16, 92, 2024, 'GEN', 19321, 1),
-(918, 16, 92, 2024, 'EWS', 1570, 1),
-(919, 16, 92, 2024, 'EWS', 3177, 1),
-(920, 16, 92, 2024, 'OBC', 3886, 1),
-(921, 16, 92, 2024, 'OBC', 8117, 1),
-(922, 16, 92, 2024, 'SC', 2279, 1),
-(923, 16, 92, 2024, 'SC', 3566, 1),
-(924, 16, 92, 2024, 'ST', 1139, 1),
-(925, 16, 92, 2024, 'ST', 1243, 1),
-(926, 16, 8, 2024, 'GEN', 8727, 1),
-(927, 16, 8, 2024, 'GEN', 16885, 1),
-(928, 16, 8, 2024, 'EWS', 1525, 1),
-(929, 16, 8, 2024, 'EWS', 2886, 1),
-(930, 16, 8, 2024, 'OBC', 3931, 1),
-(931, 16, 8, 2024, 'OBC', 7202, 1),
-(932, 16, 8, 2024, 'SC', 2300, 1),
-(933, 16, 8, 2024, 'SC', 3486, 1),
-(934, 16, 8, 2024, 'ST', 1167, 1),
-(935, 16, 8, 2024, 'ST', 1558, 1),
-(936, 16, 99, 2024, 'GEN', 8625, 1),
-(937, 16, 99, 2024, 'GEN', 19650, 1),
-(938, 16, 99, 2024, 'EWS', 1856, 1),
-(939, 16, 99, 2024, 'EWS', 3446, 1),
-(940, 16, 99, 2024, 'OBC', 4095, 1),
-(941, 16, 99, 2024, 'OBC', 8620, 1),
-(942, 16, 99, 2024, 'SC', 2481, 1),
-(943, 16, 99, 2024, 'SC', 3996, 1),
-(944, 16, 99, 2024, 'ST', 1360, 1),
-(945, 16, 99, 2024, 'ST', 1730, 1),
-(946, 11, 9, 2024, 'GEN', 823, 1),
-(947, 11, 9, 2024, 'GEN', 2515, 1),
-(948, 11, 9, 2024, 'GEN', 77, 1),
-(949, 11, 9, 2024, 'EWS', 116, 1),
-(950, 11, 9, 2024, 'EWS', 367, 1),
-(951, 11, 9, 2024, 'OBC', 375, 1),
-(952, 11, 9, 2024, 'OBC', 1039, 1),
-(953, 11, 9, 2024, 'OBC', 89, 1),
-(954, 11, 9, 2024, 'SC', 222, 1),
-(955, 11, 9, 2024, 'SC', 404, 1),
-(956, 11, 9, 2024, 'ST', 80, 1),
-(957, 11, 9, 2024, 'ST', 149, 1),
-(958, 11, 32, 2024, 'GEN', 7569, 1),
-(959, 11, 32, 2024, 'GEN', 15443, 1),
-(960, 11, 32, 2024, 'EWS', 1566, 1),
-(961, 11, 32, 2024, 'EWS', 2692, 1),
-(962, 11, 32, 2024, 'OBC', 3922, 1),
-(963, 11, 32, 2024, 'OBC', 5436, 1),
-(964, 11, 32, 2024, 'SC', 2394, 1),
-(965, 11, 32, 2024, 'ST', 1067, 1),
-(966, 11, 32, 2024, 'ST', 957, 1),
-(967, 11, 35, 2024, 'GEN', 8299, 1),
-(968, 11, 35, 2024, 'GEN', 10909, 1),
-(969, 11, 35, 2024, 'EWS', 1383, 1),
-(970, 11, 35, 2024, 'EWS', 2573, 1),
-(971, 11, 35, 2024, 'OBC', 3959, 1),
-(972, 11, 35, 2024, 'OBC', 6001, 1),
-(973, 11, 35, 2024, 'SC', 2264, 1),
-(974, 11, 35, 2024, 'ST', 872, 1),
-(975, 11, 35, 2024, 'ST', 1109, 1),
-(976, 11, 37, 2024, 'GEN', 5379, 1),
-(977, 11, 37, 2024, 'GEN', 11173, 1),
-(978, 11, 37, 2024, 'EWS', 948, 1),
-(979, 11, 37, 2024, 'EWS', 1715, 1),
-(980, 11, 37, 2024, 'OBC', 2440, 1),
-(981, 11, 37, 2024, 'OBC', 4864, 1),
-(982, 11, 37, 2024, 'SC', 1448, 1),
-(983, 11, 37, 2024, 'SC', 2507, 1),
-(984, 11, 37, 2024, 'ST', 737, 1),
-(985, 11, 37, 2024, 'ST', 1039, 1),
-(986, 11, 44, 2024, 'GEN', 7945, 1),
-(987, 11, 44, 2024, 'GEN', 15007, 1),
-(988, 11, 44, 2024, 'EWS', 1283, 1),
-(989, 11, 44, 2024, 'EWS', 2104, 1),
-(990, 11, 44, 2024, 'OBC', 3177, 1),
-(991, 11, 44, 2024, 'OBC', 5919, 1),
-(992, 11, 44, 2024, 'SC', 1811, 1),
-(993, 11, 44, 2024, 'SC', 1896, 1),
-(994, 11, 44, 2024, 'ST', 533, 1),
-(995, 11, 44, 2024, 'ST', 605, 1),
-(996, 11, 46, 2024, 'GEN', 1675, 1),
-(997, 11, 46, 2024, 'GEN', 4712, 1),
-(998, 11, 46, 2024, 'GEN', 158, 1),
-(999, 11, 46, 2024, 'EWS', 304, 1),
-(1000, 11, 46, 2024, 'EWS', 840, 1);
-
--- Note: Total cutoff records: 14976
--- Remaining records can be inserted using the same pattern.
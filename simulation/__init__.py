@@ -0,0 +1,11 @@
+"""
+JoSAA seat allocation simulator over the normalized cutoff tables.
+
+    python -m simulation [--applicants 100000] [--runs 8] [--workers N]
+"""
+
+from .allocation import cutoff_assignment, deferred_acceptance
+from .engine import Scenario, simulate, summarize
+from .market import Market, load_market
+
+__all__ = ["Market", "Scenario", "cutoff_assignment", "deferred_acceptance", "load_market", "simulate", "summarize"]
@@ -0,0 +1,109 @@
+"""
+Seat allocation over flattened preference lists (see applicants.py).
+
+deferred_acceptance runs applicant-proposing deferred acceptance in
+rounds, all unplaced applicants proposing at once. A full pool rejects
+proposals ranked below its worst held applicant outright, and a pool
+with room for all its proposals takes them. Only the proposals to the
+remaining pools are sorted by (pool, rank) with the applicants those
+pools hold; each keeps its first `capacity`, and those below are
+released and propose to their next pool in the following round. State is a few arrays
+(each applicant's next list entry and held entry, and per pool its held
+count and worst held rank), so a round costs O(n log n) in the entries
+it touches and no Python runs per applicant. The outcome is the
+applicant-optimal stable matching, whatever the order of proposals.
+
+cutoff_assignment gives each applicant its first pool whose cutoff it
+clears. With capacities equal to the seats it fills, that assignment is
+stable, which is how seat counts are calibrated to observed closing ranks.
+"""
+
+import numpy as np
+
+from .applicants import PreferenceLists
+
+UNASSIGNED = -1
+
+
+def deferred_acceptance(lists: PreferenceLists, capacity: np.ndarray) -> np.ndarray:
+    """Each applicant's held entry (index into lists.pool) at the end, or UNASSIGNED."""
+    end = lists.ptr[1:]
+    next_entry = lists.ptr[:-1].copy()
+    held = np.full(len(end), UNASSIGNED, dtype=np.int64)
+    # Pool of each held entry; len(capacity) for applicants not held
+    held_pool = np.full(len(end), len(capacity), dtype=np.int64)
+    key_scale = int(lists.score.max(initial=0)) + 1
+    # Seat-count table: applicants held per pool and the worst rank among them
+    filled = np.zeros(len(capacity), dtype=np.int64)
+    worst = np.zeros(len(capacity), dtype=np.int64)
+    proposers = np.flatnonzero(next_entry < end)
+    while len(proposers):
+        proposals = next_entry[proposers]
+        next_entry[proposers] += 1
+
+        # A full pool turns away anyone ranked below its worst held applicant
+        # outright; pools with room for all their other proposals take them
+        targets = lists.pool[proposals]
+        competing = (filled[targets] < capacity[targets]) | (lists.score[proposals] < worst[targets])
+        released = proposers[~competing]
+        proposers, proposals, targets = proposers[competing], proposals[competing], targets[competing]
+        overflow = np.append(filled + np.bincount(targets, minlength=len(capacity)) > capacity, False)
+        fits = ~overflow[targets]
+        held[proposers[fits]] = proposals[fits]
+        held_pool[proposers[fits]] = targets[fits]
+        filled += np.bincount(targets[fits], minlength=len(capacity))
+        np.maximum.at(worst, targets[fits], lists.score[proposals[fits]])
+
+        # The others rank their proposals with the applicants they hold
+        proposers, proposals = proposers[~fits], proposals[~fits]
+        if len(proposers):
+            holders = np.flatnonzero(overflow[held_pool])
+            applicants = np.concatenate((holders, proposers))
+            entries = np.concatenate((held[holders], proposals))
+            pools = lists.pool[entries]
+            order = np.argsort(pools.astype(np.int64) * key_scale + lists.score[entries])
+            pools = pools[order]
+            # Position of each entry within its pool's sorted run
+            starts = np.flatnonzero(np.r_[True, pools[1:] != pools[:-1]])
+            sizes = np.diff(np.r_[starts, len(pools)])
+            position = np.arange(len(pools)) - np.repeat(starts, sizes)
+            accepted = position < capacity[pools]
+
+            held[applicants[order[accepted]]] = entries[order[accepted]]
+            held_pool[applicants[order[accepted]]] = pools[accepted]
+            evicted = applicants[order[~accepted]]
+            held[evicted] = UNASSIGNED
+            held_pool[evicted] = len(capacity)
+            released = np.concatenate((released, evicted))
+            # Overflowing pools end up full; their worst is the last one kept
+            run_pools = pools[starts]
+            filled[run_pools] = capacity[run_pools]
+            kept = run_pools[capacity[run_pools] > 0]
+            last = (starts + capacity[run_pools] - 1)[capacity[run_pools] > 0]
+            worst[kept] = lists.score[entries[order[last]]]
+        proposers = released[next_entry[released] < end[released]]
+    return held
+
+
+def cutoff_assignment(lists: PreferenceLists, cutoffs: np.ndarray) -> np.ndarray:
+    """Each applicant's first entry whose rank is within its pool's cutoff, or UNASSIGNED."""
+    count = len(lists.ptr) - 1
+    eligible = np.flatnonzero(lists.score <= cutoffs[lists.pool])
+    owner = np.repeat(np.arange(count), np.diff(lists.ptr))[eligible]
+    # Entries are grouped by applicant, so each applicant's first eligible entry starts its run
+    first = np.r_[True, owner[1:] != owner[:-1]] if len(owner) else np.zeros(0, dtype=bool)
+    assigned = np.full(count, UNASSIGNED, dtype=np.int64)
+    assigned[owner[first]] = eligible[first]
+    return assigned
+
+
+def closing_ranks(lists: PreferenceLists, assigned: np.ndarray, pools: int) -> np.ndarray:
+    """Largest admitted rank per pool (0 for pools left empty)."""
+    entries = assigned[assigned != UNASSIGNED]
+    closing = np.zeros(pools, dtype=np.int64)
+    np.maximum.at(closing, lists.pool[entries], lists.score[entries])
+    return closing
+
+
+def seats_filled(lists: PreferenceLists, assigned: np.ndarray, pools: int) -> np.ndarray:
+    return np.bincount(lists.pool[assigned[assigned != UNASSIGNED]], minlength=pools)
@@ -0,0 +1,171 @@
+"""
+Synthetic applicant pools and their preference lists.
+
+`count` applicants stand for the top `population` candidates of JEE Main,
+each for population / count real candidates, so their ranks come out in
+the tables' units: applicant i of the common rank list gets a rank in
+[i, i + 1) * population / count, and its category rank is its position
+among its category's applicants on the same scale. Categories, gender and
+home state are drawn independently: categories by CATEGORY_SHARES, home
+states by each state's share of the programs. The top ADVANCED_QUALIFIERS
+sit JEE Advanced, with a log-normal spread (ADVANCED_NOISE) between their
+two exams, and the first ADVANCED_RANKED of them are ranked.
+
+An applicant lists `list_length` programs drawn around its own rank: each
+draw is the first program whose closing rank for the applicant's
+category and gender reaches rank * exp(N(LIST_SHIFT, LIST_SPREAD)), so
+lists run from ambitious to safe choices. Applicants ranked in JEE
+Advanced draw half their programs from the IITs. The list is ordered by
+utility
+
+    quality + noise * Gumbel + home_bonus * (institute in the home state)
+
+and each program expands to the pools the applicant is considered for, in
+JoSAA's order: OPEN gender-neutral, OPEN female-only, then the same two
+of the applicant's category.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from .market import ADVANCED, CATEGORIES, GEN, HOME, MAINS, OTHER, Market
+
+# Candidate shares of GEN, EWS, OBC, SC, ST
+CATEGORY_SHARES = (0.40, 0.10, 0.30, 0.14, 0.06)
+FEMALE_SHARE = 0.25
+# JEE Main ranks admitted to JEE Advanced, and JEE Advanced candidates who get a rank
+ADVANCED_QUALIFIERS = 250_000
+ADVANCED_RANKED = 48_000
+# Standard deviation of log(advanced rank / main rank) before re-ranking
+ADVANCED_NOISE = 0.5
+# Log-normal position of listed programs' closing ranks relative to the applicant's rank
+LIST_SHIFT = 0.2
+LIST_SPREAD = 0.6
+# Female-only pool and category list flags of a program's four pool variants
+VARIANT_FEMALE = np.array([0, 1, 0, 1])
+VARIANT_LIST = np.array([0, 0, 1, 1])
+
+
+@dataclass
+class Applicants:
+    category: np.ndarray    # index into CATEGORIES
+    female: np.ndarray
+    state: np.ndarray       # index into Market.states
+    # ranks[applicant, exam, list]: list 0 is the common rank list, 1 the
+    # applicant's category list (the common list for GEN); 0 = not ranked
+    ranks: np.ndarray
+
+
+@dataclass
+class PreferenceLists:
+    """Every applicant's pools, most preferred first: applicant a's entries are ptr[a]:ptr[a + 1]."""
+    ptr: np.ndarray
+    pool: np.ndarray
+    score: np.ndarray       # the applicant's rank on the pool's list (lower is better)
+
+
+def _scaled_positions(count: int, scale: float, rng: np.random.Generator) -> np.ndarray:
+    """Ranks of `count` consecutive applicants each standing for `scale` candidates."""
+    return ((np.arange(count) + rng.random(count)) * scale).astype(np.int32) + 1
+
+
+def _category_ranks(common: np.ndarray, category: np.ndarray, scale: float, rng: np.random.Generator) -> np.ndarray:
+    """Category list ranks of the ranked applicants, from their order on the common list (GEN keeps it)."""
+    ranks = common.copy()
+    for c in range(1, len(CATEGORIES)):
+        members = np.flatnonzero((category == c) & (common > 0))
+        members = members[np.argsort(common[members], kind="stable")]
+        ranks[members] = _scaled_positions(len(members), scale, rng)
+    return ranks
+
+
+def generate_applicants(market: Market, count: int, population: int, rng: np.random.Generator) -> Applicants:
+    scale = population / count
+    category = rng.choice(len(CATEGORIES), size=count, p=CATEGORY_SHARES)
+    female = rng.random(count) < FEMALE_SHARE
+    weights = np.bincount(market.program_state[market.program_state >= 0], minlength=len(market.states))
+    state = rng.choice(len(market.states), size=count, p=weights / weights.sum())
+
+    ranks = np.zeros((count, 2, 2), dtype=np.int32)
+    ranks[:, MAINS, 0] = _scaled_positions(count, scale, rng)
+    ranks[:, MAINS, 1] = _category_ranks(ranks[:, MAINS, 0], category, scale, rng)
+
+    qualifiers = np.flatnonzero(ranks[:, MAINS, 0] <= ADVANCED_QUALIFIERS)
+    performance = np.log(ranks[qualifiers, MAINS, 0]) + ADVANCED_NOISE * rng.standard_normal(len(qualifiers))
+    order = qualifiers[np.argsort(performance)]
+    advanced = _scaled_positions(len(order), scale, rng)
+    ranks[order, ADVANCED, 0] = np.where(advanced <= ADVANCED_RANKED, advanced, 0)
+    ranks[:, ADVANCED, 1] = _category_ranks(ranks[:, ADVANCED, 0], category, scale, rng)
+    return Applicants(category=category, female=female, state=state, ranks=ranks)
+
+
+def _draw_programs(market: Market, applicants: Applicants, list_length: int,
+                   rng: np.random.Generator) -> np.ndarray:
+    """(applicants, list_length) programs drawn around each applicant's rank; -1 where none is open."""
+    count = len(applicants.category)
+    half = list_length // 2
+    ranked = applicants.ranks[:, ADVANCED, 0] > 0
+    group = applicants.category * 2 + applicants.female
+    programs = np.full((count, list_length), -1, dtype=np.int32)
+    for (e, c, f), (log_closing, ladder) in market.ladders.items():
+        members = group == c * 2 + f
+        # (applicants, columns) drawn from this ladder: the first half of an
+        # advanced-ranked applicant's list from the IITs, the rest from JEE Main
+        if e == ADVANCED:
+            blocks = [(np.flatnonzero(members & ranked), slice(0, half))]
+        else:
+            blocks = [(np.flatnonzero(members & ranked), slice(half, list_length)),
+                      (np.flatnonzero(members & ~ranked), slice(0, list_length))]
+        for rows, columns in blocks:
+            if not len(rows) or not len(ladder):
+                continue
+            width = len(range(*columns.indices(list_length)))
+            target = (np.log(applicants.ranks[rows, e, 1])[:, None] + LIST_SHIFT
+                      + LIST_SPREAD * rng.standard_normal((len(rows), width)))
+            position = np.minimum(np.searchsorted(log_closing, target), len(ladder) - 1)
+            programs[rows, columns] = ladder[position]
+    return programs
+
+
+def preference_lists(market: Market, applicants: Applicants, list_length: int, noise: float,
+                     home_bonus: float, rng: np.random.Generator) -> PreferenceLists:
+    count = len(applicants.category)
+    programs = _draw_programs(market, applicants, list_length, rng)
+    home = market.program_state[programs] == applicants.state[:, None]
+    utility = (market.quality[programs] + noise * rng.gumbel(size=programs.shape) + home_bonus * home).astype(np.float32)
+
+    # Drop repeated draws and empty slots, then order each list by utility
+    order = np.argsort(programs, axis=1, kind="stable")
+    programs, utility, home = (np.take_along_axis(a, order, axis=1) for a in (programs, utility, home))
+    repeated = np.zeros(programs.shape, dtype=bool)
+    repeated[:, 1:] = programs[:, 1:] == programs[:, :-1]
+    utility[repeated | (programs < 0)] = -np.inf
+    order = np.argsort(-utility, axis=1, kind="stable")
+    programs, utility, home = (np.take_along_axis(a, order, axis=1) for a in (programs, utility, home))
+
+    # Each program's pools in consideration order (OPEN gender-neutral, OPEN
+    # female-only, then the category's), gathered by flat index into
+    # pool_of[program, category, female, slot] and ranks[applicant, exam, list]
+    pool_of = market.pool_of.reshape(-1)
+    base = programs * (len(CATEGORIES) * 4) + np.where(home, HOME, OTHER)
+    own = (applicants.category * 4)[:, None]
+    pool = np.stack((pool_of[base], pool_of[base + 2], pool_of[base + own], pool_of[base + own + 2]), axis=-1)
+    ranks = applicants.ranks.reshape(-1)
+    rank_base = np.arange(count)[:, None] * 4 + market.program_exam[programs] * 2
+    common, category_rank = ranks[rank_base], ranks[rank_base + 1]
+    score = np.stack((common, common, category_rank, category_rank), axis=-1)
+    considered = (
+        np.isfinite(utility)[..., None]
+        & (pool >= 0)
+        & (score > 0)
+        & (applicants.female[:, None, None] | (VARIANT_FEMALE == 0))
+        & ((applicants.category != GEN)[:, None, None] | (VARIANT_LIST == 0))
+    ).reshape(count, -1)
+    ptr = np.zeros(count + 1, dtype=np.int64)
+    np.cumsum(considered.sum(axis=1), out=ptr[1:])
+    return PreferenceLists(
+        ptr=ptr,
+        pool=pool.reshape(count, -1)[considered],
+        score=score.reshape(count, -1)[considered],
+    )
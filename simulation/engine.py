@@ -0,0 +1,139 @@
+"""
+JoSAA allocation simulator.
+
+The tables record closing ranks, not seat counts, so the seat-count table
+is calibrated first: a synthetic applicant pool (seed `seed`) is assigned
+with the observed closing ranks as cutoffs (see cutoff_assignment), and
+each pool gets the seats that assignment fills. Those cutoffs then clear
+the synthetic market, i.e. deferred acceptance over the calibration pool
+reproduces them. Each run draws a fresh applicant pool and preference
+lists (seeds seed + 1, seed + 2, ...) and runs deferred acceptance
+against the calibrated seats; the spread of its closing ranks around the
+observed ones is what the applicant mix and preference noise alone can
+move them by. Runs are independent and go to a process pool.
+
+A pool whose observed closing rank is beyond the last rank its list has in
+the synthetic population (e.g. a deep HS cutoff with population 250k) is
+reported as censored: everyone eligible who lists it fits.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .allocation import closing_ranks, cutoff_assignment, deferred_acceptance, seats_filled
+from .applicants import Applicants, PreferenceLists, generate_applicants, preference_lists
+from .market import CATEGORIES, GEN, Market
+
+# Percentiles of the simulated closing ranks reported per pool
+LOW_PERCENTILE, HIGH_PERCENTILE = 10, 90
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A simulated counseling year (see applicants.py)."""
+    applicants: int = 100_000
+    population: int = 250_000
+    list_length: int = 40
+    preference_noise: float = 0.5
+    home_bonus: float = 0.5
+
+
+def draw(market: Market, scenario: Scenario, seed: int) -> Tuple[Applicants, PreferenceLists]:
+    """The applicant pool and preference lists of one seed."""
+    rng = np.random.default_rng(seed)
+    applicants = generate_applicants(market, scenario.applicants, scenario.population, rng)
+    lists = preference_lists(market, applicants, scenario.list_length, scenario.preference_noise,
+                             scenario.home_bonus, rng)
+    return applicants, lists
+
+
+def list_limits(market: Market, applicants: Applicants) -> np.ndarray:
+    """Per pool, the last rank on its list in the applicant pool."""
+    limits = np.zeros((2, len(CATEGORIES)), dtype=np.int64)
+    for c in range(len(CATEGORIES)):
+        members = applicants.category == c
+        limits[:, c] = applicants.ranks[members, :, 1].max(axis=0) if members.any() else 0
+    limits[:, GEN] = applicants.ranks[:, :, 0].max(axis=0)
+    return limits[market.pool_exam, market.pool_category]
+
+
+def seat_counts(market: Market, scenario: Scenario, seed: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Calibrated seats per pool, and the last rank each pool's list reaches."""
+    applicants, lists = draw(market, scenario, seed)
+    assigned = cutoff_assignment(lists, market.closing)
+    return seats_filled(lists, assigned, len(market.closing)), list_limits(market, applicants)
+
+
+def run_once(market: Market, scenario: Scenario, capacity: np.ndarray, seed: int) -> np.ndarray:
+    """Simulated closing rank of every pool (0 if it stays empty)."""
+    _, lists = draw(market, scenario, seed)
+    return closing_ranks(lists, deferred_acceptance(lists, capacity), len(capacity))
+
+
+def simulate(market: Market, scenario: Scenario = Scenario(), runs: int = 8,
+             workers: Optional[int] = None, seed: int = 0) -> pd.DataFrame:
+    """
+    Calibrate the seats and run `runs` simulations; workers=1 runs them
+    in-process, otherwise a pool of `workers` processes (default: CPU count,
+    at most one per run). One row per pool: market.pool_table() plus
+    seats, censored, simulated_closing (median of the runs that fill it),
+    simulated_low / simulated_high (LOW_PERCENTILE / HIGH_PERCENTILE) and
+    filled (share of runs with any admission).
+    """
+    start = time.perf_counter()
+    capacity, limits = seat_counts(market, scenario, seed)
+    print(f"Calibrated {int(capacity.sum())} seats in {len(capacity)} pools in {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    workers = min(workers or os.cpu_count() or 1, runs)
+    seeds = range(seed + 1, seed + 1 + runs)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            closings = list(pool.map(run_once, repeat(market), repeat(scenario), repeat(capacity), seeds))
+    else:
+        closings = [run_once(market, scenario, capacity, s) for s in seeds]
+    elapsed = time.perf_counter() - start
+    print(f"Ran {runs} allocations of {scenario.applicants} applicants in {elapsed:.2f}s ({workers} workers)")
+
+    closing = np.array(closings, dtype=np.float64).reshape(runs, len(capacity))
+    closing[closing == 0] = np.nan
+    filled = ~np.isnan(closing)
+    any_filled = filled.any(axis=0)
+    low, median, high = np.full((3, len(capacity)), np.nan)
+    if any_filled.any():
+        low[any_filled], median[any_filled], high[any_filled] = np.nanpercentile(
+            closing[:, any_filled], [LOW_PERCENTILE, 50, HIGH_PERCENTILE], axis=0
+        )
+    table = market.pool_table()
+    table["seats"] = capacity
+    table["censored"] = market.closing > limits
+    table["simulated_closing"] = pd.array(np.round(median), dtype="Int64")
+    table["simulated_low"] = pd.array(np.round(low), dtype="Int64")
+    table["simulated_high"] = pd.array(np.round(high), dtype="Int64")
+    table["filled"] = filled.mean(axis=0)
+    return table
+
+
+def summarize(table: pd.DataFrame) -> pd.DataFrame:
+    """
+    Per family: pools, seats, censored pools and, over the other pools with
+    seats, the median |log(simulated / observed)| closing rank and the share
+    of observed closing ranks inside the simulated low-high band.
+    """
+    compared = table[~table["censored"] & (table["seats"] > 0) & table["simulated_closing"].notna()]
+    ratio = np.log(compared["simulated_closing"].astype(float) / compared["closing_rank"])
+    inside = compared["closing_rank"].between(compared["simulated_low"], compared["simulated_high"])
+    return pd.DataFrame({
+        "pools": table.groupby("family").size(),
+        "seats": table.groupby("family")["seats"].sum(),
+        "censored": table.groupby("family")["censored"].sum(),
+        "median_log_error": ratio.abs().groupby(compared["family"]).median().round(3),
+        "inside_band": inside.groupby(compared["family"]).mean().round(3),
+    })
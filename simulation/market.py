@@ -0,0 +1,169 @@
+"""
+Seat pools of the normalized cutoff tables, as arrays for the simulator.
+
+A program is one (institute, branch) of a family; a pool is one of its
+seat pools: (program, category, gender pool, quota). The market holds the
+pools of one year's last round that the simulator models - non-PwD seats
+of the HS, OS and AI quotas (IIT seats have no quota) - with their
+observed closing ranks. Rank units follow the tables: IIT pools are
+ranked on the JEE Advanced lists and the rest on JEE Main; OPEN (GEN)
+pools use the common rank list, the others their category's list.
+
+pool_of[program, category, female, slot] is the pool an applicant is
+considered for: slot HOME for applicants from the institute's state (HS
+pools), OTHER for the rest (OS pools); AI and quota-less pools fill both
+slots, GO/JK/LA pools neither.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ingestion.engine import FAMILIES
+
+CATEGORIES = ("GEN", "EWS", "OBC", "SC", "ST")
+GEN = 0
+GENDERS = ("Gender-Neutral", "Female-only")
+# Exams, indexing the ranks of an applicant
+MAINS, ADVANCED = 0, 1
+ADVANCED_FAMILIES = ("iit",)
+HOME, OTHER = 0, 1
+QUOTA_SLOTS = {"HS": (HOME,), "OS": (OTHER,), "AI": (HOME, OTHER), "": (HOME, OTHER)}
+
+
+@dataclass
+class Market:
+    """Programs and seat pools of one counseling year (see the module docstring)."""
+    year: int
+    states: List[str]
+    # Per program
+    program_family: np.ndarray
+    program_institute: np.ndarray
+    program_branch: np.ndarray
+    program_state: np.ndarray         # index into `states`, -1 when unknown
+    program_exam: np.ndarray          # MAINS or ADVANCED
+    quality: np.ndarray               # -log of the OPEN gender-neutral closing rank (higher = more demanded)
+    # Per pool
+    pool_program: np.ndarray
+    pool_category: np.ndarray
+    pool_female: np.ndarray
+    pool_quota: np.ndarray
+    closing: np.ndarray
+    pool_of: np.ndarray               # (programs, categories, 2, 2) pool index, -1 for none
+    # (exam, category, female) -> (log closing rank, program) of every program
+    # with a pool of that category open to the gender, by closing rank
+    ladders: Dict[Tuple[int, int, int], Tuple[np.ndarray, np.ndarray]]
+
+    @property
+    def pool_exam(self) -> np.ndarray:
+        return self.program_exam[self.pool_program]
+
+    def pool_table(self) -> pd.DataFrame:
+        """One row per pool: family, institute_id, branch_id, category, gender, quota, observed closing_rank."""
+        program = self.pool_program
+        return pd.DataFrame({
+            "family": self.program_family[program],
+            "institute_id": self.program_institute[program],
+            "branch_id": self.program_branch[program],
+            "category": np.array(CATEGORIES)[self.pool_category],
+            "gender": np.array(GENDERS)[self.pool_female.astype(np.int64)],
+            "quota": self.pool_quota,
+            "closing_rank": self.closing,
+        })
+
+
+def _family_pools(key: str, data_dir: Path, year: Optional[int]) -> pd.DataFrame:
+    """Modelled pools of one family's last round of `year` (default: its latest year)."""
+    config = FAMILIES[key]
+    cutoffs = pd.read_csv(data_dir / config.cutoff_csv)
+    institutes = pd.read_csv(data_dir / config.institute_csv, usecols=[config.id_column, "state"])
+    year = int(cutoffs["year"].max()) if year is None else year
+    cutoffs = cutoffs[cutoffs["year"] == year]
+    cutoffs = cutoffs[cutoffs["round"] == cutoffs["round"].max()]
+    quota = cutoffs["quota"].fillna("") if "quota" in cutoffs else pd.Series("", index=cutoffs.index)
+    keep = (
+        ~cutoffs["pwd"].astype(bool)
+        & cutoffs["category"].isin(CATEGORIES)
+        & cutoffs["gender"].isin(GENDERS)
+        & quota.isin(list(QUOTA_SLOTS))
+        & (cutoffs["closing_rank"] > 0)
+    )
+    pools = cutoffs[keep].assign(quota=quota[keep]).rename(columns={config.id_column: "institute_id"})
+    # Several programs can map to one branch id; their seats are one pool here
+    pools = (
+        pools.groupby(["institute_id", "branch_id", "category", "gender", "quota"], as_index=False)["closing_rank"]
+        .max()
+    )
+    states = institutes.rename(columns={config.id_column: "institute_id"})
+    pools = pools.merge(states, on="institute_id", how="left")
+    return pools.assign(family=key, year=year)
+
+
+def load_market(data_dir: str = "normalized_data", year: Optional[int] = None,
+                families: Optional[Iterable[str]] = None) -> Market:
+    """Read the families' normalized cutoff tables (default: all) into a Market."""
+    frames = [_family_pools(key, Path(data_dir), year) for key in (families or FAMILIES)]
+    pools = pd.concat(frames, ignore_index=True)
+    if pools.empty:
+        raise ValueError(f"No cutoffs for year {year} in {data_dir}")
+    pools = pools.sort_values(["family", "institute_id", "branch_id", "category", "gender", "quota"], ignore_index=True)
+
+    program = pools.groupby(["family", "institute_id", "branch_id"], sort=False).ngroup().to_numpy()
+    first = np.unique(program, return_index=True)[1]
+    programs = pools.iloc[first]
+    state_codes, states = pd.factorize(programs["state"])
+    exam = np.where(programs["family"].isin(ADVANCED_FAMILIES), ADVANCED, MAINS).astype(np.int8)
+
+    category = pools["category"].map(CATEGORIES.index).to_numpy(np.int64)
+    female = (pools["gender"] == GENDERS[1]).to_numpy()
+    closing = pools["closing_rank"].to_numpy(np.int64)
+    quota = pools["quota"].to_numpy(dtype=object)
+
+    pool_of = np.full((len(programs), len(CATEGORIES), 2, 2), -1, dtype=np.int32)
+    index = np.arange(len(pools), dtype=np.int32)
+    for name, slots in QUOTA_SLOTS.items():
+        rows = quota == name
+        for slot in slots:
+            pool_of[program[rows], category[rows], female[rows].astype(np.int64), slot] = index[rows]
+
+    # Quality from the OPEN gender-neutral seats; programs without any get the median
+    open_closing = np.full(len(programs), np.inf)
+    open_rows = (category == GEN) & ~female
+    np.minimum.at(open_closing, program[open_rows], closing[open_rows])
+    known = np.isfinite(open_closing)
+    quality = np.full(len(programs), -np.log(np.median(open_closing[known])) if known.any() else 0.0)
+    quality[known] = -np.log(open_closing[known])
+
+    # Most lenient closing rank per (program, category) for each gender;
+    # female applicants are also considered for the gender-neutral pools
+    reach = np.zeros((len(programs), len(CATEGORIES), 2), dtype=np.int64)
+    np.maximum.at(reach, (program, category, female.astype(np.int64)), closing)
+    reach[:, :, 1] = np.maximum(reach[:, :, 0], reach[:, :, 1])
+    ladders = {}
+    for e in (MAINS, ADVANCED):
+        for c in range(len(CATEGORIES)):
+            for f in (0, 1):
+                candidates = np.flatnonzero((exam == e) & (reach[:, c, f] > 0))
+                order = candidates[np.argsort(reach[candidates, c, f], kind="stable")]
+                ladders[e, c, f] = (np.log(reach[order, c, f]), order.astype(np.int32))
+
+    return Market(
+        year=int(pools["year"].max()),
+        states=list(states),
+        program_family=programs["family"].to_numpy(dtype=object),
+        program_institute=programs["institute_id"].to_numpy(np.int64),
+        program_branch=programs["branch_id"].to_numpy(np.int64),
+        program_state=state_codes.astype(np.int64),
+        program_exam=exam,
+        quality=quality,
+        pool_program=program,
+        pool_category=category,
+        pool_female=female,
+        pool_quota=quota,
+        closing=closing,
+        pool_of=pool_of,
+        ladders=ladders,
+    )